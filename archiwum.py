@@ -0,0 +1,383 @@
+# === MODUŁ ARCHIWUM - NISKOPOZIOMOWE OPERACJE NA ZIP ===
+"""
+Moduł zawierający niskopoziomowe operacje na archiwach ZIP.
+Odpowiedzialny za:
+- Zapis wpisów z danych już skompresowanych (bez ponownej kompresji)
+- Zapis wpisów metodami, których zipfile nie obsługuje (np. zstd)
+- Wycofywanie nieudanych wpisów z archiwum otwartego do zapisu
+- Kopiowanie wpisów między archiwami bajt po bajcie (bez rekompresji)
+- Odczyt wpisów metodami, których zipfile nie obsługuje (np. zstd)
+- Zapis i odczyt dokładnego czasu modyfikacji w polu extra NTFS
+
+Standardowy moduł zipfile zawsze sam kompresuje zapisywane dane. Tutaj
+zapisujemy gotowy strumień (np. deflate skompresowany równolegle w blokach),
+korzystając z tych samych pól ZipFile, których używa ZipFile.open("w").
+"""
+
+import copy
+import struct
+import zipfile
+import zlib
+from collections.abc import Iterator
+
+# Bit flagi "sumy CRC i rozmiary zapisane za danymi" - u nas zawsze w nagłówku
+_FLAGA_DESKRYPTORA_DANYCH = 0x08
+
+# Nagłówek lokalny ZIP: stała część i położenie długości nazwy/pola extra
+_ROZMIAR_NAGLOWKA_LOKALNEGO = 30
+_FORMAT_DLUGOSCI_NAZWY_EXTRA = "<HH"
+_POZYCJA_DLUGOSCI_NAZWY_EXTRA = 26
+
+# Identyfikator pola extra ZIP64 - odtwarzany przez zipfile przy zapisie
+_ID_POLA_ZIP64 = 0x0001
+
+# Pole extra NTFS: czasy w jednostkach 100 ns od 1601 roku (UTC), więc - w
+# odróżnieniu od daty DOS - bez zaokrąglenia do 2 sekund i strefy czasowej
+_ID_POLA_NTFS = 0x000A
+_FORMAT_POLA_NTFS = "<HHIHHQQQ"  # id, długość, zarezerwowane, atrybut 1: czasy
+_EPOKA_NTFS = 116444736000000000  # 1970-01-01 w jednostkach 100 ns od 1601
+
+# Rozmiar bloku przy kopiowaniu wpisów
+_ROZMIAR_BLOKU_KOPII = 1024 * 1024
+
+
+class SurowyWpisZip:
+    """
+    Wpis archiwum ZIP zapisywany z danych już skompresowanych.
+
+    Najpierw zapisywany jest nagłówek lokalny z zerowymi sumami, potem dane,
+    a na końcu nagłówek jest nadpisywany prawdziwą sumą CRC i rozmiarami -
+    dokładnie tak, jak robi to zipfile przy zapisie do pliku.
+
+    Atrybuty:
+        zipf (zipfile.ZipFile): Archiwum otwarte do zapisu
+        info (zipfile.ZipInfo): Opis zapisywanego wpisu
+    """
+
+    def __init__(self, zipf: zipfile.ZipFile, info: zipfile.ZipInfo):
+        """
+        Rozpoczyna zapis wpisu - zapisuje nagłówek lokalny.
+
+        Args:
+            zipf (zipfile.ZipFile): Archiwum otwarte w trybie "w", "x" lub "a"
+            info (zipfile.ZipInfo): Opis wpisu; compress_type musi odpowiadać
+                metodzie, którą skompresowano dane, a file_size - oczekiwanemu
+                rozmiarowi danych (decyduje o użyciu ZIP64)
+
+        Raises:
+            ValueError: Gdy archiwum nie obsługuje przewijania
+        """
+        if not zipf.fp.seekable():
+            raise ValueError("zapis surowych wpisów wymaga pliku z przewijaniem")
+
+        self.zipf = zipf
+        self.info = info
+        self._zamkniety = False
+
+        info.flag_bits &= ~_FLAGA_DESKRYPTORA_DANYCH
+        info.compress_size = 0
+        info.CRC = 0
+        if not info.external_attr:
+            info.external_attr = 0o600 << 16  # uprawnienia: ?rw-------
+
+        # Skompresowane dane mogą być nieco większe od danych wejściowych
+        self._zip64 = info.file_size * 1.05 > zipfile.ZIP64_LIMIT
+
+        zipf.fp.seek(zipf.start_dir)
+        info.header_offset = zipf.fp.tell()
+        zipf._didModify = True  # tak samo robi ZipFile.open("w")
+        zipf.fp.write(info.FileHeader(self._zip64))
+
+    def zapisz(self, dane_skompresowane: bytes):
+        """
+        Dopisuje fragment skompresowanych danych.
+
+        Args:
+            dane_skompresowane (bytes): Kolejny fragment strumienia
+        """
+        self.zipf.fp.write(dane_skompresowane)
+        self.info.compress_size += len(dane_skompresowane)
+
+    def zamknij(self, crc: int, rozmiar_pliku: int):
+        """
+        Kończy wpis: uzupełnia nagłówek i dodaje wpis do katalogu archiwum.
+
+        Args:
+            crc (int): Suma CRC32 danych przed kompresją
+            rozmiar_pliku (int): Rozmiar danych przed kompresją
+
+        Raises:
+            RuntimeError: Gdy rozmiary wymagają ZIP64, a nagłówek go nie ma
+        """
+        if self._zamkniety:
+            return
+        self._zamkniety = True
+
+        self.info.CRC = crc
+        self.info.file_size = rozmiar_pliku
+        if not self._zip64 and (
+            rozmiar_pliku > zipfile.ZIP64_LIMIT
+            or self.info.compress_size > zipfile.ZIP64_LIMIT
+        ):
+            raise RuntimeError("rozmiar wpisu wymaga rozszerzeń ZIP64")
+
+        # Nadpisz nagłówek lokalny, zachowując pozycję końca danych
+        fp = self.zipf.fp
+        self.zipf.start_dir = fp.tell()
+        fp.seek(self.info.header_offset)
+        fp.write(self.info.FileHeader(self._zip64))
+        fp.seek(self.zipf.start_dir)
+
+        self.zipf.filelist.append(self.info)
+        self.zipf.NameToInfo[self.info.filename] = self.info
+
+
+def zapamietaj_stan(zipf: zipfile.ZipFile) -> tuple[int, int]:
+    """
+    Zapamiętuje stan archiwum przed dopisaniem wpisu.
+
+    Args:
+        zipf (zipfile.ZipFile): Archiwum otwarte do zapisu
+
+    Returns:
+        Tuple[int, int]: (pozycja_konca_danych, liczba_wpisow)
+    """
+    return zipf.start_dir, len(zipf.filelist)
+
+
+def wycofaj_do_stanu(zipf: zipfile.ZipFile, stan: tuple[int, int]):
+    """
+    Usuwa z archiwum wpisy dopisane po zapamiętaniu stanu.
+
+    Używane, gdy zapis pliku do wspólnego archiwum się nie powiódł -
+    bez tego w archiwum zostałby ucięty, ale "poprawny" wpis.
+
+    Args:
+        zipf (zipfile.ZipFile): Archiwum otwarte do zapisu
+        stan (Tuple[int, int]): Wynik zapamietaj_stan
+    """
+    pozycja, liczba_wpisow = stan
+
+    for info in zipf.filelist[liczba_wpisow:]:
+        zipf.NameToInfo.pop(info.filename, None)
+    del zipf.filelist[liczba_wpisow:]
+
+    # Przerwany zapis mógł zostawić otwarty uchwyt wpisu
+    zipf._writing = False
+    zipf.start_dir = pozycja
+    zipf.fp.seek(pozycja)
+    zipf.fp.truncate()
+
+
+def _usun_pole_zip64(extra: bytes) -> bytes:
+    """
+    Usuwa pole ZIP64 z danych extra wpisu.
+
+    zipfile dopisuje własne pole ZIP64 przy zapisie nagłówka, więc stare
+    pole z kopiowanego wpisu musi zniknąć, żeby się nie zdublowało.
+
+    Args:
+        extra (bytes): Pole extra wpisu
+
+    Returns:
+        bytes: Pole extra bez rekordu ZIP64
+    """
+    wynik = bytearray()
+    pozycja = 0
+    while pozycja + 4 <= len(extra):
+        identyfikator, dlugosc = struct.unpack_from("<HH", extra, pozycja)
+        koniec = pozycja + 4 + dlugosc
+        if identyfikator != _ID_POLA_ZIP64:
+            wynik += extra[pozycja:koniec]
+        pozycja = koniec
+    return bytes(wynik)
+
+
+def pole_czasu_ntfs(mtime_ns: int) -> bytes:
+    """
+    Tworzy pole extra NTFS z czasem modyfikacji pliku.
+
+    Czas ostatniego dostępu i utworzenia dostają tę samą wartość - pole
+    wymaga wszystkich trzech, a rozpakowujące narzędzia ustawiają z niego
+    czas modyfikacji.
+
+    Args:
+        mtime_ns (int): Czas modyfikacji w nanosekundach (os.stat().st_mtime_ns)
+
+    Returns:
+        bytes: Pole extra do ZipInfo.extra
+    """
+    czas = _EPOKA_NTFS + mtime_ns // 100
+    return struct.pack(_FORMAT_POLA_NTFS, _ID_POLA_NTFS, 32, 0, 1, 24, czas, czas, czas)
+
+
+def czas_z_pola_ntfs(extra: bytes) -> int | None:
+    """
+    Odczytuje czas modyfikacji z pola extra NTFS wpisu.
+
+    Args:
+        extra (bytes): Pole extra wpisu (ZipInfo.extra)
+
+    Returns:
+        int | None: Czas modyfikacji w nanosekundach (z dokładnością do
+            100 ns) lub None, gdy wpis nie ma pola NTFS
+    """
+    pozycja = 0
+    while pozycja + 4 <= len(extra):
+        identyfikator, dlugosc = struct.unpack_from("<HH", extra, pozycja)
+        if identyfikator == _ID_POLA_NTFS and 32 <= dlugosc <= len(extra) - pozycja - 4:
+            # Za 4 zarezerwowanymi bajtami atrybut 1 z czasami (mtime pierwszy)
+            atrybut, rozmiar = struct.unpack_from("<HH", extra, pozycja + 8)
+            if atrybut == 1 and rozmiar >= 24:
+                (czas,) = struct.unpack_from("<Q", extra, pozycja + 12)
+                return (czas - _EPOKA_NTFS) * 100
+        pozycja += 4 + dlugosc
+    return None
+
+
+def przejdz_do_danych(plik_archiwum, info: zipfile.ZipInfo):
+    """
+    Ustawia plik archiwum na początku skompresowanych danych wpisu.
+
+    Args:
+        plik_archiwum: Plik archiwum otwarty w trybie "rb"
+        info (zipfile.ZipInfo): Wpis archiwum (z jego katalogu)
+    """
+    # Dane zaczynają się za nagłówkiem lokalnym, którego długość zależy
+    # od długości nazwy i pola extra zapisanych w tym nagłówku
+    plik_archiwum.seek(info.header_offset + _POZYCJA_DLUGOSCI_NAZWY_EXTRA)
+    dlugosc_nazwy, dlugosc_extra = struct.unpack(
+        _FORMAT_DLUGOSCI_NAZWY_EXTRA, plik_archiwum.read(4)
+    )
+    plik_archiwum.seek(
+        info.header_offset + _ROZMIAR_NAGLOWKA_LOKALNEGO + dlugosc_nazwy + dlugosc_extra
+    )
+
+
+def kopiuj_wpis(plik_zrodlowy, info: zipfile.ZipInfo, zipf: zipfile.ZipFile):
+    """
+    Kopiuje skompresowany wpis z innego archiwum bez rozpakowywania.
+
+    Args:
+        plik_zrodlowy: Plik archiwum źródłowego otwarty w trybie "rb"
+        info (zipfile.ZipInfo): Wpis archiwum źródłowego (z jego katalogu)
+        zipf (zipfile.ZipFile): Archiwum docelowe otwarte do zapisu
+    """
+    przejdz_do_danych(plik_zrodlowy, info)
+
+    nowe_info = copy.copy(info)
+    nowe_info.extra = _usun_pole_zip64(info.extra)
+    wpis = SurowyWpisZip(zipf, nowe_info)
+
+    pozostalo = info.compress_size
+    while pozostalo > 0:
+        blok = plik_zrodlowy.read(min(_ROZMIAR_BLOKU_KOPII, pozostalo))
+        if not blok:
+            raise EOFError(f"ucięty wpis {info.filename} w archiwum źródłowym")
+        wpis.zapisz(blok)
+        pozostalo -= len(blok)
+
+    wpis.zamknij(info.CRC, info.file_size)
+
+
+def czytaj_wpis(
+    plik_archiwum,
+    info: zipfile.ZipInfo,
+    dekompresor,
+    rozmiar_bloku: int = _ROZMIAR_BLOKU_KOPII,
+) -> Iterator[bytes]:
+    """
+    Rozpakowuje wpis zapisany metodą, której zipfile nie obsługuje.
+
+    Dane są czytane i rozpakowywane blokami, więc pamięć nie zależy od
+    rozmiaru wpisu. Suma CRC-32 i rozmiar są sprawdzane na końcu - jak
+    w ZipFile.open, błąd pojawia się dopiero po ostatnim bloku.
+
+    Args:
+        plik_archiwum: Plik archiwum otwarty w trybie "rb"
+        info (zipfile.ZipInfo): Wpis archiwum (z jego katalogu)
+        dekompresor: Obiekt z metodą decompress(dane)
+        rozmiar_bloku (int): Najwięcej skompresowanych bajtów czytanych naraz
+
+    Yields:
+        bytes: Kolejne fragmenty rozpakowanych danych
+
+    Raises:
+        zipfile.BadZipFile: Gdy suma CRC-32 lub rozmiar się nie zgadzają
+        EOFError: Gdy dane wpisu są ucięte
+    """
+    przejdz_do_danych(plik_archiwum, info)
+
+    crc = 0
+    rozmiar = 0
+    pozostalo = info.compress_size
+    while pozostalo > 0:
+        blok = plik_archiwum.read(min(rozmiar_bloku, pozostalo))
+        if not blok:
+            raise EOFError(f"ucięty wpis {info.filename} w archiwum")
+        pozostalo -= len(blok)
+        dane = dekompresor.decompress(blok)
+        if dane:
+            crc = zlib.crc32(dane, crc)
+            rozmiar += len(dane)
+            yield dane
+
+    if rozmiar != info.file_size:
+        raise zipfile.BadZipFile(f"Bad size for file {info.filename!r}")
+    if crc != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+
+
+class StrumienKompresujacy:
+    """
+    Plikopodobny zapis wpisu ZIP przez zewnętrzny kompresor.
+
+    Działa jak obiekt zwracany przez ZipFile.open("w"), ale kompresję
+    wykonuje podany obiekt (np. kompresor zstd), którego zipfile nie zna.
+
+    Atrybuty:
+        wpis (SurowyWpisZip): Zapisywany wpis
+        kompresor: Obiekt z metodami compress(dane) i flush()
+    """
+
+    def __init__(self, zipf: zipfile.ZipFile, info: zipfile.ZipInfo, kompresor):
+        """
+        Rozpoczyna zapis wpisu.
+
+        Args:
+            zipf (zipfile.ZipFile): Archiwum otwarte do zapisu
+            info (zipfile.ZipInfo): Opis wpisu z ustawionym compress_type
+            kompresor: Obiekt z metodami compress(dane) i flush()
+        """
+        self.wpis = SurowyWpisZip(zipf, info)
+        self.kompresor = kompresor
+        self._crc = 0
+        self._rozmiar = 0
+
+    def write(self, dane) -> int:
+        """
+        Kompresuje i zapisuje fragment danych.
+
+        Args:
+            dane: Fragment danych (bytes lub memoryview)
+
+        Returns:
+            int: Liczba przyjętych bajtów
+        """
+        self._crc = zlib.crc32(dane, self._crc)
+        self._rozmiar += len(dane)
+        self.wpis.zapisz(self.kompresor.compress(dane))
+        return len(dane)
+
+    def close(self):
+        """Kończy strumień kompresora i zamyka wpis."""
+        self.wpis.zapisz(self.kompresor.flush())
+        self.wpis.zamknij(self._crc, self._rozmiar)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, typ_wyjatku, wyjatek, slad):
+        # Przy błędzie nie kończymy wpisu - archiwum i tak zostanie odrzucone
+        if typ_wyjatku is None:
+            self.close()
@@ -0,0 +1,127 @@
+# === BENCHMARK - CZAS IMPORTU MODUŁÓW ===
+"""
+Mierzy czas "zimnego" importu modułów SqueezeIt bez GUI.
+
+Każdy pomiar to nowy proces Pythona, więc liczy się wszystko, co moduł
+wczytuje przy starcie. Skrypt kończy się kodem 1, gdy mediana czasu
+przekracza limit albo gdy moduł wczytał bibliotekę GUI - można go
+uruchamiać w CI jako strażnika szybkiego startu.
+
+Uruchomienie (z głównego folderu projektu):
+    python benchmarki/czas_importu.py
+    python benchmarki/czas_importu.py --powtorzenia 21 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Główny folder projektu (tu leżą core.py, utils.py, cli.py)
+FOLDER_PROJEKTU = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Limity mediany czasu importu w milisekundach. CLI dodatkowo wczytuje
+# argparse, więc ma nieco wyższy limit niż sama biblioteka.
+LIMITY_MS = {
+    "utils": 50,
+    "core": 50,
+    "cli": 75,
+}
+
+# Moduły, których import bez GUI nie może wczytać
+MODULY_GUI = ("FreeSimpleGUI", "tkinter")
+
+# Program uruchamiany w osobnym procesie: mierzy import i sprawdza moduły GUI
+_PROGRAM_POMIARU = """
+import sys, time
+poczatek = time.perf_counter()
+import {modul}
+czas = time.perf_counter() - poczatek
+gui = [nazwa for nazwa in {moduly_gui!r} if nazwa in sys.modules]
+print(czas, ",".join(gui))
+"""
+
+
+def zmierz_import(modul: str, powtorzenia: int) -> tuple[list[float], list[str]]:
+    """
+    Mierzy czas importu modułu w nowych procesach.
+
+    Pierwsze uruchomienie tylko zapisuje skompilowany kod (.pyc) do
+    folderu tymczasowego - tak jak po instalacji, pomiary go nie kompilują.
+
+    Args:
+        modul (str): Nazwa modułu (np. "core")
+        powtorzenia (int): Liczba pomiarów
+
+    Returns:
+        Tuple[List[float], List[str]]: (czasy_ms, wczytane_moduly_gui)
+    """
+    program = _PROGRAM_POMIARU.format(modul=modul, moduly_gui=MODULY_GUI)
+
+    with tempfile.TemporaryDirectory() as folder_pyc:
+        srodowisko = dict(os.environ, PYTHONPYCACHEPREFIX=folder_pyc)
+        srodowisko.pop("PYTHONDONTWRITEBYTECODE", None)
+
+        czasy = []
+        moduly_gui = []
+        for numer in range(powtorzenia + 1):
+            wynik = subprocess.run(
+                [sys.executable, "-c", program],
+                cwd=FOLDER_PROJEKTU,
+                env=srodowisko,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            czas, gui = wynik.stdout.split(" ", 1)
+            if numer > 0:  # Pomiar 0 tylko rozgrzewa pamięć podręczną .pyc
+                czasy.append(float(czas) * 1000)
+            moduly_gui = [nazwa for nazwa in gui.strip().split(",") if nazwa]
+
+    return czasy, moduly_gui
+
+
+def main() -> int:
+    """
+    Uruchamia pomiary i porównuje je z limitami.
+
+    Returns:
+        int: 0 gdy wszystkie moduły mieszczą się w limitach, 1 w przeciwnym razie
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--powtorzenia", type=int, default=11)
+    parser.add_argument("--json", action="store_true", help="wynik jako JSON")
+    opcje = parser.parse_args()
+
+    wyniki = {}
+    for modul, limit_ms in LIMITY_MS.items():
+        czasy, moduly_gui = zmierz_import(modul, opcje.powtorzenia)
+        mediana = statistics.median(czasy)
+        wyniki[modul] = {
+            "mediana_ms": round(mediana, 2),
+            "min_ms": round(min(czasy), 2),
+            "limit_ms": limit_ms,
+            "moduly_gui": moduly_gui,
+            "ok": mediana <= limit_ms and not moduly_gui,
+        }
+
+    if opcje.json:
+        print(json.dumps(wyniki, indent=2, ensure_ascii=False))
+    else:
+        for modul, wynik in wyniki.items():
+            znak = "✅" if wynik["ok"] else "❌"
+            opis_gui = f" (wczytano GUI: {', '.join(wynik['moduly_gui'])})"
+            print(
+                f"{znak} import {modul}: {wynik['mediana_ms']:.1f} ms "
+                f"(min {wynik['min_ms']:.1f}, limit {wynik['limit_ms']} ms)"
+                f"{opis_gui if wynik['moduly_gui'] else ''}"
+            )
+
+    return 0 if all(wynik["ok"] for wynik in wyniki.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,497 @@
+# === BENCHMARK - PRZEPUSTOWOŚĆ I STOPIEŃ KOMPRESJI ===
+"""
+Mierzy przepustowość i stopień kompresji KompresorPlikow na korpusach testowych.
+
+Skrypt generuje powtarzalne (stałe ziarno losowania) korpusy: małe pliki
+tekstowe, duży CSV i JSON, już skompresowane pliki binarne oraz drzewo
+bardzo małych plików. Każdy pomiar to nowy proces Pythona, więc czas
+procesora i szczytowe zużycie pamięci (RSS) dotyczą tylko tego pomiaru.
+
+Wynik (JSON) można zapisać jako bazę i porównywać z nią kolejne wersje -
+tryb porównania kończy się kodem 1, gdy któryś pomiar się pogorszył.
+
+Uruchomienie (z głównego folderu projektu):
+    python benchmarki/przepustowosc.py --skala 0.1
+    python benchmarki/przepustowosc.py --wynik baza.json
+    python benchmarki/przepustowosc.py --porownaj baza.json
+    python benchmarki/przepustowosc.py --wczytaj nowy.json --porownaj baza.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Główny folder projektu (tu leżą core.py, utils.py, cli.py)
+FOLDER_PROJEKTU = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Wersja formatu korpusu - zmiana generatora wymaga nowej wersji
+WERSJA_KORPUSU = 1
+
+# Korpusy testowe; rozmiary podane dla skali 1.0
+KORPUSY = ("male_teksty", "duzy_csv", "duzy_json", "skompresowane", "drzewo_malych")
+
+# Metryki porównywane z bazą: (nazwa, czy_wiecej_znaczy_lepiej)
+METRYKI_POROWNANIA = (
+    ("mb_na_s", True),
+    ("stosunek", False),
+    ("szczyt_rss_mb", False),
+)
+
+# Program uruchamiany w osobnym procesie: jeden pomiar kompresji
+_PROGRAM_POMIARU = """
+import json, os, sys, time
+parametry = json.loads(sys.argv[1])
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from core import KompresorPlikow
+from skaner import SkanerPlikow
+
+cpu_przed = os.times()
+poczatek = time.perf_counter()
+
+skaner = SkanerPlikow()
+pliki = skaner.skanuj([parametry["korpus"]], rekurencyjnie=True)
+kompresor = KompresorPlikow(
+    parametry["folder_wyniku"],
+    parametry["poziom"],
+    liczba_procesow=parametry["procesy"],
+    kodek=parametry["kodek"],
+    nazwa_archiwum=parametry["nazwa_archiwum"],
+)
+kompresor.skaner = skaner
+kompresor.kompresuj_wiele_plikow(pliki)
+
+czas = time.perf_counter() - poczatek
+cpu_po = os.times()
+cpu = sum(cpu_po[:4]) - sum(cpu_przed[:4])  # Proces i zakończone procesy puli
+
+szczyt_rss_mb = None
+if resource is not None:
+    # Linux podaje ru_maxrss w KB, macOS w bajtach
+    jednostka = 1 if sys.platform == "darwin" else 1024
+    szczyt = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    szczyt_rss_mb = szczyt * jednostka / (1024 * 1024)
+
+podsumowanie = kompresor.wyniki_plikow.podsumowanie()
+print(json.dumps({
+    "czas_s": czas,
+    "cpu_s": cpu,
+    "szczyt_rss_mb": szczyt_rss_mb,
+    "liczba_plikow": podsumowanie["liczba_plikow"],
+    "liczba_bledow": podsumowanie["liczba_bledow"],
+    "bajty_przed": podsumowanie["rozmiar_przed"],
+    "bajty_po": podsumowanie["rozmiar_po"],
+}))
+"""
+
+
+# === GENEROWANIE KORPUSÓW ===
+
+
+def _slownik(los: random.Random, liczba_slow: int = 2000) -> list[str]:
+    """
+    Tworzy słownik pseudo-słów do generowania tekstu.
+
+    Args:
+        los (random.Random): Generator liczb losowych
+        liczba_slow (int): Liczba słów
+
+    Returns:
+        List[str]: Słowa z małych liter
+    """
+    litery = "aąbcćdeęfghijklłmnńoóprsśtuwyzźż"
+    return [
+        "".join(los.choice(litery) for _ in range(los.randint(3, 10)))
+        for _ in range(liczba_slow)
+    ]
+
+
+def _tekst(los: random.Random, slowa: list[str], rozmiar: int) -> str:
+    """
+    Tworzy tekst z losowych słów o przybliżonym rozmiarze.
+
+    Args:
+        los (random.Random): Generator liczb losowych
+        slowa (List[str]): Słownik
+        rozmiar (int): Docelowy rozmiar w znakach
+
+    Returns:
+        str: Tekst podzielony na wiersze
+    """
+    wiersze = []
+    dlugosc = 0
+    while dlugosc < rozmiar:
+        wiersz = " ".join(los.choices(slowa, k=12))
+        wiersze.append(wiersz)
+        dlugosc += len(wiersz) + 1
+    return "\n".join(wiersze) + "\n"
+
+
+def generuj_korpusy(folder: str, skala: float, ziarno: int) -> dict[str, str]:
+    """
+    Generuje korpusy testowe (albo używa wygenerowanych wcześniej).
+
+    Przy tych samych skali i ziarnie pliki są identyczne bajt w bajt, więc
+    wyniki z różnych dni i maszyn dotyczą tych samych danych.
+
+    Args:
+        folder (str): Folder korpusów
+        skala (float): Mnożnik rozmiarów (1.0 = ok. 75 MB danych)
+        ziarno (int): Ziarno generatora liczb losowych
+
+    Returns:
+        Dict[str, str]: {nazwa_korpusu: folder_korpusu}
+    """
+    foldery = {nazwa: os.path.join(folder, nazwa) for nazwa in KORPUSY}
+    opis = {"wersja": WERSJA_KORPUSU, "skala": skala, "ziarno": ziarno}
+    sciezka_opisu = os.path.join(folder, "korpus.json")
+
+    try:
+        with open(sciezka_opisu, encoding="utf-8") as f:
+            if json.load(f) == opis:
+                return foldery  # Korpus już jest
+    except (OSError, ValueError):
+        pass
+
+    if os.path.isdir(folder):
+        shutil.rmtree(folder)
+    for sciezka in foldery.values():
+        os.makedirs(sciezka)
+
+    los = random.Random(ziarno)
+    slowa = _slownik(los)
+
+    # Małe pliki tekstowe: 500 plików po 1-8 KB
+    for numer in range(max(int(500 * skala), 1)):
+        sciezka = os.path.join(foldery["male_teksty"], f"tekst_{numer:05d}.txt")
+        with open(sciezka, "w", encoding="utf-8") as f:
+            f.write(_tekst(los, slowa, los.randint(1024, 8192)))
+
+    # Duży CSV: ok. 32 MB
+    with open(
+        os.path.join(foldery["duzy_csv"], "dane.csv"), "w", encoding="utf-8"
+    ) as f:
+        f.write("id,data,kategoria,ilosc,cena\n")
+        rozmiar = 0
+        numer = 0
+        while rozmiar < 32 * 1024 * 1024 * skala:
+            wiersz = (
+                f"{numer},2024-{los.randint(1, 12):02d}-{los.randint(1, 28):02d},"
+                f"{los.choice(slowa)},{los.randint(1, 1000)},"
+                f"{los.random() * 1000:.2f}\n"
+            )
+            f.write(wiersz)
+            rozmiar += len(wiersz)
+            numer += 1
+
+    # Duży JSON (JSON lines): ok. 16 MB
+    with open(
+        os.path.join(foldery["duzy_json"], "zdarzenia.jsonl"), "w", encoding="utf-8"
+    ) as f:
+        rozmiar = 0
+        numer = 0
+        while rozmiar < 16 * 1024 * 1024 * skala:
+            wiersz = json.dumps(
+                {
+                    "id": numer,
+                    "uzytkownik": los.choice(slowa),
+                    "akcja": los.choice(("start", "stop", "zapis", "odczyt")),
+                    "czas_ms": los.randint(1, 5000),
+                    "opis": " ".join(los.choices(slowa, k=6)),
+                },
+                ensure_ascii=False,
+            )
+            f.write(wiersz + "\n")
+            rozmiar += len(wiersz) + 1
+            numer += 1
+
+    # Już skompresowane pliki binarne: 4 pliki po 4 MB losowych bajtów
+    for numer in range(4):
+        sciezka = os.path.join(foldery["skompresowane"], f"archiwum_{numer}.bin")
+        with open(sciezka, "wb") as f:
+            f.write(los.randbytes(max(int(4 * 1024 * 1024 * skala), 1)))
+
+    # Drzewo bardzo małych plików: 20 folderów po 100 plików po 50-500 B
+    for numer_folderu in range(20):
+        podfolder = os.path.join(
+            foldery["drzewo_malych"], f"folder_{numer_folderu:02d}"
+        )
+        os.makedirs(podfolder)
+        for numer in range(max(int(100 * skala), 1)):
+            sciezka = os.path.join(podfolder, f"plik_{numer:04d}.txt")
+            with open(sciezka, "w", encoding="utf-8") as f:
+                f.write(_tekst(los, slowa, los.randint(50, 500)))
+
+    with open(sciezka_opisu, "w", encoding="utf-8") as f:
+        json.dump(opis, f)
+    return foldery
+
+
+# === POMIARY ===
+
+
+def zmierz(
+    folder_korpusu: str,
+    kodek: str,
+    poziom: int,
+    procesy: int,
+    wspolne_archiwum: bool,
+    powtorzenia: int,
+) -> dict:
+    """
+    Mierzy kompresję korpusu w nowych procesach i zwraca medianę pomiarów.
+
+    Args:
+        folder_korpusu (str): Folder z plikami do kompresji
+        kodek (str): Nazwa kodeka
+        poziom (int): Poziom kompresji (1-9)
+        procesy (int): Liczba procesów roboczych
+        wspolne_archiwum (bool): True = jedno archiwum zamiast archiwum na plik
+        powtorzenia (int): Liczba pomiarów
+
+    Returns:
+        dict: czas_s, czas_min_s, cpu_s, szczyt_rss_mb, mb_na_s, stosunek,
+            liczba_plikow, liczba_bledow, bajty_przed, bajty_po
+    """
+    pomiary = []
+    for _ in range(powtorzenia):
+        with tempfile.TemporaryDirectory() as folder_wyniku:
+            parametry = {
+                "korpus": folder_korpusu,
+                "folder_wyniku": folder_wyniku,
+                "kodek": kodek,
+                "poziom": poziom,
+                "procesy": procesy,
+                "nazwa_archiwum": "korpus.zip" if wspolne_archiwum else None,
+            }
+            wynik = subprocess.run(
+                [sys.executable, "-c", _PROGRAM_POMIARU, json.dumps(parametry)],
+                cwd=FOLDER_PROJEKTU,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            pomiary.append(json.loads(wynik.stdout))
+
+    czas = statistics.median(pomiar["czas_s"] for pomiar in pomiary)
+    ostatni = pomiary[-1]
+    rss = [pomiar["szczyt_rss_mb"] for pomiar in pomiary if pomiar["szczyt_rss_mb"]]
+    return {
+        "czas_s": round(czas, 4),
+        "czas_min_s": round(min(pomiar["czas_s"] for pomiar in pomiary), 4),
+        "cpu_s": round(statistics.median(pomiar["cpu_s"] for pomiar in pomiary), 4),
+        "szczyt_rss_mb": round(max(rss), 1) if rss else None,
+        "mb_na_s": round(ostatni["bajty_przed"] / (1024 * 1024) / czas, 2),
+        "stosunek": round(ostatni["bajty_po"] / max(ostatni["bajty_przed"], 1), 4),
+        "liczba_plikow": ostatni["liczba_plikow"],
+        "liczba_bledow": ostatni["liczba_bledow"],
+        "bajty_przed": ostatni["bajty_przed"],
+        "bajty_po": ostatni["bajty_po"],
+    }
+
+
+def _klucz(pomiar: dict) -> tuple:
+    """Identyfikuje pomiar przy porównaniu z bazą."""
+    return (
+        pomiar["korpus"],
+        pomiar["kodek"],
+        pomiar["poziom"],
+        pomiar["procesy"],
+        pomiar["wspolne_archiwum"],
+    )
+
+
+def porownaj(baza: dict, biezace: dict, tolerancja: float) -> list[dict]:
+    """
+    Porównuje wyniki z bazą.
+
+    Pomiar jest regresją, gdy przepustowość spadła albo stosunek kompresji
+    lub szczytowa pamięć wzrosły o więcej niż tolerancja. Pomiary obecne
+    tylko w jednym z wyników są pomijane.
+
+    Args:
+        baza (dict): Zapisany wcześniej wynik
+        biezace (dict): Bieżący wynik
+        tolerancja (float): Dopuszczalna względna zmiana (np. 0.1 = 10%)
+
+    Returns:
+        List[dict]: Zmiany: pomiar, metryka, baza, biezaca, zmiana
+            (względna, dodatnia = lepiej) i regresja (bool)
+    """
+    pomiary_bazy = {_klucz(pomiar): pomiar for pomiar in baza["pomiary"]}
+    zmiany = []
+    for pomiar in biezace["pomiary"]:
+        pomiar_bazy = pomiary_bazy.get(_klucz(pomiar))
+        if pomiar_bazy is None:
+            continue
+        for metryka, wiecej_lepiej in METRYKI_POROWNANIA:
+            stara, nowa = pomiar_bazy.get(metryka), pomiar.get(metryka)
+            if not stara or nowa is None:
+                continue
+            zmiana = (nowa - stara) / stara
+            if not wiecej_lepiej:
+                zmiana = -zmiana
+            zmiany.append(
+                {
+                    "pomiar": "/".join(str(czesc) for czesc in _klucz(pomiar)),
+                    "metryka": metryka,
+                    "baza": stara,
+                    "biezaca": nowa,
+                    "zmiana": round(zmiana, 4),
+                    "regresja": zmiana < -tolerancja,
+                }
+            )
+    return zmiany
+
+
+def _lista(tekst: str, typ=str) -> list:
+    """Zamienia listę rozdzieloną przecinkami (np. '1,6,9') na listę wartości."""
+    return [typ(czesc) for czesc in tekst.split(",") if czesc]
+
+
+def main() -> int:
+    """
+    Uruchamia pomiary, zapisuje je i porównuje z bazą.
+
+    Returns:
+        int: 0 gdy nie ma regresji, 1 gdy porównanie wykazało regresję
+    """
+    from kodeki import KODEKI  # Po ustawieniu sys.path na folder projektu
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--skala", type=float, default=0.25, help="mnożnik rozmiaru korpusów"
+    )
+    parser.add_argument("--ziarno", type=int, default=2024)
+    parser.add_argument("--korpusy", type=_lista, default=list(KORPUSY))
+    parser.add_argument(
+        "--kodeki",
+        type=_lista,
+        default=[k for k in ("deflate", "lzma", "zstd") if k in KODEKI],
+    )
+    parser.add_argument(
+        "--poziomy", type=lambda tekst: _lista(tekst, int), default=[1, 6, 9]
+    )
+    parser.add_argument(
+        "--procesy",
+        type=lambda tekst: _lista(tekst, int),
+        default=sorted({1, os.cpu_count() or 1}),
+    )
+    parser.add_argument(
+        "--wspolne-archiwum", action="store_true", help="jedno archiwum na korpus"
+    )
+    parser.add_argument("--powtorzenia", type=int, default=3)
+    parser.add_argument(
+        "--folder-korpusu", help="gdzie trzymać korpusy (domyślnie folder tymczasowy)"
+    )
+    parser.add_argument(
+        "--wynik", metavar="PLIK", help="zapisz wynik jako JSON (np. baza)"
+    )
+    parser.add_argument(
+        "--wczytaj", metavar="PLIK", help="nie mierz - użyj zapisanego wyniku"
+    )
+    parser.add_argument("--porownaj", metavar="BAZA", help="porównaj wynik z bazą")
+    parser.add_argument(
+        "--tolerancja",
+        type=float,
+        default=0.10,
+        help="dopuszczalne pogorszenie (0.10 = 10%%)",
+    )
+    parser.add_argument("--json", action="store_true", help="wypisz wynik jako JSON")
+    opcje = parser.parse_args()
+
+    if opcje.wczytaj:
+        with open(opcje.wczytaj, encoding="utf-8") as f:
+            wynik = json.load(f)
+    else:
+        folder_korpusu = opcje.folder_korpusu or os.path.join(
+            tempfile.gettempdir(), f"squeezeit-korpus-{opcje.ziarno}-{opcje.skala}"
+        )
+        foldery = generuj_korpusy(folder_korpusu, opcje.skala, opcje.ziarno)
+
+        wynik = {
+            "srodowisko": {
+                "python": platform.python_version(),
+                "system": platform.platform(),
+                "procesor": platform.processor() or platform.machine(),
+                "rdzenie": os.cpu_count(),
+            },
+            "parametry": {
+                "skala": opcje.skala,
+                "ziarno": opcje.ziarno,
+                "powtorzenia": opcje.powtorzenia,
+            },
+            "pomiary": [],
+        }
+        for korpus in opcje.korpusy:
+            for kodek in opcje.kodeki:
+                for poziom in opcje.poziomy:
+                    for procesy in opcje.procesy:
+                        pomiar = {
+                            "korpus": korpus,
+                            "kodek": kodek,
+                            "poziom": poziom,
+                            "procesy": procesy,
+                            "wspolne_archiwum": opcje.wspolne_archiwum,
+                        }
+                        pomiar.update(
+                            zmierz(
+                                foldery[korpus],
+                                kodek,
+                                poziom,
+                                procesy,
+                                opcje.wspolne_archiwum,
+                                opcje.powtorzenia,
+                            )
+                        )
+                        wynik["pomiary"].append(pomiar)
+                        if not opcje.json:
+                            print(
+                                f"⏱️ {korpus:14} {kodek:8} poziom {poziom} "
+                                f"procesy {procesy:2}: {pomiar['mb_na_s']:8.1f} MB/s, "
+                                f"stosunek {pomiar['stosunek']:.3f}, "
+                                f"CPU {pomiar['cpu_s']:.2f} s, "
+                                f"RSS {pomiar['szczyt_rss_mb']} MB",
+                                file=sys.stderr,
+                            )
+
+    if opcje.wynik:
+        with open(opcje.wynik, "w", encoding="utf-8") as f:
+            json.dump(wynik, f, indent=2, ensure_ascii=False)
+
+    if opcje.json:
+        print(json.dumps(wynik, indent=2, ensure_ascii=False))
+
+    if not opcje.porownaj:
+        return 0
+
+    with open(opcje.porownaj, encoding="utf-8") as f:
+        baza = json.load(f)
+    zmiany = porownaj(baza, wynik, opcje.tolerancja)
+    for zmiana in zmiany:
+        znak = "❌" if zmiana["regresja"] else "✅"
+        print(
+            f"{znak} {zmiana['pomiar']} {zmiana['metryka']}: "
+            f"{zmiana['baza']} -> {zmiana['biezaca']} ({zmiana['zmiana']:+.1%})"
+        )
+    regresje = sum(zmiana["regresja"] for zmiana in zmiany)
+    print(f"📊 Porównano {len(zmiany)} wartości, regresje: {regresje}")
+    return 1 if regresje else 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, FOLDER_PROJEKTU)
+    sys.exit(main())
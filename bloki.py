@@ -0,0 +1,114 @@
+# === MODUŁ BLOKI - KOMPRESJA BLOKOWA ===
+"""
+Moduł zawierający kompresję dużych plików w niezależnych blokach.
+Odpowiedzialny za:
+- Podział danych na bloki
+- Równoległą kompresję bloków na wielu rdzeniach
+- Sklejanie bloków w jeden poprawny strumień deflate
+
+Działa jak pigz: każdy blok kompresowany jest osobno, a wszystkie bloki
+poza ostatnim kończone są "flush" (Z_SYNC_FLUSH). Taki blok kończy się
+na granicy bajtu i nie zamyka strumienia, więc bloki można po prostu
+skleić. Każdy blok dostaje jako słownik ostatnie 32 KB poprzedniego
+bloku, więc stopień kompresji jest prawie taki sam jak przy jednym wątku.
+Bez słownika (niezalezne=True) każdy blok da się rozpakować osobno -
+z tego korzysta tryb dostępu swobodnego (moduł indeks).
+"""
+
+import zlib
+from collections import deque
+from collections.abc import Iterator
+from typing import BinaryIO
+
+# Rozmiar okna deflate - tyle danych z poprzedniego bloku może być użyte
+ROZMIAR_OKNA_DEFLATE = 32 * 1024
+
+
+def kompresuj_blok_deflate(
+    dane: bytes, poziom: int, slownik: bytes | None, ostatni: bool
+) -> bytes:
+    """
+    Kompresuje jeden blok do surowego fragmentu strumienia deflate.
+
+    Args:
+        dane (bytes): Dane bloku
+        poziom (int): Poziom kompresji (1-9)
+        slownik (bytes | None): Końcówka poprzedniego bloku (lub None)
+        ostatni (bool): Czy to ostatni blok strumienia
+
+    Returns:
+        bytes: Skompresowany fragment strumienia
+    """
+    # wbits=-15 oznacza surowy deflate (bez nagłówka zlib) - taki jak w ZIP
+    if slownik:
+        kompresor = zlib.compressobj(poziom, zlib.DEFLATED, -15, zdict=slownik)
+    else:
+        kompresor = zlib.compressobj(poziom, zlib.DEFLATED, -15)
+
+    wynik = kompresor.compress(dane)
+    return wynik + kompresor.flush(zlib.Z_FINISH if ostatni else zlib.Z_SYNC_FLUSH)
+
+
+def kompresuj_deflate_rownolegle(
+    zrodlo: BinaryIO,
+    poziom: int,
+    rozmiar_bloku: int,
+    liczba_watkow: int,
+    niezalezne: bool = False,
+) -> Iterator[tuple[bytes, bytes]]:
+    """
+    Kompresuje strumień równolegle w blokach.
+
+    Moduł zlib zwalnia GIL na czas kompresji, więc zwykłe wątki
+    wykorzystują wszystkie rdzenie bez kopiowania danych między procesami.
+    W pamięci jest jednocześnie najwyżej 2 * liczba_watkow bloków.
+
+    Args:
+        zrodlo (BinaryIO): Strumień danych wejściowych; read() może zwracać
+            memoryview (np. na zmapowany plik) - bloki nie są wtedy kopiowane
+        poziom (int): Poziom kompresji (1-9)
+        rozmiar_bloku (int): Rozmiar bloku w bajtach
+        liczba_watkow (int): Liczba wątków kompresujących
+        niezalezne (bool): True = bloki bez słownika z poprzedniego bloku -
+            każdy da się rozpakować osobno (kosztem nieco gorszej kompresji
+            początku bloku)
+
+    Yields:
+        Tuple[bytes | memoryview, bytes]: (dane_bloku, skompresowany_blok)
+            w kolejności bloków; sklejone skompresowane bloki tworzą jeden
+            strumień deflate
+    """
+    # Import na miejscu - concurrent.futures wydłuża start programu
+    from concurrent.futures import ThreadPoolExecutor
+
+    limit_w_toku = 2 * liczba_watkow
+    w_toku = deque()
+
+    with ThreadPoolExecutor(max_workers=liczba_watkow) as pula:
+        slownik = None
+        blok = zrodlo.read(rozmiar_bloku)
+
+        # Pusty plik - strumień deflate zawierający tylko blok końcowy
+        if not blok:
+            yield b"", kompresuj_blok_deflate(b"", poziom, None, True)
+            return
+
+        while blok:
+            # Czytamy z wyprzedzeniem, żeby wiedzieć, czy blok jest ostatni
+            nastepny = zrodlo.read(rozmiar_bloku)
+            zadanie = pula.submit(
+                kompresuj_blok_deflate, blok, poziom, slownik, not nastepny
+            )
+            w_toku.append((blok, zadanie))
+            if not niezalezne:
+                slownik = blok[-ROZMIAR_OKNA_DEFLATE:]
+
+            if len(w_toku) >= limit_w_toku:
+                dane, zadanie = w_toku.popleft()
+                yield dane, zadanie.result()
+
+            blok = nastepny
+
+        while w_toku:
+            dane, zadanie = w_toku.popleft()
+            yield dane, zadanie.result()
@@ -0,0 +1,407 @@
+# === MODUŁ CIĄGŁY - ARCHIWUM CIĄGŁE DLA MAŁYCH PLIKÓW ===
+"""
+Moduł zawierający bloki ciągłe - wiele małych plików w jednym wpisie.
+Odpowiedzialny za:
+- Zbieranie małych plików w blok ciągły (strumień tar w pamięci)
+- Spis plików bloku: położenie i suma CRC-32 każdego pliku
+- Odczyt pojedynczych plików z bloków (CzytnikCiagly)
+- Rozkładanie bloku na pliki przy rozpakowywaniu
+
+Każdy wpis ZIP ma własny nagłówek lokalny, wpis w katalogu centralnym
+i osobny strumień kompresji, który zaczyna od pustego słownika. Dla
+plików po kilka KB to większość kosztu: tysiące powtórzonych nagłówków
+kodu źródłowego czy logów kompresują się osobno, choć są niemal takie
+same. Blok ciągły skleja małe pliki w jeden strumień tar i kompresuje
+go jako jeden wpis - kompresor widzi podobieństwa między plikami,
+a archiwum ma jeden wpis zamiast setek.
+
+Blok ".squeezeit/ciagly_000001.tar" to zwykły plik tar, więc pliki
+odzyska też unzip + tar. Obok leży spis ".squeezeit/ciagly_000001.json",
+dzięki któremu CzytnikCiagly znajduje plik bez czytania innych bloków.
+"""
+
+import io
+import struct
+import zipfile
+import zlib
+from collections.abc import Iterator
+
+# Folder wpisów trybu ciągłego w archiwum
+FOLDER_CIAGLY = ".squeezeit/"
+
+# Pliki nie większe od tego trafiają do bloków ciągłych (64 KB)
+MAKS_ROZMIAR_PLIKU_CIAGLEGO = 64 * 1024
+
+# Rozmiar bloku ciągłego przed kompresją (4 MB) - większy blok to lepsza
+# kompresja, ale wolniejszy odczyt pojedynczego pliku
+ROZMIAR_BLOKU_CIAGLEGO = 4 * 1024 * 1024
+
+# Wersja formatu spisu bloku
+WERSJA_SPISU = 1
+
+# Rekord tar ma 512 bajtów; archiwum kończą dwa puste rekordy
+_ROZMIAR_REKORDU_TAR = 512
+_KONIEC_TAR = bytes(2 * _ROZMIAR_REKORDU_TAR)
+
+# Nagłówek ustar: nazwa, tryb, uid, gid, rozmiar, czas, suma kontrolna, typ,
+# dowiązanie, znacznik, wersja, użytkownik, grupa, urządzenie (2x), prefiks
+_NAGLOWEK_USTAR = struct.Struct("100s8s8s8s12s12s8sc100s6s2s32s32s8s8s155s12x")
+_POLOZENIE_SUMY = 148
+_MAKS_CZAS_USTAR = 8**11  # Czas zapisany ósemkowo na 11 cyfrach
+
+
+def _naglowek_tar(nazwa: str, rozmiar: int, czas: int, tryb: int) -> bytes:
+    """
+    Tworzy nagłówek tar pliku.
+
+    Typowy nagłówek (nazwa do 100 bajtów) składamy sami - tarfile.TarInfo
+    jest kilka razy wolniejszy, a przy tysiącach małych plików to koszt
+    porównywalny z kompresją. Długie nazwy i nietypowe czasy obsługuje
+    tarfile (format PAX).
+
+    Args:
+        nazwa (str): Nazwa pliku w archiwum
+        rozmiar (int): Rozmiar pliku w bajtach
+        czas (int): Czas modyfikacji (sekundy epoki)
+        tryb (int): Uprawnienia pliku
+
+    Returns:
+        bytes: Nagłówek (wielokrotność 512 bajtów)
+    """
+    nazwa_bajty = nazwa.encode("utf-8", "surrogateescape")
+    if len(nazwa_bajty) > 100 or not 0 <= czas < _MAKS_CZAS_USTAR:
+        # Import na miejscu - tarfile potrzebny tylko w trybie ciągłym
+        import tarfile
+
+        naglowek = tarfile.TarInfo(nazwa)
+        naglowek.size = rozmiar
+        naglowek.mtime = czas
+        naglowek.mode = tryb
+        # PAX zapisuje dowolnie długie nazwy w UTF-8
+        return naglowek.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+
+    naglowek = bytearray(
+        _NAGLOWEK_USTAR.pack(
+            nazwa_bajty,
+            b"%07o\0" % tryb,
+            b"0000000\0",
+            b"0000000\0",
+            b"%011o\0" % rozmiar,
+            b"%011o\0" % czas,
+            b" " * 8,  # Przy liczeniu sumy pole sumy to spacje
+            b"0",  # Zwykły plik
+            b"",
+            b"ustar\0",
+            b"00",
+            b"",
+            b"",
+            b"",
+            b"",
+            b"",
+        )
+    )
+    naglowek[_POLOZENIE_SUMY : _POLOZENIE_SUMY + 8] = b"%06o\0 " % sum(naglowek)
+    return bytes(naglowek)
+
+
+def nazwa_bloku(numer: int) -> str:
+    """
+    Tworzy nazwę wpisu bloku ciągłego.
+
+    Args:
+        numer (int): Numer bloku w archiwum (od 1)
+
+    Returns:
+        str: Nazwa wpisu bloku (spis ma tę samą nazwę z rozszerzeniem .json)
+    """
+    return f"{FOLDER_CIAGLY}ciagly_{numer:06d}.tar"
+
+
+def nazwa_spisu(nazwa_bloku: str) -> str:
+    """
+    Zwraca nazwę wpisu ze spisem bloku ciągłego.
+
+    Args:
+        nazwa_bloku (str): Nazwa wpisu bloku
+
+    Returns:
+        str: Nazwa wpisu spisu
+    """
+    return nazwa_bloku.removesuffix(".tar") + ".json"
+
+
+def czy_blok_ciagly(nazwa_wpisu: str) -> bool:
+    """
+    Sprawdza, czy wpis archiwum jest blokiem ciągłym.
+
+    Args:
+        nazwa_wpisu (str): Nazwa wpisu
+
+    Returns:
+        bool: True dla wpisów ".squeezeit/ciagly_*.tar"
+    """
+    return nazwa_wpisu.startswith(FOLDER_CIAGLY + "ciagly_") and nazwa_wpisu.endswith(
+        ".tar"
+    )
+
+
+def czy_spis_ciagly(nazwa_wpisu: str) -> bool:
+    """
+    Sprawdza, czy wpis archiwum jest spisem bloku ciągłego.
+
+    Args:
+        nazwa_wpisu (str): Nazwa wpisu
+
+    Returns:
+        bool: True dla wpisów ".squeezeit/ciagly_*.json"
+    """
+    return nazwa_wpisu.startswith(FOLDER_CIAGLY + "ciagly_") and nazwa_wpisu.endswith(
+        ".json"
+    )
+
+
+class BlokCiagly:
+    """
+    Blok ciągły zbierany w pamięci przed zapisem do archiwum.
+
+    Pliki są dopisywane od razu jako rekordy tar (nagłówek, dane,
+    dopełnienie do 512 bajtów), więc zapis bloku to jeden strumień bez
+    dodatkowego kopiowania.
+
+    Atrybuty:
+        pliki (list): [[nazwa, przesuniecie, rozmiar, crc]] - spis bloku;
+            przesunięcie to początek danych pliku w strumieniu tar
+        stosunek (float): Stopień kompresji ostatnio zapisanego bloku -
+            szacunek rozmiaru po kompresji dla bloku zbieranego
+    """
+
+    def __init__(self):
+        """Tworzy pusty blok."""
+        self._dane = bytearray()
+        self.pliki = []
+        self._konce = []  # Koniec rekordu tar każdego pliku w strumieniu
+        self.stosunek = 1.0
+
+    def __len__(self) -> int:
+        return len(self.pliki)
+
+    @property
+    def rozmiar(self) -> int:
+        """Rozmiar strumienia tar bloku w bajtach (bez rekordów końca)."""
+        return len(self._dane)
+
+    def szacuj_rozmiar_po(self) -> int:
+        """
+        Szacuje rozmiar bloku po kompresji (np. dla limitu woluminu).
+
+        Returns:
+            int: Rozmiar bloku razy stopień kompresji poprzedniego bloku
+        """
+        return int(len(self._dane) * self.stosunek)
+
+    def dodaj(self, nazwa: str, dane: bytes, czas_modyfikacji: float, tryb: int):
+        """
+        Dopisuje plik do bloku.
+
+        Args:
+            nazwa (str): Nazwa pliku w archiwum (ścieżka z "/")
+            dane (bytes): Zawartość pliku
+            czas_modyfikacji (float): Czas modyfikacji pliku (sekundy epoki)
+            tryb (int): Uprawnienia pliku (st_mode)
+        """
+        self._dane += _naglowek_tar(
+            nazwa, len(dane), int(czas_modyfikacji), tryb & 0o7777
+        )
+        self.pliki.append([nazwa, len(self._dane), len(dane), zlib.crc32(dane)])
+        self._dane += dane
+        self._dane += bytes(-len(dane) % _ROZMIAR_REKORDU_TAR)
+        self._konce.append(len(self._dane))
+
+    def podziel(self, wartosc: int) -> list[int]:
+        """
+        Dzieli wartość bloku (np. rozmiar po kompresji) między jego pliki.
+
+        Udział pliku jest proporcjonalny do rozmiaru jego rekordu tar,
+        a udziały sumują się dokładnie do wartości.
+
+        Args:
+            wartosc (int): Wartość całego bloku
+
+        Returns:
+            List[int]: Udziały plików w kolejności dodania
+        """
+        calosc = self.rozmiar or 1
+        udzialy = []
+        poprzedni = 0
+        for koniec in self._konce:
+            biezacy = wartosc * koniec // calosc
+            udzialy.append(biezacy - poprzedni)
+            poprzedni = biezacy
+        return udzialy
+
+    def dane(self) -> bytearray:
+        """
+        Zwraca cały strumień tar bloku (z rekordami końca archiwum).
+
+        Returns:
+            bytearray: Dane wpisu bloku
+        """
+        return self._dane + _KONIEC_TAR
+
+    def spis(self) -> bytes:
+        """
+        Zwraca spis bloku w formacie JSON.
+
+        Returns:
+            bytes: {"wersja": 1, "pliki": [[nazwa, przesuniecie, rozmiar, crc]]}
+        """
+        # Import na miejscu - json potrzebny tylko w trybie ciągłym
+        import json
+
+        return json.dumps(
+            {"wersja": WERSJA_SPISU, "pliki": self.pliki}, ensure_ascii=False
+        ).encode("utf-8")
+
+    def wyczysc(self):
+        """Opróżnia blok (po zapisie lub nieudanej próbie zapisu)."""
+        self._dane = bytearray()
+        self.pliki = []
+        self._konce = []
+
+
+def pliki_bloku(dane: bytes) -> Iterator[tuple[str, memoryview, int]]:
+    """
+    Rozkłada rozpakowany blok ciągły na pliki.
+
+    Blok jest czytany jako zwykły strumień tar (bez spisu), więc działa
+    także dla bloku, którego spis zaginął. Pomijane są wpisy inne niż
+    zwykłe pliki.
+
+    Args:
+        dane (bytes): Rozpakowany wpis bloku
+
+    Yields:
+        Tuple[str, memoryview, int]: (nazwa pliku, dane, czas modyfikacji)
+
+    Raises:
+        tarfile.TarError: Gdy blok nie jest poprawnym strumieniem tar
+    """
+    # Import na miejscu - tarfile potrzebny tylko w trybie ciągłym
+    import tarfile
+
+    widok = memoryview(dane)
+    with tarfile.open(fileobj=io.BytesIO(dane), mode="r:", encoding="utf-8") as tar:
+        for naglowek in tar:
+            if naglowek.isfile():
+                poczatek = naglowek.offset_data
+                yield (
+                    naglowek.name,
+                    widok[poczatek : poczatek + naglowek.size],
+                    naglowek.mtime,
+                )
+
+
+class CzytnikCiagly:
+    """
+    Odczyt pojedynczych plików z bloków ciągłych archiwum.
+
+    Przy otwarciu wczytywane są tylko spisy bloków (małe wpisy JSON).
+    Odczyt pliku rozpakowuje jego blok - ostatnio użyty blok jest
+    pamiętany, więc czytanie plików po kolei rozpakowuje każdy blok raz.
+    Suma CRC-32 każdego pliku jest sprawdzana.
+
+    Obiekt nie jest bezpieczny dla wielu wątków naraz.
+    """
+
+    def __init__(self, sciezka_archiwum: str):
+        """
+        Otwiera archiwum i wczytuje spisy bloków.
+
+        Args:
+            sciezka_archiwum (str): Ścieżka archiwum ZIP
+
+        Raises:
+            OSError: Gdy archiwum nie da się otworzyć
+            zipfile.BadZipFile: Gdy plik nie jest archiwum ZIP
+            KeyError: Gdy brakuje spisu bloku
+            ValueError: Gdy spis bloku jest uszkodzony
+        """
+        # Import na miejscu - json potrzebny tylko w trybie ciągłym
+        import json
+
+        self._zipf = zipfile.ZipFile(sciezka_archiwum)
+        self._pliki = {}  # {nazwa: (blok, przesuniecie, rozmiar, crc)}
+        try:
+            for info in self._zipf.infolist():
+                blok = info.filename
+                if not czy_blok_ciagly(blok):
+                    continue
+                spis = json.loads(self._zipf.read(nazwa_spisu(blok)))
+                if spis.get("wersja") != WERSJA_SPISU:
+                    raise ValueError(f"nieobsługiwana wersja spisu bloku {blok}")
+                for nazwa, przesuniecie, rozmiar, crc in spis["pliki"]:
+                    self._pliki[nazwa] = (blok, przesuniecie, rozmiar, crc)
+        except BaseException:
+            self._zipf.close()
+            raise
+        self._ostatni_blok = (None, b"")  # (nazwa, dane) ostatnio rozpakowanego
+
+    def pliki(self) -> list[str]:
+        """
+        Zwraca nazwy plików zapisanych w blokach ciągłych.
+
+        Returns:
+            List[str]: Nazwy plików w kolejności zapisu
+        """
+        return list(self._pliki)
+
+    def __contains__(self, nazwa: str) -> bool:
+        return nazwa in self._pliki
+
+    def rozmiar(self, nazwa: str) -> int:
+        """
+        Zwraca rozmiar pliku.
+
+        Args:
+            nazwa (str): Nazwa pliku w archiwum
+
+        Returns:
+            int: Rozmiar w bajtach
+
+        Raises:
+            KeyError: Gdy bloki nie zawierają pliku
+        """
+        return self._pliki[nazwa][2]
+
+    def czytaj(self, nazwa: str) -> bytes:
+        """
+        Czyta plik z bloku ciągłego.
+
+        Args:
+            nazwa (str): Nazwa pliku w archiwum
+
+        Returns:
+            bytes: Zawartość pliku
+
+        Raises:
+            KeyError: Gdy bloki nie zawierają pliku
+            zipfile.BadZipFile: Gdy suma CRC-32 pliku się nie zgadza
+        """
+        blok, przesuniecie, rozmiar, crc = self._pliki[nazwa]
+        if self._ostatni_blok[0] != blok:
+            self._ostatni_blok = (blok, self._zipf.read(blok))
+        dane = self._ostatni_blok[1][przesuniecie : przesuniecie + rozmiar]
+        if zlib.crc32(dane) != crc:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {nazwa!r} in {blok!r}")
+        return dane
+
+    def zamknij(self):
+        """Zamyka archiwum."""
+        self._ostatni_blok = (None, b"")
+        self._zipf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, typ_wyjatku, wyjatek, slad):
+        self.zamknij()
@@ -0,0 +1,637 @@
+# === MODUŁ CLI - URUCHAMIANIE Z WIERSZA POLECEŃ ===
+"""
+Moduł zawierający wersję SqueezeIt bez interfejsu graficznego.
+Odpowiedzialny za:
+- Zbieranie plików z argumentów (pliki, foldery, wzorce glob, lista z stdin)
+- Filtrowanie plików wzorcami --uwzglednij / --pomin
+- Uruchomienie kompresji z opcjami z wiersza poleceń
+- Rozpakowywanie i sprawdzanie archiwów (--rozpakuj, --sprawdz)
+- Zwracanie kodu wyjścia zrozumiałego dla skryptów (cron, CI)
+
+Moduł nie importuje FreeSimpleGUI, więc działa na serwerach bez ekranu.
+
+Przykłady:
+    python cli.py -o wynik logi/*.txt
+    python cli.py -o wynik -r dane --uwzglednij "*.csv" --pomin "tmp_*"
+    find . -name "*.log" | python cli.py -o wynik --lista -
+    python cli.py --sprawdz -r archiwa -j 0
+    python cli.py --rozpakuj -o przywrocone archiwa/*.zip
+"""
+
+import argparse
+import fnmatch
+import glob
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+from core import KompresorPlikow
+from dziennik import Dziennik, UjscieDziennika
+from kodeki import KODEKI
+from potok import DOMYSLNA_GLEBOKOSC
+from skaner import SkanerPlikow
+
+# Kody wyjścia programu
+KOD_OK = 0
+KOD_BLEDY_PLIKOW = 1  # Część plików nie została skompresowana
+KOD_BLEDNE_ARGUMENTY = 2  # Tak samo jak błędy argparse
+KOD_BRAK_PLIKOW = 3  # Żaden plik nie pasuje do podanych argumentów
+KOD_PRZERWANO = 130  # Przerwanie przez Ctrl+C (128 + SIGINT)
+
+
+def stworz_parser() -> argparse.ArgumentParser:
+    """
+    Tworzy parser argumentów wiersza poleceń.
+
+    Returns:
+        argparse.ArgumentParser: Parser argumentów
+    """
+    parser = argparse.ArgumentParser(
+        prog="squeezeit",
+        description="SqueezeIt - kompresja plików do archiwów ZIP bez GUI.",
+    )
+
+    # Wejście
+    parser.add_argument(
+        "wejscie",
+        nargs="*",
+        help="pliki, foldery lub wzorce glob (np. 'logi/**/*.txt')",
+    )
+    parser.add_argument(
+        "-r",
+        "--rekurencyjnie",
+        action="store_true",
+        help="przeszukuj foldery razem z podfolderami",
+    )
+    parser.add_argument(
+        "--lista",
+        metavar="PLIK",
+        help="czytaj ścieżki z pliku, po jednej w wierszu ('-' = stdin)",
+    )
+    parser.add_argument(
+        "-0",
+        "--zero",
+        action="store_true",
+        help="ścieżki w --lista rozdzielone znakiem NUL (jak find -print0)",
+    )
+    parser.add_argument(
+        "--uwzglednij",
+        action="append",
+        default=[],
+        metavar="WZORZEC",
+        help="kompresuj tylko pliki pasujące do wzorca (można powtarzać)",
+    )
+    parser.add_argument(
+        "--pomin",
+        action="append",
+        default=[],
+        metavar="WZORZEC",
+        help="pomiń pliki pasujące do wzorca (można powtarzać)",
+    )
+
+    # Tryb pracy (domyślnie kompresja)
+    tryb = parser.add_mutually_exclusive_group()
+    tryb.add_argument(
+        "--rozpakuj",
+        action="store_true",
+        help="rozpakuj podane archiwa ZIP do folderu -o",
+    )
+    tryb.add_argument(
+        "--sprawdz",
+        action="store_true",
+        help="sprawdź sumy CRC-32 podanych archiwów bez rozpakowywania",
+    )
+
+    # Wynik
+    parser.add_argument(
+        "-o",
+        "--folder-docelowy",
+        help="folder, do którego trafią archiwa (przy --rozpakuj - ich pliki)",
+    )
+    parser.add_argument(
+        "-a",
+        "--archiwum",
+        metavar="NAZWA",
+        help="zapisz wszystkie pliki do jednego archiwum o tej nazwie",
+    )
+    parser.add_argument(
+        "--wolumin-mb",
+        type=int,
+        metavar="MB",
+        help="dziel wspólne archiwum na woluminy o podanym rozmiarze",
+    )
+    parser.add_argument(
+        "--przyrostowo",
+        action="store_true",
+        help="aktualizuj istniejące wspólne archiwum tylko o zmienione pliki",
+    )
+
+    # Ustawienia kompresji
+    parser.add_argument(
+        "-l",
+        "--poziom",
+        type=int,
+        choices=range(1, 10),
+        default=6,
+        metavar="1-9",
+        help="poziom kompresji (domyślnie 6)",
+    )
+    parser.add_argument(
+        "--cel-mb-s",
+        type=float,
+        metavar="MB_S",
+        help="dobieraj poziom dla każdego pliku tak, by utrzymać co najmniej "
+        "tyle MB/s (--poziom to poziom startowy)",
+    )
+    parser.add_argument(
+        "--budzet-s",
+        type=float,
+        metavar="SEKUNDY",
+        help="dobieraj poziom tak, by kompresja zmieściła się w tylu "
+        "sekundach z możliwie najlepszą kompresją",
+    )
+    parser.add_argument(
+        "--dostep-swobodny",
+        action="store_true",
+        help="kompresuj duże pliki w niezależnych blokach z indeksem "
+        "(szybki odczyt fragmentów, np. końca logu)",
+    )
+    parser.add_argument(
+        "--ciagly",
+        action="store_true",
+        help="małe pliki wspólnego archiwum (-a) kompresuj razem, w blokach "
+        "ciągłych (lepsza kompresja, więcej plików/s)",
+    )
+    parser.add_argument(
+        "-k",
+        "--kodek",
+        choices=[*sorted(KODEKI), "auto"],
+        default="deflate",
+        help="metoda kompresji (domyślnie deflate)",
+    )
+    parser.add_argument(
+        "-j",
+        "--procesy",
+        type=int,
+        default=1,
+        metavar="N",
+        help="liczba procesów kompresujących pliki lub archiwa (0 = liczba rdzeni)",
+    )
+    parser.add_argument(
+        "--watki-na-plik",
+        type=int,
+        default=1,
+        metavar="N",
+        help="liczba wątków kompresujących jeden duży plik (0 = liczba rdzeni)",
+    )
+    parser.add_argument(
+        "--prog-kompresowalnosci",
+        type=float,
+        metavar="STOSUNEK",
+        help="nie kompresuj plików, których szacowany stosunek rozmiarów "
+        "przekracza próg (np. 0.9)",
+    )
+    parser.add_argument(
+        "--pomijaj-nieskompresowalne",
+        action="store_true",
+        help="pomiń pliki powyżej progu zamiast zapisywać je bez kompresji",
+    )
+    parser.add_argument(
+        "--pamiec",
+        metavar="FOLDER",
+        help="folder pamięci podręcznej dla niezmienionych plików",
+    )
+    parser.add_argument(
+        "--bez-mmap",
+        action="store_true",
+        help="czytaj pliki zwykle zamiast mapować je do pamięci (mmap)",
+    )
+    parser.add_argument(
+        "--glebokosc-potoku",
+        type=int,
+        default=DOMYSLNA_GLEBOKOSC,
+        metavar="N",
+        help="ile bloków może czekać między odczytem, kompresją i zapisem "
+        f"dużych plików (domyślnie {DOMYSLNA_GLEBOKOSC}, 0 = bez potoku)",
+    )
+    parser.add_argument(
+        "--wznowienie",
+        metavar="PLIK",
+        help="dziennik ukończonych plików - po przerwaniu ponowne "
+        "uruchomienie pominie pliki już skompresowane",
+    )
+    parser.add_argument(
+        "--synchronizuj-co",
+        type=int,
+        default=0,
+        metavar="N",
+        help="co N ukończonych plików zapisuj archiwa na dysk (fsync) "
+        "(domyślnie 0 = bez fsync)",
+    )
+
+    # Wyjście programu
+    parser.add_argument(
+        "-q",
+        "--cicho",
+        action="store_true",
+        help="wypisuj tylko błędy i podsumowanie",
+    )
+    parser.add_argument(
+        "--dziennik",
+        metavar="PLIK",
+        help="dopisuj operacje do pliku JSON lines (rotowanego co 10 MB)",
+    )
+    parser.add_argument(
+        "--metryki",
+        metavar="PLIK",
+        help="zapisz czasy faz, liczniki i histogramy (.json lub format "
+        "Prometheusa, np. .prom)",
+    )
+    parser.add_argument(
+        "--raport",
+        metavar="PLIK",
+        help="zapisz raport paczki: sumy dla rozszerzeń (.csv) lub pełny "
+        "raport z kwantylami i najsłabszymi plikami (.json)",
+    )
+    parser.add_argument(
+        "--profil",
+        metavar="PLIK",
+        help="profiluj kompresję modułem cProfile (python -m pstats PLIK)",
+    )
+
+    return parser
+
+
+def wczytaj_liste(strumien, separator_nul: bool = False) -> list[str]:
+    """
+    Wczytuje listę ścieżek ze strumienia tekstowego.
+
+    Args:
+        strumien: Otwarty plik tekstowy (np. sys.stdin)
+        separator_nul (bool): Ścieżki rozdzielone znakiem NUL zamiast
+            końców wierszy
+
+    Returns:
+        List[str]: Niepuste ścieżki
+    """
+    tekst = strumien.read()
+    if separator_nul:
+        sciezki = tekst.split("\0")
+    else:
+        sciezki = [wiersz.strip() for wiersz in tekst.splitlines()]
+    return [sciezka for sciezka in sciezki if sciezka]
+
+
+def _pasuje(sciezka_pliku: str, wzorce: list[str]) -> bool:
+    """
+    Sprawdza, czy plik pasuje do któregoś wzorca.
+
+    Wzorzec porównywany jest z nazwą pliku oraz z całą ścieżką, więc
+    działa zarówno "*.txt", jak i "logi/*/stare_*".
+
+    Args:
+        sciezka_pliku (str): Ścieżka do pliku
+        wzorce (List[str]): Wzorce w stylu fnmatch
+
+    Returns:
+        bool: True jeśli któryś wzorzec pasuje
+    """
+    nazwa = os.path.basename(sciezka_pliku)
+    sciezka = sciezka_pliku.replace(os.sep, "/")
+    return any(
+        fnmatch.fnmatch(nazwa, wzorzec) or fnmatch.fnmatch(sciezka, wzorzec)
+        for wzorzec in wzorce
+    )
+
+
+def zbierz_pliki(
+    wejscie: list[str],
+    rekurencyjnie: bool = False,
+    uwzglednij: list[str] | None = None,
+    pomin: list[str] | None = None,
+    skaner: SkanerPlikow | None = None,
+) -> list[str]:
+    """
+    Zamienia argumenty (pliki, foldery, wzorce glob) na listę plików.
+
+    Ścieżki, które nie istnieją, zostają na liście - walidacja kompresora
+    zgłosi je jako błędy, zamiast po cichu je pominąć. Pliki z folderów
+    są posortowane, żeby wynik był powtarzalny.
+
+    Args:
+        wejscie (List[str]): Pliki, foldery i wzorce glob
+        rekurencyjnie (bool): Czy przeszukiwać podfoldery
+        uwzglednij (List[str] | None): Wzorce plików do kompresji
+            (None lub pusta lista = wszystkie pliki)
+        pomin (List[str] | None): Wzorce plików do pominięcia
+        skaner (SkanerPlikow | None): Skaner, który zapamięta wyniki stat
+            znalezionych plików - przekazany kompresorowi oszczędza ponowne
+            sprawdzanie plików przy walidacji
+
+    Returns:
+        List[str]: Ścieżki plików bez powtórzeń, w kolejności argumentów
+    """
+    if skaner is None:
+        skaner = SkanerPlikow()
+
+    # Wzorce glob rozwijamy na miejscu; pliki i foldery sprawdza skaner
+    # (jeden stat na ścieżkę, pliki folderów prosto z os.scandir)
+    sciezki = []
+    for argument in wejscie:
+        if glob.has_magic(argument) and not os.path.lexists(argument):
+            sciezki.extend(sorted(glob.glob(argument, recursive=True)))
+        else:
+            sciezki.append(argument)
+    znalezione = skaner.skanuj(sciezki, rekurencyjnie)
+
+    pliki = []
+    widziane = set()
+    for sciezka in znalezione:
+        if uwzglednij and not _pasuje(sciezka, uwzglednij):
+            continue
+        if pomin and _pasuje(sciezka, pomin):
+            continue
+
+        klucz = os.path.normpath(os.path.abspath(sciezka))
+        if klucz not in widziane:
+            widziane.add(klucz)
+            pliki.append(sciezka)
+
+    return pliki
+
+
+def uruchom_z_przerwaniem(
+    funkcja: Callable[..., tuple[int, int, list[str]]], sciezki: list[str]
+) -> tuple[tuple[int, int, list[str]], bool]:
+    """
+    Uruchamia operację na wielu plikach tak, by Ctrl+C nie zostawiał
+    uszkodzonych wyników.
+
+    Operacja działa w osobnym wątku; wątek główny czeka na nią i po
+    Ctrl+C prosi ją o przerwanie, a potem czeka, aż posprząta.
+
+    Args:
+        funkcja (Callable): Np. kompresor.kompresuj_wiele_plikow - wywoływana
+            jako funkcja(sciezki, None, przerwij)
+        sciezki (List[str]): Pliki lub archiwa do przetworzenia
+
+    Returns:
+        Tuple[Tuple[int, int, List[str]], bool]: (wynik funkcji, czy_przerwano)
+    """
+    przerwij = threading.Event()
+    zakonczono = threading.Event()
+    wynik = []
+    bledy = []
+
+    def uruchom():
+        try:
+            wynik.append(funkcja(sciezki, None, przerwij))
+        except BaseException as e:
+            bledy.append(e)
+        finally:
+            zakonczono.set()
+
+    threading.Thread(target=uruchom, daemon=True).start()
+    try:
+        # Czekanie z limitem czasu, żeby Ctrl+C docierał do wątku głównego
+        while not zakonczono.wait(0.2):
+            pass
+    except KeyboardInterrupt:
+        przerwij.set()
+        zakonczono.wait()
+
+    if bledy:
+        raise bledy[0]
+    return wynik[0], przerwij.is_set()
+
+
+def kompresuj_z_przerwaniem(
+    kompresor: KompresorPlikow, sciezki_plikow: list[str]
+) -> tuple[tuple[int, int, list[str]], bool]:
+    """
+    Kompresuje pliki tak, by Ctrl+C nie zostawiał uszkodzonych archiwów.
+
+    Args:
+        kompresor (KompresorPlikow): Skonfigurowany kompresor
+        sciezki_plikow (List[str]): Pliki do kompresji
+
+    Returns:
+        Tuple[Tuple[int, int, List[str]], bool]: (wynik kompresuj_wiele_plikow,
+            czy_przerwano)
+    """
+    return uruchom_z_przerwaniem(kompresor.kompresuj_wiele_plikow, sciezki_plikow)
+
+
+def rozpakuj_archiwa(opcje: argparse.Namespace, sciezki_archiwow: list[str]) -> int:
+    """
+    Rozpakowuje (--rozpakuj) lub sprawdza (--sprawdz) archiwa.
+
+    Args:
+        opcje (argparse.Namespace): Opcje z wiersza poleceń
+        sciezki_archiwow (List[str]): Archiwa do przetworzenia
+
+    Returns:
+        int: Kod wyjścia (KOD_OK, KOD_BLEDY_PLIKOW, KOD_BLEDNE_ARGUMENTY
+            lub KOD_PRZERWANO)
+    """
+    # Import na miejscu - moduł potrzebny tylko przy rozpakowywaniu
+    from rozpakowanie import RozpakowywaczArchiwow
+
+    dziennik = None
+    try:
+        if opcje.dziennik:
+            dziennik = Dziennik(ujscie=UjscieDziennika(opcje.dziennik))
+        rozpakowywacz = RozpakowywaczArchiwow(
+            None if opcje.sprawdz else opcje.folder_docelowy,
+            liczba_procesow=opcje.procesy or None,
+            dziennik=dziennik,
+        )
+    except (ValueError, OSError) as e:
+        print(f"❌ Błędna konfiguracja: {e}", file=sys.stderr)
+        zamknij_dziennik(dziennik)
+        return KOD_BLEDNE_ARGUMENTY
+
+    if opcje.sprawdz:
+        funkcja = rozpakowywacz.sprawdz_wiele_archiwow
+    else:
+        funkcja = rozpakowywacz.rozpakuj_wiele_archiwow
+    poczatek = time.perf_counter()
+    try:
+        (sukces, bledy, komunikaty), przerwano = uruchom_z_przerwaniem(
+            funkcja, sciezki_archiwow
+        )
+    except OSError as e:
+        print(f"❌ Nie można rozpakować archiwów: {e}", file=sys.stderr)
+        return KOD_BLEDNE_ARGUMENTY
+    finally:
+        zamknij_dziennik(dziennik)
+    czas = time.perf_counter() - poczatek
+
+    for komunikat in komunikaty:
+        if not opcje.cicho or komunikat.startswith("❌"):
+            print(komunikat)
+    rozmiar_mb = sum(wynik.rozmiar for wynik in rozpakowywacz.wyniki) / (1024 * 1024)
+    print(
+        f"📊 Pomyślnie: {sukces}, błędy: {bledy} "
+        f"({rozmiar_mb / czas if czas > 0 else 0.0:.1f} MB/s)",
+        file=sys.stderr,
+    )
+
+    if przerwano:
+        return KOD_PRZERWANO
+    return KOD_BLEDY_PLIKOW if bledy else KOD_OK
+
+
+def zamknij_dziennik(dziennik: Dziennik | None):
+    """
+    Zapisuje zaległe wpisy dziennika i zgłasza błąd zapisu na stderr.
+
+    Błąd dziennika nie zmienia kodu wyjścia - archiwa są ważniejsze.
+
+    Args:
+        dziennik (Dziennik | None): Dziennik z ujściem do pliku (None = brak)
+    """
+    if dziennik is None:
+        return
+    try:
+        dziennik.zamknij()
+    except OSError as e:
+        utracone = dziennik.ujscie.liczba_utraconych
+        print(
+            f"⚠️ Błąd zapisu dziennika ({utracone} wpisów utraconych): {e}",
+            file=sys.stderr,
+        )
+
+
+def main(argumenty: list[str] | None = None) -> int:
+    """
+    Uruchamia kompresję z wiersza poleceń.
+
+    Args:
+        argumenty (List[str] | None): Argumenty (None = sys.argv[1:])
+
+    Returns:
+        int: Kod wyjścia (KOD_OK, KOD_BLEDY_PLIKOW, KOD_BLEDNE_ARGUMENTY,
+            KOD_BRAK_PLIKOW lub KOD_PRZERWANO)
+    """
+    parser = stworz_parser()
+    opcje = parser.parse_args(argumenty)
+    if not opcje.folder_docelowy and not opcje.sprawdz:
+        parser.error("wymagany argument: -o/--folder-docelowy")
+    rozpakowanie = opcje.rozpakuj or opcje.sprawdz
+    if rozpakowanie and not opcje.uwzglednij:
+        # W folderach szukamy tylko archiwów
+        opcje.uwzglednij = ["*.zip"]
+
+    wejscie = list(opcje.wejscie)
+    if opcje.lista == "-":
+        wejscie.extend(wczytaj_liste(sys.stdin, opcje.zero))
+    elif opcje.lista:
+        try:
+            with open(opcje.lista, encoding="utf-8") as f:
+                wejscie.extend(wczytaj_liste(f, opcje.zero))
+        except OSError as e:
+            print(f"❌ Nie można odczytać listy plików: {e}", file=sys.stderr)
+            return KOD_BLEDNE_ARGUMENTY
+
+    if not wejscie:
+        parser.print_usage(sys.stderr)
+        print("❌ Nie podano plików (argumenty lub --lista)", file=sys.stderr)
+        return KOD_BLEDNE_ARGUMENTY
+
+    skaner = SkanerPlikow()
+    sciezki_plikow = zbierz_pliki(
+        wejscie, opcje.rekurencyjnie, opcje.uwzglednij, opcje.pomin, skaner
+    )
+    if not sciezki_plikow:
+        print("❌ Żaden plik nie pasuje do podanych argumentów", file=sys.stderr)
+        return KOD_BRAK_PLIKOW
+
+    if rozpakowanie:
+        return rozpakuj_archiwa(opcje, sciezki_plikow)
+
+    dziennik = None
+    try:
+        if opcje.dziennik:
+            dziennik = Dziennik(ujscie=UjscieDziennika(opcje.dziennik))
+
+        pamiec = None
+        if opcje.pamiec:
+            # Import na miejscu - moduł potrzebny tylko z opcją --pamiec
+            from pamiec_podreczna import PamiecPodreczna
+
+            pamiec = PamiecPodreczna(opcje.pamiec)
+
+        kompresor = KompresorPlikow(
+            opcje.folder_docelowy,
+            opcje.poziom,
+            liczba_procesow=opcje.procesy or None,
+            liczba_watkow_na_plik=opcje.watki_na_plik or None,
+            kodek=opcje.kodek,
+            prog_kompresowalnosci=opcje.prog_kompresowalnosci,
+            pomijaj_nieskompresowalne=opcje.pomijaj_nieskompresowalne,
+            nazwa_archiwum=opcje.archiwum,
+            maks_rozmiar_woluminu_mb=opcje.wolumin_mb,
+            tryb_przyrostowy=opcje.przyrostowo,
+            pamiec_podreczna=pamiec,
+            dziennik=dziennik,
+            plik_profilu=opcje.profil,
+            uzywaj_mmap=not opcje.bez_mmap,
+            glebokosc_potoku=opcje.glebokosc_potoku,
+            plik_wznowienia=opcje.wznowienie,
+            synchronizuj_co=opcje.synchronizuj_co,
+            cel_mb_na_s=opcje.cel_mb_s,
+            budzet_s=opcje.budzet_s,
+            dostep_swobodny=opcje.dostep_swobodny,
+            tryb_ciagly=opcje.ciagly,
+        )
+    except (ValueError, OSError) as e:
+        print(f"❌ Błędna konfiguracja: {e}", file=sys.stderr)
+        zamknij_dziennik(dziennik)
+        return KOD_BLEDNE_ARGUMENTY
+
+    # Walidacja skorzysta z wyników stat zebranych przy szukaniu plików
+    kompresor.skaner = skaner
+
+    try:
+        (sukces, bledy, komunikaty), przerwano = kompresuj_z_przerwaniem(
+            kompresor, sciezki_plikow
+        )
+    except OSError as e:
+        # Np. dziennik wznowienia (--wznowienie) w niedostępnym miejscu
+        print(f"❌ Nie można skompresować plików: {e}", file=sys.stderr)
+        return KOD_BLEDNE_ARGUMENTY
+    finally:
+        zamknij_dziennik(dziennik)
+
+    if opcje.metryki:
+        try:
+            kompresor.metryki.zapisz_do_pliku(opcje.metryki)
+        except OSError as e:
+            print(f"⚠️ Nie można zapisać metryk: {e}", file=sys.stderr)
+    if opcje.raport:
+        try:
+            kompresor.wyniki_plikow.raport.zapisz_do_pliku(opcje.raport)
+        except OSError as e:
+            print(f"⚠️ Nie można zapisać raportu: {e}", file=sys.stderr)
+
+    for komunikat in komunikaty:
+        if not opcje.cicho or komunikat.startswith(("❌", "⏹️")):
+            print(komunikat)
+    migawka = kompresor.metryki.migawka()
+    print(
+        f"📊 Pomyślnie: {sukces}, błędy: {bledy} "
+        f"({migawka['mb_na_s']:.1f} MB/s, {migawka['pliki_na_s']:.0f} plików/s)",
+        file=sys.stderr,
+    )
+
+    if przerwano:
+        return KOD_PRZERWANO
+    return KOD_BLEDY_PLIKOW if bledy else KOD_OK
+
+
+# === PUNKT WEJŚCIA ===
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,12 +8,87 @@ Odpowiedzialny za:
 - Logowanie operacji
 """
 
+import contextlib
+import copy
 import os
+import threading
+import time
 import zipfile
-from datetime import datetime
+import zlib
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING
+
+from archiwum import (
+    StrumienKompresujacy,
+    SurowyWpisZip,
+    czas_z_pola_ntfs,
+    kopiuj_wpis,
+    pole_czasu_ntfs,
+    wycofaj_do_stanu,
+    zapamietaj_stan,
+)
+from bloki import kompresuj_deflate_rownolegle
+from ciagly import (
+    MAKS_ROZMIAR_PLIKU_CIAGLEGO,
+    ROZMIAR_BLOKU_CIAGLEGO,
+    BlokCiagly,
+    czy_blok_ciagly,
+    nazwa_bloku,
+    nazwa_spisu,
+)
+from dziennik import POZIOM_BLAD, POZIOM_INFO, Dziennik
+from indeks import ROZSZERZENIE_INDEKSU, IndeksBlokow
+from kodeki import (
+    KODEKI,
+    Kodek,
+    PolitykaKodekow,
+    oszacuj_kompresowalnosc,
+    pobierz_kodek,
+)
+from metryki import Metryki, PlikZPomiarem, profiluj
+from odczyt import ZrodloPliku, otworz_zrodlo
+from potok import DOMYSLNA_GLEBOKOSC, czytaj_z_wyprzedzeniem, zapis_w_tle
+from skaner import RekordPliku, SkanerPlikow
+from strojenie import POZIOM_STORE, StrojeniePoziomu
+from trwalosc import PunktyKontrolne, sciezka_tymczasowa, zapisz_atomowo
+from utils import pobierz_zuzycie_pamieci
+from wyniki import (
+    KOD_BEZ_BLEDU,
+    KOD_BLAD_KOMPRESJI,
+    KOD_BRAK_PLIKU,
+    KOD_BRAK_UPRAWNIEN,
+    KOD_KOLIZJA_NAZWY,
+    KOD_LIMIT_PAMIECI,
+    KOD_PRZERWANO,
+    WynikiKompresji,
+    WynikPliku,
+    opis_bledu_walidacji,
+)
+
+if TYPE_CHECKING:
+    from pamiec_podreczna import PamiecPodreczna
 
 # from typing import List, Tuple
 
+# Moduły asyncio, concurrent.futures i pamiec_podreczna importujemy dopiero
+# w metodach, które z nich korzystają - sam import tych modułów trwa dłużej
+# niż reszta programu
+
+# Domyślny rozmiar bloku odczytywanego z pliku źródłowego (1 MB)
+DOMYSLNY_ROZMIAR_BLOKU = 1024 * 1024
+
+# Typ funkcji zwrotnej postępu: (sciezka_pliku, przetworzone_bajty, rozmiar_pliku)
+FunkcjaPostepu = Callable[[str, int, int], None]
+
+# Grupy wyników w kolejności, w jakiej podaje je kompresuj_wiele_plikow
+_GRUPA_WALIDACJI = 0
+_GRUPA_POMINIETYCH = 1
+_GRUPA_KOMPRESJI = 2
+
+
+class PrzerwanieKompresji(Exception):  # noqa: N818 - nazwa po polsku
+    """Wyjątek przerywający kompresję pliku (np. po anulowaniu zadania)."""
+
 
 class KompresorPlikow:
     """
@@ -22,20 +97,209 @@ class KompresorPlikow:
     Atrybuty:
         sciezka_docelowa (str): Ścieżka do folderu docelowego
         poziom_kompresji (int): Poziom kompresji (1-9)
-        log_operacji (List[str]): Lista wykonanych operacji
+        liczba_procesow (int): Liczba procesów używanych przy kompresji wielu plików
+        rozmiar_bloku (int): Rozmiar bloku (w bajtach) czytanego z pliku źródłowego
+        limit_pamieci_mb (int | None): Maksymalne zużycie pamięci (RSS) w MB
+        liczba_watkow_na_plik (int): Liczba wątków kompresujących jeden duży plik
+        kodek (str): Nazwa kodeka lub "auto" (wybór przez politykę kodeków)
+        polityka_kodekow (PolitykaKodekow): Polityka wyboru kodeka w trybie "auto"
+        prog_kompresowalnosci (float | None): Próg szacowanego stosunku rozmiarów,
+            powyżej którego plik nie jest kompresowany (None = bez sondy)
+        pomijaj_nieskompresowalne (bool): Pomijaj takie pliki zamiast zapisywać
+            je bez kompresji (store)
+        nazwa_archiwum (str | None): Nazwa wspólnego archiwum dla wszystkich plików
+        maks_rozmiar_woluminu_mb (int | None): Maksymalny rozmiar woluminu w MB
+        tryb_przyrostowy (bool): Aktualizuj istniejące wspólne archiwum
+        pamiec_podreczna (PamiecPodreczna | None): Pamięć wyników dla
+            niezmienionych plików
+        skaner (SkanerPlikow): Wyniki stat plików bieżącego przebiegu; po
+            każdym przebiegu zastępowany nowym, pustym skanerem
+        wyniki_plikow (WynikiKompresji): Wyniki plików z ostatniej kompresji
+            wielu plików (kolumnowo, także pliki odrzucone przez walidację)
+        dziennik (Dziennik): Dziennik operacji z buforem ostatnich wpisów
+        metryki (Metryki): Czasy faz, liczniki i histogramy wszystkich przebiegów
+        plik_profilu (str | None): Plik statystyk cProfile dla
+            kompresuj_wiele_plikow (None = bez profilowania)
+        uzywaj_mmap (bool): Czy duże pliki źródłowe czytać przez mmap
+        glebokosc_potoku (int): Ile bloków może czekać między etapami potoku
+            odczyt -> kompresja -> zapis (0 = bez potoku)
+        plik_wznowienia (str | None): Dziennik punktów kontrolnych
+            kompresuj_wiele_plikow (None = bez wznawiania)
+        synchronizuj_co (int): Co ile ukończonych plików wykonywać fsync
+            (0 = bez fsync)
+        strojenie (StrojeniePoziomu | None): Adaptacyjny dobór poziomu
+            kompresji dla każdego pliku (None = zawsze poziom_kompresji)
+        dostep_swobodny (bool): Czy duże pliki deflate kompresować w
+            niezależnych blokach z indeksem (odczyt fragmentów - moduł indeks)
+        tryb_ciagly (bool): Czy małe pliki wspólnego archiwum zapisywać
+            razem, w blokach ciągłych (moduł ciagly)
     """
 
-    def __init__(self, sciezka_docelowa: str, poziom_kompresji: int = 6):
+    def __init__(
+        self,
+        sciezka_docelowa: str,
+        poziom_kompresji: int = 6,
+        liczba_procesow: int | None = 1,
+        rozmiar_bloku: int = DOMYSLNY_ROZMIAR_BLOKU,
+        limit_pamieci_mb: int | None = None,
+        liczba_watkow_na_plik: int | None = 1,
+        kodek: str = "deflate",
+        polityka_kodekow: PolitykaKodekow | None = None,
+        prog_kompresowalnosci: float | None = None,
+        pomijaj_nieskompresowalne: bool = False,
+        nazwa_archiwum: str | None = None,
+        maks_rozmiar_woluminu_mb: int | None = None,
+        tryb_przyrostowy: bool = False,
+        pamiec_podreczna: "PamiecPodreczna | None" = None,
+        dziennik: Dziennik | None = None,
+        plik_profilu: str | None = None,
+        uzywaj_mmap: bool = True,
+        glebokosc_potoku: int = DOMYSLNA_GLEBOKOSC,
+        plik_wznowienia: str | None = None,
+        synchronizuj_co: int = 0,
+        cel_mb_na_s: float | None = None,
+        budzet_s: float | None = None,
+        dostep_swobodny: bool = False,
+        tryb_ciagly: bool = False,
+    ):
         """
         Inicjalizuje kompresor plików.
 
         Args:
             sciezka_docelowa (str): Folder gdzie zapisać skompresowane pliki
             poziom_kompresji (int): Poziom kompresji od 1 (najszybszy) do 9 (najlepszy)
+            liczba_procesow (int | None): Liczba procesów roboczych dla
+                kompresuj_wiele_plikow; 1 = kompresja sekwencyjna,
+                None = tyle procesów, ile rdzeni procesora
+            rozmiar_bloku (int): Rozmiar bloku odczytu przy kompresji strumieniowej
+            limit_pamieci_mb (int | None): Limit pamięci procesu (RSS) w MB;
+                po jego przekroczeniu kompresja pliku jest przerywana z błędem
+            liczba_watkow_na_plik (int | None): Liczba wątków kompresujących
+                bloki jednego pliku większego niż rozmiar_bloku; 1 = bez
+                podziału, None = tyle wątków, ile rdzeni procesora
+            kodek (str): "store", "deflate", "bzip2", "lzma", "zstd" (gdy
+                zainstalowano zstandard) lub "auto" - wybór dla każdego pliku
+            polityka_kodekow (PolitykaKodekow | None): Polityka dla trybu
+                "auto"; None = polityka domyślna
+            prog_kompresowalnosci (float | None): Gdy ustawiony, walidacja
+                szacuje z próbek stosunek rozmiaru po kompresji do rozmiaru
+                przed; pliki powyżej progu (np. 0.9) nie są kompresowane
+            pomijaj_nieskompresowalne (bool): True = pomiń takie pliki,
+                False = zapisz je w archiwum bez kompresji (store)
+            nazwa_archiwum (str | None): Gdy ustawiona, kompresuj_wiele_plikow
+                zapisuje wszystkie pliki do jednego archiwum o tej nazwie
+                (ze ścieżkami względem wspólnego folderu) zamiast do
+                osobnych archiwów
+            maks_rozmiar_woluminu_mb (int | None): Dzieli wspólne archiwum na
+                woluminy nazwa_001.zip, nazwa_002.zip, ... o podanym rozmiarze
+            tryb_przyrostowy (bool): Gdy wspólne archiwum już istnieje,
+                kompresowane są tylko nowe i zmienione pliki, a niezmienione
+                wpisy są kopiowane bez ponownej kompresji
+            pamiec_podreczna (PamiecPodreczna | None): Gdy ustawiona, pliki
+                niezmienione od poprzedniej kompresji nie są kompresowane
+                ponownie - archiwum jest brane z pamięci
+            dziennik (Dziennik | None): Dziennik operacji (np. z ujściem do
+                pliku); None = dziennik z domyślną pojemnością bufora
+            plik_profilu (str | None): Gdy ustawiony, każde wywołanie
+                kompresuj_wiele_plikow jest profilowane modułem cProfile,
+                a statystyki trafiają do tego pliku
+            uzywaj_mmap (bool): True = pliki od 1 MB są mapowane do pamięci
+                (mmap) i kompresowane bez kopiowania danych; False = zawsze
+                zwykły odczyt (np. gdy pliki mogą być skracane w trakcie)
+            glebokosc_potoku (int): Pliki większe od rozmiar_bloku są
+                czytane i zapisywane w osobnych wątkach, równocześnie z
+                kompresją; między etapami czeka najwyżej tyle bloków
+                (0 = odczyt, kompresja i zapis po kolei)
+            plik_wznowienia (str | None): Gdy ustawiony, kompresuj_wiele_plikow
+                zapisuje w nim ukończone pliki; po przerwaniu (lub awarii)
+                kolejne wywołanie z tymi samymi ustawieniami pomija pliki
+                niezmienione od tamtej pory. Dziennik jest usuwany, gdy
+                wszystkie pliki skompresowano bez błędów
+            synchronizuj_co (int): Co ile ukończonych plików synchronizować
+                archiwa i dziennik wznowienia z dyskiem (fsync), żeby
+                przetrwały także awarię zasilania; 0 = bez fsync
+            cel_mb_na_s (float | None): Gdy ustawiony, poziom kompresji jest
+                dobierany dla każdego pliku tak, by utrzymać co najmniej tyle
+                MB/s (poziom_kompresji to wtedy poziom startowy)
+            budzet_s (float | None): Gdy ustawiony, poziom jest dobierany tak,
+                by kompresuj_wiele_plikow zmieściło się w tylu sekundach -
+                z możliwie najlepszą kompresją
+            dostep_swobodny (bool): Gdy True, pliki deflate większe od
+                rozmiar_bloku są kompresowane w niezależnych blokach, a obok
+                wpisu powstaje wpis "<nazwa>.sqidx" z indeksem bloków -
+                CzytnikFragmentow czyta z nich zakresy bajtów lub wierszy
+                bez rozpakowania całości
+            tryb_ciagly (bool): Gdy True, pliki wspólnego archiwum nie
+                większe od MAKS_ROZMIAR_PLIKU_CIAGLEGO są sklejane w bloki
+                ciągłe (strumień tar w jednym wpisie) i kompresowane razem -
+                lepsza kompresja i wielokrotnie więcej plików na sekundę.
+                Pliki czyta CzytnikCiagly; wolumin może przekroczyć limit
+                o rozmiar jednego bloku
+
+        Raises:
+            ValueError: Gdy wybrany kodek jest niedostępny, tryb
+                przyrostowy połączono z woluminami lub trybem ciągłym, cel
+                doboru poziomu nie jest dodatni, dostęp swobodny połączono
+                z kodekiem innym niż deflate i auto lub tryb ciągły
+                włączono bez wspólnego archiwum
         """
         self.sciezka_docelowa = sciezka_docelowa
         self.poziom_kompresji = min(max(poziom_kompresji, 1), 9)  # Ograniczenie 1-9
-        self.log_operacji = []
+        if liczba_procesow is None:
+            liczba_procesow = os.cpu_count() or 1
+        self.liczba_procesow = max(liczba_procesow, 1)
+        self.rozmiar_bloku = max(rozmiar_bloku, 4096)
+        self.limit_pamieci_mb = limit_pamieci_mb
+        if liczba_watkow_na_plik is None:
+            liczba_watkow_na_plik = os.cpu_count() or 1
+        self.liczba_watkow_na_plik = max(liczba_watkow_na_plik, 1)
+        if kodek != "auto":
+            pobierz_kodek(kodek)  # Sprawdź, czy kodek jest dostępny
+        self.kodek = kodek
+        if dostep_swobodny and kodek not in ("deflate", "auto"):
+            raise ValueError("dostęp swobodny wymaga kodeka deflate lub auto")
+        self.dostep_swobodny = dostep_swobodny
+        self.polityka_kodekow = polityka_kodekow or PolitykaKodekow()
+        self.prog_kompresowalnosci = prog_kompresowalnosci
+        self.pomijaj_nieskompresowalne = pomijaj_nieskompresowalne
+        self.nazwa_archiwum = nazwa_archiwum
+        self.maks_rozmiar_woluminu_mb = maks_rozmiar_woluminu_mb
+        if tryb_przyrostowy and maks_rozmiar_woluminu_mb:
+            raise ValueError("tryb przyrostowy nie obsługuje woluminów")
+        self.tryb_przyrostowy = tryb_przyrostowy
+        if tryb_ciagly and not nazwa_archiwum:
+            raise ValueError("tryb ciągły wymaga wspólnego archiwum")
+        if tryb_ciagly and tryb_przyrostowy:
+            raise ValueError("tryb przyrostowy nie obsługuje trybu ciągłego")
+        self.tryb_ciagly = tryb_ciagly
+        self.pamiec_podreczna = pamiec_podreczna
+        self.skaner = SkanerPlikow()
+        self.wyniki_plikow = WynikiKompresji()
+        self.dziennik = dziennik if dziennik is not None else Dziennik()
+        self.metryki = Metryki()
+        self.plik_profilu = plik_profilu
+        self.uzywaj_mmap = uzywaj_mmap
+        self.glebokosc_potoku = max(glebokosc_potoku, 0)
+        self.plik_wznowienia = plik_wznowienia
+        self.synchronizuj_co = max(synchronizuj_co, 0)
+        self.strojenie = None
+        if cel_mb_na_s is not None or budzet_s is not None:
+            self.strojenie = StrojeniePoziomu(
+                cel_mb_na_s, budzet_s, self.poziom_kompresji
+            )
+
+        # Punkty kontrolne bieżącego kompresuj_wiele_plikow (lub None)
+        self._punkty = None
+
+        # Zgłasza funkcji postępu koniec pliku bez kompresji (lub None)
+        self._zglos_koniec_pliku = None
+
+        # Wspólny folder wszystkich zwalidowanych plików paczki - nazwy wpisów
+        # archiwum są od niego liczone także po pominięciu części plików
+        self._katalog_wspolny = None
+
+        # Szacowane stopnie kompresji z walidacji: {sciezka: stosunek}
+        self._sondy = {}
 
         # Sprawdź czy folder docelowy istnieje, jeśli nie - stwórz go
         if not os.path.exists(sciezka_docelowa):
@@ -55,116 +319,1920 @@ class KompresorPlikow:
         pliki_bledne = []
 
         for sciezka in sciezki_plikow:
-            if os.path.exists(sciezka) and os.path.isfile(sciezka):
-                # Sprawdź czy plik można odczytać
-                try:
-                    with open(sciezka, "rb") as f:
-                        f.read(1)  # Próba odczytu pierwszego bajtu
-                    pliki_prawidlowe.append(sciezka)
-                except (PermissionError, OSError):
-                    pliki_bledne.append(f"{sciezka} - brak uprawnień do odczytu")
+            kod_bledu = self._waliduj_plik(sciezka)
+            if kod_bledu == KOD_BEZ_BLEDU:
+                pliki_prawidlowe.append(sciezka)
             else:
-                pliki_bledne.append(f"{sciezka} - plik nie istnieje")
+                pliki_bledne.append(opis_bledu_walidacji(sciezka, kod_bledu))
 
         return pliki_prawidlowe, pliki_bledne
 
-    def kompresuj_plik(self, sciezka_pliku: str) -> tuple[bool, str, str]:
+    def _waliduj_plik(self, sciezka_pliku: str) -> int:
+        """
+        Sprawdza jeden plik (jak waliduj_pliki).
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+
+        Returns:
+            int: KOD_BEZ_BLEDU, KOD_BRAK_PLIKU lub KOD_BRAK_UPRAWNIEN
+        """
+        poczatek = time.perf_counter_ns()
+        try:
+            # Jedno wywołanie stat (albo żadne, gdy plik znalazł już skaner)
+            rekord = self.skaner.rekord(sciezka_pliku)
+            if rekord is None:
+                return KOD_BRAK_PLIKU
+
+            # Prawo odczytu sprawdzamy z uprawnień zapisanych w rekordzie,
+            # bez otwierania pliku
+            if not rekord.czy_do_odczytu():
+                return KOD_BRAK_UPRAWNIEN
+
+            if self.prog_kompresowalnosci is not None:
+                try:
+                    self._sondy[sciezka_pliku] = oszacuj_kompresowalnosc(
+                        sciezka_pliku, rekord.rozmiar
+                    )
+                except OSError:
+                    return KOD_BRAK_UPRAWNIEN
+
+            return KOD_BEZ_BLEDU
+        finally:
+            self.metryki.dodaj_czas("walidacja", time.perf_counter_ns() - poczatek)
+
+    def kompresuj_plik(
+        self, sciezka_pliku: str, postep: FunkcjaPostepu | None = None
+    ) -> tuple[bool, str, str]:
         """
         Kompresuje pojedynczy plik tekstowy.
 
         Args:
             sciezka_pliku (str): Ścieżka do pliku do skompresowania
+            postep (FunkcjaPostepu | None): Funkcja wywoływana po każdym
+                bloku z liczbą przetworzonych bajtów
 
         Returns:
             Tuple[bool, str, str]: (sukces, sciezka_wyniku, komunikat)
         """
+        with self._przebieg():
+            wynik, szczegoly = self._kompresuj_plik_szczegolowo(sciezka_pliku, postep)
+            self.metryki.zarejestruj_plik(szczegoly)
+        return wynik
+
+    @contextlib.contextmanager
+    def _przebieg(self):
+        """
+        Wyznacza jeden przebieg kompresji.
+
+        W trakcie przebiegu każdy plik jest sprawdzany (stat) najwyżej raz.
+        Po nim kompresor dostaje nowy skaner, więc kolejny przebieg widzi
+        aktualne rozmiary i daty plików, a rekordy zakończonego przebiegu
+        zostają w starym skanerze (np. do raportu). Czas przebiegu trafia
+        do metryk jako czas pracy.
+        """
+        poczatek = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.skaner = SkanerPlikow()
+            self.metryki.dodaj_czas_pracy(time.perf_counter_ns() - poczatek)
+
+    def _kompresuj_plik_szczegolowo(
+        self, sciezka_pliku: str, postep: FunkcjaPostepu | None = None
+    ) -> tuple[tuple[bool, str, str], WynikPliku]:
+        """
+        Kompresuje plik i zwraca dodatkowo szczegóły jego kompresji.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku do skompresowania
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+
+        Returns:
+            Tuple[Tuple[bool, str, str], WynikPliku]: (wynik jak w
+                kompresuj_plik, szczegóły - patrz _stworz_szczegoly)
+        """
+        poczatek = time.perf_counter()
+        szczegoly = self._stworz_szczegoly(sciezka_pliku, "blad")
         try:
-            # Pobierz nazwę pliku bez rozszerzenia
             nazwa_pliku = os.path.basename(sciezka_pliku)
-            nazwa_bez_rozszerzenia = os.path.splitext(nazwa_pliku)[0]
+            sciezka_wyniku = self._sciezka_wyniku(sciezka_pliku)
 
-            # Stwórz nazwę pliku wynikowego
-            sciezka_wyniku = os.path.join(
-                self.sciezka_docelowa, f"{nazwa_bez_rozszerzenia}.zip"
-            )
+            # Plik niezmieniony od poprzedniej kompresji - użyj gotowego wyniku
+            klucz_pamieci = None
+            if self.pamiec_podreczna is not None:
+                klucz_pamieci = self._klucz_pamieci(sciezka_pliku, nazwa_pliku)
+                if self._uzyj_pamieci(klucz_pamieci, sciezka_wyniku, szczegoly):
+                    komunikat = f"Plik {nazwa_pliku} bez zmian - użyto wyniku z pamięci"
+                    self.dziennik.zapisz(komunikat, plik=sciezka_pliku)
+                    szczegoly.czas = time.perf_counter() - poczatek
+                    return (True, sciezka_wyniku, komunikat), szczegoly
+
+            # Kompresja pliku - archiwum powstaje pod nazwą tymczasową i
+            # dopiero gotowe zastępuje stary wynik (także dowiązanie do
+            # pliku w pamięci, który dzięki temu nie jest nadpisywany)
+            with (
+                zapisz_atomowo(sciezka_wyniku) as sciezka_w_zapisie,
+                zipfile.ZipFile(
+                    sciezka_w_zapisie,
+                    "w",
+                    zipfile.ZIP_DEFLATED,
+                    compresslevel=self.poziom_kompresji,
+                ) as zipf,
+            ):
+                self._zapisz_wpis(zipf, sciezka_pliku, nazwa_pliku, szczegoly, postep)
 
-            # Kompresja pliku
-            with zipfile.ZipFile(
-                sciezka_wyniku,
-                "w",
-                zipfile.ZIP_DEFLATED,
-                compresslevel=self.poziom_kompresji,
-            ) as zipf:
-                zipf.write(sciezka_pliku, nazwa_pliku)
+            if klucz_pamieci is not None:
+                self.pamiec_podreczna.dodaj(
+                    klucz_pamieci, sciezka_wyniku, szczegoly.jako_slownik()
+                )
 
             # Logowanie operacji
             komunikat = f"Plik {nazwa_pliku} skompresowany pomyślnie"
-            self.log_operacji.append(f"{datetime.now()}: {komunikat}")
+            self.dziennik.zapisz(komunikat, plik=sciezka_pliku)
 
-            return True, sciezka_wyniku, komunikat
+            szczegoly.czas = time.perf_counter() - poczatek
+            return (True, sciezka_wyniku, komunikat), szczegoly
 
         except Exception as e:
-            komunikat = (
-                f"Błąd kompresji pliku {os.path.basename(sciezka_pliku)}: {str(e)}"
+            # Niedokończone archiwum usunął już zapisz_atomowo
+            komunikat = _komunikat_bledu_kompresji(sciezka_pliku, e)
+            self.dziennik.zapisz(komunikat, POZIOM_BLAD, sciezka_pliku)
+            _oznacz_blad(szczegoly, e)
+            szczegoly.czas = time.perf_counter() - poczatek
+            return (False, "", komunikat), szczegoly
+
+    def _sciezka_wyniku(self, sciezka_pliku: str) -> str:
+        """
+        Tworzy ścieżkę osobnego archiwum ZIP dla pliku.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+
+        Returns:
+            str: Ścieżka w sciezka_docelowa, np. "wyniki/raport.zip"
+        """
+        nazwa_bez_rozszerzenia = os.path.splitext(os.path.basename(sciezka_pliku))[0]
+        return os.path.join(self.sciezka_docelowa, f"{nazwa_bez_rozszerzenia}.zip")
+
+    def _kolizje_nazw(self, sciezki_plikow: list[str]) -> set[int]:
+        """
+        Wskazuje pliki, których archiwum nadpisałoby archiwum wcześniejszego
+        pliku paczki (np. x/log.txt i y/log.txt dają oba log.zip).
+
+        Args:
+            sciezki_plikow (List[str]): Lista ścieżek do plików
+
+        Returns:
+            Set[int]: Indeksy plików do odrzucenia z KOD_KOLIZJA_NAZWY -
+                archiwum dostaje pierwszy plik o danej nazwie
+        """
+        # Wspólne archiwum ma nazwy wpisów względem wspólnego katalogu
+        if self.nazwa_archiwum:
+            return set()
+
+        kolizje = set()
+        zajete = set()
+        for indeks, sciezka in enumerate(sciezki_plikow):
+            nazwa = os.path.normcase(self._sciezka_wyniku(sciezka))
+            if nazwa in zajete:
+                kolizje.add(indeks)
+            else:
+                zajete.add(nazwa)
+        return kolizje
+
+    def _klucz_pamieci(self, sciezka_pliku: str, nazwa_w_archiwum: str) -> str:
+        """
+        Tworzy klucz pamięci podręcznej dla pliku.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+            nazwa_w_archiwum (str): Nazwa wpisu w archiwum
+
+        Returns:
+            str: Klucz zależny od zawartości pliku i ustawień kompresji
+        """
+        ustawienia = [
+            nazwa_w_archiwum,
+            self.kodek,
+            self.poziom_kompresji,
+            self.prog_kompresowalnosci,
+            # Kompresja blokowa daje inny strumień deflate niż ciągła
+            self.rozmiar_bloku,
+            self.liczba_watkow_na_plik > 1,
+        ]
+        if self.dostep_swobodny:
+            ustawienia.append("dostep_swobodny")  # Archiwum zawiera też indeks
+        if self.kodek == "auto":
+            polityka = self.polityka_kodekow
+            ustawienia.append(
+                (
+                    "polityka",
+                    polityka.kodek_domyslny,
+                    polityka.kodek_duzego_tekstu,
+                    polityka.prog_duzego_pliku_mb,
+                    polityka.prog_kompresowalnosci,
+                    polityka.sprawdzaj_probke,
+                )
+            )
+        if self.strojenie is not None:
+            strojenie = self.strojenie
+            ustawienia.append(
+                (
+                    "strojenie",
+                    strojenie.cel_mb_na_s,
+                    strojenie.budzet_s,
+                    strojenie.pozwol_store,
+                )
+            )
+        return self.pamiec_podreczna.stworz_klucz(
+            self.pamiec_podreczna.skrot_pliku(
+                sciezka_pliku, self.skaner.pobierz(sciezka_pliku)
+            ),
+            *ustawienia,
+        )
+
+    def _uzyj_pamieci(
+        self, klucz: str, sciezka_wyniku: str, szczegoly: WynikPliku
+    ) -> bool:
+        """
+        Udostępnia archiwum z pamięci podręcznej pod ścieżką wyniku.
+
+        Args:
+            klucz (str): Klucz pamięci podręcznej
+            sciezka_wyniku (str): Docelowa ścieżka archiwum
+            szczegoly (WynikPliku): Szczegóły pliku - uzupełniane z pamięci
+
+        Returns:
+            bool: True jeśli wynik wzięto z pamięci
+        """
+        zapisane = self.pamiec_podreczna.znajdz(klucz)
+        if zapisane is None:
+            return False
+
+        sciezka_obiektu = zapisane.pop("sciezka_obiektu")
+        # Wynik już jest tym samym plikiem co w pamięci - nic do zrobienia
+        if not (
+            os.path.exists(sciezka_wyniku)
+            and os.path.samefile(sciezka_obiektu, sciezka_wyniku)
+        ):
+            from pamiec_podreczna import udostepnij_plik
+
+            udostepnij_plik(sciezka_obiektu, sciezka_wyniku)
+
+        szczegoly.kodek = zapisane.get("kodek") or ""
+        szczegoly.rozmiar_przed = zapisane.get("rozmiar_przed") or 0
+        szczegoly.rozmiar_po = zapisane.get("rozmiar_po") or 0
+        szczegoly.decyzja = "pamiec"
+        return True
+
+    def _zapisz_wpis(
+        self,
+        zipf: zipfile.ZipFile,
+        sciezka_pliku: str,
+        nazwa_w_archiwum: str,
+        szczegoly: WynikPliku,
+        postep: FunkcjaPostepu | None = None,
+    ) -> zipfile.ZipInfo:
+        """
+        Kompresuje plik do nowego wpisu w otwartym archiwum.
+
+        Args:
+            zipf (zipfile.ZipFile): Otwarte do zapisu archiwum
+            sciezka_pliku (str): Ścieżka do pliku źródłowego
+            nazwa_w_archiwum (str): Nazwa wpisu w archiwum
+            szczegoly (WynikPliku): Szczegóły pliku - uzupełniane w trakcie zapisu
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+
+        Returns:
+            zipfile.ZipInfo: Opis zapisanego wpisu
+        """
+        # Wybór metody kompresji dla tego pliku
+        rekord = self.skaner.pobierz(sciezka_pliku)
+        rozmiar_pliku = rekord.rozmiar
+        kodek = self.wybierz_kodek(sciezka_pliku, rozmiar_pliku)
+        poziom = self.poziom_kompresji
+        if self.strojenie is not None:
+            # Poziom dobrany do celu na podstawie wcześniejszych plików
+            poziom = self.strojenie.wybierz_poziom(kodek)
+            if poziom == POZIOM_STORE:
+                kodek = KODEKI["store"]
+        szczegoly.kodek = kodek.nazwa
+        szczegoly.poziom = poziom
+        szczegoly.rozmiar_przed = rozmiar_pliku
+
+        # Odczyt i zapis mierzą opakowania plików; reszta czasu wpisu to
+        # kompresja (także suma CRC i zgłaszanie postępu). Przy mmap dane
+        # są wczytywane dopiero przy kompresji, więc tam liczy się ich odczyt
+        archiwum = PlikZPomiarem.dla_archiwum(zipf)
+        zapis_przed = archiwum.czas_ns
+
+        # Tryb dostępu swobodnego: niezależne bloki deflate i ich indeks
+        indeks = None
+        if (
+            self.dostep_swobodny
+            and kodek.nazwa == "deflate"
+            and rozmiar_pliku > self.rozmiar_bloku
+        ):
+            indeks = IndeksBlokow()
+
+        # Pliki większe od bloku idą przez potok: odczyt i zapis w osobnych
+        # wątkach, równocześnie z kompresją (małe pliki nie mają czego nakładać)
+        potokowo = self.glebokosc_potoku > 0 and rozmiar_pliku > self.rozmiar_bloku
+        with open(sciezka_pliku, "rb") as plik_zrodlowy:
+            pomiar = PlikZPomiarem(plik_zrodlowy)
+            zrodlo = otworz_zrodlo(pomiar, rozmiar_pliku, self.uzywaj_mmap)
+            if potokowo:
+                zrodlo = czytaj_z_wyprzedzeniem(
+                    zrodlo, self.rozmiar_bloku, self.glebokosc_potoku
+                )
+            zapis = None
+            poczatek = time.perf_counter_ns()
+            try:
+                with (
+                    zapis_w_tle(zipf, self.glebokosc_potoku)
+                    if potokowo
+                    else contextlib.nullcontext()
+                ) as zapis:
+                    # Duże pliki można podzielić na bloki kompresowane równolegle
+                    if indeks is not None or (
+                        kodek.nazwa == "deflate"
+                        and self.liczba_watkow_na_plik > 1
+                        and rozmiar_pliku > self.rozmiar_bloku
+                    ):
+                        info = self._zapisz_rownolegle(
+                            zipf,
+                            rekord,
+                            zrodlo,
+                            nazwa_w_archiwum,
+                            poziom,
+                            postep,
+                            indeks,
+                        )
+                    else:
+                        info = self._zapisz_strumieniowo(
+                            zipf,
+                            rekord,
+                            zrodlo,
+                            nazwa_w_archiwum,
+                            kodek,
+                            poziom,
+                            postep,
+                        )
+            finally:
+                calosc_ns = time.perf_counter_ns() - poczatek
+                # Po zamknięciu wątki potoku już nie zmieniają pomiarów
+                zrodlo.zamknij()
+                kompresja_ns = None
+                if potokowo:
+                    # Etapy się nakładają - kompresja to czas wątku głównego
+                    # bez czekania na wątki odczytu i zapisu
+                    kompresja_ns = calosc_ns - getattr(zrodlo, "czas_oczekiwania_ns", 0)
+                    if zapis is not None:
+                        kompresja_ns -= zapis.czas_oczekiwania_ns
+                self.metryki.dodaj_wpis(
+                    calosc_ns,
+                    pomiar.czas_ns,
+                    archiwum.czas_ns - zapis_przed,
+                    kompresja_ns,
+                )
+
+        szczegoly.decyzja = "store" if kodek.nazwa == "store" else "kompresja"
+        szczegoly.rozmiar_po = info.compress_size
+        if indeks is not None:
+            info_indeksu = zipfile.ZipInfo(
+                nazwa_w_archiwum + ROZSZERZENIE_INDEKSU, info.date_time
             )
-            self.log_operacji.append(f"{datetime.now()}: {komunikat}")
-            return False, "", komunikat
+            info_indeksu.compress_type = zipfile.ZIP_DEFLATED
+            zipf.writestr(info_indeksu, indeks.jako_bajty())
+            szczegoly.rozmiar_po += zipf.getinfo(info_indeksu.filename).compress_size
+        if self.strojenie is not None:
+            self.strojenie.zarejestruj(kodek.nazwa, poziom, rozmiar_pliku, calosc_ns)
+
+        return info
+
+    def _stworz_szczegoly(self, sciezka_pliku: str, decyzja: str) -> WynikPliku:
+        """
+        Tworzy wynik pliku, uzupełniany w trakcie jego kompresji.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+            decyzja (str): "kompresja", "store", "pamiec", "kopia", "pominiety",
+                "blad", "gotowy" lub "ciagly"
+
+        Returns:
+            WynikPliku: Wynik z poziomem kompresji i szacowanym stosunkiem
+                z sondy (None, gdy jej nie było)
+        """
+        return WynikPliku(
+            sciezka_pliku,
+            decyzja,
+            poziom=self.poziom_kompresji,
+            szacowany_stosunek=self._sondy.get(sciezka_pliku),
+        )
+
+    def _stworz_wynik_walidacji(self, sciezka_pliku: str, kod_bledu: int) -> WynikPliku:
+        """
+        Tworzy wynik pliku odrzuconego przez walidację.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+            kod_bledu (int): Kod błędu z _waliduj_plik
+
+        Returns:
+            WynikPliku: Wynik z decyzją "blad" i kodem błędu
+        """
+        szczegoly = self._stworz_szczegoly(sciezka_pliku, "blad")
+        szczegoly.kod_bledu = kod_bledu
+        return szczegoly
+
+    def _czy_nieskompresowalny(self, sciezka_pliku: str) -> bool:
+        """
+        Sprawdza, czy sonda uznała plik za niewart kompresji.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+
+        Returns:
+            bool: True jeśli szacowany stosunek rozmiarów przekracza próg
+        """
+        stosunek = self._sondy.get(sciezka_pliku)
+        return stosunek is not None and stosunek > self.prog_kompresowalnosci
+
+    def _pomin_plik(
+        self, sciezka_pliku: str
+    ) -> tuple[tuple[bool, str, str], WynikPliku]:
+        """
+        Tworzy wynik dla pliku pominiętego przez sondę kompresowalności.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+
+        Returns:
+            Tuple[Tuple[bool, str, str], WynikPliku]: (wynik, szczegóły) -
+                tak samo jak _kompresuj_plik_szczegolowo
+        """
+        komunikat = (
+            f"Plik {os.path.basename(sciezka_pliku)} pominięty - "
+            f"szacowany stopień kompresji {self._sondy[sciezka_pliku]:.2f}"
+        )
+        return (True, "", komunikat), self._stworz_szczegoly(sciezka_pliku, "pominiety")
+
+    def wybierz_kodek(
+        self, sciezka_pliku: str, rozmiar_pliku: int | None = None
+    ) -> Kodek:
+        """
+        Wybiera kodek dla pliku zgodnie z ustawieniem kodek.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+            rozmiar_pliku (int | None): Rozmiar pliku (None = odczytaj z dysku)
+
+        Returns:
+            Kodek: Kodek, którym plik zostanie skompresowany
+        """
+        # Plik odrzucony przez sondę nie jest kompresowany
+        if self._czy_nieskompresowalny(sciezka_pliku):
+            return KODEKI["store"]
+
+        if self.kodek == "auto":
+            return self.polityka_kodekow.wybierz(
+                sciezka_pliku, rozmiar_pliku, self._sondy.get(sciezka_pliku)
+            )
+        return pobierz_kodek(self.kodek)
+
+    def _zapisz_strumieniowo(
+        self,
+        zipf: zipfile.ZipFile,
+        rekord: RekordPliku,
+        zrodlo: ZrodloPliku,
+        nazwa_w_archiwum: str,
+        kodek: Kodek,
+        poziom: int,
+        postep: FunkcjaPostepu | None = None,
+    ):
+        """
+        Zapisuje plik do archiwum blok po bloku, ze stałym zużyciem pamięci.
+
+        Args:
+            zipf (zipfile.ZipFile): Otwarte do zapisu archiwum
+            rekord (RekordPliku): Rekord pliku źródłowego
+            zrodlo (ZrodloPliku): Źródło danych pliku (z otworz_zrodlo)
+            nazwa_w_archiwum (str): Nazwa wpisu w archiwum
+            kodek (Kodek): Metoda kompresji wpisu
+            poziom (int): Poziom kompresji od 1 do 9
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+
+        Returns:
+            zipfile.ZipInfo: Opis zapisanego wpisu (z rozmiarem po kompresji)
+
+        Raises:
+            MemoryError: Gdy zużycie pamięci przekroczy limit_pamieci_mb
+        """
+        # Metadane wpisu (data modyfikacji, rozmiar) bierzemy z rekordu pliku
+        sciezka_pliku = rekord.sciezka
+        info = _info_wpisu(rekord, nazwa_w_archiwum)
+        info.compress_type = kodek.metoda_zip
+        # Poziom ustawiamy tak samo jak ZipFile.write
+        info._compresslevel = kodek.przelicz_poziom(poziom)
+
+        rozmiar_pliku = info.file_size
+
+        # Bloki to widoki na jeden bufor lub na zmapowany plik - bez kopii
+        # danych, a pamięć nie rośnie z rozmiarem pliku
+        przetworzone = 0
+
+        with self._otworz_wpis(zipf, info, kodek, poziom) as cel:
+            for blok in zrodlo.bloki(self.rozmiar_bloku):
+                cel.write(blok)
+                przetworzone += len(blok)
+
+                self._sprawdz_limit_pamieci()
+                if postep:
+                    postep(sciezka_pliku, przetworzone, rozmiar_pliku)
+
+        return info
+
+    def _otworz_wpis(
+        self, zipf: zipfile.ZipFile, info: zipfile.ZipInfo, kodek: Kodek, poziom: int
+    ):
+        """
+        Otwiera wpis archiwum do zapisu wybranym kodekiem.
+
+        Args:
+            zipf (zipfile.ZipFile): Otwarte do zapisu archiwum
+            info (zipfile.ZipInfo): Opis wpisu
+            kodek (Kodek): Metoda kompresji wpisu
+            poziom (int): Poziom kompresji od 1 do 9
+
+        Returns:
+            Plikopodobny obiekt z metodą write(), używany jako menedżer kontekstu
+        """
+        if kodek.wbudowany:
+            return zipf.open(info, "w")
+
+        # Metody nieznane modułowi zipfile (np. zstd) kompresujemy sami
+        return StrumienKompresujacy(zipf, info, kodek.stworz_kompresor(poziom))
+
+    def _zapisz_rownolegle(
+        self,
+        zipf: zipfile.ZipFile,
+        rekord: RekordPliku,
+        zrodlo: ZrodloPliku,
+        nazwa_w_archiwum: str,
+        poziom: int,
+        postep: FunkcjaPostepu | None = None,
+        indeks: IndeksBlokow | None = None,
+    ):
+        """
+        Zapisuje plik do archiwum, kompresując jego bloki na wielu wątkach.
+
+        Bloki są sklejane w jeden strumień deflate, więc archiwum da się
+        rozpakować dowolnym standardowym narzędziem.
+
+        Args:
+            zipf (zipfile.ZipFile): Otwarte do zapisu archiwum
+            rekord (RekordPliku): Rekord pliku źródłowego
+            zrodlo (ZrodloPliku): Źródło danych pliku (z otworz_zrodlo)
+            nazwa_w_archiwum (str): Nazwa wpisu w archiwum
+            poziom (int): Poziom kompresji od 1 do 9
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+            indeks (IndeksBlokow | None): Gdy podany, bloki są niezależne
+                (bez słownika z poprzedniego bloku) i trafiają do indeksu
+
+        Returns:
+            zipfile.ZipInfo: Opis zapisanego wpisu (z rozmiarem po kompresji)
+
+        Raises:
+            MemoryError: Gdy zużycie pamięci przekroczy limit_pamieci_mb
+        """
+        sciezka_pliku = rekord.sciezka
+        info = _info_wpisu(rekord, nazwa_w_archiwum)
+        info.compress_type = zipfile.ZIP_DEFLATED
+
+        rozmiar_pliku = info.file_size
+        crc = 0
+        przetworzone = 0
+
+        wpis = SurowyWpisZip(zipf, info)
+        for dane, skompresowane in kompresuj_deflate_rownolegle(
+            zrodlo,
+            poziom,
+            self.rozmiar_bloku,
+            self.liczba_watkow_na_plik,
+            niezalezne=indeks is not None,
+        ):
+            # Sumę CRC liczymy w wątku głównym, gdy pula kompresuje dalsze bloki
+            crc = zlib.crc32(dane, crc)
+            if indeks is not None:
+                indeks.dodaj_blok(dane, len(skompresowane))
+            wpis.zapisz(skompresowane)
+            przetworzone += len(dane)
+            zrodlo.zwolnij_do(przetworzone)
+
+            self._sprawdz_limit_pamieci()
+            if postep:
+                postep(sciezka_pliku, przetworzone, rozmiar_pliku)
+
+        wpis.zamknij(crc, przetworzone)
+
+        return info
+
+    def _sprawdz_limit_pamieci(self):
+        """
+        Sprawdza, czy proces nie przekroczył limitu pamięci.
+
+        Raises:
+            MemoryError: Gdy zużycie pamięci przekroczy limit_pamieci_mb
+        """
+        if not self.limit_pamieci_mb:
+            return
+
+        if pobierz_zuzycie_pamieci() > self.limit_pamieci_mb * 1024 * 1024:
+            raise MemoryError(f"przekroczono limit pamięci {self.limit_pamieci_mb} MB")
 
     def kompresuj_wiele_plikow(
-        self, sciezki_plikow: list[str]
+        self,
+        sciezki_plikow: list[str],
+        postep: FunkcjaPostepu | None = None,
+        przerwij: threading.Event | None = None,
     ) -> tuple[int, int, list[str]]:
         """
         Kompresuje wiele plików do osobnych archiwów ZIP.
 
+        Plik, którego archiwum nadpisałoby archiwum wcześniejszego pliku
+        o tej samej nazwie, kończy się błędem KOD_KOLIZJA_NAZWY.
+
+        Args:
+            sciezki_plikow (List[str]): Lista ścieżek do plików
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu; w trybie
+                równoległym wywoływana raz, po ukończeniu każdego pliku.
+                Koniec każdego pliku z wynikiem (także pustego, z pamięci
+                podręcznej, błędnego lub pominiętego) jest zgłaszany
+                dokładnie raz wywołaniem z przetworzone == rozmiar
+            przerwij (threading.Event | None): Ustawienie zdarzenia (np. z
+                innego wątku) przerywa kompresję; plik w toku nie zostawia
+                niedokończonego archiwum, a pozostałe pliki są pomijane
+
+        Returns:
+            Tuple[int, int, List[str]]: (liczba_sukcesow, liczba_bledow,
+                komunikaty) - szczegóły plików zostają w wyniki_plikow
+        """
+        # Koniec każdego pliku trafia do funkcji postępu - także pliku bez
+        # kompresji (pusty, z pamięci podręcznej, błędny lub pominięty)
+        if postep is not None:
+            postep, self._zglos_koniec_pliku = self._postep_z_koncem_plikow(postep)
+        try:
+            with self._przebieg(), profiluj(self.plik_profilu):
+                return self._kompresuj_wiele_plikow(sciezki_plikow, postep, przerwij)
+        finally:
+            self._zglos_koniec_pliku = None
+
+    def _kompresuj_wiele_plikow(
+        self,
+        sciezki_plikow: list[str],
+        postep: FunkcjaPostepu | None = None,
+        przerwij: threading.Event | None = None,
+    ) -> tuple[int, int, list[str]]:
+        """
+        Wykonuje kompresuj_wiele_plikow w ramach jednego przebiegu.
+
+        Args:
+            sciezki_plikow (List[str]): Lista ścieżek do plików
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+            przerwij (threading.Event | None): Zdarzenie przerwania kompresji
+
+        Returns:
+            Tuple[int, int, List[str]]: (liczba_sukcesow, liczba_bledow,
+                komunikaty) - szczegóły plików zostają w wyniki_plikow
+        """
+        # Walidacja plików (wraz z sondą kompresowalności, jeśli włączona)
+        self._sondy.clear()
+        self.wyniki_plikow = wyniki_plikow = WynikiKompresji()
+        pliki_prawidlowe = []
+        kolizje = self._kolizje_nazw(sciezki_plikow)
+        for indeks, sciezka in enumerate(sciezki_plikow):
+            if indeks in kolizje:
+                kod_bledu = KOD_KOLIZJA_NAZWY
+            else:
+                kod_bledu = self._waliduj_plik(sciezka)
+            if kod_bledu == KOD_BEZ_BLEDU:
+                pliki_prawidlowe.append(sciezka)
+            else:
+                # Komunikat błędu walidacji wyniki składają same z kodu błędu
+                self._dodaj_wynik(self._stworz_wynik_walidacji(sciezka, kod_bledu))
+
+        if self.nazwa_archiwum and pliki_prawidlowe:
+            self._katalog_wspolny = _katalog_wspolny(pliki_prawidlowe)
+
+        # Pliki odrzucone przez sondę można pominąć bez otwierania archiwum
+        if self.pomijaj_nieskompresowalne and self._sondy:
+            do_kompresji = []
+            for sciezka in pliki_prawidlowe:
+                if self._czy_nieskompresowalny(sciezka):
+                    (_, _, komunikat), szczegoly = self._pomin_plik(sciezka)
+                    self._dodaj_wynik(szczegoly, komunikat)
+                else:
+                    do_kompresji.append(sciezka)
+            pliki_prawidlowe = do_kompresji
+
+        # Punkty kontrolne: fsync archiwów paczkami i dziennik wznowienia
+        punkty = self._otworz_punkty_kontrolne()
+        self._punkty = punkty
+        wszystkie_przetworzone = False
+        try:
+            wznowiono = False
+            if punkty is not None and punkty.ukonczone:
+                do_kompresji = self._pomin_ukonczone(pliki_prawidlowe)
+                wznowiono = len(do_kompresji) < len(pliki_prawidlowe)
+                pliki_prawidlowe = do_kompresji
+
+            wszystkie_przetworzone = self._kompresuj_prawidlowe(
+                pliki_prawidlowe, postep, przerwij, wznowiono
+            )
+        finally:
+            self._punkty = None
+            self._katalog_wspolny = None
+            if punkty is not None:
+                # Dziennik jest potrzebny tylko do powtórzenia nieudanych
+                # lub pominiętych plików
+                try:
+                    punkty.zamknij(
+                        usun_dziennik=wszystkie_przetworzone
+                        and not wyniki_plikow.liczba_bledow()
+                    )
+                finally:
+                    self.metryki.dodaj_czas("fsync", punkty.czas_synchronizacji_ns)
+
+        liczba_bledow = wyniki_plikow.liczba_bledow()
+        return (
+            len(wyniki_plikow) - liczba_bledow,
+            liczba_bledow,
+            list(wyniki_plikow.komunikaty()),
+        )
+
+    def _kompresuj_prawidlowe(
+        self,
+        pliki_prawidlowe: list[str],
+        postep: FunkcjaPostepu | None,
+        przerwij: threading.Event | None,
+        wznowiono: bool,
+    ) -> bool:
+        """
+        Kompresuje zwalidowane pliki, dopisując wyniki do wyniki_plikow.
+
+        Args:
+            pliki_prawidlowe (List[str]): Zwalidowane ścieżki do plików
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+            przerwij (threading.Event | None): Zdarzenie przerwania kompresji
+            wznowiono (bool): Czy część plików ukończono w przerwanym
+                przebiegu (wspólne archiwum jest wtedy uzupełniane)
+
+        Returns:
+            bool: True jeśli przetworzono wszystkie pliki (bez przerwania)
+        """
+        wyniki_plikow = self.wyniki_plikow
+        punkty = self._punkty
+
+        # Budżet czasu doboru poziomu liczy się od tej chwili (rekordy są
+        # już w skanerze po walidacji)
+        if self.strojenie is not None:
+            rekordy = (self.skaner.rekord(sciezka) for sciezka in pliki_prawidlowe)
+            self.strojenie.rozpocznij(
+                sum(rekord.rozmiar for rekord in rekordy if rekord is not None)
+            )
+
+        # Postęp pliku jest zgłaszany po każdym bloku - tam najszybciej
+        # można przerwać kompresję (nie dotyczy puli procesów)
+        postep_pliku = postep
+        if przerwij is not None:
+            postep_pliku = _postep_z_przerwaniem(postep, przerwij)
+
+        # Kompresja prawidłowych plików: do wspólnego archiwum albo do
+        # osobnych archiwów (sekwencyjnie lub w puli procesów). Wznowione
+        # wspólne archiwum jest uzupełniane, a woluminy - dopisywane dalej
+        if self.nazwa_archiwum and (
+            self.tryb_przyrostowy or (wznowiono and not self.maks_rozmiar_woluminu_mb)
+        ):
+            wyniki = self._aktualizuj_archiwum(pliki_prawidlowe, postep_pliku)
+        elif self.nazwa_archiwum:
+            pierwszy_wolumin = 1
+            if wznowiono:
+                while os.path.exists(self._sciezka_woluminu(pierwszy_wolumin)):
+                    pierwszy_wolumin += 1
+            wyniki = self._kompresuj_do_archiwum(
+                pliki_prawidlowe, postep_pliku, pierwszy_wolumin
+            )
+        elif self.liczba_procesow > 1 and len(pliki_prawidlowe) > 1:
+            wyniki = self._kompresuj_rownolegle(pliki_prawidlowe, postep, przerwij)
+            # Pula sama kończy pracę po przerwaniu, podając wyniki plików,
+            # których procesy robocze nie zdążyły porzucić
+            przerwij = None
+        else:
+            wyniki = (
+                self._kompresuj_plik_szczegolowo(sciezka, postep_pliku)
+                for sciezka in pliki_prawidlowe
+            )
+
+        liczba_przetworzonych = 0
+        try:
+            for (sukces, sciezka_wyniku, komunikat), szczegoly in wyniki:
+                liczba_przetworzonych += 1
+                self._dodaj_wynik(szczegoly, komunikat)
+
+                # Plik trafi do dziennika wznowienia, gdy jego archiwum
+                # będzie gotowe (i zsynchronizowane z dyskiem)
+                if punkty is not None and sukces and szczegoly.decyzja != "pominiety":
+                    punkty.dodaj(
+                        szczegoly,
+                        self.skaner.pobierz(szczegoly.sciezka),
+                        sciezka_wyniku,
+                    )
+
+                if przerwij is not None and przerwij.is_set():
+                    break
+        finally:
+            # Zamknięcie generatora sprząta po przerwanej kompresji (zamyka
+            # archiwum, usuwa plik tymczasowy, anuluje zadania puli)
+            wyniki.close()
+
+        pozostalo = len(pliki_prawidlowe) - liczba_przetworzonych
+        if pozostalo:
+            komunikat = f"Kompresja przerwana - pominięto plików: {pozostalo}"
+            self.dziennik.zapisz(komunikat)
+            wyniki_plikow.uwagi.append(f"⏹️ {komunikat}")
+        return not pozostalo
+
+    def _otworz_punkty_kontrolne(self) -> PunktyKontrolne | None:
+        """
+        Otwiera punkty kontrolne, gdy włączono wznawianie lub fsync.
+
+        Returns:
+            PunktyKontrolne | None: Punkty kontrolne przebiegu (None, gdy
+                plik_wznowienia i synchronizuj_co nie są ustawione)
+
+        Raises:
+            OSError: Gdy dziennika wznowienia nie da się otworzyć
+        """
+        if self.plik_wznowienia is None and not self.synchronizuj_co:
+            return None
+
+        # Dziennik z innymi ustawieniami opisuje inne archiwa - nie wznawiamy
+        ustawienia = {
+            "sciezka_docelowa": os.path.abspath(self.sciezka_docelowa),
+            "nazwa_archiwum": self.nazwa_archiwum,
+            "maks_rozmiar_woluminu_mb": self.maks_rozmiar_woluminu_mb,
+            "kodek": self.kodek,
+            "poziom_kompresji": self.poziom_kompresji,
+        }
+        if self.dostep_swobodny:
+            ustawienia["dostep_swobodny"] = True
+        if self.tryb_ciagly:
+            ustawienia["tryb_ciagly"] = True
+        return PunktyKontrolne(self.plik_wznowienia, ustawienia, self.synchronizuj_co)
+
+    def _postep_z_koncem_plikow(
+        self, postep: FunkcjaPostepu
+    ) -> tuple[FunkcjaPostepu, Callable[[WynikPliku], None]]:
+        """
+        Opakowuje funkcję postępu tak, by koniec pliku był zgłaszany dla
+        każdego wyniku paczki.
+
+        Args:
+            postep (FunkcjaPostepu): Oryginalna funkcja postępu
+
+        Returns:
+            Tuple[FunkcjaPostepu, Callable]: (funkcja postępu dla kompresji,
+                funkcja wywoływana z każdym wynikiem - zgłasza koniec pliku,
+                jeśli kompresja go nie zgłosiła)
+        """
+        # Pliki, których koniec zgłosiła już kompresja, a wynik jeszcze nie
+        # dotarł (w trybie ciągłym wyniki przychodzą po zapisie bloku)
+        zgloszone = set()
+
+        def postep_z_koncem(sciezka: str, przetworzone: int, rozmiar: int):
+            if przetworzone >= rozmiar:
+                zgloszone.add(sciezka)
+            postep(sciezka, przetworzone, rozmiar)
+
+        def zglos_koniec_pliku(szczegoly: WynikPliku):
+            sciezka = szczegoly.sciezka
+            if sciezka in zgloszone:
+                zgloszone.discard(sciezka)
+                return
+            # Rozmiar z rekordu, jak przy liczeniu rozmiaru paczki
+            rekord = self.skaner.rekord(sciezka)
+            rozmiar = rekord.rozmiar if rekord is not None else 0
+            postep(sciezka, rozmiar, rozmiar)
+
+        return postep_z_koncem, zglos_koniec_pliku
+
+    def _dodaj_wynik(self, szczegoly: WynikPliku, komunikat: str = ""):
+        """
+        Dopisuje wynik pliku do wyniki_plikow i metryk, zgłaszając koniec
+        pliku funkcji postępu.
+
+        Args:
+            szczegoly (WynikPliku): Wynik pliku
+            komunikat (str): Komunikat bez ikony ("" = składany z wyniku)
+        """
+        self.wyniki_plikow.dodaj(szczegoly, komunikat)
+        self.metryki.zarejestruj_plik(szczegoly)
+        if self._zglos_koniec_pliku is not None:
+            self._zglos_koniec_pliku(szczegoly)
+
+    def _pomin_ukonczone(self, sciezki_plikow: list[str]) -> list[str]:
+        """
+        Pomija pliki ukończone w przerwanym przebiegu (z dziennika wznowienia).
+
+        Args:
+            sciezki_plikow (List[str]): Zwalidowane ścieżki do plików
+
+        Returns:
+            List[str]: Pliki, które trzeba skompresować
+        """
+        do_kompresji = []
+        for sciezka in sciezki_plikow:
+            wpis = self._punkty.ukonczony(sciezka, self.skaner.pobierz(sciezka))
+            if wpis is None:
+                do_kompresji.append(sciezka)
+                continue
+
+            szczegoly = self._stworz_szczegoly(sciezka, "gotowy")
+            szczegoly.kodek = wpis["kodek"]
+            szczegoly.rozmiar_przed = wpis["rozmiar"]
+            szczegoly.rozmiar_po = wpis["rozmiar_po"]
+            komunikat = (
+                f"Plik {os.path.basename(sciezka)} pominięty - "
+                "ukończony w przerwanym przebiegu"
+            )
+            self._dodaj_wynik(szczegoly, komunikat)
+        return do_kompresji
+
+    async def kompresuj_wiele_plikow_async(
+        self,
+        sciezki_plikow: list[str],
+        maks_rownoleglych: int | None = None,
+        postep: FunkcjaPostepu | None = None,
+    ) -> tuple[int, int, list[str]]:
+        """
+        Asynchroniczna wersja kompresuj_wiele_plikow.
+
+        Kompresja odbywa się w wątkach, więc pętla zdarzeń nie jest
+        blokowana. Wynik i komunikaty są takie same jak w wersji
+        synchronicznej (błędy walidacji, pominięte pliki, potem wyniki
+        kompresji - w kolejności wejścia).
+
         Args:
             sciezki_plikow (List[str]): Lista ścieżek do plików
+            maks_rownoleglych (int | None): Ile plików kompresować naraz;
+                None = tyle, ile rdzeni procesora
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu,
+                wywoływana w pętli zdarzeń
 
         Returns:
-            Tuple[int, int, List[str]]: (liczba_sukcesow, liczba_bledow, komunikaty)
+            Tuple[int, int, List[str]]: (liczba_sukcesow, liczba_bledow,
+                komunikaty) - szczegóły plików zostają w wyniki_plikow
+
+        Raises:
+            ValueError: Gdy ustawiono wspólne archiwum (nazwa_archiwum)
+            asyncio.CancelledError: Po anulowaniu - niedokończone archiwa
+                są usuwane przed zgłoszeniem wyjątku
+        """
+        wyniki = [
+            element
+            async for element in self._iteruj_kompresje_async(
+                sciezki_plikow, maks_rownoleglych, postep
+            )
+        ]
+        wyniki.sort(key=lambda element: (element[1], element[0]))
+
+        self.wyniki_plikow = wyniki_plikow = WynikiKompresji()
+        for _indeks, grupa, (_sukces, _sciezka_wyniku, komunikat), szczegoly in wyniki:
+            # Komunikat błędu walidacji wyniki składają same z kodu błędu
+            if grupa == _GRUPA_WALIDACJI:
+                komunikat = ""
+            wyniki_plikow.dodaj(szczegoly, komunikat)
+
+        liczba_bledow = wyniki_plikow.liczba_bledow()
+        return (
+            len(wyniki_plikow) - liczba_bledow,
+            liczba_bledow,
+            list(wyniki_plikow.komunikaty()),
+        )
+
+    async def iteruj_kompresje_async(
+        self,
+        sciezki_plikow: list[str],
+        maks_rownoleglych: int | None = None,
+        postep: FunkcjaPostepu | None = None,
+    ) -> AsyncIterator[tuple[str, tuple[bool, str, str]]]:
+        """
+        Kompresuje pliki w wątkach, podając wynik każdego pliku zaraz po
+        jego ukończeniu (kolejność ukończenia, nie kolejność wejścia).
+
+        Anulowanie zadania lub zamknięcie iteratora przerywa kompresję
+        plików w toku i usuwa ich niedokończone archiwa. Przy wychodzeniu
+        z pętli "async for" przez break iterator trzeba zamknąć jawnie:
+
+            async with contextlib.aclosing(kompresor.iteruj_kompresje_async(p)) as it:
+                async for sciezka, wynik in it:
+                    ...
+
+        Args:
+            sciezki_plikow (List[str]): Lista ścieżek do plików
+            maks_rownoleglych (int | None): Ile plików kompresować naraz;
+                None = tyle, ile rdzeni procesora
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu,
+                wywoływana w pętli zdarzeń
+
+        Yields:
+            Tuple[str, Tuple[bool, str, str]]: (sciezka_pliku, wynik), gdzie
+                wynik to (sukces, sciezka_wyniku, komunikat) jak w
+                kompresuj_plik; błąd walidacji daje (False, "", opis_bledu)
+
+        Raises:
+            ValueError: Gdy ustawiono wspólne archiwum (nazwa_archiwum)
         """
-        # Walidacja plików
-        pliki_prawidlowe, pliki_bledne = self.waliduj_pliki(sciezki_plikow)
+        silnik = self._iteruj_kompresje_async(sciezki_plikow, maks_rownoleglych, postep)
+        async with contextlib.aclosing(silnik):
+            async for indeks, _grupa, wynik, _szczegoly in silnik:
+                yield sciezki_plikow[indeks], wynik
 
-        komunikaty = []
-        liczba_sukcesow = 0
-        liczba_bledow = len(pliki_bledne)
+    async def _iteruj_kompresje_async(
+        self,
+        sciezki_plikow: list[str],
+        maks_rownoleglych: int | None = None,
+        postep: FunkcjaPostepu | None = None,
+    ) -> AsyncIterator[tuple[int, int, tuple[bool, str, str], WynikPliku]]:
+        """
+        Wspólny silnik metod asynchronicznych.
+
+        Args:
+            sciezki_plikow (List[str]): Lista ścieżek do plików
+            maks_rownoleglych (int | None): Ile plików kompresować naraz
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+
+        Yields:
+            Tuple[int, int, Tuple[bool, str, str], WynikPliku]: (indeks_pliku,
+                grupa_wyniku, wynik, szczegoly) w kolejności ukończenia
+        """
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Wspólne archiwum jest zapisywane po kolei - nie ma czego zrównoleglać
+        if self.nazwa_archiwum:
+            raise ValueError("tryb asynchroniczny nie obsługuje wspólnego archiwum")
+
+        if maks_rownoleglych is None:
+            maks_rownoleglych = os.cpu_count() or 1
+        maks_rownoleglych = max(maks_rownoleglych, 1)
 
-        # Dodaj komunikaty o błędach walidacji
-        for blad in pliki_bledne:
-            komunikaty.append(f"❌ {blad}")
+        petla = asyncio.get_running_loop()
+        przerwij = threading.Event()
+        self._sondy.clear()
 
-        # Kompresja prawidłowych plików
-        for sciezka_pliku in pliki_prawidlowe:
-            sukces, sciezka_wyniku, komunikat = self.kompresuj_plik(sciezka_pliku)
+        def postep_w_petli(sciezka: str, przetworzone: int, rozmiar: int):
+            petla.call_soon_threadsafe(postep, sciezka, przetworzone, rozmiar)
 
-            if sukces:
-                liczba_sukcesow += 1
-                komunikaty.append(f"✅ {komunikat}")
+        # Wywoływane w wątku roboczym po każdym bloku - tu najszybciej
+        # można zauważyć anulowanie
+        postep_watku = _postep_z_przerwaniem(postep and postep_w_petli, przerwij)
+
+        kolizje = self._kolizje_nazw(sciezki_plikow)
+
+        def przetworz(indeks: int, sciezka: str):
+            if indeks in kolizje:
+                kod_bledu = KOD_KOLIZJA_NAZWY
             else:
-                liczba_bledow += 1
-                komunikaty.append(f"❌ {komunikat}")
+                kod_bledu = self._waliduj_plik(sciezka)
+            if kod_bledu != KOD_BEZ_BLEDU:
+                blad = opis_bledu_walidacji(sciezka, kod_bledu)
+                szczegoly = self._stworz_wynik_walidacji(sciezka, kod_bledu)
+                return indeks, _GRUPA_WALIDACJI, (False, "", blad), szczegoly
+            if self.pomijaj_nieskompresowalne and self._czy_nieskompresowalny(sciezka):
+                return indeks, _GRUPA_POMINIETYCH, *self._pomin_plik(sciezka)
+            if przerwij.is_set():
+                raise PrzerwanieKompresji("kompresja przerwana")
+            wynik, szczegoly = self._kompresuj_plik_szczegolowo(sciezka, postep_watku)
+            return indeks, _GRUPA_KOMPRESJI, wynik, szczegoly
+
+        pula = ThreadPoolExecutor(max_workers=maks_rownoleglych)
+        kolejne = enumerate(sciezki_plikow)
+        w_toku = set()
+
+        def uruchom_kolejne():
+            # Zlecamy tylko tyle plików, ile może być kompresowanych naraz
+            for indeks, sciezka in kolejne:
+                w_toku.add(petla.run_in_executor(pula, przetworz, indeks, sciezka))
+                if len(w_toku) >= maks_rownoleglych:
+                    break
+
+        with self._przebieg():
+            try:
+                uruchom_kolejne()
+                while w_toku:
+                    gotowe, _ = await asyncio.wait(
+                        w_toku, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    w_toku.difference_update(gotowe)
+                    uruchom_kolejne()
+                    for zadanie in gotowe:
+                        wynik = zadanie.result()
+                        self.metryki.zarejestruj_plik(wynik[3])
+                        yield wynik
+            finally:
+                # Anulowanie lub przerwana pętla: zatrzymaj wątki i poczekaj, aż
+                # usuną niedokończone archiwa, zanim wyjątek pójdzie dalej
+                przerwij.set()
+                pula.shutdown(wait=False, cancel_futures=True)
+                await asyncio.shield(asyncio.gather(*w_toku, return_exceptions=True))
+
+    def _kompresuj_rownolegle(
+        self,
+        sciezki_plikow: list[str],
+        postep: FunkcjaPostepu | None = None,
+        przerwij: threading.Event | None = None,
+    ):
+        """
+        Kompresuje pliki w puli procesów, zwracając wyniki w kolejności wejścia.
+
+        Args:
+            sciezki_plikow (List[str]): Lista zwalidowanych ścieżek do plików
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+            przerwij (threading.Event | None): Po ustawieniu nierozpoczęte
+                pliki są anulowane; pliki już kompresowane są kończone
+
+        Yields:
+            Tuple[Tuple[bool, str, str], WynikPliku]: (wynik, szczegóły) dla
+                kolejnych plików - tak samo jak _kompresuj_plik_szczegolowo
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Procesy robocze dostają kopię kompresora bez historii operacji
+        kopia = copy.copy(self)
+        kopia.dziennik = Dziennik(pojemnosc=0)
+        kopia.metryki = Metryki()
+        kopia.plik_profilu = None
+        kopia.plik_wznowienia = None
+        kopia.synchronizuj_co = 0
+        kopia._punkty = None
+        kopia.wyniki_plikow = WynikiKompresji()
+        liczba_procesow = min(self.liczba_procesow, len(sciezki_plikow))
+        if self.strojenie is not None:
+            # Każdy proces dobiera poziom dla swojej części paczki
+            kopia.strojenie = self.strojenie.podziel(liczba_procesow)
+
+        with ProcessPoolExecutor(
+            max_workers=liczba_procesow,
+            initializer=_inicjalizuj_proces_roboczy,
+            initargs=(kopia,),
+        ) as pula:
+            zadania = [
+                pula.submit(_kompresuj_w_procesie, sciezka)
+                for sciezka in sciezki_plikow
+            ]
+
+            # Odbieramy wyniki w kolejności plików, a nie kolejności ukończenia,
+            # dzięki czemu komunikaty są zawsze w tej samej kolejności
+            try:
+                for sciezka_pliku, zadanie in zip(sciezki_plikow, zadania, strict=True):
+                    if przerwij is not None and przerwij.is_set():
+                        for pozostale in zadania:
+                            pozostale.cancel()
+                    if zadanie.cancelled():
+                        continue
+
+                    try:
+                        wynik, szczegoly, fazy_ns = zadanie.result()
+                        # Czasy faz zmierzone w procesie roboczym
+                        self.metryki.dodaj_fazy(fazy_ns)
+                    except Exception as e:
+                        # Awaria procesu roboczego (np. zabity proces) -
+                        # traktujemy jak zwykły błąd kompresji tego pliku
+                        komunikat = _komunikat_bledu_kompresji(sciezka_pliku, e)
+                        wynik = (False, "", komunikat)
+                        szczegoly = self._stworz_szczegoly(sciezka_pliku, "blad")
+                        _oznacz_blad(szczegoly, e)
+
+                    self.dziennik.zapisz(
+                        wynik[2],
+                        POZIOM_INFO if wynik[0] else POZIOM_BLAD,
+                        sciezka_pliku,
+                    )
+
+                    if postep and wynik[0]:
+                        rozmiar_pliku = szczegoly.rozmiar_przed
+                        postep(sciezka_pliku, rozmiar_pliku, rozmiar_pliku)
+
+                    yield wynik, szczegoly
+            finally:
+                # Przerwana kompresja - nie czekaj na pliki jeszcze nierozpoczęte
+                for zadanie in zadania:
+                    zadanie.cancel()
+
+    def _kompresuj_do_archiwum(
+        self,
+        sciezki_plikow: list[str],
+        postep: FunkcjaPostepu | None = None,
+        pierwszy_wolumin: int = 1,
+    ):
+        """
+        Kompresuje pliki do jednego archiwum (lub kolejnych woluminów).
+
+        Archiwum pozostaje otwarte przez cały czas kompresji, więc nie ma
+        kosztu tworzenia tysięcy osobnych plików i katalogów ZIP. Wolumin
+        jest zapisywany pod nazwą tymczasową i dostaje docelową nazwę po
+        zamknięciu (także po przerwaniu - zawiera wtedy ukończone pliki).
+
+        W trybie ciągłym małe pliki trafiają do bloku ciągłego, a ich wyniki
+        (i wyniki plików po nich) są podawane po zapisie bloku. Po
+        przerwaniu niezapisany blok jest porzucany, a jego pliki nie są
+        podawane - zostają do kolejnego przebiegu.
 
-        return liczba_sukcesow, liczba_bledow, komunikaty
+        Args:
+            sciezki_plikow (List[str]): Lista zwalidowanych ścieżek do plików
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+            pierwszy_wolumin (int): Numer pierwszego zapisywanego woluminu
+                (większy od 1 przy wznawianiu, by nie nadpisać gotowych)
+
+        Yields:
+            Tuple[Tuple[bool, str, str], WynikPliku]: (wynik, szczegóły) dla
+                kolejnych plików - tak samo jak _kompresuj_plik_szczegolowo
+        """
+        if not sciezki_plikow:
+            return
+
+        katalog_wspolny = self._katalog_wspolny or _katalog_wspolny(sciezki_plikow)
+        limit_bajty = (
+            self.maks_rozmiar_woluminu_mb * 1024 * 1024
+            if self.maks_rozmiar_woluminu_mb
+            else None
+        )
+
+        # Tryb ciągły: małe pliki czekają w bloku, a ich wyniki (i wyniki
+        # plików po nich) - na zapis bloku, żeby zachować kolejność plików
+        blok = BlokCiagly() if self.tryb_ciagly else None
+        oczekujace = []  # [(wynik lub None dla pliku w bloku, szczegóły)]
+
+        zipf = None
+        sciezka_woluminu = None
+        numer_woluminu = pierwszy_wolumin - 1
+        try:
+            for sciezka_pliku in sciezki_plikow:
+                poczatek = time.perf_counter()
+                szczegoly = self._stworz_szczegoly(sciezka_pliku, "blad")
+                nazwa_w_archiwum = _nazwa_wpisu(sciezka_pliku, katalog_wspolny)
+
+                try:
+                    # Nowy wolumin, gdy plik nie zmieści się w bieżącym
+                    zalegle = blok.szacuj_rozmiar_po() if blok is not None else 0
+                    if zipf is None or (
+                        limit_bajty
+                        and (zipf.filelist or zalegle)
+                        and zipf.start_dir
+                        + zalegle
+                        + self._szacuj_rozmiar_wpisu(sciezka_pliku)
+                        > limit_bajty
+                    ):
+                        if zipf is not None:
+                            if oczekujace:
+                                yield from self._zapisz_blok_ciagly(
+                                    zipf, blok, oczekujace, sciezka_woluminu
+                                )
+                            self._zamknij_wolumin(zipf, sciezka_woluminu)
+                            zipf = None
+                        numer_woluminu += 1
+                        sciezka_woluminu = self._sciezka_woluminu(numer_woluminu)
+                        zipf = zipfile.ZipFile(
+                            sciezka_tymczasowa(sciezka_woluminu),
+                            "w",
+                            zipfile.ZIP_DEFLATED,
+                            compresslevel=self.poziom_kompresji,
+                        )
+                        if self._punkty is not None:
+                            self._punkty.rozpocznij_wynik(sciezka_woluminu)
+
+                    if blok is not None and self._czy_do_bloku(sciezka_pliku):
+                        self._dodaj_do_bloku(
+                            blok, sciezka_pliku, nazwa_w_archiwum, szczegoly, postep
+                        )
+                        szczegoly.czas = time.perf_counter() - poczatek
+                        oczekujace.append((None, szczegoly))
+                        if blok.rozmiar >= ROZMIAR_BLOKU_CIAGLEGO:
+                            yield from self._zapisz_blok_ciagly(
+                                zipf, blok, oczekujace, sciezka_woluminu
+                            )
+                        continue
+
+                    # Nieudany zapis nie może zostawić uciętego wpisu
+                    stan = zapamietaj_stan(zipf)
+                    try:
+                        self._zapisz_wpis(
+                            zipf, sciezka_pliku, nazwa_w_archiwum, szczegoly, postep
+                        )
+                    except Exception:
+                        wycofaj_do_stanu(zipf, stan)
+                        raise
+
+                    komunikat = (
+                        f"Plik {os.path.basename(sciezka_pliku)} dodany do "
+                        f"archiwum {os.path.basename(sciezka_woluminu)}"
+                    )
+                    self.dziennik.zapisz(komunikat, plik=sciezka_pliku)
+                    wynik = (True, sciezka_woluminu, komunikat)
+
+                except Exception as e:
+                    komunikat = _komunikat_bledu_kompresji(sciezka_pliku, e)
+                    self.dziennik.zapisz(komunikat, POZIOM_BLAD, sciezka_pliku)
+                    _oznacz_blad(szczegoly, e)
+                    wynik = (False, "", komunikat)
+
+                szczegoly.czas = time.perf_counter() - poczatek
+                if not oczekujace:
+                    yield wynik, szczegoly
+                    continue
+                oczekujace.append((wynik, szczegoly))
+                if szczegoly.kod_bledu == KOD_PRZERWANO:
+                    # Po przerwaniu blok nie jest zapisywany - jego pliki
+                    # zostają nieprzetworzone i trafią do kolejnego przebiegu
+                    yield from self._zapisz_blok_ciagly(
+                        zipf, blok, oczekujace, sciezka_woluminu, zapisz=False
+                    )
+
+            if oczekujace:
+                yield from self._zapisz_blok_ciagly(
+                    zipf, blok, oczekujace, sciezka_woluminu
+                )
+        finally:
+            if zipf is not None:
+                # Wolumin otwarty dla pliku, którego nie udało się zapisać
+                # (np. po przerwaniu), zostałby pusty
+                if numer_woluminu > pierwszy_wolumin and not zipf.filelist:
+                    zipf.close()
+                    os.remove(zipf.filename)
+                else:
+                    self._zamknij_wolumin(zipf, sciezka_woluminu)
+
+    def _czy_do_bloku(self, sciezka_pliku: str) -> bool:
+        """
+        Sprawdza, czy plik trafia do bloku ciągłego (tryb ciągły).
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+
+        Returns:
+            bool: True dla małych plików, których sonda nie uznała za
+                niewarte kompresji
+        """
+        rozmiar_pliku = self.skaner.pobierz(sciezka_pliku).rozmiar
+        if rozmiar_pliku > MAKS_ROZMIAR_PLIKU_CIAGLEGO:
+            return False
+        return not self._czy_nieskompresowalny(sciezka_pliku)
+
+    def _kodek_bloku(self) -> Kodek:
+        """
+        Zwraca kodek bloków ciągłych.
+
+        Returns:
+            Kodek: Wybrany kodek, a w trybie "auto" - deflate
+        """
+        if self.kodek == "auto":
+            return KODEKI["deflate"]
+        return pobierz_kodek(self.kodek)
+
+    def _dodaj_do_bloku(
+        self,
+        blok: BlokCiagly,
+        sciezka_pliku: str,
+        nazwa_w_archiwum: str,
+        szczegoly: WynikPliku,
+        postep: FunkcjaPostepu | None = None,
+    ):
+        """
+        Wczytuje mały plik do bloku ciągłego.
+
+        Rozmiar pliku po kompresji jest znany dopiero po zapisie bloku
+        (_zapisz_blok_ciagly).
+
+        Args:
+            blok (BlokCiagly): Zbierany blok
+            sciezka_pliku (str): Ścieżka do pliku źródłowego
+            nazwa_w_archiwum (str): Nazwa pliku w archiwum
+            szczegoly (WynikPliku): Szczegóły pliku - uzupełniane w trakcie
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+        """
+        rekord = self.skaner.pobierz(sciezka_pliku)
+        kodek = self._kodek_bloku()
+
+        poczatek = time.perf_counter_ns()
+        with open(sciezka_pliku, "rb") as plik_zrodlowy:
+            dane = plik_zrodlowy.read()
+        odczyt_ns = time.perf_counter_ns() - poczatek
+        self.metryki.dodaj_wpis(odczyt_ns, odczyt_ns, 0, 0)
+
+        # Postęp przed dopisaniem - przerwany plik nie trafia do bloku
+        if postep:
+            postep(sciezka_pliku, len(dane), len(dane))
+        blok.dodaj(nazwa_w_archiwum, dane, rekord.czas_modyfikacji, rekord.tryb)
+
+        szczegoly.decyzja = "ciagly"
+        szczegoly.kodek = kodek.nazwa
+        szczegoly.rozmiar_przed = len(dane)
+        if self.strojenie is not None:
+            # Małe pliki nie uczą doboru, ale liczą się do budżetu paczki
+            self.strojenie.zarejestruj(kodek.nazwa, szczegoly.poziom, len(dane), 0)
+
+    def _zapisz_blok_ciagly(
+        self,
+        zipf: zipfile.ZipFile,
+        blok: BlokCiagly,
+        oczekujace: list,
+        sciezka_woluminu: str,
+        zapisz: bool = True,
+    ):
+        """
+        Zapisuje blok ciągły i podaje wyniki czekających plików.
+
+        Blok trafia do wpisu ".squeezeit/ciagly_NNNNNN.tar", a jego spis - do
+        wpisu o tej samej nazwie z rozszerzeniem .json. Rozmiar bloku po
+        kompresji i czas zapisu są dzielone między pliki bloku. Gdy zapis
+        się nie uda, wpisy są wycofywane, a pliki bloku dostają błąd.
+
+        Args:
+            zipf (zipfile.ZipFile): Otwarte do zapisu archiwum
+            blok (BlokCiagly): Blok do zapisu (opróżniany)
+            oczekujace (list): [(wynik lub None, szczegóły)] - wyniki czekające
+                na zapis bloku (None = plik w bloku); lista jest opróżniana
+            sciezka_woluminu (str): Docelowa ścieżka archiwum
+            zapisz (bool): False = porzuć blok (po przerwaniu) - jego pliki
+                nie są podawane wcale
+
+        Yields:
+            Tuple[Tuple[bool, str, str], WynikPliku]: (wynik, szczegóły) dla
+                czekających plików, w kolejności plików
+        """
+        gotowe = list(oczekujace)
+        oczekujace.clear()
+        nazwa_archiwum = os.path.basename(sciezka_woluminu)
+
+        blad = None
+        udzialy_rozmiaru = udzialy_czasu = ()
+        if zapisz and len(blok):
+            kodek = self._kodek_bloku()
+            poziom = self.poziom_kompresji
+            numer = 1 + sum(czy_blok_ciagly(info.filename) for info in zipf.filelist)
+            archiwum = PlikZPomiarem.dla_archiwum(zipf)
+            zapis_przed = archiwum.czas_ns
+            poczatek = time.perf_counter_ns()
+
+            stan = zapamietaj_stan(zipf)
+            try:
+                dane = blok.dane()
+                info = zipfile.ZipInfo(nazwa_bloku(numer), time.localtime()[:6])
+                info.compress_type = kodek.metoda_zip
+                info._compresslevel = kodek.przelicz_poziom(poziom)
+                info.file_size = len(dane)
+                with self._otworz_wpis(zipf, info, kodek, poziom) as cel:
+                    cel.write(dane)
+
+                info_spisu = zipfile.ZipInfo(nazwa_spisu(info.filename), info.date_time)
+                info_spisu.compress_type = zipfile.ZIP_DEFLATED
+                zipf.writestr(info_spisu, blok.spis())
+                rozmiar_po = (
+                    info.compress_size + zipf.getinfo(info_spisu.filename).compress_size
+                )
+            except Exception as e:
+                wycofaj_do_stanu(zipf, stan)
+                blad = e
+            calosc_ns = time.perf_counter_ns() - poczatek
+            self.metryki.dodaj_wpis(calosc_ns, 0, archiwum.czas_ns - zapis_przed)
+            if blad is None:
+                udzialy_rozmiaru = blok.podziel(rozmiar_po)
+                blok.stosunek = rozmiar_po / len(dane)
+            udzialy_czasu = blok.podziel(calosc_ns)
+        blok.wyczysc()
+
+        numer_w_bloku = 0
+        for wynik, szczegoly in gotowe:
+            if wynik is None:
+                if not zapisz:
+                    continue
+                sciezka_pliku = szczegoly.sciezka
+                szczegoly.czas += udzialy_czasu[numer_w_bloku] / 1e9
+                if blad is None:
+                    szczegoly.rozmiar_po = udzialy_rozmiaru[numer_w_bloku]
+                    komunikat = (
+                        f"Plik {os.path.basename(sciezka_pliku)} dodany do "
+                        f"bloku ciągłego archiwum {nazwa_archiwum}"
+                    )
+                    self.dziennik.zapisz(komunikat, plik=sciezka_pliku)
+                    wynik = (True, sciezka_woluminu, komunikat)
+                else:
+                    komunikat = _komunikat_bledu_kompresji(sciezka_pliku, blad)
+                    self.dziennik.zapisz(komunikat, POZIOM_BLAD, sciezka_pliku)
+                    _oznacz_blad(szczegoly, blad)
+                    wynik = (False, "", komunikat)
+                numer_w_bloku += 1
+            yield wynik, szczegoly
+
+    def _zamknij_wolumin(self, zipf: zipfile.ZipFile, sciezka_woluminu: str):
+        """
+        Zamyka wolumin i nadaje mu docelową nazwę.
+
+        Args:
+            zipf (zipfile.ZipFile): Wolumin zapisany pod nazwą tymczasową
+            sciezka_woluminu (str): Docelowa ścieżka woluminu
+        """
+        zipf.close()
+        os.replace(zipf.filename, sciezka_woluminu)
+        if self._punkty is not None:
+            self._punkty.zakoncz_wynik(sciezka_woluminu)
+
+    def _aktualizuj_archiwum(
+        self, sciezki_plikow: list[str], postep: FunkcjaPostepu | None = None
+    ):
+        """
+        Aktualizuje istniejące wspólne archiwum o nowe i zmienione pliki.
+
+        Wpisy niezmienionych plików (ten sam rozmiar i czas modyfikacji) oraz
+        wpisy plików spoza tej paczki są kopiowane bajt po bajcie, bez
+        rozpakowywania. Nowe archiwum powstaje obok starego i zastępuje je
+        atomowo - przerwana aktualizacja nie psuje starego archiwum.
+        Bloki ciągłe (wznowienie w trybie ciągłym) też są kopiowane, a
+        pozostałe pliki trafiają do zwykłych wpisów.
+
+        Args:
+            sciezki_plikow (List[str]): Lista zwalidowanych ścieżek do plików
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+
+        Yields:
+            Tuple[Tuple[bool, str, str], WynikPliku]: (wynik, szczegóły) dla
+                kolejnych plików - tak samo jak _kompresuj_plik_szczegolowo
+        """
+        sciezka_archiwum = self._sciezka_woluminu(1)
+        if not sciezki_plikow or not os.path.exists(sciezka_archiwum):
+            yield from self._kompresuj_do_archiwum(sciezki_plikow, postep)
+            return
+
+        katalog_wspolny = self._katalog_wspolny or _katalog_wspolny(sciezki_plikow)
+        nazwa_archiwum = os.path.basename(sciezka_archiwum)
+        if self._punkty is not None:
+            self._punkty.rozpocznij_wynik(sciezka_archiwum)
+
+        with (
+            zipfile.ZipFile(sciezka_archiwum) as stare_archiwum,
+            open(sciezka_archiwum, "rb") as plik_stary,
+        ):
+            stare_wpisy = {info.filename: info for info in stare_archiwum.infolist()}
+
+            with zapisz_atomowo(sciezka_archiwum) as sciezka_w_zapisie:
+                with zipfile.ZipFile(
+                    sciezka_w_zapisie,
+                    "w",
+                    zipfile.ZIP_DEFLATED,
+                    compresslevel=self.poziom_kompresji,
+                ) as zipf:
+                    for sciezka_pliku in sciezki_plikow:
+                        poczatek = time.perf_counter()
+                        szczegoly = self._stworz_szczegoly(sciezka_pliku, "blad")
+                        nazwa_w_archiwum = _nazwa_wpisu(sciezka_pliku, katalog_wspolny)
+                        nazwa_pliku = os.path.basename(sciezka_pliku)
+                        stary_wpis = stare_wpisy.pop(nazwa_w_archiwum, None)
+
+                        stan = zapamietaj_stan(zipf)
+                        try:
+                            if stary_wpis is not None and _czy_wpis_aktualny(
+                                stary_wpis, self.skaner.pobierz(sciezka_pliku)
+                            ):
+                                kopiuj_wpis(plik_stary, stary_wpis, zipf)
+                                szczegoly.decyzja = "kopia"
+                                szczegoly.kodek = _nazwa_kodeka_wpisu(stary_wpis)
+                                szczegoly.rozmiar_przed = stary_wpis.file_size
+                                szczegoly.rozmiar_po = stary_wpis.compress_size
+                                komunikat = (
+                                    f"Plik {nazwa_pliku} bez zmian - "
+                                    f"skopiowano z archiwum {nazwa_archiwum}"
+                                )
+                            else:
+                                self._zapisz_wpis(
+                                    zipf,
+                                    sciezka_pliku,
+                                    nazwa_w_archiwum,
+                                    szczegoly,
+                                    postep,
+                                )
+                                # Stary indeks opisywał poprzednią wersję pliku
+                                stare_wpisy.pop(
+                                    nazwa_w_archiwum + ROZSZERZENIE_INDEKSU, None
+                                )
+                                czynnosc = (
+                                    "dodany do"
+                                    if stary_wpis is None
+                                    else "zaktualizowany w"
+                                )
+                                komunikat = (
+                                    f"Plik {nazwa_pliku} {czynnosc} "
+                                    f"archiwum {nazwa_archiwum}"
+                                )
+                        except Exception as e:
+                            wycofaj_do_stanu(zipf, stan)
+                            # Stara wersja pliku zostaje w archiwum
+                            if stary_wpis is not None:
+                                stare_wpisy[nazwa_w_archiwum] = stary_wpis
+                            komunikat = _komunikat_bledu_kompresji(sciezka_pliku, e)
+                            self.dziennik.zapisz(komunikat, POZIOM_BLAD, sciezka_pliku)
+                            _oznacz_blad(szczegoly, e)
+                            szczegoly.czas = time.perf_counter() - poczatek
+                            yield (False, "", komunikat), szczegoly
+                            continue
+
+                        self.dziennik.zapisz(komunikat, plik=sciezka_pliku)
+                        szczegoly.czas = time.perf_counter() - poczatek
+                        yield (True, sciezka_archiwum, komunikat), szczegoly
+
+                    # Wpisy plików spoza tej paczki przepisujemy bez zmian
+                    for stary_wpis in stare_wpisy.values():
+                        kopiuj_wpis(plik_stary, stary_wpis, zipf)
+
+        if self._punkty is not None:
+            self._punkty.zakoncz_wynik(sciezka_archiwum)
+
+    def _sciezka_woluminu(self, numer_woluminu: int) -> str:
+        """
+        Tworzy ścieżkę wspólnego archiwum lub jego woluminu.
+
+        Args:
+            numer_woluminu (int): Numer woluminu (od 1)
+
+        Returns:
+            str: Ścieżka do pliku archiwum
+        """
+        nazwa_bazowa = os.path.splitext(self.nazwa_archiwum)[0]
+        if self.maks_rozmiar_woluminu_mb:
+            nazwa_bazowa = f"{nazwa_bazowa}_{numer_woluminu:03d}"
+        return os.path.join(self.sciezka_docelowa, f"{nazwa_bazowa}.zip")
+
+    def _szacuj_rozmiar_wpisu(self, sciezka_pliku: str) -> int:
+        """
+        Szacuje rozmiar pliku po kompresji (z sondy, jeśli była).
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+
+        Returns:
+            int: Szacowany rozmiar wpisu w bajtach
+        """
+        stosunek = self._sondy.get(sciezka_pliku, 1.0)
+        rozmiar_pliku = self.skaner.pobierz(sciezka_pliku).rozmiar
+        return int(rozmiar_pliku * min(stosunek, 1.0))
 
     def pobierz_statystyki(self) -> dict:
         """
         Zwraca statystyki wykonanych operacji.
 
         Returns:
-            dict: Słownik ze statystykami
+            dict: Słownik ze statystykami (liczba_operacji, ostatnia_operacja,
+                ostatnie_operacje - do 10 najnowszych wpisów dziennika,
+                poziom_kompresji, kodek, folder_docelowy) oraz metrykami
+                z Metryki.migawka (fazy, liczniki, przepustowość, histogramy)
         """
+        ostatni = self.dziennik.ostatni()
         return {
-            "liczba_operacji": len(self.log_operacji),
-            "ostatnia_operacja": self.log_operacji[-1]
-            if self.log_operacji
-            else "Brak operacji",
+            **self.metryki.migawka(),
+            "liczba_operacji": self.dziennik.liczba_wpisow,
+            "ostatnia_operacja": str(ostatni) if ostatni else "Brak operacji",
+            "ostatnie_operacje": [str(wpis) for wpis in self.dziennik.ostatnie(10)],
             "poziom_kompresji": self.poziom_kompresji,
+            "kodek": self.kodek,
             "folder_docelowy": self.sciezka_docelowa,
         }
 
+    @property
+    def log_operacji(self) -> list[str]:
+        """List[str]: Operacje z bufora dziennika jako napisy "czas: komunikat"."""
+        return [str(wpis) for wpis in self.dziennik]
+
     def wyczysc_log(self):
         """Czyści historię operacji."""
-        self.log_operacji.clear()
+        self.dziennik.wyczysc()
+
+
+# === PULA PROCESÓW ===
+
+# Kompresor procesu roboczego - ustawiany raz przy starcie procesu w puli
+_kompresor_procesu: KompresorPlikow | None = None
+
+
+def _inicjalizuj_proces_roboczy(kompresor: KompresorPlikow):
+    """
+    Zapamiętuje kompresor w procesie roboczym puli.
+
+    Args:
+        kompresor (KompresorPlikow): Kopia kompresora z procesu głównego
+    """
+    global _kompresor_procesu
+    _kompresor_procesu = kompresor
+
+
+def _kompresuj_w_procesie(
+    sciezka_pliku: str,
+) -> tuple[tuple[bool, str, str], WynikPliku, dict[str, int]]:
+    """
+    Kompresuje jeden plik w procesie roboczym puli.
+
+    Args:
+        sciezka_pliku (str): Ścieżka do pliku do skompresowania
+
+    Returns:
+        Tuple[Tuple[bool, str, str], WynikPliku, Dict[str, int]]: (wynik,
+            szczegóły kompresji, czasy faz tego pliku w nanosekundach)
+    """
+    # Dziennik i metryki prowadzi proces główny - tu mierzymy tylko fazy
+    # jednego pliku i odsyłamy je razem z wynikiem
+    metryki = _kompresor_procesu.metryki
+    metryki.wyczysc()
+    wynik, szczegoly = _kompresor_procesu._kompresuj_plik_szczegolowo(sciezka_pliku)
+    return wynik, szczegoly, metryki.czasy_faz()
+
+
+def _postep_z_przerwaniem(
+    postep: FunkcjaPostepu | None, przerwij: threading.Event
+) -> FunkcjaPostepu:
+    """
+    Opakowuje funkcję postępu tak, by przerywała kompresję na żądanie.
+
+    Args:
+        postep (FunkcjaPostepu | None): Oryginalna funkcja postępu
+        przerwij (threading.Event): Zdarzenie żądania przerwania
+
+    Returns:
+        FunkcjaPostepu: Funkcja zgłaszająca PrzerwanieKompresji, gdy
+            zdarzenie jest ustawione
+    """
+
+    def postep_z_przerwaniem(sciezka: str, przetworzone: int, rozmiar: int):
+        if przerwij.is_set():
+            raise PrzerwanieKompresji("kompresja przerwana")
+        if postep is not None:
+            postep(sciezka, przetworzone, rozmiar)
+
+    return postep_z_przerwaniem
+
+
+def _katalog_wspolny(sciezki_plikow: list[str]) -> str:
+    """
+    Zwraca najgłębszy folder zawierający wszystkie podane pliki.
+
+    Args:
+        sciezki_plikow (List[str]): Lista ścieżek do plików
+
+    Returns:
+        str: Ścieżka wspólnego folderu
+    """
+    return os.path.commonpath(
+        [os.path.dirname(os.path.abspath(sciezka)) for sciezka in sciezki_plikow]
+    )
+
+
+def _nazwa_wpisu(sciezka_pliku: str, katalog_wspolny: str) -> str:
+    """
+    Tworzy nazwę wpisu archiwum - ścieżkę względem wspólnego folderu.
+
+    Args:
+        sciezka_pliku (str): Ścieżka do pliku
+        katalog_wspolny (str): Wspólny folder plików
+
+    Returns:
+        str: Nazwa wpisu z separatorem "/" (jak w formacie ZIP)
+    """
+    nazwa = os.path.relpath(os.path.abspath(sciezka_pliku), katalog_wspolny)
+    return nazwa.replace(os.sep, "/")
+
+
+def _czy_wpis_aktualny(info: zipfile.ZipInfo, rekord: RekordPliku) -> bool:
+    """
+    Sprawdza, czy wpis archiwum odpowiada bieżącej wersji pliku.
+
+    Porównywany jest rozmiar i czas modyfikacji z pola extra NTFS (zapisany
+    z dokładnością do 100 ns, w UTC). Wpisy bez tego pola (ze starszych
+    archiwów) mają tylko datę DOS z dokładnością do 2 sekund w czasie
+    lokalnym - gdy i ona się zgadza, o aktualności decyduje suma CRC pliku.
+
+    Args:
+        info (zipfile.ZipInfo): Wpis archiwum
+        rekord (RekordPliku): Rekord pliku
+
+    Returns:
+        bool: True jeśli plik nie zmienił się od zapisania wpisu
+
+    Raises:
+        OSError: Gdy trzeba policzyć sumę CRC, a pliku nie da się odczytać
+    """
+    if info.file_size != rekord.rozmiar:
+        return False
+
+    czas_wpisu = czas_z_pola_ntfs(info.extra)
+    if czas_wpisu is not None:
+        return czas_wpisu == rekord.mtime_ns // 100 * 100
+
+    czas = time.localtime(rekord.czas_modyfikacji)
+    if info.date_time != (*czas[:5], czas[5] // 2 * 2):
+        return False
+    return _crc_pliku(rekord.sciezka) == info.CRC
+
+
+def _crc_pliku(sciezka_pliku: str) -> int:
+    """
+    Liczy sumę CRC32 pliku (jak w nagłówku ZIP).
+
+    Args:
+        sciezka_pliku (str): Ścieżka do pliku
+
+    Returns:
+        int: Suma CRC32 zawartości pliku
+
+    Raises:
+        OSError: Gdy pliku nie da się odczytać
+    """
+    crc = 0
+    with open(sciezka_pliku, "rb") as plik:
+        while dane := plik.read(DOMYSLNY_ROZMIAR_BLOKU):
+            crc = zlib.crc32(dane, crc)
+    return crc
+
+
+def _info_wpisu(rekord: RekordPliku, nazwa_w_archiwum: str) -> zipfile.ZipInfo:
+    """
+    Tworzy opis wpisu ZIP z rekordu pliku - jak ZipInfo.from_file, ale
+    bez ponownego wywołania stat.
+
+    Args:
+        rekord (RekordPliku): Rekord pliku źródłowego
+        nazwa_w_archiwum (str): Nazwa wpisu w archiwum
+
+    Returns:
+        zipfile.ZipInfo: Opis wpisu z datą modyfikacji (także w polu extra
+            NTFS), uprawnieniami i rozmiarem
+
+    Raises:
+        ValueError: Gdy data modyfikacji jest wcześniejsza niż 1980 rok
+    """
+    info = zipfile.ZipInfo(
+        nazwa_w_archiwum, time.localtime(rekord.czas_modyfikacji)[:6]
+    )
+    info.external_attr = (rekord.tryb & 0xFFFF) << 16
+    info.file_size = rekord.rozmiar
+    # Dokładny czas do wykrywania zmian przy aktualizacji archiwum
+    info.extra = pole_czasu_ntfs(rekord.mtime_ns)
+    return info
+
+
+def _oznacz_blad(szczegoly: WynikPliku, blad: Exception):
+    """
+    Oznacza wynik pliku jako błąd z kodem zależnym od wyjątku.
+
+    Args:
+        szczegoly (WynikPliku): Wynik pliku
+        blad (Exception): Wyjątek, który przerwał kompresję pliku
+    """
+    szczegoly.decyzja = "blad"
+    if isinstance(blad, PrzerwanieKompresji):
+        szczegoly.kod_bledu = KOD_PRZERWANO
+    elif isinstance(blad, MemoryError):
+        szczegoly.kod_bledu = KOD_LIMIT_PAMIECI
+    else:
+        szczegoly.kod_bledu = KOD_BLAD_KOMPRESJI
+
+
+def _nazwa_kodeka_wpisu(info: zipfile.ZipInfo) -> str:
+    """
+    Zwraca nazwę kodeka, którym skompresowano istniejący wpis archiwum.
+
+    Args:
+        info (zipfile.ZipInfo): Wpis archiwum
+
+    Returns:
+        str: Nazwa kodeka lub "" dla metody nieznanej programowi
+    """
+    for kodek in KODEKI.values():
+        if kodek.metoda_zip == info.compress_type:
+            return kodek.nazwa
+    return ""
+
+
+def _komunikat_bledu_kompresji(sciezka_pliku: str, blad: Exception) -> str:
+    """
+    Tworzy komunikat o błędzie kompresji pliku.
+
+    Args:
+        sciezka_pliku (str): Ścieżka do pliku
+        blad (Exception): Wyjątek, który wystąpił
+
+    Returns:
+        str: Komunikat błędu
+    """
+    return f"Błąd kompresji pliku {os.path.basename(sciezka_pliku)}: {str(blad)}"
 
 
 def formatuj_rozmiar_pliku(rozmiar_bajty: int) -> str:
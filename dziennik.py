@@ -0,0 +1,377 @@
+# === MODUŁ DZIENNIK - OGRANICZONY DZIENNIK OPERACJI ===
+"""
+Moduł zawierający dziennik operacji kompresora.
+Odpowiedzialny za:
+- Przechowywanie ostatnich operacji w buforze o stałej pojemności
+- Zapisywanie operacji do pliku JSON lines w osobnym wątku
+- Rotację pliku dziennika po przekroczeniu rozmiaru
+
+Dawniej każda operacja była napisem z datetime.now() dopisywanym do listy,
+która rosła bez końca. Teraz wpis to mały obiekt z jednym odczytem zegara,
+bufor zapomina najstarsze wpisy, a zapis do pliku odbywa się paczkami poza
+pętlą kompresji.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime
+
+# Domyślna liczba ostatnich wpisów pamiętanych w buforze
+DOMYSLNA_POJEMNOSC = 1000
+
+# Poziomy wpisów
+POZIOM_INFO = "info"
+POZIOM_BLAD = "blad"
+
+# Znacznik końca pracy wątku zapisującego
+_KONIEC = object()
+
+
+class WpisDziennika:
+    """
+    Jeden wpis dziennika.
+
+    Czas jest odczytywany raz - z zegara monotonicznego - a czas ścienny
+    powstaje przez dodanie przesunięcia zapamiętanego przy tworzeniu
+    dziennika. Dzięki temu kolejność wpisów nie zależy od zmian zegara
+    systemowego.
+
+    Atrybuty:
+        czas_ns (int): Czas ścienny w nanosekundach od epoki Unix
+        monotoniczny_ns (int): Odczyt time.monotonic_ns() (do mierzenia odstępów)
+        poziom (str): POZIOM_INFO lub POZIOM_BLAD
+        komunikat (str): Treść wpisu
+        plik (str | None): Ścieżka pliku, którego dotyczy wpis
+    """
+
+    __slots__ = ("czas_ns", "monotoniczny_ns", "poziom", "komunikat", "plik")
+
+    def __init__(
+        self,
+        czas_ns: int,
+        monotoniczny_ns: int,
+        poziom: str,
+        komunikat: str,
+        plik: str | None = None,
+    ):
+        self.czas_ns = czas_ns
+        self.monotoniczny_ns = monotoniczny_ns
+        self.poziom = poziom
+        self.komunikat = komunikat
+        self.plik = plik
+
+    def __repr__(self) -> str:
+        return f"WpisDziennika({self.poziom!r}, {self.komunikat!r})"
+
+    def __str__(self) -> str:
+        # Ten sam format, co dawne napisy w log_operacji
+        return f"{self.czas}: {self.komunikat}"
+
+    @property
+    def czas(self) -> datetime:
+        """datetime: Czas wpisu (lokalny)."""
+        return datetime.fromtimestamp(self.czas_ns / 1e9)
+
+    def jako_slownik(self) -> dict:
+        """
+        Zwraca wpis jako słownik (np. do zapisu w JSON).
+
+        Returns:
+            dict: czas (ISO 8601), monotoniczny_ns, poziom, komunikat
+                i plik (gdy podany)
+        """
+        wpis = {
+            "czas": self.czas.isoformat(),
+            "monotoniczny_ns": self.monotoniczny_ns,
+            "poziom": self.poziom,
+            "komunikat": self.komunikat,
+        }
+        if self.plik is not None:
+            wpis["plik"] = self.plik
+        return wpis
+
+
+class Dziennik:
+    """
+    Dziennik operacji z buforem ostatnich wpisów o stałej pojemności.
+
+    Zapis wpisu to jeden odczyt zegara i dopisanie do collections.deque
+    (najstarszy wpis wypada sam), więc pamięć nie rośnie z długością
+    pracy. Opcjonalne ujście zapisuje wszystkie wpisy do pliku.
+
+    Metody można wywoływać z wielu wątków naraz.
+    """
+
+    def __init__(
+        self,
+        pojemnosc: int = DOMYSLNA_POJEMNOSC,
+        ujscie: "UjscieDziennika | None" = None,
+    ):
+        """
+        Inicjalizuje pusty dziennik.
+
+        Args:
+            pojemnosc (int): Ile ostatnich wpisów pamiętać (0 = żadnego -
+                wpisy trafiają tylko do ujścia)
+            ujscie (UjscieDziennika | None): Gdzie dodatkowo zapisywać wpisy
+        """
+        self.pojemnosc = max(pojemnosc, 0)
+        self.ujscie = ujscie
+        self._bufor: deque[WpisDziennika] = deque(maxlen=self.pojemnosc)
+        self._blokada = threading.Lock()
+        self._liczba_wpisow = 0
+
+        # Przesunięcie zegara monotonicznego względem czasu ściennego -
+        # wyznaczane raz, a nie przy każdym wpisie
+        self._przesuniecie_ns = time.time_ns() - time.monotonic_ns()
+
+    def __len__(self) -> int:
+        """Liczba wpisów w buforze (najwyżej pojemnosc)."""
+        return len(self._bufor)
+
+    def __iter__(self):
+        """Iteruje po wpisach z bufora, od najstarszego."""
+        with self._blokada:
+            wpisy = list(self._bufor)
+        return iter(wpisy)
+
+    def __getstate__(self) -> dict:
+        # Kopia dziennika przekazywana do procesu roboczego jest pusta
+        # i bez ujścia (wątku ani pliku nie da się przesłać)
+        return {"pojemnosc": self.pojemnosc}
+
+    def __setstate__(self, stan: dict):
+        self.__init__(stan["pojemnosc"])
+
+    @property
+    def liczba_wpisow(self) -> int:
+        """int: Liczba wszystkich wpisów od utworzenia lub wyczyszczenia."""
+        return self._liczba_wpisow
+
+    def zapisz(
+        self, komunikat: str, poziom: str = POZIOM_INFO, plik: str | None = None
+    ) -> WpisDziennika:
+        """
+        Dodaje wpis do dziennika.
+
+        Args:
+            komunikat (str): Treść wpisu
+            poziom (str): POZIOM_INFO lub POZIOM_BLAD
+            plik (str | None): Ścieżka pliku, którego dotyczy wpis
+
+        Returns:
+            WpisDziennika: Dodany wpis
+        """
+        teraz = time.monotonic_ns()
+        wpis = WpisDziennika(
+            teraz + self._przesuniecie_ns, teraz, poziom, komunikat, plik
+        )
+        with self._blokada:
+            self._bufor.append(wpis)
+            self._liczba_wpisow += 1
+        if self.ujscie is not None:
+            self.ujscie.dodaj(wpis)
+        return wpis
+
+    def ostatni(self) -> WpisDziennika | None:
+        """
+        Zwraca najnowszy wpis.
+
+        Returns:
+            WpisDziennika | None: Ostatni wpis lub None, gdy bufor jest pusty
+        """
+        try:
+            return self._bufor[-1]
+        except IndexError:
+            return None
+
+    def ostatnie(self, liczba: int) -> list[WpisDziennika]:
+        """
+        Zwraca najnowsze wpisy.
+
+        Args:
+            liczba (int): Ile wpisów zwrócić
+
+        Returns:
+            List[WpisDziennika]: Wpisy od najstarszego do najnowszego
+        """
+        wpisy = list(self)
+        return wpisy[-liczba:] if liczba > 0 else []
+
+    def wyczysc(self):
+        """Czyści bufor i licznik wpisów (ujście zostaje bez zmian)."""
+        with self._blokada:
+            self._bufor.clear()
+            self._liczba_wpisow = 0
+
+    def zamknij(self):
+        """
+        Zamyka ujście dziennika, czekając na zapis zaległych wpisów.
+
+        Raises:
+            OSError: Gdy zapis do pliku dziennika się nie powiódł
+        """
+        if self.ujscie is not None:
+            self.ujscie.zamknij()
+
+
+class UjscieDziennika:
+    """
+    Zapis wpisów dziennika do pliku JSON lines w osobnym wątku.
+
+    Wątek kompresji tylko wkłada wpis do kolejki. Wątek zapisujący zbiera
+    wszystkie czekające wpisy w paczkę i zapisuje ją jednym wywołaniem
+    write. Gdy plik przekroczy maks_rozmiar_mb, jest przenoszony do
+    plik.1 (starsze kopie do plik.2, plik.3, ...), a zapis trwa w nowym
+    pliku - tak jak logging.handlers.RotatingFileHandler.
+
+    Błąd zapisu nie przerywa kompresji: wpisy są liczone jako utracone,
+    a błąd jest zgłaszany przy zamknięciu.
+    """
+
+    def __init__(
+        self,
+        sciezka_pliku: str,
+        maks_rozmiar_mb: float | None = 10,
+        liczba_kopii: int = 3,
+        rozmiar_paczki: int = 512,
+    ):
+        """
+        Otwiera plik dziennika i uruchamia wątek zapisujący.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku dziennika (dopisywanie)
+            maks_rozmiar_mb (float | None): Rozmiar, po którym plik jest
+                rotowany; None = bez rotacji
+            liczba_kopii (int): Ile starych plików zachować (0 = plik jest
+                po prostu zaczynany od nowa)
+            rozmiar_paczki (int): Najwięcej wpisów zapisywanych naraz
+
+        Raises:
+            OSError: Gdy nie można otworzyć pliku dziennika
+        """
+        self.sciezka_pliku = sciezka_pliku
+        self.maks_rozmiar = int(maks_rozmiar_mb * 1024 * 1024) if maks_rozmiar_mb else 0
+        self.liczba_kopii = max(liczba_kopii, 0)
+        self.rozmiar_paczki = max(rozmiar_paczki, 1)
+        self.liczba_utraconych = 0
+        self.blad: OSError | None = None
+
+        # Otwarcie tutaj, a nie w wątku - zła ścieżka to błąd od razu
+        self._plik = open(sciezka_pliku, "ab")
+        self._rozmiar = self._plik.tell()
+        self._kolejka: queue.SimpleQueue = queue.SimpleQueue()
+        self._watek = threading.Thread(
+            target=self._pracuj, name="squeezeit-dziennik", daemon=True
+        )
+        self._watek.start()
+
+    def __enter__(self) -> "UjscieDziennika":
+        return self
+
+    def __exit__(self, typ_wyjatku, wyjatek, slad):
+        self.zamknij()
+
+    def dodaj(self, wpis: WpisDziennika):
+        """
+        Przekazuje wpis do zapisu (nie czeka na zapis).
+
+        Args:
+            wpis (WpisDziennika): Wpis do zapisania
+        """
+        self._kolejka.put(wpis)
+
+    def dodaj_wiele(self, wpisy: Iterable[WpisDziennika]):
+        """
+        Przekazuje do zapisu wiele wpisów, np. bufor dziennika (nie czeka
+        na zapis).
+
+        Args:
+            wpisy (Iterable[WpisDziennika]): Wpisy do zapisania
+        """
+        for wpis in wpisy:
+            self._kolejka.put(wpis)
+
+    def zamknij(self):
+        """
+        Zapisuje zaległe wpisy, kończy wątek i zamyka plik.
+
+        Raises:
+            OSError: Gdy któryś zapis się nie powiódł
+        """
+        if self._watek.is_alive():
+            self._kolejka.put(_KONIEC)
+            self._watek.join()
+        if self._plik is not None:
+            try:
+                self._plik.close()
+            except OSError as e:
+                self.blad = self.blad or e
+            self._plik = None
+        if self.blad is not None:
+            raise self.blad
+
+    def _pracuj(self):
+        """Pętla wątku zapisującego: zbiera paczki wpisów i je zapisuje."""
+        # Import na miejscu - json potrzebny tylko, gdy zapisujemy do pliku
+        import json
+
+        koniec = False
+        while not koniec:
+            paczka = [self._kolejka.get()]
+            while len(paczka) < self.rozmiar_paczki:
+                try:
+                    paczka.append(self._kolejka.get_nowait())
+                except queue.Empty:
+                    break
+
+            linie = []
+            for wpis in paczka:
+                if wpis is _KONIEC:
+                    koniec = True
+                else:
+                    linie.append(json.dumps(wpis.jako_slownik(), ensure_ascii=False))
+            if linie:
+                self._zapisz_linie(linie)
+
+    def _zapisz_linie(self, linie: list[str]):
+        """
+        Zapisuje paczkę linii i w razie potrzeby rotuje plik.
+
+        Args:
+            linie (List[str]): Wpisy w formacie JSON
+        """
+        if self._plik is None:
+            self.liczba_utraconych += len(linie)
+            return
+
+        dane = ("\n".join(linie) + "\n").encode("utf-8")
+        try:
+            self._plik.write(dane)
+            self._plik.flush()
+            self._rozmiar += len(dane)
+            if self.maks_rozmiar and self._rozmiar >= self.maks_rozmiar:
+                self._rotuj()
+        except OSError as e:
+            self.blad = e
+            self.liczba_utraconych += len(linie)
+
+    def _rotuj(self):
+        """Przenosi pełny plik do kopii i otwiera nowy, pusty plik."""
+        self._plik.close()
+        self._plik = None
+
+        if self.liczba_kopii:
+            for numer in range(self.liczba_kopii - 1, 0, -1):
+                starsza = f"{self.sciezka_pliku}.{numer}"
+                if os.path.exists(starsza):
+                    os.replace(starsza, f"{self.sciezka_pliku}.{numer + 1}")
+            os.replace(self.sciezka_pliku, f"{self.sciezka_pliku}.1")
+            self._plik = open(self.sciezka_pliku, "ab")
+        else:
+            self._plik = open(self.sciezka_pliku, "wb")
+        self._rozmiar = 0
@@ -8,13 +8,23 @@ Odpowiedzialny za:
 - Integrację z logiką kompresji
 """
 
-# import os
+import threading
+import time
 from typing import List, Optional, Tuple
 
 import FreeSimpleGUI as sg  # noqa: N813
 
 from core import KompresorPlikow, formatuj_rozmiar_pliku, oblicz_oszczednosc
 
+# Zdarzenia wysyłane z wątku kompresji do pętli zdarzeń okna
+ZDARZENIE_POSTEP_BAJTOW = "zdarzenie_postep_bajtow"
+ZDARZENIE_POSTEP_PLIKU = "zdarzenie_postep_pliku"
+ZDARZENIE_KONIEC = "zdarzenie_koniec"
+ZDARZENIE_BLAD = "zdarzenie_blad"
+
+# Jak często (w sekundach) wątek kompresji może odświeżać pasek postępu
+ODSTEP_POSTEPU = 0.1
+
 
 class SqueezeItGUI:
     """
@@ -23,12 +33,23 @@ class SqueezeItGUI:
     Atrybuty:
         window: Główne okno aplikacji
         kompresor: Instancja kompresora plików
+        watek_kompresji: Wątek wykonujący bieżącą kompresję (lub None)
     """
 
     def __init__(self):
         """Inicjalizuje interfejs użytkownika."""
         self.window = None
         self.kompresor = None
+        self.watek_kompresji = None
+
+        # Stan bieżącej kompresji
+        self._przerwij = threading.Event()
+        self._bajty_razem = 0
+        self._bajty_ukonczone = 0
+        self._liczba_plikow = 0
+        self._pliki_ukonczone = 0
+        self._czas_startu = 0.0
+        self._ostatni_postep = 0.0
 
     def stworz_glowne_okno(self) -> sg.Window:
         """
@@ -75,6 +96,12 @@ class SqueezeItGUI:
                 size=(20, 15),
             ),
             sg.Text("6", key="label_poziom", size=(3, 1)),
+            sg.Text("Cel MB/s:"),
+            sg.Input(
+                key="input_cel_mb_s",
+                size=(6, 1),
+                tooltip="Opcjonalnie: poziom dobierany do tej przepustowości",
+            ),
         ]
 
         # Przyciski akcji
@@ -85,6 +112,12 @@ class SqueezeItGUI:
                 size=(12, 1),
                 button_color=("white", "green"),
             ),
+            sg.Button(
+                "⏹️ Anuluj",
+                key="btn_anuluj",
+                size=(12, 1),
+                disabled=True,
+            ),
             sg.Button(
                 "📊 Statystyki",
                 key="btn_statystyki",
@@ -99,6 +132,14 @@ class SqueezeItGUI:
             ),
         ]
 
+        # Pasek postępu kompresji
+        sekcja_postep = [
+            sg.ProgressBar(
+                1000, orientation="h", size=(30, 15), key="progress_kompresja"
+            ),
+            sg.Text("", key="label_postep", size=(40, 1)),
+        ]
+
         # Obszar wyników
         obszar_wynikow = [
             sg.Text("Wyniki operacji:", font=("Arial", 12, "bold")),
@@ -123,6 +164,7 @@ class SqueezeItGUI:
             [sekcja_ustawienia],
             [sg.HSeparator()],
             [przyciski],
+            [sekcja_postep],
             [sg.HSeparator()],
             [obszar_wynikow],
         ]
@@ -181,6 +223,29 @@ class SqueezeItGUI:
                     f"Ostatnia operacja: {statystyki.get('ostatnia_operacja', 'Brak')}"
                 )
             ],
+            [sg.Text("Ostatnie operacje:")],
+            [
+                sg.Multiline(
+                    "\n".join(statystyki.get("ostatnie_operacje", [])),
+                    size=(70, 8),
+                    disabled=True,
+                )
+            ],
+            [
+                sg.Text(
+                    f"Przepustowość: {statystyki.get('mb_na_s', 0.0):.1f} MB/s, "
+                    f"{statystyki.get('pliki_na_s', 0.0):.1f} plików/s"
+                )
+            ],
+            [
+                sg.Text(
+                    "Czas faz: "
+                    + ", ".join(
+                        f"{faza} {sekundy:.2f} s"
+                        for faza, sekundy in statystyki.get("fazy", {}).items()
+                    )
+                )
+            ],
             [sg.Text(f"Poziom kompresji: {statystyki.get('poziom_kompresji', 6)}")],
             [
                 sg.Text(
@@ -266,11 +331,33 @@ class SqueezeItGUI:
             elif event == "btn_kompresuj":
                 self.obsluz_kompresje(values)
 
+            # Obsługa przycisku anulowania
+            elif event == "btn_anuluj":
+                self.obsluz_anulowanie()
+
             # Obsługa przycisku statystyk
             elif event == "btn_statystyki":
                 self.obsluz_statystyki()
 
-        # Zamknięcie aplikacji
+            # Zdarzenia z wątku kompresji
+            elif event == ZDARZENIE_POSTEP_BAJTOW:
+                self.aktualizuj_postep(values[event])
+
+            elif event == ZDARZENIE_POSTEP_PLIKU:
+                self._pliki_ukonczone += 1
+
+            elif event == ZDARZENIE_KONIEC:
+                self.zakoncz_kompresje(*values[event])
+
+            elif event == ZDARZENIE_BLAD:
+                self.zakoncz_kompresje_bledem(values[event])
+
+        # Zamknięcie aplikacji - przerwij kompresję i poczekaj, aż wątek
+        # usunie niedokończone archiwum
+        if self.watek_kompresji is not None:
+            self._przerwij.set()
+            self.watek_kompresji.join()
+
         self.window.close()
 
     def obsluz_kompresje(self, values: dict):
@@ -284,6 +371,7 @@ class SqueezeItGUI:
         pliki_tekst = values.get("input_pliki", "")
         folder_docelowy = values.get("input_folder", "")
         poziom_kompresji = int(values.get("slider_kompresja", 6))
+        cel_mb_na_s = values.get("input_cel_mb_s", "").strip()
 
         # Walidacja danych wejściowych
         if not pliki_tekst:
@@ -299,34 +387,173 @@ class SqueezeItGUI:
         sciezki_plikow = [pliki_tekst] if isinstance(pliki_tekst, str) else pliki_tekst
 
         try:
-            # Inicjalizacja kompresora
-            self.kompresor = KompresorPlikow(folder_docelowy, poziom_kompresji)
+            # Inicjalizacja kompresora - z celem MB/s poziom z suwaka jest
+            # tylko poziomem startowym
+            self.kompresor = KompresorPlikow(
+                folder_docelowy,
+                poziom_kompresji,
+                cel_mb_na_s=float(cel_mb_na_s) if cel_mb_na_s else None,
+            )
+        except Exception as e:
+            komunikat_bledu = f"❌ Błąd aplikacji: {str(e)}"
+            self.dodaj_komunikat(komunikat_bledu)
+            sg.popup_error(komunikat_bledu)
+            return
 
-            # Wyczyść obszar wyników
-            self.wyczysc_wyniki()
-            self.dodaj_komunikat("🚀 Rozpoczynam kompresję...")
+        # Wyczyść obszar wyników
+        self.wyczysc_wyniki()
+        self.dodaj_komunikat("🚀 Rozpoczynam kompresję...")
 
-            # Kompresja plików
-            sukces, bledy, komunikaty = self.kompresor.kompresuj_wiele_plikow(
-                sciezki_plikow
-            )
+        # Kompresja odbywa się w osobnym wątku, żeby okno nie zamarzało;
+        # wątek informuje okno o postępie przez window.write_event_value
+        self._przygotuj_postep(sciezki_plikow)
+        self.watek_kompresji = threading.Thread(
+            target=self._kompresuj_w_tle, args=(sciezki_plikow,), daemon=True
+        )
+        self.watek_kompresji.start()
 
-            # Wyświetl wyniki w obszarze wyników
-            for komunikat in komunikaty:
-                self.dodaj_komunikat(komunikat)
+    def _przygotuj_postep(self, sciezki_plikow: list[str]):
+        """
+        Zeruje stan postępu i blokuje przyciski na czas kompresji.
 
-            # Podsumowanie
-            self.dodaj_komunikat("\n📊 Podsumowanie:")
-            self.dodaj_komunikat(f"✅ Pomyślnie: {sukces} plików")
-            self.dodaj_komunikat(f"❌ Błędy: {bledy} plików")
+        Args:
+            sciezki_plikow (List[str]): Lista plików do kompresji
+        """
+        self._przerwij.clear()
+        # Rekordy skanera kompresora wykorzysta potem walidacja plików
+        self._bajty_razem = 0
+        for sciezka in sciezki_plikow:
+            rekord = self.kompresor.skaner.rekord(sciezka)
+            if rekord is not None:  # Brak pliku zgłosi walidacja
+                self._bajty_razem += rekord.rozmiar
+        self._bajty_ukonczone = 0
+        self._liczba_plikow = len(sciezki_plikow)
+        self._pliki_ukonczone = 0
+        self._czas_startu = time.monotonic()
+        self._ostatni_postep = 0.0
+
+        self.window["btn_kompresuj"].update(disabled=True)
+        self.window["btn_anuluj"].update(disabled=False)
+        self.window["progress_kompresja"].update(current_count=0)
+        self.aktualizuj_postep(0)
+
+    def _kompresuj_w_tle(self, sciezki_plikow: list[str]):
+        """
+        Kompresuje pliki - wykonywane w wątku kompresji.
 
-            # Pokaż okno z wynikami
-            self.pokaz_okno_wynikow(sukces, bledy, komunikaty)
+        Nie wolno tu zmieniać elementów okna; wyniki trafiają do pętli
+        zdarzeń jako zdarzenia ZDARZENIE_KONIEC lub ZDARZENIE_BLAD.
 
+        Args:
+            sciezki_plikow (List[str]): Lista plików do kompresji
+        """
+        try:
+            wynik = self.kompresor.kompresuj_wiele_plikow(
+                sciezki_plikow, self._zglos_postep, self._przerwij
+            )
+            self.window.write_event_value(ZDARZENIE_KONIEC, wynik)
         except Exception as e:
-            komunikat_bledu = f"❌ Błąd aplikacji: {str(e)}"
-            self.dodaj_komunikat(komunikat_bledu)
-            sg.popup_error(komunikat_bledu)
+            self.window.write_event_value(
+                ZDARZENIE_BLAD, f"❌ Błąd aplikacji: {str(e)}"
+            )
+
+    def _zglos_postep(self, sciezka_pliku: str, przetworzone: int, rozmiar: int):
+        """
+        Funkcja postępu kompresora - wykonywana w wątku kompresji.
+
+        Wywoływana po każdym bloku, więc zdarzenia postępu bajtów są
+        wysyłane najwyżej co ODSTEP_POSTEPU sekund, by nie zalać okna.
+        Koniec każdego pliku z wynikiem - także pustego, z pamięci
+        podręcznej lub błędnego - kompresor zgłasza raz, z przetworzone
+        równym rozmiar, więc licznik plików i pasek dochodzą do końca.
+
+        Args:
+            sciezka_pliku (str): Kompresowany plik
+            przetworzone (int): Liczba przetworzonych bajtów pliku
+            rozmiar (int): Rozmiar pliku
+        """
+        if przetworzone >= rozmiar:
+            self._bajty_ukonczone += rozmiar
+            bajty = self._bajty_ukonczone
+            self.window.write_event_value(ZDARZENIE_POSTEP_PLIKU, sciezka_pliku)
+        else:
+            bajty = self._bajty_ukonczone + przetworzone
+
+        teraz = time.monotonic()
+        if przetworzone >= rozmiar or teraz - self._ostatni_postep >= ODSTEP_POSTEPU:
+            self._ostatni_postep = teraz
+            self.window.write_event_value(ZDARZENIE_POSTEP_BAJTOW, bajty)
+
+    def aktualizuj_postep(self, bajty: int):
+        """
+        Aktualizuje pasek postępu, prędkość i szacowany czas do końca.
+
+        Args:
+            bajty (int): Liczba przetworzonych bajtów całej paczki
+        """
+        uplynelo = time.monotonic() - self._czas_startu
+        predkosc = bajty / uplynelo if uplynelo > 0 else 0.0
+        pozostalo = (self._bajty_razem - bajty) / predkosc if predkosc > 0 else None
+        ulamek = bajty / self._bajty_razem if self._bajty_razem else 0.0
+
+        self.window["progress_kompresja"].update(
+            current_count=int(min(ulamek, 1.0) * 1000)
+        )
+        self.window["label_postep"].update(
+            f"{self._pliki_ukonczone}/{self._liczba_plikow} plików • "
+            f"{predkosc / (1024 * 1024):.1f} MB/s • "
+            f"pozostało {formatuj_czas(pozostalo)}"
+        )
+
+    def obsluz_anulowanie(self):
+        """Obsługuje przycisk anulowania kompresji."""
+        if self.watek_kompresji is not None:
+            self._przerwij.set()
+            self.window["btn_anuluj"].update(disabled=True)
+            self.dodaj_komunikat("⏹️ Anulowanie kompresji...")
+
+    def _odblokuj_przyciski(self):
+        """Kończy kompresję w tle i przywraca przyciski."""
+        if self.watek_kompresji is not None:
+            self.watek_kompresji.join()
+            self.watek_kompresji = None
+
+        self.window["btn_kompresuj"].update(disabled=False)
+        self.window["btn_anuluj"].update(disabled=True)
+
+    def zakoncz_kompresje(self, sukces: int, bledy: int, komunikaty: list[str]):
+        """
+        Wyświetla wyniki zakończonej (lub anulowanej) kompresji.
+
+        Args:
+            sukces (int): Liczba pomyślnie skompresowanych plików
+            bledy (int): Liczba błędów
+            komunikaty (List[str]): Lista komunikatów
+        """
+        self._odblokuj_przyciski()
+
+        # Wyświetl wyniki w obszarze wyników
+        for komunikat in komunikaty:
+            self.dodaj_komunikat(komunikat)
+
+        # Podsumowanie
+        self.dodaj_komunikat("\n📊 Podsumowanie:")
+        self.dodaj_komunikat(f"✅ Pomyślnie: {sukces} plików")
+        self.dodaj_komunikat(f"❌ Błędy: {bledy} plików")
+
+        # Pokaż okno z wynikami
+        self.pokaz_okno_wynikow(sukces, bledy, komunikaty)
+
+    def zakoncz_kompresje_bledem(self, komunikat_bledu: str):
+        """
+        Wyświetla błąd, który przerwał kompresję w tle.
+
+        Args:
+            komunikat_bledu (str): Komunikat błędu
+        """
+        self._odblokuj_przyciski()
+        self.dodaj_komunikat(komunikat_bledu)
+        sg.popup_error(komunikat_bledu)
 
     def obsluz_statystyki(self):
         """Obsługuje wyświetlanie statystyk."""
@@ -337,6 +564,26 @@ class SqueezeItGUI:
             sg.popup("ℹ️ Brak danych - wykonaj najpierw kompresję plików.")
 
 
+def formatuj_czas(sekundy: float | None) -> str:
+    """
+    Formatuje czas w sekundach jako mm:ss (lub gg:mm:ss).
+
+    Args:
+        sekundy (float | None): Czas w sekundach (None = nieznany)
+
+    Returns:
+        str: Sformatowany czas, np. "03:25"; "--:--" gdy czas nieznany
+    """
+    if sekundy is None:
+        return "--:--"
+
+    minuty, sekundy = divmod(int(sekundy), 60)
+    godziny, minuty = divmod(minuty, 60)
+    if godziny:
+        return f"{godziny}:{minuty:02d}:{sekundy:02d}"
+    return f"{minuty:02d}:{sekundy:02d}"
+
+
 def uruchom_aplikacje():
     """
     Funkcja pomocnicza do uruchomienia aplikacji.
@@ -0,0 +1,407 @@
+# === MODUŁ INDEKS - DOSTĘP SWOBODNY DO SKOMPRESOWANYCH PLIKÓW ===
+"""
+Moduł zawierający indeks bloków i odczyt fragmentów dużych wpisów.
+Odpowiedzialny za:
+- Indeks bloków: początek każdego bloku przed i po kompresji, liczba
+  wierszy do końca bloku i suma CRC-32 bloku
+- Zapis indeksu w zwartej postaci binarnej (wpis "<nazwa>.sqidx" obok
+  wpisu w tym samym archiwum)
+- Odczyt zakresu bajtów lub wierszy z rozpakowaniem tylko potrzebnych bloków
+
+Kompresor w trybie dostępu swobodnego kompresuje plik w niezależnych
+blokach deflate (bez słownika z poprzedniego bloku, każdy kończony
+Z_SYNC_FLUSH). Sklejone bloki nadal tworzą jeden zwykły strumień deflate,
+więc archiwum otworzy każde narzędzie ZIP - a dzięki indeksowi każdy
+blok da się też rozpakować osobno. Odczyt kilku wierszy z końca 20 GB
+logu to rozpakowanie jednego lub dwóch bloków zamiast całego pliku.
+"""
+
+import struct
+import sys
+import zipfile
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+
+from archiwum import przejdz_do_danych
+
+# Rozszerzenie wpisu z indeksem, dopisywane do nazwy wpisu danych
+ROZSZERZENIE_INDEKSU = ".sqidx"
+
+# Nagłówek indeksu: znacznik, wersja, liczba bloków, rozmiar danych,
+# liczba wierszy (po nim kolumny: 3 x uint64 i uint32 na blok)
+_NAGLOWEK = struct.Struct("<4sBIQQ")
+_ZNACZNIK = b"SQIX"
+WERSJA_INDEKSU = 1
+
+# Rozmiar fragmentu czytanego z wpisu bez indeksu
+_ROZMIAR_FRAGMENTU = 1024 * 1024
+
+
+class IndeksBlokow:
+    """
+    Indeks bloków jednego wpisu, zapisany kolumnowo w tablicach array.
+
+    Atrybuty:
+        poczatki (array): Początek bloku w danych (przed kompresją)
+        pozycje (array): Początek bloku w skompresowanym wpisie
+        wiersze (array): Liczba znaków nowego wiersza od początku pliku do
+            końca bloku
+        sumy_crc (array): Suma CRC-32 danych bloku
+        rozmiar (int): Rozmiar danych przed kompresją
+        liczba_wierszy (int): Liczba wierszy (ostatni może nie mieć "\\n")
+    """
+
+    def __init__(self):
+        """Tworzy pusty indeks."""
+        self.poczatki = array("Q")
+        self.pozycje = array("Q")
+        self.wiersze = array("Q")
+        self.sumy_crc = array("I")
+        self.rozmiar = 0
+        self.liczba_wierszy = 0
+        self._rozmiar_skompresowany = 0
+        self._znaki_nowego_wiersza = 0
+
+    def __len__(self) -> int:
+        return len(self.poczatki)
+
+    def dodaj_blok(self, dane, rozmiar_skompresowany: int):
+        """
+        Dopisuje kolejny blok.
+
+        Args:
+            dane (bytes | memoryview): Dane bloku przed kompresją
+            rozmiar_skompresowany (int): Rozmiar skompresowanego bloku
+        """
+        # bytes() - memoryview (np. na zmapowany plik) nie ma metody count;
+        # kopia bloku to ułamek czasu jego kompresji
+        dane = bytes(dane)
+        self.poczatki.append(self.rozmiar)
+        self.pozycje.append(self._rozmiar_skompresowany)
+        self._znaki_nowego_wiersza += dane.count(b"\n")
+        self.wiersze.append(self._znaki_nowego_wiersza)
+        self.sumy_crc.append(zlib.crc32(dane))
+        self.rozmiar += len(dane)
+        self._rozmiar_skompresowany += rozmiar_skompresowany
+        if dane:
+            # Niedokończony ostatni wiersz też jest wierszem
+            self.liczba_wierszy = self._znaki_nowego_wiersza + (dane[-1:] != b"\n")
+
+    def jako_bajty(self) -> bytes:
+        """
+        Zapisuje indeks w postaci binarnej (little-endian).
+
+        Returns:
+            bytes: Nagłówek i kolumny indeksu
+        """
+        kolumny = [self.poczatki, self.pozycje, self.wiersze, self.sumy_crc]
+        if sys.byteorder == "big":
+            kolumny = [array(kolumna.typecode, kolumna) for kolumna in kolumny]
+            for kolumna in kolumny:
+                kolumna.byteswap()
+        naglowek = _NAGLOWEK.pack(
+            _ZNACZNIK, WERSJA_INDEKSU, len(self), self.rozmiar, self.liczba_wierszy
+        )
+        return naglowek + b"".join(kolumna.tobytes() for kolumna in kolumny)
+
+    @classmethod
+    def z_bajtow(cls, dane: bytes) -> "IndeksBlokow":
+        """
+        Odczytuje indeks zapisany przez jako_bajty.
+
+        Args:
+            dane (bytes): Zapisany indeks
+
+        Returns:
+            IndeksBlokow: Odczytany indeks
+
+        Raises:
+            ValueError: Gdy dane nie są indeksem lub mają inną wersję
+        """
+        try:
+            znacznik, wersja, liczba, rozmiar, wiersze = _NAGLOWEK.unpack_from(dane)
+        except struct.error:
+            raise ValueError("uszkodzony indeks bloków") from None
+        if znacznik != _ZNACZNIK or wersja != WERSJA_INDEKSU:
+            raise ValueError("nieobsługiwany format indeksu bloków")
+
+        indeks = cls()
+        indeks.rozmiar = rozmiar
+        indeks.liczba_wierszy = wiersze
+        pozycja = _NAGLOWEK.size
+        for kolumna in (
+            indeks.poczatki,
+            indeks.pozycje,
+            indeks.wiersze,
+            indeks.sumy_crc,
+        ):
+            koniec = pozycja + liczba * kolumna.itemsize
+            if koniec > len(dane):
+                raise ValueError("uszkodzony indeks bloków")
+            kolumna.frombytes(dane[pozycja:koniec])
+            if sys.byteorder == "big":
+                kolumna.byteswap()
+            pozycja = koniec
+        return indeks
+
+    def blok_bajtu(self, pozycja: int) -> int:
+        """
+        Zwraca numer bloku zawierającego bajt.
+
+        Args:
+            pozycja (int): Pozycja bajtu w danych (0 <= pozycja < rozmiar)
+
+        Returns:
+            int: Numer bloku
+        """
+        return max(bisect_right(self.poczatki, pozycja) - 1, 0)
+
+    def blok_wiersza(self, numer: int) -> int:
+        """
+        Zwraca numer bloku, w którym zaczyna się wiersz.
+
+        Wiersz numer n (od 0) zaczyna się za n-tym znakiem nowego wiersza,
+        więc szukamy bloku z tym znakiem.
+
+        Args:
+            numer (int): Numer wiersza (od 0)
+
+        Returns:
+            int: Numer bloku (dla wiersza 0 - blok 0)
+        """
+        if numer <= 0:
+            return 0
+        return min(bisect_left(self.wiersze, numer), len(self) - 1)
+
+
+class CzytnikFragmentow:
+    """
+    Odczyt zakresów bajtów i wierszy z wpisu archiwum bez rozpakowania całości.
+
+    Gdy wpis ma indeks bloków, rozpakowywane są tylko bloki obejmujące
+    zakres (ostatnio użyty blok jest pamiętany), a ich sumy CRC-32 są
+    sprawdzane. Wpis bez indeksu (np. skompresowany bez trybu dostępu
+    swobodnego) też da się czytać - wtedy od początku, blokami o stałym
+    rozmiarze, więc wolniej, ale bez wczytywania całości do pamięci.
+
+    Obiekt nie jest bezpieczny dla wielu wątków naraz.
+
+    Atrybuty:
+        info (zipfile.ZipInfo): Czytany wpis
+        indeks (IndeksBlokow | None): Indeks bloków (None = wpis bez indeksu)
+        rozmiar (int): Rozmiar danych wpisu przed kompresją
+    """
+
+    def __init__(self, sciezka_archiwum: str, nazwa_wpisu: str | None = None):
+        """
+        Otwiera archiwum i wczytuje indeks wpisu.
+
+        Args:
+            sciezka_archiwum (str): Ścieżka archiwum ZIP
+            nazwa_wpisu (str | None): Nazwa wpisu (None = pierwszy wpis, który
+                nie jest folderem ani indeksem)
+
+        Raises:
+            OSError: Gdy archiwum nie da się otworzyć
+            zipfile.BadZipFile: Gdy plik nie jest archiwum ZIP
+            KeyError: Gdy archiwum nie zawiera wpisu
+            ValueError: Gdy indeks wpisu jest uszkodzony
+        """
+        self._zipf = zipfile.ZipFile(sciezka_archiwum)
+        try:
+            if nazwa_wpisu is None:
+                nazwa_wpisu = next(
+                    (
+                        info.filename
+                        for info in self._zipf.infolist()
+                        if not info.is_dir()
+                        and not info.filename.endswith(ROZSZERZENIE_INDEKSU)
+                    ),
+                    None,
+                )
+                if nazwa_wpisu is None:
+                    raise KeyError("archiwum nie zawiera plików")
+            self.info = self._zipf.getinfo(nazwa_wpisu)
+            self.rozmiar = self.info.file_size
+
+            self.indeks = None
+            self._poczatek_danych = None
+            if (
+                self.info.compress_type == zipfile.ZIP_DEFLATED
+                and nazwa_wpisu + ROZSZERZENIE_INDEKSU in self._zipf.NameToInfo
+            ):
+                indeks = IndeksBlokow.z_bajtow(
+                    self._zipf.read(nazwa_wpisu + ROZSZERZENIE_INDEKSU)
+                )
+                if indeks.rozmiar != self.rozmiar:
+                    raise ValueError("indeks bloków nie pasuje do wpisu")
+                self.indeks = indeks
+                przejdz_do_danych(self._zipf.fp, self.info)
+                self._poczatek_danych = self._zipf.fp.tell()
+        except BaseException:
+            self._zipf.close()
+            raise
+
+        self._liczba_wierszy = self.indeks.liczba_wierszy if self.indeks else None
+        self._ostatni_blok = (-1, b"")  # (numer, dane) ostatnio rozpakowanego bloku
+
+    @property
+    def liczba_wierszy(self) -> int:
+        """Liczba wierszy wpisu (bez indeksu - liczona przy pierwszym użyciu)."""
+        if self._liczba_wierszy is None:
+            znaki = 0
+            ostatni = b"\n"
+            for _, dane in self._dane_od(0):
+                znaki += dane.count(b"\n")
+                ostatni = dane[-1:]
+            self._liczba_wierszy = znaki + (ostatni != b"\n")
+        return self._liczba_wierszy
+
+    def _blok(self, numer: int) -> bytes:
+        """
+        Rozpakowuje jeden blok wpisu z indeksem.
+
+        Args:
+            numer (int): Numer bloku
+
+        Returns:
+            bytes: Dane bloku
+
+        Raises:
+            zipfile.BadZipFile: Gdy suma CRC-32 bloku się nie zgadza
+        """
+        if self._ostatni_blok[0] == numer:
+            return self._ostatni_blok[1]
+
+        indeks = self.indeks
+        poczatek = indeks.pozycje[numer]
+        if numer + 1 < len(indeks):
+            koniec = indeks.pozycje[numer + 1]
+        else:
+            koniec = self.info.compress_size
+        self._zipf.fp.seek(self._poczatek_danych + poczatek)
+        skompresowane = self._zipf.fp.read(koniec - poczatek)
+
+        # Blok zaczyna się na granicy bajtu i nie odwołuje się do
+        # wcześniejszych danych, więc wystarczy nowy dekompresor
+        dane = zlib.decompressobj(-15).decompress(skompresowane)
+        if zlib.crc32(dane) != indeks.sumy_crc[numer]:
+            raise zipfile.BadZipFile(
+                f"Bad CRC-32 for block {numer} of file {self.info.filename!r}"
+            )
+        self._ostatni_blok = (numer, dane)
+        return dane
+
+    def _dane_od(self, numer_bloku: int) -> Iterator[tuple[int, bytes]]:
+        """
+        Podaje dane wpisu od początku bloku do końca wpisu.
+
+        Args:
+            numer_bloku (int): Pierwszy blok (bez indeksu - zawsze od początku)
+
+        Yields:
+            Tuple[int, bytes]: (pozycja fragmentu w danych, fragment)
+        """
+        if self.indeks is not None:
+            for numer in range(numer_bloku, len(self.indeks)):
+                yield self.indeks.poczatki[numer], self._blok(numer)
+            return
+
+        pozycja = 0
+        with self._zipf.open(self.info) as wpis:
+            while dane := wpis.read(_ROZMIAR_FRAGMENTU):
+                yield pozycja, dane
+                pozycja += len(dane)
+
+    def czytaj(self, poczatek: int, dlugosc: int = -1) -> bytes:
+        """
+        Czyta zakres bajtów wpisu.
+
+        Args:
+            poczatek (int): Pozycja pierwszego bajtu (ujemna - od końca)
+            dlugosc (int): Liczba bajtów (-1 = do końca wpisu)
+
+        Returns:
+            bytes: Dane z zakresu (krótsze na końcu wpisu)
+        """
+        if poczatek < 0:
+            poczatek = max(self.rozmiar + poczatek, 0)
+        koniec = self.rozmiar if dlugosc < 0 else min(poczatek + dlugosc, self.rozmiar)
+        if poczatek >= koniec:
+            return b""
+
+        numer = self.indeks.blok_bajtu(poczatek) if self.indeks else 0
+        czesci = []
+        for pozycja, dane in self._dane_od(numer):
+            if pozycja >= koniec:
+                break
+            if pozycja + len(dane) > poczatek:
+                czesci.append(dane[max(poczatek - pozycja, 0) : koniec - pozycja])
+        return b"".join(czesci)
+
+    def _pozycja_wiersza(self, numer: int) -> int:
+        """
+        Zwraca pozycję pierwszego bajtu wiersza.
+
+        Args:
+            numer (int): Numer wiersza (od 0)
+
+        Returns:
+            int: Pozycja w danych (rozmiar, gdy wiersza nie ma)
+        """
+        if numer <= 0:
+            return 0
+        if self.indeks is not None:
+            if numer >= self.indeks.liczba_wierszy:
+                return self.rozmiar
+            numer_bloku = self.indeks.blok_wiersza(numer)
+            przed = self.indeks.wiersze[numer_bloku - 1] if numer_bloku else 0
+        else:
+            numer_bloku = 0
+            przed = 0
+
+        # Szukamy znaku nowego wiersza numer (numer - przed) od początku bloku
+        do_pominiecia = numer - przed
+        for pozycja, dane in self._dane_od(numer_bloku):
+            znak = -1
+            while do_pominiecia:
+                znak = dane.find(b"\n", znak + 1)
+                if znak < 0:
+                    break
+                do_pominiecia -= 1
+            if not do_pominiecia:
+                return pozycja + znak + 1
+        return self.rozmiar
+
+    def czytaj_wiersze(self, pierwszy: int, liczba: int | None = None) -> bytes:
+        """
+        Czyta kolejne wiersze wpisu (razem ze znakami nowego wiersza).
+
+        Args:
+            pierwszy (int): Numer pierwszego wiersza od 0 (ujemny - od końca,
+                np. -100 to ostatnie 100 wierszy)
+            liczba (int | None): Liczba wierszy (None = do końca wpisu)
+
+        Returns:
+            bytes: Wiersze z zakresu
+        """
+        if pierwszy < 0:
+            pierwszy = max(self.liczba_wierszy + pierwszy, 0)
+        poczatek = self._pozycja_wiersza(pierwszy)
+        if liczba is None:
+            return self.czytaj(poczatek)
+        koniec = self._pozycja_wiersza(pierwszy + max(liczba, 0))
+        return self.czytaj(poczatek, koniec - poczatek)
+
+    def zamknij(self):
+        """Zamyka archiwum."""
+        self._ostatni_blok = (-1, b"")
+        self._zipf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, typ_wyjatku, wyjatek, slad):
+        self.zamknij()
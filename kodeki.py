@@ -0,0 +1,307 @@
+# === MODUŁ KODEKI - METODY KOMPRESJI ===
+"""
+Moduł zawierający dostępne metody kompresji (kodeki) wpisów ZIP.
+Odpowiedzialny za:
+- Opis kodeków: store, deflate, bzip2, lzma i opcjonalnie zstd
+- Przeliczanie poziomu kompresji 1-9 na zakres danego kodeka
+- Szybkie oszacowanie, czy plik warto kompresować
+- Wybór kodeka dla pliku (polityka kodeków)
+"""
+
+import os
+import zipfile
+import zlib
+
+from utils import czy_plik_skompresowany, czy_plik_tekstowy
+
+# Opcjonalna biblioteka zstd - gdy jej brak, kodek zstd jest niedostępny
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Identyfikator metody zstd w formacie ZIP (APPNOTE 6.3.7)
+ZIP_ZSTD = 93
+
+
+class Kodek:
+    """
+    Opis jednej metody kompresji wpisów ZIP.
+
+    Atrybuty:
+        nazwa (str): Nazwa kodeka (np. "deflate")
+        metoda_zip (int): Identyfikator metody w nagłówku ZIP
+        poziom_min (int | None): Najniższy poziom kodeka (None = bez poziomów)
+        poziom_max (int | None): Najwyższy poziom kodeka
+        wbudowany (bool): Czy moduł zipfile sam obsługuje tę metodę
+    """
+
+    def __init__(
+        self,
+        nazwa: str,
+        metoda_zip: int,
+        poziom_min: int | None = None,
+        poziom_max: int | None = None,
+        wbudowany: bool = True,
+    ):
+        """
+        Inicjalizuje opis kodeka.
+
+        Args:
+            nazwa (str): Nazwa kodeka
+            metoda_zip (int): Identyfikator metody w nagłówku ZIP
+            poziom_min (int | None): Najniższy poziom kodeka
+            poziom_max (int | None): Najwyższy poziom kodeka
+            wbudowany (bool): Czy moduł zipfile sam obsługuje tę metodę
+        """
+        self.nazwa = nazwa
+        self.metoda_zip = metoda_zip
+        self.poziom_min = poziom_min
+        self.poziom_max = poziom_max
+        self.wbudowany = wbudowany
+
+    def przelicz_poziom(self, poziom: int) -> int | None:
+        """
+        Przelicza poziom 1-9 aplikacji na zakres poziomów kodeka.
+
+        Args:
+            poziom (int): Poziom kompresji od 1 do 9
+
+        Returns:
+            int | None: Poziom kodeka lub None, gdy kodek nie ma poziomów
+        """
+        if self.poziom_min is None or self.poziom_max is None:
+            return None
+
+        poziom = min(max(poziom, 1), 9)
+        zakres = self.poziom_max - self.poziom_min
+        return self.poziom_min + round((poziom - 1) * zakres / 8)
+
+    def stworz_kompresor(self, poziom: int):
+        """
+        Tworzy kompresor strumieniowy dla kodeków spoza modułu zipfile.
+
+        Args:
+            poziom (int): Poziom kompresji od 1 do 9
+
+        Returns:
+            Obiekt z metodami compress(dane) i flush()
+
+        Raises:
+            ValueError: Gdy kodek jest obsługiwany bezpośrednio przez zipfile
+        """
+        if self.metoda_zip == ZIP_ZSTD and zstandard is not None:
+            kompresor = zstandard.ZstdCompressor(level=self.przelicz_poziom(poziom))
+            return kompresor.compressobj()
+
+        raise ValueError(f"kodek {self.nazwa} nie ma własnego kompresora")
+
+    def stworz_dekompresor(self):
+        """
+        Tworzy dekompresor strumieniowy dla kodeków spoza modułu zipfile.
+
+        Returns:
+            Obiekt z metodą decompress(dane)
+
+        Raises:
+            ValueError: Gdy kodek jest obsługiwany bezpośrednio przez zipfile
+        """
+        if self.metoda_zip == ZIP_ZSTD and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompressobj()
+
+        raise ValueError(f"kodek {self.nazwa} nie ma własnego dekompresora")
+
+    def __repr__(self) -> str:
+        return f"Kodek({self.nazwa!r})"
+
+
+# Kodeki z biblioteki standardowej (LZMA w zipfile nie ma poziomów)
+KODEKI = {
+    "store": Kodek("store", zipfile.ZIP_STORED),
+    "deflate": Kodek("deflate", zipfile.ZIP_DEFLATED, 1, 9),
+    "bzip2": Kodek("bzip2", zipfile.ZIP_BZIP2, 1, 9),
+    "lzma": Kodek("lzma", zipfile.ZIP_LZMA),
+}
+
+if zstandard is not None:
+    KODEKI["zstd"] = Kodek("zstd", ZIP_ZSTD, 1, 19, wbudowany=False)
+
+
+def kodek_metody(metoda_zip: int) -> Kodek:
+    """
+    Zwraca kodek, którym zapisano wpis o podanej metodzie ZIP.
+
+    Args:
+        metoda_zip (int): Identyfikator metody z nagłówka wpisu
+
+    Returns:
+        Kodek: Opis kodeka
+
+    Raises:
+        NotImplementedError: Gdy metoda jest nieznana lub jej biblioteka
+            nie jest zainstalowana
+    """
+    for kodek in KODEKI.values():
+        if kodek.metoda_zip == metoda_zip:
+            return kodek
+    if metoda_zip == ZIP_ZSTD:
+        raise NotImplementedError(
+            "metoda zstd wymaga biblioteki zstandard (pip install zstandard)"
+        )
+    raise NotImplementedError(f"nieobsługiwana metoda kompresji {metoda_zip}")
+
+
+def pobierz_kodek(nazwa: str) -> Kodek:
+    """
+    Zwraca kodek o podanej nazwie.
+
+    Args:
+        nazwa (str): Nazwa kodeka (np. "deflate", "zstd")
+
+    Returns:
+        Kodek: Opis kodeka
+
+    Raises:
+        ValueError: Gdy kodek nie istnieje lub nie jest zainstalowany
+    """
+    try:
+        return KODEKI[nazwa]
+    except KeyError:
+        if nazwa == "zstd":
+            raise ValueError(
+                "kodek zstd wymaga biblioteki zstandard (pip install zstandard)"
+            ) from None
+        dostepne = ", ".join(sorted(KODEKI))
+        raise ValueError(f"nieznany kodek {nazwa!r} (dostępne: {dostepne})") from None
+
+
+def oszacuj_kompresowalnosc(
+    sciezka_pliku: str,
+    rozmiar_pliku: int,
+    liczba_probek: int = 4,
+    rozmiar_probki: int = 64 * 1024,
+) -> float:
+    """
+    Szacuje stopień kompresji pliku na podstawie kilku próbek.
+
+    Próbki rozłożone równomiernie w pliku kompresowane są najszybszym
+    poziomem deflate - to ułamek kosztu kompresji całego pliku.
+
+    Args:
+        sciezka_pliku (str): Ścieżka do pliku
+        rozmiar_pliku (int): Rozmiar pliku w bajtach
+        liczba_probek (int): Liczba próbek
+        rozmiar_probki (int): Rozmiar jednej próbki w bajtach
+
+    Returns:
+        float: Szacowany stosunek rozmiaru po kompresji do rozmiaru przed
+            (np. 0.3 = plik zmniejszy się do 30%); 1.0 dla pustego pliku
+    """
+    if rozmiar_pliku <= 0:
+        return 1.0
+
+    # Mały plik - próbką jest cały plik
+    if rozmiar_pliku <= liczba_probek * rozmiar_probki:
+        pozycje = [0]
+        rozmiar_probki = rozmiar_pliku
+    else:
+        krok = (rozmiar_pliku - rozmiar_probki) // (liczba_probek - 1 or 1)
+        pozycje = [i * krok for i in range(liczba_probek)]
+
+    przed = 0
+    po = 0
+    with open(sciezka_pliku, "rb") as f:
+        for pozycja in pozycje:
+            f.seek(pozycja)
+            probka = f.read(rozmiar_probki)
+            przed += len(probka)
+            po += len(zlib.compress(probka, 1))
+
+    return po / przed if przed else 1.0
+
+
+class PolitykaKodekow:
+    """
+    Wybiera kodek dla pliku na podstawie rozszerzenia, rozmiaru i próbki.
+
+    Atrybuty:
+        kodek_domyslny (str): Kodek dla zwykłych plików
+        kodek_duzego_tekstu (str): Kodek dla dużych plików tekstowych
+        prog_duzego_pliku_mb (int): Od ilu MB plik tekstowy jest "duży"
+        prog_kompresowalnosci (float): Pliki o szacowanym stosunku rozmiarów
+            powyżej tego progu są zapisywane bez kompresji (store)
+        sprawdzaj_probke (bool): Czy szacować kompresowalność z próbek
+    """
+
+    def __init__(
+        self,
+        kodek_domyslny: str = "deflate",
+        kodek_duzego_tekstu: str = "deflate",
+        prog_duzego_pliku_mb: int = 64,
+        prog_kompresowalnosci: float = 0.95,
+        sprawdzaj_probke: bool = True,
+    ):
+        """
+        Inicjalizuje politykę kodeków.
+
+        Args:
+            kodek_domyslny (str): Kodek dla zwykłych plików
+            kodek_duzego_tekstu (str): Kodek dla dużych plików tekstowych,
+                np. "zstd" (szybszy) lub "lzma" (lepsza kompresja)
+            prog_duzego_pliku_mb (int): Od ilu MB plik tekstowy jest "duży"
+            prog_kompresowalnosci (float): Próg stosunku rozmiarów (0-1)
+            sprawdzaj_probke (bool): Czy szacować kompresowalność z próbek
+
+        Raises:
+            ValueError: Gdy któryś z kodeków jest niedostępny
+        """
+        # Sprawdź od razu, czy kodeki istnieją - błąd konfiguracji, nie pliku
+        pobierz_kodek(kodek_domyslny)
+        pobierz_kodek(kodek_duzego_tekstu)
+
+        self.kodek_domyslny = kodek_domyslny
+        self.kodek_duzego_tekstu = kodek_duzego_tekstu
+        self.prog_duzego_pliku_mb = prog_duzego_pliku_mb
+        self.prog_kompresowalnosci = prog_kompresowalnosci
+        self.sprawdzaj_probke = sprawdzaj_probke
+
+    def wybierz(
+        self,
+        sciezka_pliku: str,
+        rozmiar_pliku: int | None = None,
+        szacowany_stosunek: float | None = None,
+    ) -> Kodek:
+        """
+        Wybiera kodek dla pliku.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+            rozmiar_pliku (int | None): Rozmiar pliku (None = odczytaj z dysku)
+            szacowany_stosunek (float | None): Wynik wcześniejszej sondy
+                kompresowalności (None = polityka sama pobierze próbki)
+
+        Returns:
+            Kodek: Wybrany kodek
+        """
+        # Pliki już skompresowane (zdjęcia, filmy, archiwa) tylko zapisujemy
+        if czy_plik_skompresowany(sciezka_pliku):
+            return KODEKI["store"]
+
+        if rozmiar_pliku is None:
+            rozmiar_pliku = os.path.getsize(sciezka_pliku)
+
+        if self.sprawdzaj_probke:
+            if szacowany_stosunek is None:
+                szacowany_stosunek = oszacuj_kompresowalnosc(
+                    sciezka_pliku, rozmiar_pliku
+                )
+            if szacowany_stosunek > self.prog_kompresowalnosci:
+                return KODEKI["store"]
+
+        if (
+            czy_plik_tekstowy(sciezka_pliku)
+            and rozmiar_pliku >= self.prog_duzego_pliku_mb * 1024 * 1024
+        ):
+            return pobierz_kodek(self.kodek_duzego_tekstu)
+
+        return pobierz_kodek(self.kodek_domyslny)
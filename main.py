@@ -3,15 +3,20 @@
 SqueezeIt - Kompresor Plików
 Główny plik aplikacji - punkt wejścia programu.
 
-Ten plik importuje i uruchamia główną aplikację GUI.
+Ten plik uruchamia główną aplikację GUI, a gdy podano argumenty -
+wersję z wiersza poleceń (cli.py).
 Wszystka logika została przeniesiona do odpowiednich modułów:
 - gui.py - interfejs użytkownika
+- cli.py - wiersz poleceń (bez GUI)
 - core.py - logika kompresji
 - utils.py - funkcje pomocnicze (planowany)
+
+Moduły GUI (FreeSimpleGUI, tkinter) są importowane dopiero przed
+otwarciem okna, więc wersja z wiersza poleceń startuje szybko i działa
+na serwerach bez ekranu.
 """
 
-# Import głównej funkcji GUI
-from gui import uruchom_aplikacje
+import sys
 
 # === PUNKT WEJŚCIA APLIKACJI ===
 if __name__ == "__main__":
@@ -21,11 +26,20 @@ if __name__ == "__main__":
     Ta funkcja jest wywoływana gdy plik main.py jest uruchamiany
     bezpośrednio (nie jako moduł).
     """
+    # Argumenty w wierszu poleceń - kompresja bez okna
+    if len(sys.argv) > 1:
+        from cli import main
+
+        sys.exit(main())
+
     print("Uruchamianie SqueezeIt - Kompresor Plikow")
     print("Aplikacja edukacyjna do nauki programowania w Pythonie")
     print("=" * 50)
 
     try:
+        # Import GUI dopiero tutaj - to najwolniejsza część startu
+        from gui import uruchom_aplikacje
+
         # Uruchomienie głównej aplikacji GUI
         uruchom_aplikacje()
     except KeyboardInterrupt:
@@ -0,0 +1,460 @@
+# === MODUŁ METRYKI - POMIARY WYDAJNOŚCI KOMPRESJI ===
+"""
+Moduł zawierający wbudowane pomiary wydajności kompresora.
+Odpowiedzialny za:
+- Mierzenie czasu faz: walidacji, odczytu, kompresji, zapisu i fsync
+- Liczniki plików i bajtów oraz przepustowość (pliki/s, MB/s)
+- Histogramy czasu i rozmiaru plików
+- Eksport w formacie tekstowym Prometheusa lub JSON
+- Opcjonalne profilowanie cProfile
+
+Pomiar to dwa odczyty time.perf_counter_ns() na blok danych i kilka
+dodawań na plik, więc nie spowalnia kompresji.
+"""
+
+import bisect
+import contextlib
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wyniki import WynikPliku
+
+# Fazy przetwarzania pliku, w kolejności ich wykonywania
+FAZY = ("walidacja", "odczyt", "kompresja", "zapis", "fsync")
+
+# Granice przedziałów histogramu czasu pliku (sekundy)
+GRANICE_CZASU = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+# Granice przedziałów histogramu rozmiaru pliku (bajty): 1 KB, 4 KB, ..., 1 GB
+GRANICE_ROZMIARU = tuple(1024 * 4**wykladnik for wykladnik in range(11))
+
+
+class Histogram:
+    """
+    Histogram o stałych przedziałach (jak histogram Prometheusa).
+
+    Pamięta tylko liczbę wartości w każdym przedziale, ich sumę i liczbę,
+    więc zajmuje tyle samo pamięci niezależnie od liczby plików.
+
+    Atrybuty:
+        granice (Tuple[float, ...]): Górne granice przedziałów (włącznie)
+        liczniki (List[int]): Liczba wartości w przedziałach; ostatni
+            licznik to wartości większe od ostatniej granicy
+        suma (float): Suma wszystkich wartości
+        liczba (int): Liczba wartości
+    """
+
+    __slots__ = ("granice", "liczniki", "suma", "liczba")
+
+    def __init__(self, granice: tuple[float, ...]):
+        self.granice = granice
+        self.liczniki = [0] * (len(granice) + 1)
+        self.suma = 0.0
+        self.liczba = 0
+
+    def obserwuj(self, wartosc: float):
+        """
+        Dodaje wartość do histogramu.
+
+        Args:
+            wartosc (float): Zmierzona wartość
+        """
+        self.liczniki[bisect.bisect_left(self.granice, wartosc)] += 1
+        self.suma += wartosc
+        self.liczba += 1
+
+    def kwantyl(self, q: float) -> float | None:
+        """
+        Szacuje kwantyl z przedziałów (interpolacja liniowa, jak
+        histogram_quantile w Prometheusie).
+
+        Args:
+            q (float): Kwantyl od 0 do 1 (np. 0.95)
+
+        Returns:
+            float | None: Szacowana wartość lub None, gdy histogram jest pusty
+        """
+        if not self.liczba:
+            return None
+
+        cel = q * self.liczba
+        narastajaco = 0
+        for indeks, liczba in enumerate(self.liczniki):
+            if liczba and narastajaco + liczba >= cel:
+                if indeks == len(self.granice):
+                    return self.granice[-1]  # Powyżej ostatniej granicy
+                dolna = self.granice[indeks - 1] if indeks else 0.0
+                gorna = self.granice[indeks]
+                return dolna + (gorna - dolna) * (cel - narastajaco) / liczba
+            narastajaco += liczba
+        return self.granice[-1]
+
+    def jako_slownik(self) -> dict:
+        """
+        Zwraca histogram jako słownik.
+
+        Returns:
+            dict: granice, liczniki, suma, liczba, p50 i p95
+        """
+        return {
+            "granice": list(self.granice),
+            "liczniki": list(self.liczniki),
+            "suma": self.suma,
+            "liczba": self.liczba,
+            "p50": self.kwantyl(0.5),
+            "p95": self.kwantyl(0.95),
+        }
+
+
+class Metryki:
+    """
+    Liczniki, czasy faz i histogramy kompresora.
+
+    Wartości sumują się przez kolejne przebiegi, aż do wyczysc(). Czas
+    faz jest sumą po wszystkich wątkach, więc przy kompresji wielu plików
+    naraz może przekroczyć czas pracy.
+
+    Metody można wywoływać z wielu wątków naraz.
+    """
+
+    def __init__(self):
+        """Inicjalizuje puste metryki."""
+        self._blokada = threading.Lock()
+        self.wyczysc()
+
+    def __getstate__(self) -> dict:
+        # Kopia metryk przekazywana do procesu roboczego jest pusta
+        return {}
+
+    def __setstate__(self, stan: dict):
+        self.__init__()
+
+    def wyczysc(self):
+        """Zeruje wszystkie metryki."""
+        with self._blokada:
+            self._fazy_ns = dict.fromkeys(FAZY, 0)
+            self._pliki = {}  # {decyzja: liczba plików}
+            self._bajty_przed = 0
+            self._bajty_po = 0
+            self._czas_pracy_ns = 0
+            self._czas_pliku = Histogram(GRANICE_CZASU)
+            self._rozmiar_pliku = Histogram(GRANICE_ROZMIARU)
+
+    def dodaj_czas(self, faza: str, czas_ns: int):
+        """
+        Dodaje czas do fazy.
+
+        Args:
+            faza (str): Jedna z FAZY
+            czas_ns (int): Czas w nanosekundach
+        """
+        with self._blokada:
+            self._fazy_ns[faza] += czas_ns
+
+    def dodaj_fazy(self, fazy_ns: dict[str, int]):
+        """
+        Dodaje czasy wielu faz naraz (np. zmierzone w procesie roboczym).
+
+        Args:
+            fazy_ns (Dict[str, int]): {faza: czas_ns}
+        """
+        with self._blokada:
+            for faza, czas_ns in fazy_ns.items():
+                self._fazy_ns[faza] += czas_ns
+
+    def dodaj_wpis(
+        self,
+        calosc_ns: int,
+        odczyt_ns: int,
+        zapis_ns: int,
+        kompresja_ns: int | None = None,
+    ):
+        """
+        Rozdziela czas zapisu wpisu archiwum na odczyt, kompresję i zapis.
+
+        Kompresja to czas, który został po odjęciu odczytu i zapisu - chyba
+        że podano ją osobno (w potoku etapy działają równocześnie, więc
+        suma faz może przekraczać czas wpisu).
+
+        Args:
+            calosc_ns (int): Czas zapisu całego wpisu
+            odczyt_ns (int): Czas odczytu pliku źródłowego
+            zapis_ns (int): Czas zapisu do archiwum
+            kompresja_ns (int | None): Czas kompresji (None = reszta czasu)
+        """
+        if kompresja_ns is None:
+            kompresja_ns = calosc_ns - odczyt_ns - zapis_ns
+        with self._blokada:
+            self._fazy_ns["odczyt"] += odczyt_ns
+            self._fazy_ns["zapis"] += zapis_ns
+            self._fazy_ns["kompresja"] += max(kompresja_ns, 0)
+
+    def dodaj_czas_pracy(self, czas_ns: int):
+        """
+        Dodaje czas jednego przebiegu (podstawa przepustowości).
+
+        Args:
+            czas_ns (int): Czas przebiegu w nanosekundach
+        """
+        with self._blokada:
+            self._czas_pracy_ns += czas_ns
+
+    def zarejestruj_plik(self, wynik: "WynikPliku"):
+        """
+        Dolicza wynik pliku do liczników i histogramów.
+
+        Pliki, których nie przetwarzano (np. błąd walidacji), są liczone,
+        ale nie trafiają do histogramów.
+
+        Args:
+            wynik (WynikPliku): Wynik kompresji pliku
+        """
+        with self._blokada:
+            self._pliki[wynik.decyzja] = self._pliki.get(wynik.decyzja, 0) + 1
+            self._bajty_przed += wynik.rozmiar_przed
+            self._bajty_po += wynik.rozmiar_po
+            if wynik.czas > 0:
+                self._czas_pliku.obserwuj(wynik.czas)
+                self._rozmiar_pliku.obserwuj(wynik.rozmiar_przed)
+
+    def czasy_faz(self) -> dict[str, int]:
+        """
+        Zwraca kopię czasów faz.
+
+        Returns:
+            Dict[str, int]: {faza: czas_ns}
+        """
+        with self._blokada:
+            return dict(self._fazy_ns)
+
+    def migawka(self) -> dict:
+        """
+        Zwraca bieżący stan metryk wraz z wartościami pochodnymi.
+
+        Returns:
+            dict: fazy ({faza: sekundy}), pliki ({decyzja: liczba}),
+                liczba_plikow, bajty_przed, bajty_po, stosunek_kompresji,
+                czas_pracy, pliki_na_s, mb_na_s, czas_pliku i rozmiar_pliku
+                (histogramy jako słowniki)
+        """
+        with self._blokada:
+            czas_pracy = self._czas_pracy_ns / 1e9
+            liczba_plikow = sum(self._pliki.values())
+            return {
+                "fazy": {faza: ns / 1e9 for faza, ns in self._fazy_ns.items()},
+                "pliki": dict(self._pliki),
+                "liczba_plikow": liczba_plikow,
+                "bajty_przed": self._bajty_przed,
+                "bajty_po": self._bajty_po,
+                "stosunek_kompresji": (
+                    self._bajty_po / self._bajty_przed if self._bajty_przed else None
+                ),
+                "czas_pracy": czas_pracy,
+                "pliki_na_s": liczba_plikow / czas_pracy if czas_pracy else 0.0,
+                "mb_na_s": (
+                    self._bajty_przed / (1024 * 1024) / czas_pracy
+                    if czas_pracy
+                    else 0.0
+                ),
+                "czas_pliku": self._czas_pliku.jako_slownik(),
+                "rozmiar_pliku": self._rozmiar_pliku.jako_slownik(),
+            }
+
+    def jako_json(self) -> str:
+        """
+        Zwraca migawkę metryk jako JSON.
+
+        Returns:
+            str: Migawka w formacie JSON
+        """
+        # Import na miejscu - json potrzebny tylko przy eksporcie
+        import json
+
+        return json.dumps(self.migawka(), ensure_ascii=False, indent=2)
+
+    def jako_prometheus(self, prefiks: str = "squeezeit") -> str:
+        """
+        Zwraca metryki w formacie tekstowym Prometheusa.
+
+        Liczniki mają przyrostek _total, a histogramy - przedziały _bucket
+        z etykietą le oraz _sum i _count.
+
+        Args:
+            prefiks (str): Przedrostek nazw metryk
+
+        Returns:
+            str: Metryki w formacie tekstowym (wersja 0.0.4)
+        """
+        with self._blokada:
+            fazy = dict(self._fazy_ns)
+            pliki = dict(self._pliki)
+            bajty_przed, bajty_po = self._bajty_przed, self._bajty_po
+            czas_pracy_ns = self._czas_pracy_ns
+            histogramy = (
+                ("czas_pliku_sekundy", "Czas kompresji pliku", self._czas_pliku),
+                (
+                    "rozmiar_pliku_bajty",
+                    "Rozmiar pliku przed kompresją",
+                    self._rozmiar_pliku,
+                ),
+            )
+            histogramy = [
+                (nazwa, opis, h.granice, list(h.liczniki), h.suma, h.liczba)
+                for nazwa, opis, h in histogramy
+            ]
+
+        linie = []
+
+        def licznik(nazwa: str, opis: str, wartosci: dict[str, float], etykieta=""):
+            linie.append(f"# HELP {prefiks}_{nazwa} {opis}")
+            linie.append(f"# TYPE {prefiks}_{nazwa} counter")
+            for wartosc_etykiety, wartosc in wartosci.items():
+                etykiety = f'{{{etykieta}="{wartosc_etykiety}"}}' if etykieta else ""
+                linie.append(f"{prefiks}_{nazwa}{etykiety} {wartosc}")
+
+        licznik(
+            "faza_sekundy_total",
+            "Łączny czas faz przetwarzania",
+            {faza: ns / 1e9 for faza, ns in fazy.items()},
+            "faza",
+        )
+        licznik("pliki_total", "Przetworzone pliki", pliki, "decyzja")
+        licznik("bajty_wejscia_total", "Bajty przed kompresją", {"": bajty_przed})
+        licznik("bajty_wyjscia_total", "Bajty po kompresji", {"": bajty_po})
+        licznik(
+            "czas_pracy_sekundy_total", "Czas przebiegów", {"": czas_pracy_ns / 1e9}
+        )
+
+        for nazwa, opis, granice, liczniki, suma, liczba in histogramy:
+            linie.append(f"# HELP {prefiks}_{nazwa} {opis}")
+            linie.append(f"# TYPE {prefiks}_{nazwa} histogram")
+            narastajaco = 0
+            for granica, ile in zip(granice, liczniki, strict=False):
+                narastajaco += ile
+                linie.append(
+                    f'{prefiks}_{nazwa}_bucket{{le="{granica}"}} {narastajaco}'
+                )
+            linie.append(f'{prefiks}_{nazwa}_bucket{{le="+Inf"}} {liczba}')
+            linie.append(f"{prefiks}_{nazwa}_sum {suma}")
+            linie.append(f"{prefiks}_{nazwa}_count {liczba}")
+
+        return "\n".join(linie) + "\n"
+
+    def zapisz_do_pliku(self, sciezka_pliku: str):
+        """
+        Zapisuje metryki do pliku, który może czytać lokalny zbieracz.
+
+        Plik .json dostaje migawkę JSON, każdy inny - format Prometheusa
+        (np. .prom dla textfile collectora node_exportera). Zapis idzie do
+        pliku tymczasowego zamienianego w miejscu, więc czytający nigdy
+        nie zobaczy połowy pliku.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku metryk
+
+        Raises:
+            OSError: Gdy nie można zapisać pliku
+        """
+        if sciezka_pliku.endswith(".json"):
+            tresc = self.jako_json()
+        else:
+            tresc = self.jako_prometheus()
+
+        sciezka_tymczasowa = f"{sciezka_pliku}.{os.getpid()}.tmp"
+        try:
+            with open(sciezka_tymczasowa, "w", encoding="utf-8") as f:
+                f.write(tresc)
+            os.replace(sciezka_tymczasowa, sciezka_pliku)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(sciezka_tymczasowa)
+            raise
+
+
+class PlikZPomiarem:
+    """
+    Opakowanie pliku mierzące czas odczytu i zapisu.
+
+    Pozostałe metody (seek, tell, close, ...) są przekazywane do pliku bez
+    zmian, więc opakowanie może zastąpić plik archiwum w zipfile.ZipFile.
+
+    Atrybuty:
+        czas_ns (int): Łączny czas wywołań read, readinto i write
+    """
+
+    __slots__ = ("_plik", "czas_ns")
+
+    def __init__(self, plik):
+        """
+        Args:
+            plik: Otwarty plik (lub obiekt plikopodobny)
+        """
+        self._plik = plik
+        self.czas_ns = 0
+
+    def __getattr__(self, nazwa: str):
+        return getattr(self._plik, nazwa)
+
+    def read(self, *argumenty):
+        poczatek = time.perf_counter_ns()
+        dane = self._plik.read(*argumenty)
+        self.czas_ns += time.perf_counter_ns() - poczatek
+        return dane
+
+    def readinto(self, bufor):
+        poczatek = time.perf_counter_ns()
+        odczytane = self._plik.readinto(bufor)
+        self.czas_ns += time.perf_counter_ns() - poczatek
+        return odczytane
+
+    def write(self, dane):
+        poczatek = time.perf_counter_ns()
+        zapisane = self._plik.write(dane)
+        self.czas_ns += time.perf_counter_ns() - poczatek
+        return zapisane
+
+    @classmethod
+    def dla_archiwum(cls, zipf) -> "PlikZPomiarem":
+        """
+        Podmienia plik otwartego archiwum na opakowanie (raz na archiwum).
+
+        Args:
+            zipf (zipfile.ZipFile): Archiwum otwarte do zapisu
+
+        Returns:
+            PlikZPomiarem: Opakowanie pliku archiwum
+        """
+        if not isinstance(zipf.fp, cls):
+            zipf.fp = cls(zipf.fp)
+        return zipf.fp
+
+
+@contextlib.contextmanager
+def profiluj(sciezka_pliku: str | None):
+    """
+    Profiluje kod w bloku with modułem cProfile.
+
+    Wynik można obejrzeć poleceniem: python -m pstats PLIK. Profilowany
+    jest tylko wątek, który wszedł do bloku.
+
+    Args:
+        sciezka_pliku (str | None): Gdzie zapisać statystyki (None = bez
+            profilowania)
+    """
+    if sciezka_pliku is None:
+        yield
+        return
+
+    # Import na miejscu - cProfile potrzebny tylko przy profilowaniu
+    import cProfile
+
+    profil = cProfile.Profile()
+    profil.enable()
+    try:
+        yield
+    finally:
+        profil.disable()
+        profil.dump_stats(sciezka_pliku)
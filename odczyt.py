@@ -0,0 +1,246 @@
+# === MODUŁ ODCZYT - CZYTANIE PLIKÓW ŹRÓDŁOWYCH ===
+"""
+Moduł zawierający odczyt plików źródłowych dla kompresora.
+Odpowiedzialny za:
+- Odczyt dużych plików przez mmap - bloki to memoryview bez kopiowania
+- Odczyt zwykły (readinto do jednego bufora) dla małych plików i
+  plików, których nie da się zmapować
+- Zwalnianie przetworzonych stron pliku, żeby RSS nie rósł z rozmiarem
+
+Przy zwykłym odczycie każdy blok jest kopiowany z pamięci podręcznej
+systemu do bufora Pythona. Przy mmap kompresor i CRC32 czytają strony
+pliku bezpośrednio - odczyt z dysku odbywa się w trakcie kompresji.
+"""
+
+import contextlib
+import mmap
+from collections.abc import Iterator
+
+# Mniejsze pliki czytamy zwykle - ustawienie mapowania kosztuje więcej
+# niż skopiowanie jednego bloku
+MIN_ROZMIAR_MMAP = 1024 * 1024
+
+
+class ZrodloPliku:
+    """
+    Zwykły odczyt pliku źródłowego.
+
+    Atrybuty:
+        mapowane (bool): Czy plik jest czytany przez mmap (tu zawsze False)
+    """
+
+    mapowane = False
+
+    def __init__(self, plik):
+        """
+        Args:
+            plik: Plik otwarty w trybie binarnym (z metodami read i readinto)
+        """
+        self._plik = plik
+
+    def read(self, rozmiar: int = -1):
+        """
+        Czyta kolejny fragment pliku (jak plik.read).
+
+        Args:
+            rozmiar (int): Najwięcej bajtów do odczytania (-1 = do końca)
+
+        Returns:
+            bytes: Odczytane dane (puste na końcu pliku)
+        """
+        return self._plik.read(rozmiar)
+
+    def bloki(self, rozmiar_bloku: int) -> Iterator[memoryview]:
+        """
+        Czyta plik blokami do jednego bufora wielokrotnego użytku.
+
+        Blok jest ważny tylko do pobrania następnego - nie wolno go
+        przechowywać.
+
+        Args:
+            rozmiar_bloku (int): Rozmiar bloku w bajtach
+
+        Yields:
+            memoryview: Kolejne bloki pliku
+        """
+        bufor = bytearray(rozmiar_bloku)
+        widok = memoryview(bufor)
+        while True:
+            odczytane = self._plik.readinto(bufor)
+            if not odczytane:
+                return
+            yield widok[:odczytane]
+
+    def zwolnij_do(self, koniec: int):
+        """
+        Informuje, że dane przed podanym miejscem są już przetworzone.
+
+        Przy zwykłym odczycie nie ma czego zwalniać.
+
+        Args:
+            koniec (int): Koniec przetworzonej części pliku
+        """
+
+    def zamknij(self):
+        """Zwalnia zasoby źródła (sam plik zamyka jego właściciel)."""
+
+
+class ZrodloMapowane(ZrodloPliku):
+    """
+    Odczyt pliku źródłowego przez mmap.
+
+    read() i bloki() zwracają memoryview na zmapowane strony pliku, więc
+    dane nie są kopiowane. Bloki zwracane przez read() pozostają ważne
+    (np. czekając w kolejce wątków kompresji) aż do zamknij(); po ich
+    przetworzeniu warto wywołać zwolnij_do, żeby RSS nie rósł.
+
+    Uwaga: skrócenie pliku przez inny proces w trakcie kompresji kończy
+    się sygnałem SIGBUS - dlatego mmap można wyłączyć w kompresorze.
+    """
+
+    mapowane = True
+
+    def __init__(self, plik, mapa: mmap.mmap):
+        """
+        Args:
+            plik: Plik otwarty w trybie binarnym
+            mapa (mmap.mmap): Mapowanie całego pliku tylko do odczytu
+        """
+        super().__init__(plik)
+        self._mapa = mapa
+        self._widok = memoryview(mapa)
+        self._pozycja = 0
+        self._zwolnione = 0  # Do tego miejsca strony oddano systemowi
+        self._wyprzedzenie = 0
+        self._zapowiedziane = 0  # Do tego miejsca prosiliśmy o odczyt w tle
+
+    def read(self, rozmiar: int = -1) -> memoryview:
+        """
+        Zwraca kolejny fragment pliku bez kopiowania.
+
+        Args:
+            rozmiar (int): Najwięcej bajtów (-1 = do końca)
+
+        Returns:
+            memoryview: Fragment pliku (pusty na końcu pliku)
+        """
+        poczatek = self._pozycja
+        koniec = len(self._widok)
+        if rozmiar >= 0:
+            koniec = min(poczatek + rozmiar, koniec)
+        self._pozycja = koniec
+        if self._wyprzedzenie:
+            self._zapowiedz(koniec + self._wyprzedzenie)
+        return self._widok[poczatek:koniec]
+
+    def ustaw_wyprzedzenie(self, bajty: int):
+        """
+        Włącza odczyt z wyprzedzeniem przez system.
+
+        Przy każdym read() system dostaje prośbę (madvise MADV_WILLNEED)
+        o wczytanie w tle podanej liczby bajtów za bieżącym miejscem, więc
+        kompresor rzadziej czeka na dysk.
+
+        Args:
+            bajty (int): Ile bajtów wczytywać naprzód (0 = wyłącz)
+        """
+        self._wyprzedzenie = bajty
+
+    def _zapowiedz(self, koniec: int):
+        """
+        Prosi system o wczytanie w tle stron pliku do podanego miejsca.
+
+        Args:
+            koniec (int): Koniec fragmentu pliku, który będzie potrzebny
+        """
+        if not hasattr(mmap, "MADV_WILLNEED"):
+            return
+        poczatek = max(self._zapowiedziane, self._pozycja)
+        poczatek -= poczatek % mmap.PAGESIZE  # madvise działa na całych stronach
+        koniec = min(koniec, len(self._widok))
+        if koniec > poczatek:
+            with contextlib.suppress(OSError):
+                self._mapa.madvise(mmap.MADV_WILLNEED, poczatek, koniec - poczatek)
+            self._zapowiedziane = koniec
+
+    def bloki(self, rozmiar_bloku: int) -> Iterator[memoryview]:
+        """
+        Podaje plik blokami; strony przetworzonych bloków są zwalniane.
+
+        Args:
+            rozmiar_bloku (int): Rozmiar bloku w bajtach
+
+        Yields:
+            memoryview: Kolejne bloki pliku
+        """
+        while True:
+            blok = self.read(rozmiar_bloku)
+            if not blok:
+                return
+            yield blok
+            # Blok został przetworzony - jego strony nie są już potrzebne
+            self.zwolnij_do(self._pozycja)
+
+    def zwolnij_do(self, koniec: int):
+        """
+        Oddaje systemowi strony pliku przed podanym miejscem.
+
+        Strony pliku i tak zostają w pamięci podręcznej systemu; madvise
+        tylko usuwa je z pamięci procesu, więc RSS nie rośnie z rozmiarem
+        pliku. Ponowny odczyt tych stron nadal zwróciłby poprawne dane.
+
+        Args:
+            koniec (int): Koniec przetworzonej części pliku
+        """
+        if not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        koniec -= koniec % mmap.PAGESIZE  # madvise działa na całych stronach
+        if koniec > self._zwolnione:
+            with contextlib.suppress(OSError):
+                self._mapa.madvise(
+                    mmap.MADV_DONTNEED, self._zwolnione, koniec - self._zwolnione
+                )
+            self._zwolnione = koniec
+
+    def zamknij(self):
+        """
+        Usuwa mapowanie pliku.
+
+        Gdy jakiś blok jest jeszcze używany (np. w śladzie wyjątku),
+        mapowanie zniknie razem z ostatnim blokiem.
+        """
+        self._widok.release()
+        with contextlib.suppress(BufferError):
+            self._mapa.close()
+
+
+def otworz_zrodlo(plik, rozmiar_pliku: int, uzywaj_mmap: bool = True) -> ZrodloPliku:
+    """
+    Wybiera sposób odczytu pliku źródłowego.
+
+    mmap jest używany dla plików od MIN_ROZMIAR_MMAP w górę. Gdy nie da
+    się go użyć (potok, plik specjalny, system plików bez mmap), plik jest
+    czytany zwykle.
+
+    Args:
+        plik: Plik otwarty w trybie binarnym (może być opakowaniem z
+            metodą fileno)
+        rozmiar_pliku (int): Rozmiar pliku w bajtach
+        uzywaj_mmap (bool): False = zawsze zwykły odczyt
+
+    Returns:
+        ZrodloPliku: Źródło do odczytu; po użyciu należy wywołać zamknij()
+    """
+    if not uzywaj_mmap or rozmiar_pliku < MIN_ROZMIAR_MMAP:
+        return ZrodloPliku(plik)
+
+    try:
+        mapa = mmap.mmap(plik.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, AttributeError):
+        return ZrodloPliku(plik)
+
+    # Czytamy po kolei - system może czytać z wyprzedzeniem
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        with contextlib.suppress(OSError):
+            mapa.madvise(mmap.MADV_SEQUENTIAL)
+    return ZrodloMapowane(plik, mapa)
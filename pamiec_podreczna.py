@@ -0,0 +1,292 @@
+# === MODUŁ PAMIĘCI PODRĘCZNEJ - POMIJANIE NIEZMIENIONYCH PLIKÓW ===
+"""
+Moduł zawierający trwałą pamięć podręczną wyników kompresji.
+Odpowiedzialny za:
+- Rozpoznawanie niezmienionych plików (rozmiar + czas modyfikacji + i-węzeł,
+  a dopiero potem skrót zawartości)
+- Przechowywanie gotowych archiwów pod kluczem zależnym od zawartości
+- Udostępnianie gotowego archiwum (dowiązanie twarde lub kopia)
+- Usuwanie najdawniej używanych wpisów po przekroczeniu limitu rozmiaru
+
+Indeks jest bazą SQLite, więc z jednej pamięci mogą korzystać różne
+instancje KompresorPlikow i różne procesy jednocześnie. Wątki jednego
+procesu dzielą połączenie, więc korzystają z niego po kolei (blokada).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from skaner import RekordPliku
+
+# Rozmiar bloku czytanego przy liczeniu skrótu zawartości
+_ROZMIAR_BLOKU_SKROTU = 1024 * 1024
+
+
+class PamiecPodreczna:
+    """
+    Trwała pamięć podręczna archiwów, adresowana zawartością plików.
+
+    Atrybuty:
+        folder (str): Folder z indeksem i przechowywanymi archiwami
+        maks_rozmiar_mb (int): Maksymalny łączny rozmiar archiwów w MB
+    """
+
+    def __init__(self, folder: str, maks_rozmiar_mb: int = 1024):
+        """
+        Inicjalizuje pamięć podręczną.
+
+        Args:
+            folder (str): Folder pamięci (tworzony, jeśli nie istnieje)
+            maks_rozmiar_mb (int): Maksymalny łączny rozmiar archiwów w MB
+        """
+        self.folder = folder
+        self.maks_rozmiar_mb = maks_rozmiar_mb
+        self._polaczenie = None
+        self._blokada = threading.RLock()
+
+        os.makedirs(os.path.join(folder, "obiekty"), exist_ok=True)
+
+    def __getstate__(self) -> dict:
+        # Połączenia z bazą nie da się przekazać do innego procesu
+        stan = self.__dict__.copy()
+        stan["_polaczenie"] = None
+        del stan["_blokada"]
+        return stan
+
+    def __setstate__(self, stan: dict):
+        self.__dict__.update(stan)
+        self._blokada = threading.RLock()
+
+    def _baza(self) -> "sqlite3.Connection":
+        """
+        Zwraca połączenie z indeksem (tworzone przy pierwszym użyciu).
+
+        Returns:
+            sqlite3.Connection: Połączenie z bazą indeksu
+        """
+        with self._blokada:
+            if self._polaczenie is None:
+                # Import na miejscu - program bez pamięci podręcznej nie
+                # płaci za wczytanie modułu sqlite3
+                import sqlite3
+
+                self._polaczenie = sqlite3.connect(
+                    os.path.join(self.folder, "indeks.sqlite"),
+                    timeout=30,
+                    check_same_thread=False,
+                )
+                self._polaczenie.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS pliki (
+                        sciezka TEXT PRIMARY KEY,
+                        rozmiar INTEGER,
+                        mtime_ns INTEGER,
+                        inode INTEGER,
+                        skrot TEXT
+                    );
+                    CREATE TABLE IF NOT EXISTS obiekty (
+                        klucz TEXT PRIMARY KEY,
+                        rozmiar INTEGER,
+                        ostatnie_uzycie REAL,
+                        szczegoly TEXT
+                    );
+                    CREATE INDEX IF NOT EXISTS obiekty_uzycie
+                        ON obiekty (ostatnie_uzycie);
+                    """
+                )
+            return self._polaczenie
+
+    def skrot_pliku(
+        self, sciezka_pliku: str, rekord: "RekordPliku | None" = None
+    ) -> str:
+        """
+        Zwraca skrót zawartości pliku.
+
+        Gdy rozmiar, czas modyfikacji i i-węzeł pliku są takie same jak
+        przy poprzednim liczeniu, skrót jest brany z indeksu bez czytania
+        pliku.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+            rekord (RekordPliku | None): Rekord pliku ze skanera
+                (None = wywołaj stat)
+
+        Returns:
+            str: Skrót BLAKE2b zawartości (szesnastkowo)
+        """
+        sciezka = os.path.abspath(sciezka_pliku)
+        if rekord is None:
+            stat = os.stat(sciezka)
+            metadane = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        else:
+            metadane = (rekord.rozmiar, rekord.mtime_ns, rekord.inode)
+        baza = self._baza()
+
+        with self._blokada:
+            wiersz = baza.execute(
+                "SELECT rozmiar, mtime_ns, inode, skrot FROM pliki WHERE sciezka = ?",
+                (sciezka,),
+            ).fetchone()
+        if wiersz and wiersz[:3] == metadane:
+            return wiersz[3]
+
+        skrot = hashlib.blake2b(digest_size=20)
+        with open(sciezka, "rb") as f:
+            while blok := f.read(_ROZMIAR_BLOKU_SKROTU):
+                skrot.update(blok)
+        skrot = skrot.hexdigest()
+
+        with self._blokada, baza:
+            baza.execute(
+                "INSERT OR REPLACE INTO pliki VALUES (?, ?, ?, ?, ?)",
+                (sciezka, *metadane, skrot),
+            )
+        return skrot
+
+    def stworz_klucz(self, skrot_zawartosci: str, *ustawienia) -> str:
+        """
+        Tworzy klucz wpisu z zawartości pliku i ustawień kompresji.
+
+        Args:
+            skrot_zawartosci (str): Skrót zawartości pliku
+            *ustawienia: Wszystko, od czego zależy wynik (nazwa wpisu,
+                kodek, poziom itp.)
+
+        Returns:
+            str: Klucz wpisu
+        """
+        skrot_ustawien = hashlib.blake2b(repr(ustawienia).encode(), digest_size=8)
+        return f"{skrot_zawartosci}-{skrot_ustawien.hexdigest()}"
+
+    def _sciezka_obiektu(self, klucz: str) -> str:
+        """
+        Zwraca ścieżkę archiwum przechowywanego pod kluczem.
+
+        Args:
+            klucz (str): Klucz wpisu
+
+        Returns:
+            str: Ścieżka do pliku w pamięci
+        """
+        return os.path.join(self.folder, "obiekty", klucz[:2], f"{klucz}.zip")
+
+    def znajdz(self, klucz: str) -> dict | None:
+        """
+        Szuka wpisu i oznacza go jako ostatnio użyty.
+
+        Args:
+            klucz (str): Klucz wpisu
+
+        Returns:
+            dict | None: Szczegóły kompresji zapisane z wpisem oraz
+                "sciezka_obiektu", lub None gdy wpisu nie ma
+        """
+        with self._blokada:
+            baza = self._baza()
+            wiersz = baza.execute(
+                "SELECT szczegoly FROM obiekty WHERE klucz = ?", (klucz,)
+            ).fetchone()
+            if wiersz is None:
+                return None
+
+            sciezka_obiektu = self._sciezka_obiektu(klucz)
+            if not os.path.exists(sciezka_obiektu):
+                # Plik usunięty spoza programu - zapomnij wpis
+                with baza:
+                    baza.execute("DELETE FROM obiekty WHERE klucz = ?", (klucz,))
+                return None
+
+            with baza:
+                baza.execute(
+                    "UPDATE obiekty SET ostatnie_uzycie = ? WHERE klucz = ?",
+                    (time.time(), klucz),
+                )
+
+            szczegoly = json.loads(wiersz[0])
+            szczegoly["sciezka_obiektu"] = sciezka_obiektu
+            return szczegoly
+
+    def dodaj(self, klucz: str, sciezka_wyniku: str, szczegoly: dict):
+        """
+        Zapamiętuje gotowe archiwum pod kluczem.
+
+        Args:
+            klucz (str): Klucz wpisu
+            sciezka_wyniku (str): Ścieżka do gotowego archiwum
+            szczegoly (dict): Szczegóły kompresji do zapamiętania
+        """
+        sciezka_obiektu = self._sciezka_obiektu(klucz)
+        os.makedirs(os.path.dirname(sciezka_obiektu), exist_ok=True)
+        udostepnij_plik(sciezka_wyniku, sciezka_obiektu)
+
+        with self._blokada:
+            with self._baza() as baza:
+                baza.execute(
+                    "INSERT OR REPLACE INTO obiekty VALUES (?, ?, ?, ?)",
+                    (
+                        klucz,
+                        os.path.getsize(sciezka_obiektu),
+                        time.time(),
+                        json.dumps(szczegoly),
+                    ),
+                )
+            self._usun_nadmiar()
+
+    def _usun_nadmiar(self):
+        """Usuwa najdawniej używane wpisy, aż pamięć zmieści się w limicie."""
+        baza = self._baza()
+        limit_bajty = self.maks_rozmiar_mb * 1024 * 1024
+        (razem,) = baza.execute(
+            "SELECT COALESCE(SUM(rozmiar), 0) FROM obiekty"
+        ).fetchone()
+        if razem <= limit_bajty:
+            return
+
+        usuniete = []
+        for klucz, rozmiar in baza.execute(
+            "SELECT klucz, rozmiar FROM obiekty ORDER BY ostatnie_uzycie"
+        ).fetchall():
+            if razem <= limit_bajty:
+                break
+            usuniete.append((klucz,))
+            razem -= rozmiar
+            try:
+                os.remove(self._sciezka_obiektu(klucz))
+            except OSError:
+                pass
+
+        with baza:
+            baza.executemany("DELETE FROM obiekty WHERE klucz = ?", usuniete)
+
+    def zamknij(self):
+        """Zamyka połączenie z indeksem."""
+        if self._polaczenie is not None:
+            self._polaczenie.close()
+            self._polaczenie = None
+
+
+def udostepnij_plik(sciezka_zrodla: str, sciezka_celu: str):
+    """
+    Tworzy w miejscu celu ten sam plik co źródło - dowiązaniem twardym,
+    a gdy to niemożliwe (np. inny dysk), kopią.
+
+    Cel jest podmieniany atomowo, więc nigdy nie jest widoczny w połowie.
+
+    Args:
+        sciezka_zrodla (str): Istniejący plik
+        sciezka_celu (str): Ścieżka, pod którą plik ma się pojawić
+    """
+    sciezka_tymczasowa = f"{sciezka_celu}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.link(sciezka_zrodla, sciezka_tymczasowa)
+    except OSError:
+        shutil.copy2(sciezka_zrodla, sciezka_tymczasowa)
+    os.replace(sciezka_tymczasowa, sciezka_celu)
@@ -0,0 +1,312 @@
+# === MODUŁ POTOK - ODCZYT, KOMPRESJA I ZAPIS JEDNOCZEŚNIE ===
+"""
+Moduł zawierający potok kompresji jednego pliku.
+Odpowiedzialny za:
+- Odczyt z wyprzedzeniem w osobnym wątku (CzytnikWTle)
+- Zapis w tle w osobnym wątku (ZapisWTle, zapis_w_tle)
+- Ograniczenie pamięci - etapy łączą kolejki o stałej długości
+
+Bez potoku odczyt, kompresja i zapis następują po sobie: dysk czeka,
+gdy procesor kompresuje, a procesor czeka na dysk. W potoku wątek
+odczytu czyta kolejne bloki, wątek główny (lub pula wątków) je kompresuje,
+a wątek zapisu zapisuje wcześniejsze wyniki. Odczyt, zapis i kompresja
+zlib/bz2/lzma zwalniają GIL, więc etapy naprawdę działają równocześnie,
+a czas pliku zbliża się do czasu najwolniejszego etapu zamiast sumy.
+"""
+
+import contextlib
+import queue
+import threading
+import time
+import zipfile
+from collections.abc import Iterator
+
+from odczyt import ZrodloPliku
+
+# Ile bloków może czekać między etapami potoku
+DOMYSLNA_GLEBOKOSC = 4
+
+# Znacznik końca danych w kolejce zapisu
+_KONIEC = None
+
+
+class CzytnikWTle(ZrodloPliku):
+    """
+    Źródło czytające kolejne bloki w osobnym wątku.
+
+    Wątek czyta najwyżej glebokosc bloków naprzód. Każdy blok to nowy
+    obiekt bytes, więc może czekać w kolejce wątków kompresji.
+
+    Atrybuty:
+        czas_oczekiwania_ns (int): Ile wątek główny czekał na dane
+    """
+
+    def __init__(self, zrodlo: ZrodloPliku, rozmiar_bloku: int, glebokosc: int):
+        """
+        Uruchamia wątek odczytu.
+
+        Args:
+            zrodlo (ZrodloPliku): Źródło czytane przez wątek
+            rozmiar_bloku (int): Rozmiar bloku odczytu w bajtach
+            glebokosc (int): Najwięcej bloków przeczytanych naprzód
+        """
+        super().__init__(zrodlo)
+        self._rozmiar_bloku = rozmiar_bloku
+        self._kolejka = queue.Queue(maxsize=max(glebokosc, 1))
+        self._zatrzymaj = threading.Event()
+        self._reszta = memoryview(b"")
+        self._koniec = False
+        self.czas_oczekiwania_ns = 0
+        self._watek = threading.Thread(
+            target=self._czytaj, name="squeezeit-odczyt", daemon=True
+        )
+        self._watek.start()
+
+    def _czytaj(self):
+        """Pętla wątku odczytu: bloki, potem b"" (koniec) lub wyjątek."""
+        try:
+            while not self._zatrzymaj.is_set():
+                blok = self._plik.read(self._rozmiar_bloku)
+                self._kolejka.put(blok)
+                if not blok:
+                    return
+        except BaseException as e:  # Błąd odczytu zgłosi wątek główny
+            self._kolejka.put(e)
+
+    def _nastepny_blok(self):
+        """
+        Pobiera kolejny blok z kolejki.
+
+        Returns:
+            bytes: Blok (pusty na końcu pliku)
+
+        Raises:
+            OSError: Błąd odczytu z wątku odczytu
+        """
+        if self._koniec:
+            return b""
+        poczatek = time.perf_counter_ns()
+        blok = self._kolejka.get()
+        self.czas_oczekiwania_ns += time.perf_counter_ns() - poczatek
+        if isinstance(blok, BaseException):
+            self._koniec = True
+            raise blok
+        if not blok:
+            self._koniec = True
+        return blok
+
+    def read(self, rozmiar: int = -1):
+        """
+        Zwraca kolejny fragment pliku.
+
+        Jak każde read, może zwrócić mniej bajtów niż rozmiar - najwyżej
+        jeden blok naraz.
+
+        Args:
+            rozmiar (int): Najwięcej bajtów (-1 = do końca)
+
+        Returns:
+            bytes | memoryview: Dane (puste na końcu pliku)
+        """
+        if rozmiar < 0:
+            czesci = [bytes(self._reszta)]
+            while blok := self._nastepny_blok():
+                czesci.append(blok)
+            self._reszta = memoryview(b"")
+            return b"".join(czesci)
+
+        if not self._reszta:
+            blok = self._nastepny_blok()
+            if len(blok) <= rozmiar:
+                return blok
+            self._reszta = memoryview(blok)
+        dane = self._reszta[:rozmiar]
+        self._reszta = self._reszta[rozmiar:]
+        return dane
+
+    def bloki(self, rozmiar_bloku: int) -> Iterator[bytes]:
+        """
+        Podaje plik blokami przeczytanymi przez wątek odczytu.
+
+        Args:
+            rozmiar_bloku (int): Najwięcej bajtów w bloku
+
+        Yields:
+            bytes: Kolejne bloki pliku
+        """
+        while blok := self.read(rozmiar_bloku):
+            yield blok
+
+    def zamknij(self):
+        """Zatrzymuje wątek odczytu (także przed końcem pliku) i zamyka źródło."""
+        self._zatrzymaj.set()
+        # Wątek może czekać na miejsce w pełnej kolejce - opróżniamy ją
+        while self._watek.is_alive():
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    self._kolejka.get_nowait()
+            self._watek.join(timeout=0.01)
+        self._plik.zamknij()
+
+
+class ZapisWTle:
+    """
+    Opakowanie pliku zapisujące dane w osobnym wątku.
+
+    write() tylko wstawia dane do kolejki. Każda inna operacja (tell, seek,
+    flush, ...) najpierw czeka na zapis zaległych danych, więc zipfile
+    widzi plik tak, jakby zapis był natychmiastowy. Dane przekazane do
+    write() nie mogą być potem zmieniane (zipfile zapisuje nowe obiekty
+    bytes).
+
+    Atrybuty:
+        czas_oczekiwania_ns (int): Ile wątek główny czekał na wątek zapisu
+    """
+
+    def __init__(self, plik, glebokosc: int):
+        """
+        Uruchamia wątek zapisu.
+
+        Args:
+            plik: Plik otwarty do zapisu
+            glebokosc (int): Najwięcej fragmentów czekających na zapis
+        """
+        self._plik = plik
+        self._kolejka = queue.Queue(maxsize=max(glebokosc, 1))
+        self._blad = None
+        self.czas_oczekiwania_ns = 0
+        self._watek = threading.Thread(
+            target=self._zapisuj, name="squeezeit-zapis", daemon=True
+        )
+        self._watek.start()
+
+    def _zapisuj(self):
+        """Pętla wątku zapisu - po błędzie pozostałe dane są pomijane."""
+        while True:
+            dane = self._kolejka.get()
+            try:
+                if dane is _KONIEC:
+                    return
+                if self._blad is None:
+                    self._plik.write(dane)
+            except BaseException as e:  # Zgłosi go wątek główny
+                self._blad = e
+            finally:
+                self._kolejka.task_done()
+
+    def _zglos_blad(self):
+        """
+        Zgłasza błąd wątku zapisu (przy każdej kolejnej operacji).
+
+        Raises:
+            OSError: Błąd zapisu z wątku zapisu
+        """
+        if self._blad is not None:
+            raise self._blad
+
+    def write(self, dane) -> int:
+        """
+        Przekazuje dane do zapisu w tle.
+
+        Args:
+            dane (bytes): Dane do zapisania
+
+        Returns:
+            int: Liczba bajtów (zawsze całe dane)
+
+        Raises:
+            OSError: Gdy wcześniejszy zapis w tle się nie powiódł
+        """
+        self._zglos_blad()
+        poczatek = time.perf_counter_ns()
+        self._kolejka.put(dane)
+        self.czas_oczekiwania_ns += time.perf_counter_ns() - poczatek
+        return len(dane)
+
+    def oproznij(self):
+        """
+        Czeka na zapis wszystkich zaległych danych.
+
+        Raises:
+            OSError: Gdy zapis w tle się nie powiódł
+        """
+        poczatek = time.perf_counter_ns()
+        self._kolejka.join()
+        self.czas_oczekiwania_ns += time.perf_counter_ns() - poczatek
+        self._zglos_blad()
+
+    def __getattr__(self, nazwa: str):
+        # Pozostałe operacje widzą plik po zapisie zaległych danych
+        self.oproznij()
+        return getattr(self._plik, nazwa)
+
+    def zamknij(self):
+        """
+        Zapisuje zaległe dane i kończy wątek zapisu (pliku nie zamyka).
+
+        Raises:
+            OSError: Gdy zapis w tle się nie powiódł
+        """
+        self._kolejka.put(_KONIEC)
+        self._watek.join()
+        self._zglos_blad()
+
+
+@contextlib.contextmanager
+def zapis_w_tle(zipf: zipfile.ZipFile, glebokosc: int) -> Iterator[ZapisWTle]:
+    """
+    Na czas bloku with zapisuje dane archiwum w osobnym wątku.
+
+    Wpis musi zostać otwarty i zamknięty wewnątrz bloku - zipfile
+    zapamiętuje plik archiwum przy otwarciu wpisu.
+
+    Args:
+        zipf (zipfile.ZipFile): Archiwum otwarte do zapisu
+        glebokosc (int): Najwięcej fragmentów czekających na zapis
+
+    Yields:
+        ZapisWTle: Opakowanie pliku archiwum
+
+    Raises:
+        OSError: Gdy zapis w tle się nie powiódł
+    """
+    plik = zipf.fp
+    zapis = ZapisWTle(plik, glebokosc)
+    zipf.fp = zapis
+    try:
+        yield zapis
+    except BaseException:
+        # Najpierw dokończ zapis - archiwum będzie wycofywane do
+        # poprzedniego stanu; błąd zapisu nie przesłania pierwotnego błędu
+        with contextlib.suppress(Exception):
+            zapis.zamknij()
+        raise
+    else:
+        zapis.zamknij()
+    finally:
+        zipf.fp = plik
+
+
+def czytaj_z_wyprzedzeniem(
+    zrodlo: ZrodloPliku, rozmiar_bloku: int, glebokosc: int
+) -> ZrodloPliku:
+    """
+    Włącza odczyt z wyprzedzeniem dla źródła pliku.
+
+    Zmapowany plik nie potrzebuje wątku - system dostaje prośbę o
+    wczytanie kolejnych bloków w tle (madvise), a kompresor czyta je bez
+    kopiowania. Zwykłe źródło jest czytane przez CzytnikWTle.
+
+    Args:
+        zrodlo (ZrodloPliku): Źródło z otworz_zrodlo
+        rozmiar_bloku (int): Rozmiar bloku odczytu w bajtach
+        glebokosc (int): Najwięcej bloków przeczytanych naprzód
+
+    Returns:
+        ZrodloPliku: Źródło do użycia zamiast podanego (jego zamknij()
+            zamyka też podane źródło)
+    """
+    if zrodlo.mapowane:
+        zrodlo.ustaw_wyprzedzenie(glebokosc * rozmiar_bloku)
+        return zrodlo
+    return CzytnikWTle(zrodlo, rozmiar_bloku, glebokosc)
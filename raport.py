@@ -0,0 +1,328 @@
+# === MODUŁ RAPORT - RAPORT Z KOMPRESJI PACZKI ===
+"""
+Moduł zawierający raport z kompresji paczki plików.
+Odpowiedzialny za:
+- Zbieranie sum na bieżąco, w miarę kończenia kolejnych plików
+- Podział na rozszerzenia plików
+- Kwantyle stopnia kompresji i przepustowości (z histogramów)
+- Listę N plików skompresowanych najsłabiej
+- Eksport do JSON i CSV
+
+Raport powstaje z wyników, które kompresor i tak zapisuje - nie sprawdza
+plików na dysku. Pamięć i czas tworzenia raportu nie zależą od liczby
+plików: sumy, histogramy i lista najsłabszych plików mają stały rozmiar,
+a rośnie tylko tabela rozszerzeń.
+"""
+
+import heapq
+import os
+from typing import TYPE_CHECKING
+
+from metryki import Histogram
+
+if TYPE_CHECKING:
+    from wyniki import WynikPliku
+
+# Granice histogramu stopnia kompresji (rozmiar po / przed): co 0.01 do 1.5
+GRANICE_STOSUNKU = tuple(numer / 100 for numer in range(1, 151))
+
+# Granice histogramu przepustowości (MB/s): od 0.01 co 2^(1/4), do ~60 GB/s
+GRANICE_PRZEPUSTOWOSCI = tuple(0.01 * 2 ** (numer / 4) for numer in range(91))
+
+# Kwantyle podawane w raporcie
+KWANTYLE = (0.5, 0.9, 0.95, 0.99)
+
+# Ile najsłabiej skompresowanych plików pamiętać
+DOMYSLNIE_NAJGORSZE = 10
+
+# Decyzje, przy których plik nie był czytany w tym przebiegu
+_BEZ_ODCZYTU = ("pominiety", "blad", "gotowy")
+
+# Kolumny tabeli rozszerzeń w CSV
+_KOLUMNY_CSV = (
+    "rozszerzenie",
+    "liczba_plikow",
+    "liczba_bledow",
+    "rozmiar_przed",
+    "rozmiar_po",
+    "stosunek",
+    "oszczednosc_procent",
+)
+
+
+def _oszczednosc(rozmiar_przed: int, rozmiar_po: int) -> float:
+    """
+    Oblicza procent oszczędności miejsca (0-100, jak utils.oblicz_oszczednosc).
+
+    Args:
+        rozmiar_przed (int): Rozmiar przed kompresją
+        rozmiar_po (int): Rozmiar po kompresji
+
+    Returns:
+        float: Procent oszczędności
+    """
+    if rozmiar_przed <= 0:
+        return 0.0
+    return max(0.0, min(100.0, (rozmiar_przed - rozmiar_po) / rozmiar_przed * 100))
+
+
+class RaportKompresji:
+    """
+    Raport z kompresji paczki, uzupełniany po każdym pliku.
+
+    dodaj() kosztuje kilka operacji na plik, a jako_slownik() - tyle samo
+    niezależnie od liczby plików, więc raport z miliona plików powstaje
+    w milisekundach. Kwantyle są szacowane z histogramów (stosunek z
+    dokładnością do 0.01, przepustowość - do kilku procent).
+
+    Atrybuty:
+        liczba_plikow (int): Liczba wszystkich plików
+        liczba_bledow (int): Liczba plików zakończonych błędem
+        rozmiar_przed (int): Suma rozmiarów plików w bajtach
+        rozmiar_po (int): Suma rozmiarów wpisów w archiwach w bajtach
+        czas (float): Suma czasów obsługi plików w sekundach
+        decyzje (dict): {decyzja: liczba plików}
+        rozszerzenia (dict): {rozszerzenie: [liczba, bledy, przed, po]}
+        stosunek (Histogram): Stopnie kompresji plików
+        przepustowosc (Histogram): Przepustowość plików w MB/s
+    """
+
+    def __init__(self, najgorsze: int = DOMYSLNIE_NAJGORSZE):
+        """
+        Tworzy pusty raport.
+
+        Args:
+            najgorsze (int): Ile najsłabiej skompresowanych plików pamiętać
+        """
+        self.najgorsze = max(najgorsze, 0)
+        self.liczba_plikow = 0
+        self.liczba_bledow = 0
+        self.rozmiar_przed = 0
+        self.rozmiar_po = 0
+        self.czas = 0.0
+        self.decyzje = {}
+        self.rozszerzenia = {}
+        self.stosunek = Histogram(GRANICE_STOSUNKU)
+        self.przepustowosc = Histogram(GRANICE_PRZEPUSTOWOSCI)
+        # Kopiec (stosunek, -numer, sciezka, przed, po) - na szczycie
+        # najlepszy z zapamiętanych, więc łatwo go wymienić na gorszy
+        self._najgorsze = []
+
+    @classmethod
+    def z_wynikow(cls, wyniki, najgorsze: int = DOMYSLNIE_NAJGORSZE):
+        """
+        Tworzy raport z gotowych wyników (np. zapisanych wcześniej).
+
+        Args:
+            wyniki (Iterable[WynikPliku]): Wyniki plików
+            najgorsze (int): Ile najsłabiej skompresowanych plików pamiętać
+
+        Returns:
+            RaportKompresji: Raport ze wszystkich wyników
+        """
+        raport = cls(najgorsze)
+        for wynik in wyniki:
+            raport.dodaj(wynik)
+        return raport
+
+    def dodaj(self, wynik: "WynikPliku"):
+        """
+        Dolicza wynik pliku do raportu.
+
+        Args:
+            wynik (WynikPliku): Wynik kompresji pliku
+        """
+        numer = self.liczba_plikow
+        self.liczba_plikow += 1
+        blad = not wynik.sukces
+        self.liczba_bledow += blad
+        self.rozmiar_przed += wynik.rozmiar_przed
+        self.rozmiar_po += wynik.rozmiar_po
+        self.czas += wynik.czas
+        decyzja = wynik.decyzja
+        self.decyzje[decyzja] = self.decyzje.get(decyzja, 0) + 1
+
+        rozszerzenie = os.path.splitext(wynik.sciezka)[1].lower()
+        sumy = self.rozszerzenia.get(rozszerzenie)
+        if sumy is None:
+            sumy = self.rozszerzenia[rozszerzenie] = [0, 0, 0, 0]
+        sumy[0] += 1
+        sumy[1] += blad
+        sumy[2] += wynik.rozmiar_przed
+        sumy[3] += wynik.rozmiar_po
+
+        stosunek = wynik.rzeczywisty_stosunek
+        if stosunek is None:
+            return
+        self.stosunek.obserwuj(stosunek)
+        if wynik.czas > 0 and decyzja not in _BEZ_ODCZYTU:
+            self.przepustowosc.obserwuj(
+                wynik.rozmiar_przed / (1024 * 1024) / wynik.czas
+            )
+
+        if self.najgorsze:
+            pozycja = (
+                stosunek,
+                -numer,
+                wynik.sciezka,
+                wynik.rozmiar_przed,
+                wynik.rozmiar_po,
+            )
+            if len(self._najgorsze) < self.najgorsze:
+                heapq.heappush(self._najgorsze, pozycja)
+            elif pozycja > self._najgorsze[0]:
+                heapq.heapreplace(self._najgorsze, pozycja)
+
+    def najgorsze_pliki(self, liczba: int | None = None) -> list[dict]:
+        """
+        Zwraca najsłabiej skompresowane pliki (największy stosunek).
+
+        Przy równym stosunku pierwszeństwo ma plik dodany wcześniej.
+
+        Args:
+            liczba (int | None): Najwięcej plików (None = wszystkie zapamiętane)
+
+        Returns:
+            List[dict]: Pliki od najgorszego: sciezka, rozmiar_przed,
+                rozmiar_po, stosunek
+        """
+        pozycje = sorted(self._najgorsze, reverse=True)[:liczba]
+        return [
+            {
+                "sciezka": sciezka,
+                "rozmiar_przed": przed,
+                "rozmiar_po": po,
+                "stosunek": stosunek,
+            }
+            for stosunek, _, sciezka, przed, po in pozycje
+        ]
+
+    def tabela_rozszerzen(self) -> list[dict]:
+        """
+        Zwraca sumy dla rozszerzeń, od największej sumy rozmiarów.
+
+        Returns:
+            List[dict]: Wiersze z kluczami jak kolumny CSV (rozszerzenie ""
+                to pliki bez rozszerzenia)
+        """
+        wiersze = []
+        for rozszerzenie, (liczba, bledy, przed, po) in sorted(
+            self.rozszerzenia.items(), key=lambda para: (-para[1][2], para[0])
+        ):
+            wiersze.append(
+                {
+                    "rozszerzenie": rozszerzenie,
+                    "liczba_plikow": liczba,
+                    "liczba_bledow": bledy,
+                    "rozmiar_przed": przed,
+                    "rozmiar_po": po,
+                    "stosunek": po / przed if przed else None,
+                    "oszczednosc_procent": _oszczednosc(przed, po),
+                }
+            )
+        return wiersze
+
+    def jako_slownik(self) -> dict:
+        """
+        Zwraca cały raport jako słownik.
+
+        Returns:
+            dict: liczba_plikow, liczba_sukcesow, liczba_bledow, rozmiar_przed,
+                rozmiar_po, oszczednosc_bajty, oszczednosc_procent, stosunek,
+                czas, decyzje, rozszerzenia (tabela_rozszerzen), kwantyle
+                ({"stosunek": {"p50": ...}, "mb_na_s": {...}}) i najgorsze
+                (najgorsze_pliki)
+        """
+        return {
+            "liczba_plikow": self.liczba_plikow,
+            "liczba_sukcesow": self.liczba_plikow - self.liczba_bledow,
+            "liczba_bledow": self.liczba_bledow,
+            "rozmiar_przed": self.rozmiar_przed,
+            "rozmiar_po": self.rozmiar_po,
+            "oszczednosc_bajty": self.rozmiar_przed - self.rozmiar_po,
+            "oszczednosc_procent": _oszczednosc(self.rozmiar_przed, self.rozmiar_po),
+            "stosunek": (
+                self.rozmiar_po / self.rozmiar_przed if self.rozmiar_przed else None
+            ),
+            "czas": self.czas,
+            "decyzje": dict(self.decyzje),
+            "rozszerzenia": self.tabela_rozszerzen(),
+            "kwantyle": {
+                nazwa: {f"p{round(q * 100)}": h.kwantyl(q) for q in KWANTYLE}
+                for nazwa, h in (
+                    ("stosunek", self.stosunek),
+                    ("mb_na_s", self.przepustowosc),
+                )
+            },
+            "najgorsze": self.najgorsze_pliki(),
+        }
+
+    def jako_json(self) -> str:
+        """
+        Zwraca raport jako JSON.
+
+        Returns:
+            str: Raport w formacie JSON
+        """
+        # Import na miejscu - json potrzebny tylko przy eksporcie
+        import json
+
+        return json.dumps(self.jako_slownik(), ensure_ascii=False, indent=2)
+
+    def jako_csv(self) -> str:
+        """
+        Zwraca tabelę rozszerzeń jako CSV, z wierszem sumy "*" na końcu.
+
+        Returns:
+            str: Raport w formacie CSV (nagłówek jak _KOLUMNY_CSV)
+        """
+        # Import na miejscu - csv potrzebny tylko przy eksporcie
+        import csv
+        import io
+
+        wyjscie = io.StringIO()
+        zapis = csv.DictWriter(wyjscie, _KOLUMNY_CSV, lineterminator="\n")
+        zapis.writeheader()
+        zapis.writerows(self.tabela_rozszerzen())
+        zapis.writerow(
+            {
+                "rozszerzenie": "*",
+                "liczba_plikow": self.liczba_plikow,
+                "liczba_bledow": self.liczba_bledow,
+                "rozmiar_przed": self.rozmiar_przed,
+                "rozmiar_po": self.rozmiar_po,
+                "stosunek": (
+                    self.rozmiar_po / self.rozmiar_przed if self.rozmiar_przed else None
+                ),
+                "oszczednosc_procent": _oszczednosc(
+                    self.rozmiar_przed, self.rozmiar_po
+                ),
+            }
+        )
+        return wyjscie.getvalue()
+
+    def zapisz_do_pliku(self, sciezka_pliku: str):
+        """
+        Zapisuje raport do pliku: .csv - tabela rozszerzeń, inne - JSON.
+
+        Plik powstaje atomowo (plik tymczasowy zamieniany w miejscu).
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku raportu
+
+        Raises:
+            OSError: Gdy nie można zapisać pliku
+        """
+        # Import na miejscu - zapis potrzebny tylko przy eksporcie
+        from trwalosc import zapisz_atomowo
+
+        if sciezka_pliku.lower().endswith(".csv"):
+            tresc = self.jako_csv()
+        else:
+            tresc = self.jako_json()
+
+        with (
+            zapisz_atomowo(sciezka_pliku) as sciezka_w_zapisie,
+            open(sciezka_w_zapisie, "w", encoding="utf-8", newline="") as plik,
+        ):
+            plik.write(tresc)
@@ -0,0 +1,693 @@
+# === MODUŁ ROZPAKOWANIE - ROZPAKOWYWANIE I SPRAWDZANIE ARCHIWÓW ===
+"""
+Moduł zawierający rozpakowywanie i sprawdzanie archiwów ZIP.
+Odpowiedzialny za:
+- Rozpakowywanie wielu archiwów naraz (pula procesów)
+- Podział dużego archiwum (np. wspólnego archiwum paczki) między procesy
+- Odczyt wpisów blokami - pamięć nie zależy od rozmiaru wpisu
+- Tryb sprawdzania: sumy CRC-32 wszystkich wpisów bez zapisu na dysk
+- Ochronę przed wpisami wychodzącymi poza folder docelowy
+- Rozkładanie bloków ciągłych (moduł ciagly) na zapisane w nich pliki
+
+To odpowiednik kompresuj_wiele_plikow z modułu core. Rozpakowanie
+deflate/bzip2/lzma zwalnia GIL tylko na krótko, więc równoległość dają
+procesy, a nie wątki. Zadaniem procesu jest archiwum albo - gdy archiwum
+jest duże - ciągły fragment jego wpisów o podobnym łącznym rozmiarze.
+"""
+
+import contextlib
+import copy
+import os
+import threading
+import time
+import zipfile
+from collections.abc import Iterator
+
+from archiwum import czytaj_wpis
+from ciagly import czy_blok_ciagly, czy_spis_ciagly, pliki_bloku
+from core import DOMYSLNY_ROZMIAR_BLOKU, FunkcjaPostepu, PrzerwanieKompresji
+from dziennik import POZIOM_BLAD, POZIOM_INFO, Dziennik
+from indeks import ROZSZERZENIE_INDEKSU
+from kodeki import kodek_metody
+from trwalosc import zapisz_atomowo
+
+# Archiwa od tego rozmiaru są dzielone między procesy
+MIN_ROZMIAR_PODZIALU = 64 * 1024 * 1024
+
+# Najmniejsza część archiwum dla jednego procesu (rozmiar po rozpakowaniu) -
+# mniejsze części kosztowałyby więcej na otwieraniu archiwum niż dają
+MIN_ROZMIAR_CZESCI = 16 * 1024 * 1024
+
+# Na ile części na proces dzielić duże archiwum - kilka mniejszych części
+# wyrównuje obciążenie, gdy wpisy rozpakowują się w różnym tempie
+CZESCI_NA_PROCES = 4
+
+# Metody, które zipfile rozpakowuje sam (pozostałe - przez czytaj_wpis)
+_METODY_ZIPFILE = (
+    zipfile.ZIP_STORED,
+    zipfile.ZIP_DEFLATED,
+    zipfile.ZIP_BZIP2,
+    zipfile.ZIP_LZMA,
+)
+
+# Zadanie: (ścieżka archiwum, pierwszy wpis, koniec zakresu wpisów lub None)
+Zadanie = tuple[str, int, int | None]
+
+
+class WynikArchiwum:
+    """
+    Wynik rozpakowania lub sprawdzenia jednego archiwum.
+
+    Atrybuty:
+        sciezka (str): Ścieżka archiwum
+        liczba_wpisow (int): Liczba poprawnie przetworzonych wpisów
+        rozmiar (int): Łączny rozmiar rozpakowanych danych w bajtach
+        bledy (List[str]): Opisy błędów ("wpis - opis" lub sam opis, gdy
+            dotyczy całego archiwum)
+        czas (float): Czas przetwarzania w sekundach (suma części)
+    """
+
+    __slots__ = ("sciezka", "liczba_wpisow", "rozmiar", "bledy", "czas")
+
+    def __init__(self, sciezka: str):
+        """
+        Tworzy pusty wynik.
+
+        Args:
+            sciezka (str): Ścieżka archiwum
+        """
+        self.sciezka = sciezka
+        self.liczba_wpisow = 0
+        self.rozmiar = 0
+        self.bledy = []
+        self.czas = 0.0
+
+    @property
+    def sukces(self) -> bool:
+        """Czy wszystkie wpisy archiwum przetworzono bez błędu."""
+        return not self.bledy
+
+    def dolacz(self, czesc: "WynikArchiwum"):
+        """
+        Dolicza wynik części tego samego archiwum.
+
+        Args:
+            czesc (WynikArchiwum): Wynik części archiwum
+        """
+        self.liczba_wpisow += czesc.liczba_wpisow
+        self.rozmiar += czesc.rozmiar
+        self.bledy.extend(czesc.bledy)
+        self.czas += czesc.czas
+
+
+def _opis_bledu(e: BaseException) -> str:
+    """
+    Tworzy krótki opis błędu odczytu archiwum lub wpisu.
+
+    Args:
+        e (BaseException): Zgłoszony wyjątek
+
+    Returns:
+        str: Opis do komunikatu
+    """
+    if isinstance(e, zipfile.BadZipFile):
+        if "CRC-32" in str(e):
+            return "błędna suma CRC-32"
+        return f"uszkodzone archiwum ({e})"
+    if isinstance(e, FileNotFoundError):
+        return "plik nie istnieje"
+    if isinstance(e, PermissionError):
+        return "brak uprawnień"
+    if isinstance(e, (NotImplementedError, ValueError)):
+        return str(e)
+    return f"uszkodzone dane ({e})"
+
+
+def sciezka_wpisu(folder_docelowy: str, nazwa_wpisu: str) -> str:
+    """
+    Wyznacza ścieżkę, pod którą należy rozpakować wpis.
+
+    Nazwy bezwzględne i zawierające ".." są odrzucane - wpis nie może
+    trafić poza folder docelowy (atak "zip slip").
+
+    Args:
+        folder_docelowy (str): Folder rozpakowywania
+        nazwa_wpisu (str): Nazwa wpisu w archiwum
+
+    Returns:
+        str: Ścieżka w folderze docelowym
+
+    Raises:
+        ValueError: Gdy nazwa wpisu wychodzi poza folder docelowy
+    """
+    nazwa = nazwa_wpisu.replace("\\", "/")
+    czesci = [czesc for czesc in nazwa.split("/") if czesc not in ("", ".")]
+    if (
+        not czesci
+        or nazwa.startswith("/")
+        or ".." in czesci
+        or os.path.splitdrive(czesci[0])[0]
+    ):
+        raise ValueError(f"niebezpieczna nazwa wpisu {nazwa_wpisu!r}")
+    return os.path.join(folder_docelowy, *czesci)
+
+
+class RozpakowywaczArchiwow:
+    """
+    Rozpakowuje lub sprawdza wiele archiwów ZIP naraz.
+
+    Sprawdzanie czyta każdy wpis do końca, więc zipfile (lub czytaj_wpis
+    dla zstd) porównuje sumę CRC-32 - bez zapisu na dysk. Rozpakowane
+    pliki powstają atomowo i dostają czas modyfikacji z archiwum. Blok
+    ciągły jest rozpakowywany w całości i rozkładany na swoje pliki.
+
+    Atrybuty:
+        folder_docelowy (str | None): Folder rozpakowywania (None = tylko
+            sprawdzanie)
+        liczba_procesow (int): Liczba procesów roboczych
+        rozmiar_bloku (int): Rozmiar bloku odczytu wpisu w bajtach
+        dziennik (Dziennik): Historia operacji
+        wyniki (List[WynikArchiwum]): Wyniki archiwów z ostatniego wywołania
+    """
+
+    def __init__(
+        self,
+        folder_docelowy: str | None = None,
+        liczba_procesow: int | None = 1,
+        rozmiar_bloku: int = DOMYSLNY_ROZMIAR_BLOKU,
+        dziennik: Dziennik | None = None,
+    ):
+        """
+        Inicjalizuje rozpakowywacz.
+
+        Args:
+            folder_docelowy (str | None): Folder, do którego trafią pliki
+                (None - dozwolone tylko sprawdzanie)
+            liczba_procesow (int | None): Liczba procesów roboczych
+                (None = liczba rdzeni procesora)
+            rozmiar_bloku (int): Rozmiar bloku odczytu wpisu w bajtach
+            dziennik (Dziennik | None): Dziennik operacji (None = nowy w pamięci)
+
+        Raises:
+            ValueError: Gdy rozmiar bloku nie jest dodatni
+        """
+        if rozmiar_bloku <= 0:
+            raise ValueError("rozmiar bloku musi być dodatni")
+        if liczba_procesow is None:
+            liczba_procesow = os.cpu_count() or 1
+
+        self.folder_docelowy = folder_docelowy
+        self.liczba_procesow = max(liczba_procesow, 1)
+        self.rozmiar_bloku = rozmiar_bloku
+        self.dziennik = dziennik if dziennik is not None else Dziennik()
+        self.wyniki = []
+        self._archiwum = None  # Ostatnio otwarte archiwum: (ścieżka, ZipFile)
+
+    def __getstate__(self) -> dict:
+        # Otwartego archiwum nie da się przekazać do procesu roboczego
+        stan = self.__dict__.copy()
+        stan["_archiwum"] = None
+        return stan
+
+    def rozpakuj_wiele_archiwow(
+        self,
+        sciezki_archiwow: list[str],
+        postep: FunkcjaPostepu | None = None,
+        przerwij: threading.Event | None = None,
+    ) -> tuple[int, int, list[str]]:
+        """
+        Rozpakowuje archiwa do folderu docelowego.
+
+        Archiwum z błędem w jednym wpisie jest liczone jako błąd, ale
+        jego pozostałe wpisy są rozpakowywane.
+
+        Args:
+            sciezki_archiwow (List[str]): Archiwa do rozpakowania
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+                (sciezka_archiwum, przetworzone_bajty, rozmiar_archiwum)
+            przerwij (threading.Event | None): Po ustawieniu nierozpoczęte
+                archiwa są pomijane
+
+        Returns:
+            Tuple[int, int, List[str]]: (liczba_sukcesów, liczba_błędów,
+                lista_komunikatów)
+
+        Raises:
+            ValueError: Gdy nie podano folderu docelowego
+        """
+        if self.folder_docelowy is None:
+            raise ValueError("rozpakowanie wymaga folderu docelowego")
+        os.makedirs(self.folder_docelowy, exist_ok=True)
+        return self._przetworz_wiele(sciezki_archiwow, False, postep, przerwij)
+
+    def sprawdz_wiele_archiwow(
+        self,
+        sciezki_archiwow: list[str],
+        postep: FunkcjaPostepu | None = None,
+        przerwij: threading.Event | None = None,
+    ) -> tuple[int, int, list[str]]:
+        """
+        Sprawdza sumy CRC-32 wszystkich wpisów archiwów, niczego nie zapisując.
+
+        Args:
+            sciezki_archiwow (List[str]): Archiwa do sprawdzenia
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+            przerwij (threading.Event | None): Po ustawieniu nierozpoczęte
+                archiwa są pomijane
+
+        Returns:
+            Tuple[int, int, List[str]]: (liczba_poprawnych, liczba_błędnych,
+                lista_komunikatów)
+        """
+        return self._przetworz_wiele(sciezki_archiwow, True, postep, przerwij)
+
+    def _przetworz_wiele(
+        self,
+        sciezki_archiwow: list[str],
+        tylko_sprawdz: bool,
+        postep: FunkcjaPostepu | None,
+        przerwij: threading.Event | None,
+    ) -> tuple[int, int, list[str]]:
+        """
+        Przetwarza archiwa i zbiera wyniki (wspólna część obu trybów).
+
+        Args:
+            sciezki_archiwow (List[str]): Archiwa do przetworzenia
+            tylko_sprawdz (bool): True = bez zapisu na dysk
+            postep (FunkcjaPostepu | None): Funkcja zwrotna postępu
+            przerwij (threading.Event | None): Zdarzenie żądania przerwania
+
+        Returns:
+            Tuple[int, int, List[str]]: (liczba_sukcesów, liczba_błędów,
+                lista_komunikatów)
+        """
+        zadania = self._zaplanuj(sciezki_archiwow)
+        if self.liczba_procesow > 1 and len(zadania) > 1:
+            czesci = self._przetworz_rownolegle(zadania, tylko_sprawdz, przerwij)
+        else:
+            czesci = self._przetworz_kolejno(zadania, tylko_sprawdz, przerwij)
+
+        # Części jednego archiwum są kolejnymi zadaniami - łączymy je
+        self.wyniki = []
+        wyniki = {}
+        for czesc in czesci:
+            wynik = wyniki.get(czesc.sciezka)
+            if wynik is None:
+                wynik = wyniki[czesc.sciezka] = WynikArchiwum(czesc.sciezka)
+                self.wyniki.append(wynik)
+            wynik.dolacz(czesc)
+            if postep:
+                postep(czesc.sciezka, wynik.rozmiar, wynik.rozmiar)
+
+        sukcesy = 0
+        komunikaty = []
+        for wynik in self.wyniki:
+            nazwa = os.path.basename(wynik.sciezka)
+            if wynik.sukces:
+                sukcesy += 1
+                if tylko_sprawdz:
+                    komunikat = (
+                        f"✅ Archiwum {nazwa} poprawne - wpisów: {wynik.liczba_wpisow}"
+                    )
+                else:
+                    komunikat = (
+                        f"✅ Archiwum {nazwa} rozpakowane - "
+                        f"wpisów: {wynik.liczba_wpisow}"
+                    )
+                komunikaty.append(komunikat)
+                self.dziennik.zapisz(komunikat, POZIOM_INFO, wynik.sciezka)
+                continue
+            for blad in wynik.bledy:
+                komunikat = f"❌ Archiwum {nazwa}: {blad}"
+                komunikaty.append(komunikat)
+                self.dziennik.zapisz(komunikat, POZIOM_BLAD, wynik.sciezka)
+
+        return sukcesy, len(self.wyniki) - sukcesy, komunikaty
+
+    def _zaplanuj(self, sciezki_archiwow: list[str]) -> list[Zadanie]:
+        """
+        Dzieli archiwa na zadania dla procesów.
+
+        Małe archiwum to jedno zadanie. Duże archiwum (przy kilku procesach)
+        jest dzielone na ciągłe zakresy wpisów o podobnym rozmiarze po
+        rozpakowaniu - pojedynczego wpisu nie da się podzielić.
+
+        Args:
+            sciezki_archiwow (List[str]): Archiwa do przetworzenia
+
+        Returns:
+            List[Zadanie]: Zadania w kolejności archiwów i wpisów
+        """
+        zadania = []
+        for sciezka in sciezki_archiwow:
+            try:
+                duze = os.path.getsize(sciezka) >= MIN_ROZMIAR_PODZIALU
+            except OSError:
+                duze = False  # Błąd zgłosi przetwarzanie archiwum
+            if self.liczba_procesow == 1 or not duze:
+                zadania.append((sciezka, 0, None))
+                continue
+
+            try:
+                with zipfile.ZipFile(sciezka) as zipf:
+                    rozmiary = [info.file_size for info in zipf.infolist()]
+            except (OSError, zipfile.BadZipFile):
+                zadania.append((sciezka, 0, None))
+                continue
+
+            rozmiar_czesci = max(
+                sum(rozmiary) // (self.liczba_procesow * CZESCI_NA_PROCES),
+                MIN_ROZMIAR_CZESCI,
+            )
+            poczatek = 0
+            suma = 0
+            for numer, rozmiar in enumerate(rozmiary):
+                suma += rozmiar
+                if suma >= rozmiar_czesci:
+                    zadania.append((sciezka, poczatek, numer + 1))
+                    poczatek = numer + 1
+                    suma = 0
+            if poczatek < len(rozmiary) or not rozmiary:
+                zadania.append((sciezka, poczatek, len(rozmiary)))
+        return zadania
+
+    def _przetworz_kolejno(
+        self,
+        zadania: list[Zadanie],
+        tylko_sprawdz: bool,
+        przerwij: threading.Event | None,
+    ) -> Iterator[WynikArchiwum]:
+        """
+        Przetwarza zadania po kolei w bieżącym procesie.
+
+        Args:
+            zadania (List[Zadanie]): Zadania z _zaplanuj
+            tylko_sprawdz (bool): True = bez zapisu na dysk
+            przerwij (threading.Event | None): Zdarzenie żądania przerwania
+
+        Yields:
+            WynikArchiwum: Wyniki kolejnych zadań
+        """
+        try:
+            for zadanie in zadania:
+                if przerwij is not None and przerwij.is_set():
+                    return
+                yield self._przetworz_zadanie(zadanie, tylko_sprawdz, przerwij)
+        finally:
+            self._zamknij_archiwum()
+
+    def _przetworz_rownolegle(
+        self,
+        zadania: list[Zadanie],
+        tylko_sprawdz: bool,
+        przerwij: threading.Event | None,
+    ) -> Iterator[WynikArchiwum]:
+        """
+        Przetwarza zadania w puli procesów, zwracając wyniki w kolejności zadań.
+
+        Args:
+            zadania (List[Zadanie]): Zadania z _zaplanuj
+            tylko_sprawdz (bool): True = bez zapisu na dysk
+            przerwij (threading.Event | None): Po ustawieniu nierozpoczęte
+                zadania są anulowane; zadania w toku są kończone
+
+        Yields:
+            WynikArchiwum: Wyniki kolejnych zadań
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Procesy robocze dostają kopię bez historii operacji
+        kopia = copy.copy(self)
+        kopia.dziennik = Dziennik(pojemnosc=0)
+        kopia.wyniki = []
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.liczba_procesow, len(zadania)),
+            initializer=_inicjalizuj_proces_roboczy,
+            initargs=(kopia,),
+        ) as pula:
+            przyszle = [
+                pula.submit(_przetworz_w_procesie, zadanie, tylko_sprawdz)
+                for zadanie in zadania
+            ]
+            try:
+                for zadanie, przyszly in zip(zadania, przyszle, strict=True):
+                    if przerwij is not None and przerwij.is_set():
+                        for pozostaly in przyszle:
+                            pozostaly.cancel()
+                    if przyszly.cancelled():
+                        continue
+                    try:
+                        yield przyszly.result()
+                    except Exception as e:
+                        # Awaria procesu roboczego - błąd całego zadania
+                        wynik = WynikArchiwum(zadanie[0])
+                        wynik.bledy.append(f"błąd procesu roboczego ({e})")
+                        yield wynik
+            finally:
+                for przyszly in przyszle:
+                    przyszly.cancel()
+
+    def _otworz_archiwum(self, sciezka_archiwum: str) -> zipfile.ZipFile:
+        """
+        Otwiera archiwum, korzystając z ostatnio otwartego.
+
+        Kolejne części dużego archiwum trafiają zwykle do tego samego
+        procesu, więc katalog archiwum nie jest wczytywany za każdym razem.
+
+        Args:
+            sciezka_archiwum (str): Ścieżka archiwum
+
+        Returns:
+            zipfile.ZipFile: Archiwum otwarte do odczytu
+
+        Raises:
+            OSError: Gdy archiwum nie da się otworzyć
+            zipfile.BadZipFile: Gdy plik nie jest archiwum ZIP
+        """
+        if self._archiwum is not None and self._archiwum[0] == sciezka_archiwum:
+            return self._archiwum[1]
+        self._zamknij_archiwum()
+        zipf = zipfile.ZipFile(sciezka_archiwum)
+        self._archiwum = (sciezka_archiwum, zipf)
+        return zipf
+
+    def _zamknij_archiwum(self):
+        """Zamyka ostatnio otwarte archiwum."""
+        if self._archiwum is not None:
+            self._archiwum[1].close()
+            self._archiwum = None
+
+    def _przetworz_zadanie(
+        self,
+        zadanie: Zadanie,
+        tylko_sprawdz: bool,
+        przerwij: threading.Event | None = None,
+    ) -> WynikArchiwum:
+        """
+        Rozpakowuje lub sprawdza zakres wpisów jednego archiwum.
+
+        Args:
+            zadanie (Zadanie): (ścieżka archiwum, pierwszy wpis, koniec zakresu)
+            tylko_sprawdz (bool): True = bez zapisu na dysk
+            przerwij (threading.Event | None): Zdarzenie żądania przerwania
+
+        Returns:
+            WynikArchiwum: Wynik zakresu wpisów
+        """
+        sciezka_archiwum, poczatek, koniec = zadanie
+        wynik = WynikArchiwum(sciezka_archiwum)
+        start = time.perf_counter()
+        try:
+            zipf = self._otworz_archiwum(sciezka_archiwum)
+            for info in zipf.infolist()[poczatek:koniec]:
+                try:
+                    wynik.rozmiar += self._przetworz_wpis(
+                        zipf, info, tylko_sprawdz, przerwij
+                    )
+                    wynik.liczba_wpisow += 1
+                except (PrzerwanieKompresji, KeyboardInterrupt):
+                    raise
+                except Exception as e:
+                    wynik.bledy.append(f"{info.filename} - {_opis_bledu(e)}")
+        except PrzerwanieKompresji:
+            wynik.bledy.append("przerwano")
+        except Exception as e:
+            wynik.bledy.append(_opis_bledu(e))
+        wynik.czas = time.perf_counter() - start
+        return wynik
+
+    def _przetworz_wpis(
+        self,
+        zipf: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        tylko_sprawdz: bool,
+        przerwij: threading.Event | None,
+    ) -> int:
+        """
+        Rozpakowuje lub sprawdza jeden wpis.
+
+        Args:
+            zipf (zipfile.ZipFile): Archiwum otwarte do odczytu
+            info (zipfile.ZipInfo): Wpis archiwum
+            tylko_sprawdz (bool): True = bez zapisu na dysk
+            przerwij (threading.Event | None): Zdarzenie żądania przerwania
+
+        Returns:
+            int: Rozmiar rozpakowanych danych w bajtach
+
+        Raises:
+            zipfile.BadZipFile: Gdy suma CRC-32 się nie zgadza
+            ValueError: Gdy nazwa wpisu wychodzi poza folder docelowy
+            PrzerwanieKompresji: Gdy ustawiono zdarzenie przerwania
+            OSError: Gdy nie można zapisać pliku
+        """
+        nazwa_pliku = info.filename.removesuffix(ROZSZERZENIE_INDEKSU)
+        if (
+            nazwa_pliku != info.filename and nazwa_pliku in zipf.NameToInfo
+        ) or czy_spis_ciagly(info.filename):
+            # Indeks bloków (tryb dostępu swobodnego) i spis bloku ciągłego
+            # nie są plikami użytkownika - tylko je sprawdzamy
+            tylko_sprawdz = True
+
+        if tylko_sprawdz:
+            rozmiar = 0
+            for blok in self._bloki_wpisu(zipf, info, przerwij):
+                rozmiar += len(blok)
+            return rozmiar
+
+        if czy_blok_ciagly(info.filename):
+            return self._rozpakuj_blok_ciagly(zipf, info, przerwij)
+
+        cel = sciezka_wpisu(self.folder_docelowy, info.filename)
+        if info.is_dir():
+            os.makedirs(cel, exist_ok=True)
+            return 0
+
+        os.makedirs(os.path.dirname(cel), exist_ok=True)
+        rozmiar = 0
+        with (
+            zapisz_atomowo(cel) as sciezka_w_zapisie,
+            open(sciezka_w_zapisie, "wb") as plik,
+        ):
+            for blok in self._bloki_wpisu(zipf, info, przerwij):
+                plik.write(blok)
+                rozmiar += len(blok)
+
+        # Czas modyfikacji z archiwum (ZIP zapisuje go z dokładnością do 2 s)
+        with contextlib.suppress(OverflowError, ValueError, OSError):
+            czas = time.mktime((*info.date_time, 0, 0, -1))
+            os.utime(cel, (czas, czas))
+        return rozmiar
+
+    def _rozpakuj_blok_ciagly(
+        self,
+        zipf: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        przerwij: threading.Event | None,
+    ) -> int:
+        """
+        Rozpakowuje pliki zapisane w bloku ciągłym.
+
+        Blok (kilka MB) jest rozpakowywany do pamięci w całości, a potem
+        dzielony na pliki - każdy zapisywany atomowo, z czasem modyfikacji
+        z nagłówka tar.
+
+        Args:
+            zipf (zipfile.ZipFile): Archiwum otwarte do odczytu
+            info (zipfile.ZipInfo): Wpis bloku ciągłego
+            przerwij (threading.Event | None): Zdarzenie żądania przerwania
+
+        Returns:
+            int: Łączny rozmiar rozpakowanych plików w bajtach
+
+        Raises:
+            zipfile.BadZipFile: Gdy suma CRC-32 bloku się nie zgadza
+            tarfile.TarError: Gdy blok nie jest poprawnym strumieniem tar
+            ValueError: Gdy nazwa pliku wychodzi poza folder docelowy
+            OSError: Gdy nie można zapisać pliku
+        """
+        dane = b"".join(self._bloki_wpisu(zipf, info, przerwij))
+        rozmiar = 0
+        for nazwa, zawartosc, czas in pliki_bloku(dane):
+            if przerwij is not None and przerwij.is_set():
+                raise PrzerwanieKompresji(nazwa)
+            cel = sciezka_wpisu(self.folder_docelowy, nazwa)
+            os.makedirs(os.path.dirname(cel), exist_ok=True)
+            with (
+                zapisz_atomowo(cel) as sciezka_w_zapisie,
+                open(sciezka_w_zapisie, "wb") as plik,
+            ):
+                plik.write(zawartosc)
+            with contextlib.suppress(OverflowError, ValueError, OSError):
+                os.utime(cel, (czas, czas))
+            rozmiar += len(zawartosc)
+        return rozmiar
+
+    def _bloki_wpisu(
+        self,
+        zipf: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        przerwij: threading.Event | None,
+    ) -> Iterator[bytes]:
+        """
+        Czyta rozpakowany wpis blokami; suma CRC-32 jest sprawdzana na końcu.
+
+        Args:
+            zipf (zipfile.ZipFile): Archiwum otwarte do odczytu
+            info (zipfile.ZipInfo): Wpis archiwum
+            przerwij (threading.Event | None): Zdarzenie żądania przerwania
+
+        Yields:
+            bytes: Kolejne fragmenty wpisu
+
+        Raises:
+            zipfile.BadZipFile: Gdy suma CRC-32 się nie zgadza
+            NotImplementedError: Gdy metoda kompresji jest nieobsługiwana
+            PrzerwanieKompresji: Gdy ustawiono zdarzenie przerwania
+        """
+        if info.compress_type in _METODY_ZIPFILE:
+            with zipf.open(info) as wpis:
+                # ZipExtFile porównuje sumę CRC-32 po odczytaniu ostatniego bloku
+                while blok := wpis.read(self.rozmiar_bloku):
+                    if przerwij is not None and przerwij.is_set():
+                        raise PrzerwanieKompresji(info.filename)
+                    yield blok
+            return
+
+        dekompresor = kodek_metody(info.compress_type).stworz_dekompresor()
+        for blok in czytaj_wpis(zipf.fp, info, dekompresor, self.rozmiar_bloku):
+            if przerwij is not None and przerwij.is_set():
+                raise PrzerwanieKompresji(info.filename)
+            yield blok
+
+
+# === PULA PROCESÓW ===
+
+# Rozpakowywacz procesu roboczego - ustawiany raz przy starcie procesu w puli
+_rozpakowywacz_procesu: RozpakowywaczArchiwow | None = None
+
+
+def _inicjalizuj_proces_roboczy(rozpakowywacz: RozpakowywaczArchiwow):
+    """
+    Zapamiętuje rozpakowywacz w procesie roboczym puli.
+
+    Args:
+        rozpakowywacz (RozpakowywaczArchiwow): Kopia z procesu głównego
+    """
+    global _rozpakowywacz_procesu
+    _rozpakowywacz_procesu = rozpakowywacz
+
+
+def _przetworz_w_procesie(zadanie: Zadanie, tylko_sprawdz: bool) -> WynikArchiwum:
+    """
+    Przetwarza jedno zadanie w procesie roboczym puli.
+
+    Args:
+        zadanie (Zadanie): Zadanie z _zaplanuj
+        tylko_sprawdz (bool): True = bez zapisu na dysk
+
+    Returns:
+        WynikArchiwum: Wynik zadania
+    """
+    return _rozpakowywacz_procesu._przetworz_zadanie(zadanie, tylko_sprawdz)
@@ -0,0 +1,278 @@
+# === MODUŁ SKANER - JEDNO WYWOŁANIE STAT NA PLIK ===
+"""
+Moduł zawierający skaner plików oparty na os.scandir.
+Odpowiedzialny za:
+- Przeglądanie folderów (także rekurencyjnie) jednym przejściem
+- Zapamiętywanie wyników stat w zwartych rekordach plików
+- Udostępnianie tych rekordów walidacji, kompresji i raportom
+
+Przy dziesiątkach tysięcy plików osobne os.path.exists, isfile i getsize
+dla każdego pliku kosztują więcej niż sama kompresja małych plików.
+Skaner wywołuje stat najwyżej raz na plik w jednym przebiegu, a pliki
+znalezione przez os.scandir dostają wynik stat z wpisu katalogu.
+"""
+
+import errno
+import functools
+import os
+import stat
+
+
+class RekordPliku:
+    """
+    Zwarty zapis wyniku stat jednego pliku.
+
+    Dzięki __slots__ rekord nie ma słownika atrybutów, więc milion
+    rekordów zajmuje kilkukrotnie mniej pamięci niż os.stat_result.
+
+    Atrybuty:
+        sciezka (str): Ścieżka do pliku (tak, jak ją podano)
+        rozmiar (int): Rozmiar pliku w bajtach
+        mtime_ns (int): Czas modyfikacji w nanosekundach
+        ctime_ns (int): Czas zmiany metadanych (lub utworzenia) w nanosekundach
+        inode (int): Numer i-węzła
+        tryb (int): Typ i uprawnienia pliku (st_mode)
+        uid (int): Identyfikator właściciela
+        gid (int): Identyfikator grupy
+    """
+
+    __slots__ = (
+        "sciezka",
+        "rozmiar",
+        "mtime_ns",
+        "ctime_ns",
+        "inode",
+        "tryb",
+        "uid",
+        "gid",
+    )
+
+    def __init__(self, sciezka: str, wynik_stat: os.stat_result):
+        """
+        Tworzy rekord z wyniku os.stat lub DirEntry.stat.
+
+        Args:
+            sciezka (str): Ścieżka do pliku
+            wynik_stat (os.stat_result): Wynik stat pliku
+        """
+        self.sciezka = sciezka
+        self.rozmiar = wynik_stat.st_size
+        self.mtime_ns = wynik_stat.st_mtime_ns
+        self.ctime_ns = wynik_stat.st_ctime_ns
+        self.inode = wynik_stat.st_ino
+        self.tryb = wynik_stat.st_mode
+        self.uid = wynik_stat.st_uid
+        self.gid = wynik_stat.st_gid
+
+    def __repr__(self) -> str:
+        return f"RekordPliku({self.sciezka!r}, rozmiar={self.rozmiar})"
+
+    @property
+    def czas_modyfikacji(self) -> float:
+        """float: Czas modyfikacji w sekundach (jak st_mtime)."""
+        return self.mtime_ns / 1e9
+
+    @property
+    def czas_utworzenia(self) -> float:
+        """float: Czas z pola st_ctime w sekundach."""
+        return self.ctime_ns / 1e9
+
+    def czy_do_odczytu(self) -> bool:
+        """
+        Sprawdza prawo odczytu pliku na podstawie zapamiętanych uprawnień.
+
+        Nie wywołuje żadnej funkcji systemowej (poza Windows, gdzie bity
+        uprawnień nic nie mówią). Listy ACL nie są brane pod uwagę - taki
+        plik zgłosi błąd dopiero przy kompresji.
+
+        Returns:
+            bool: True jeśli bieżący użytkownik może czytać plik
+        """
+        if not hasattr(os, "geteuid"):
+            return os.access(self.sciezka, os.R_OK)
+
+        euid = os.geteuid()
+        if euid == 0:
+            return True  # Administrator czyta każdy zwykły plik
+        if self.uid == euid:
+            return bool(self.tryb & stat.S_IRUSR)
+        if self.gid in _grupy_uzytkownika():
+            return bool(self.tryb & stat.S_IRGRP)
+        return bool(self.tryb & stat.S_IROTH)
+
+
+class SkanerPlikow:
+    """
+    Pamięć wyników stat plików z jednego przebiegu kompresji.
+
+    Każda ścieżka jest sprawdzana najwyżej raz; kolejne pytania o ten sam
+    plik (walidacja, wybór kodeka, nagłówek ZIP, raport) dostają rekord
+    z pamięci. Zapamiętywany jest też brak pliku, żeby nie pytać o niego
+    ponownie.
+    """
+
+    def __init__(self):
+        """Inicjalizuje pusty skaner."""
+        # {sciezka: rekord}; None = plik nie istnieje lub nie jest zwykłym plikiem
+        self._rekordy: dict[str, RekordPliku | None] = {}
+
+    def __len__(self) -> int:
+        return len(self._rekordy)
+
+    def __contains__(self, sciezka: str) -> bool:
+        return sciezka in self._rekordy
+
+    def rekord(self, sciezka_pliku: str) -> RekordPliku | None:
+        """
+        Zwraca rekord pliku, wywołując stat tylko przy pierwszym pytaniu.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+
+        Returns:
+            RekordPliku | None: Rekord lub None, gdy plik nie istnieje,
+                nie jest zwykłym plikiem albo nie można go sprawdzić
+        """
+        try:
+            return self._rekordy[sciezka_pliku]
+        except KeyError:
+            pass
+
+        try:
+            wynik_stat = os.stat(sciezka_pliku)
+        except (OSError, ValueError):  # ValueError: np. znak NUL w ścieżce
+            wynik_stat = None
+        return self._zapamietaj(sciezka_pliku, wynik_stat)
+
+    def pobierz(self, sciezka_pliku: str) -> RekordPliku:
+        """
+        Zwraca rekord pliku, którego brak jest błędem (np. przy kompresji).
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+
+        Returns:
+            RekordPliku: Rekord pliku
+
+        Raises:
+            FileNotFoundError: Gdy plik nie istnieje lub nie jest zwykłym plikiem
+        """
+        rekord = self.rekord(sciezka_pliku)
+        if rekord is None:
+            raise FileNotFoundError(
+                errno.ENOENT, os.strerror(errno.ENOENT), sciezka_pliku
+            )
+        return rekord
+
+    def skanuj(self, sciezki: list[str], rekurencyjnie: bool = False) -> list[str]:
+        """
+        Zamienia listę plików i folderów na listę plików.
+
+        Foldery są zastępowane swoimi plikami (posortowanymi, żeby wynik
+        był powtarzalny). Ścieżki, które nie istnieją, zostają na liście -
+        walidacja zgłosi je jako błędy.
+
+        Args:
+            sciezki (List[str]): Ścieżki plików i folderów
+            rekurencyjnie (bool): Czy przeszukiwać też podfoldery
+
+        Returns:
+            List[str]: Ścieżki plików w kolejności wejścia
+        """
+        pliki = []
+        for sciezka in sciezki:
+            if sciezka in self._rekordy:
+                pliki.append(sciezka)
+                continue
+
+            try:
+                wynik_stat = os.stat(sciezka)
+            except (OSError, ValueError):
+                wynik_stat = None
+
+            if wynik_stat is not None and stat.S_ISDIR(wynik_stat.st_mode):
+                pliki.extend(self._skanuj_folder(sciezka, rekurencyjnie))
+            else:
+                self._zapamietaj(sciezka, wynik_stat)
+                pliki.append(sciezka)
+        return pliki
+
+    def _skanuj_folder(self, folder: str, rekurencyjnie: bool) -> list[str]:
+        """
+        Zwraca pliki z folderu, zapamiętując ich rekordy.
+
+        Kolejność jest taka sama jak przy os.walk z sortowaniem: najpierw
+        pliki folderu, potem kolejne podfoldery. Dowiązań do folderów nie
+        odwiedzamy (jak os.walk), a niedostępne podfoldery są pomijane.
+
+        Args:
+            folder (str): Ścieżka do folderu
+            rekurencyjnie (bool): Czy przeszukiwać też podfoldery
+
+        Returns:
+            List[str]: Ścieżki plików
+        """
+        pliki = []
+        do_odwiedzenia = [folder]
+        while do_odwiedzenia:
+            biezacy = do_odwiedzenia.pop()
+            wpisy_plikow = []
+            podfoldery = []
+            try:
+                with os.scandir(biezacy) as wpisy:
+                    for wpis in wpisy:
+                        # is_dir/is_file korzystają z typu zapisanego w
+                        # katalogu - zwykle bez dodatkowego stat
+                        if rekurencyjnie and wpis.is_dir(follow_symlinks=False):
+                            podfoldery.append(wpis.path)
+                        elif wpis.is_file():
+                            wpisy_plikow.append(wpis)
+            except OSError:
+                continue
+
+            wpisy_plikow.sort(key=lambda wpis: wpis.name)
+            for wpis in wpisy_plikow:
+                try:
+                    wynik_stat = wpis.stat()  # DirEntry pamięta wynik
+                except OSError:
+                    wynik_stat = None
+                self._zapamietaj(wpis.path, wynik_stat)
+                pliki.append(wpis.path)
+
+            # Stos: odwrotna kolejność, żeby podfoldery odwiedzać alfabetycznie
+            do_odwiedzenia.extend(sorted(podfoldery, reverse=True))
+        return pliki
+
+    def _zapamietaj(
+        self, sciezka_pliku: str, wynik_stat: os.stat_result | None
+    ) -> RekordPliku | None:
+        """
+        Zapisuje rekord pliku (lub jego brak) w pamięci skanera.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+            wynik_stat (os.stat_result | None): Wynik stat (None = brak pliku)
+
+        Returns:
+            RekordPliku | None: Zapisany rekord
+        """
+        rekord = None
+        if wynik_stat is not None and stat.S_ISREG(wynik_stat.st_mode):
+            rekord = RekordPliku(sciezka_pliku, wynik_stat)
+        self._rekordy[sciezka_pliku] = rekord
+        return rekord
+
+    def wyczysc(self):
+        """Zapomina wszystkie rekordy (np. przed ponownym skanowaniem)."""
+        self._rekordy.clear()
+
+
+@functools.cache
+def _grupy_uzytkownika() -> frozenset[int]:
+    """
+    Zwraca grupy bieżącego procesu (sprawdzane raz na proces).
+
+    Returns:
+        FrozenSet[int]: Identyfikatory grup
+    """
+    return frozenset((os.getegid(), *os.getgroups()))
@@ -0,0 +1,278 @@
+# === MODUŁ STROJENIE - DOBÓR POZIOMU KOMPRESJI DO CELU ===
+"""
+Moduł zawierający adaptacyjny dobór poziomu kompresji.
+Odpowiedzialny za:
+- Cel przepustowości ("co najmniej 200 MB/s")
+- Budżet czasu paczki ("najlepsza kompresja w 10 minut")
+- Pomiar przepustowości poziomów na wcześniejszych plikach paczki
+- Wybór poziomu (i ewentualnie zapisu bez kompresji) dla kolejnego pliku
+
+Zamiast stałego poziomu podajemy cel, a kompresor przed każdym plikiem
+wybiera najwyższy poziom, który według dotychczasowych pomiarów ten cel
+spełni. Wyższy poziom to lepsza kompresja, więc przy budżecie czasu
+dostajemy najlepszy stopień kompresji, jaki mieści się w oknie paczki.
+Pomiary są średnią ruchomą, więc dobór nadąża za obciążeniem maszyny.
+"""
+
+import copy
+import math
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kodeki import Kodek
+
+# Względna szybkość poziomów 1-9 (deflate na tekście, poziom 1 = 1.0) -
+# szacunek dla poziomów, których jeszcze nie zmierzono
+WZGLEDNA_SZYBKOSC = (1.0, 0.9, 0.8, 0.65, 0.5, 0.38, 0.3, 0.18, 0.12)
+
+# Mniejsze pliki nie uczą doboru - ich czas to głównie otwarcie i zapis
+# archiwum, niezależne od poziomu
+MIN_ROZMIAR_POMIARU = 256 * 1024
+
+# Waga nowego pomiaru w średniej ruchomej (większa = szybsza reakcja)
+WAGA_POMIARU = 0.3
+
+# Zapas - poziom musi być szybszy od celu o tyle, żeby wahania pomiaru
+# nie spychały paczki poniżej celu
+ZAPAS = 1.1
+
+# Poziom oznaczający zapis bez kompresji (store)
+POZIOM_STORE = 0
+
+
+class StrojeniePoziomu:
+    """
+    Dobiera poziom kompresji kolejnych plików tak, by osiągnąć cel.
+
+    Cel to przepustowość (cel_mb_na_s), budżet czasu paczki (budzet_s)
+    albo oba - wtedy obowiązuje wyższe z wymagań. Przy budżecie wymagana
+    przepustowość jest liczona na bieżąco z pozostałych bajtów i czasu,
+    więc paczka, która wyprzedza plan, dostaje wyższe poziomy.
+
+    Przepustowość jest mierzona dla pary (kodek, poziom). Poziom, którego
+    jeszcze nie użyto, jest szacowany z najbliższego zmierzonego i tabeli
+    WZGLEDNA_SZYBKOSC. Przed pierwszym pomiarem używany jest
+    poziom_startowy.
+
+    Metody można wywoływać z wielu wątków naraz.
+
+    Atrybuty:
+        cel_mb_na_s (float | None): Najmniejsza przepustowość w MB/s
+        budzet_s (float | None): Czas na całą paczkę w sekundach
+        poziom_startowy (int): Poziom przed pierwszymi pomiarami
+        pozwol_store (bool): Czy zapisywać bez kompresji, gdy nawet
+            poziom 1 jest za wolny
+    """
+
+    def __init__(
+        self,
+        cel_mb_na_s: float | None = None,
+        budzet_s: float | None = None,
+        poziom_startowy: int = 6,
+        pozwol_store: bool = False,
+    ):
+        """
+        Tworzy dobór poziomu.
+
+        Args:
+            cel_mb_na_s (float | None): Najmniejsza przepustowość w MB/s
+            budzet_s (float | None): Czas na całą paczkę w sekundach
+                (liczony od rozpocznij())
+            poziom_startowy (int): Poziom przed pierwszymi pomiarami (1-9)
+            pozwol_store (bool): Zapisuj bez kompresji, gdy nawet poziom 1
+                nie spełnia celu
+
+        Raises:
+            ValueError: Gdy nie podano celu albo cel nie jest dodatni
+        """
+        if cel_mb_na_s is None and budzet_s is None:
+            raise ValueError("podaj cel przepustowości lub budżet czasu")
+        if cel_mb_na_s is not None and cel_mb_na_s <= 0:
+            raise ValueError("cel przepustowości musi być dodatni")
+        if budzet_s is not None and budzet_s <= 0:
+            raise ValueError("budżet czasu musi być dodatni")
+
+        self.cel_mb_na_s = cel_mb_na_s
+        self.budzet_s = budzet_s
+        self.poziom_startowy = min(max(poziom_startowy, 1), 9)
+        self.pozwol_store = pozwol_store
+        self._blokada = threading.Lock()
+        self._pomiary = {}  # {(kodek, poziom): MB/s (średnia ruchoma)}
+        self._udzial = 1.0  # Część paczki obsługiwana przez ten obiekt
+        self._poczatek = None  # time.monotonic() początku paczki
+        self._do_kompresji = 0  # Bajty paczki (dla budżetu)
+        self._przetworzone = 0
+
+    def __getstate__(self) -> dict:
+        # Blokady nie da się przekazać do procesu roboczego
+        stan = self.__dict__.copy()
+        del stan["_blokada"]
+        return stan
+
+    def __setstate__(self, stan: dict):
+        self.__dict__.update(stan)
+        self._blokada = threading.Lock()
+
+    def rozpocznij(self, bajty_do_kompresji: int):
+        """
+        Rozpoczyna paczkę - od tej chwili liczy się budżet czasu.
+
+        Pomiary poprzednich paczek zostają - maszyna jest ta sama.
+
+        Args:
+            bajty_do_kompresji (int): Łączny rozmiar plików paczki
+        """
+        with self._blokada:
+            self._poczatek = time.monotonic()
+            self._do_kompresji = bajty_do_kompresji
+            self._przetworzone = 0
+            self._udzial = 1.0
+
+    def podziel(self, liczba_procesow: int) -> "StrojeniePoziomu":
+        """
+        Tworzy kopię dla jednego z procesów kompresujących paczkę naraz.
+
+        Każdy proces dostaje równą część celu przepustowości i bajtów
+        paczki; budżet czasu jest wspólny.
+
+        Args:
+            liczba_procesow (int): Liczba procesów roboczych
+
+        Returns:
+            StrojeniePoziomu: Kopia z częścią paczki
+        """
+        kopia = copy.copy(self)
+        kopia._pomiary = dict(self._pomiary)
+        kopia._udzial = self._udzial / max(liczba_procesow, 1)
+        return kopia
+
+    def wymagana_przepustowosc(self) -> float | None:
+        """
+        Zwraca przepustowość potrzebną do osiągnięcia celu.
+
+        Returns:
+            float | None: MB/s dla tego obiektu (math.inf, gdy budżet już
+                minął; None, gdy budżet jest jedynym celem, a paczki nie
+                rozpoczęto)
+        """
+        with self._blokada:
+            return self._wymagana_przepustowosc()
+
+    def _wymagana_przepustowosc(self) -> float | None:
+        """Jak wymagana_przepustowosc, ale wywoływana pod blokadą."""
+        wymagana = None
+        if self.cel_mb_na_s is not None:
+            wymagana = self.cel_mb_na_s * self._udzial
+
+        if self.budzet_s is not None and self._poczatek is not None:
+            pozostale = self._do_kompresji * self._udzial - self._przetworzone
+            pozostaly_czas = self.budzet_s - (time.monotonic() - self._poczatek)
+            if pozostale > 0:
+                z_budzetu = (
+                    pozostale / (1024 * 1024) / pozostaly_czas
+                    if pozostaly_czas > 0
+                    else math.inf
+                )
+                wymagana = max(wymagana or 0.0, z_budzetu)
+        return wymagana
+
+    def wybierz_poziom(self, kodek: "Kodek") -> int:
+        """
+        Wybiera poziom kompresji dla kolejnego pliku.
+
+        Args:
+            kodek (Kodek): Kodek wybrany dla pliku
+
+        Returns:
+            int: Poziom 1-9 albo POZIOM_STORE (zapis bez kompresji)
+        """
+        with self._blokada:
+            wymagana = self._wymagana_przepustowosc()
+            if wymagana is None or kodek.nazwa == "store":
+                return self.poziom_startowy
+
+            # Kodek bez poziomów (np. lzma) - można tylko zrezygnować z kompresji
+            if kodek.poziom_min is None:
+                szacunek = self._pomiary.get((kodek.nazwa, self.poziom_startowy))
+                if self.pozwol_store and szacunek is not None and szacunek < wymagana:
+                    return POZIOM_STORE
+                return self.poziom_startowy
+
+            # Najwyższy poziom, który według pomiarów nadąży za celem
+            for poziom in range(9, 0, -1):
+                szacunek = self._szacuj(kodek.nazwa, poziom)
+                if szacunek is None:
+                    return self.poziom_startowy  # Jeszcze bez pomiarów
+                if szacunek >= wymagana * ZAPAS:
+                    return poziom
+            return POZIOM_STORE if self.pozwol_store else 1
+
+    def _szacuj(self, nazwa_kodeka: str, poziom: int) -> float | None:
+        """
+        Szacuje przepustowość poziomu z pomiarów (wywoływana pod blokadą).
+
+        Args:
+            nazwa_kodeka (str): Nazwa kodeka
+            poziom (int): Poziom 1-9
+
+        Returns:
+            float | None: MB/s lub None, gdy kodeka jeszcze nie mierzono
+        """
+        zmierzona = self._pomiary.get((nazwa_kodeka, poziom))
+        if zmierzona is not None:
+            return zmierzona
+
+        # Najbliższy zmierzony poziom, przeliczony tabelą szybkości
+        najblizszy = None
+        for (kodek, zmierzony), przepustowosc in self._pomiary.items():
+            if kodek != nazwa_kodeka or zmierzony == POZIOM_STORE:
+                continue
+            if najblizszy is None or abs(zmierzony - poziom) < abs(
+                najblizszy[0] - poziom
+            ):
+                najblizszy = (zmierzony, przepustowosc)
+        if najblizszy is None:
+            return None
+        zmierzony, przepustowosc = najblizszy
+        return (
+            przepustowosc
+            * WZGLEDNA_SZYBKOSC[poziom - 1]
+            / WZGLEDNA_SZYBKOSC[zmierzony - 1]
+        )
+
+    def zarejestruj(
+        self, nazwa_kodeka: str, poziom: int, rozmiar_pliku: int, czas_ns: int
+    ):
+        """
+        Dolicza skompresowany plik do pomiarów i postępu paczki.
+
+        Args:
+            nazwa_kodeka (str): Nazwa użytego kodeka
+            poziom (int): Użyty poziom (lub POZIOM_STORE)
+            rozmiar_pliku (int): Rozmiar pliku w bajtach
+            czas_ns (int): Czas kompresji pliku w nanosekundach
+        """
+        with self._blokada:
+            self._przetworzone += rozmiar_pliku
+            if rozmiar_pliku < MIN_ROZMIAR_POMIARU or czas_ns <= 0:
+                return
+            przepustowosc = rozmiar_pliku / (1024 * 1024) / (czas_ns / 1e9)
+            klucz = (nazwa_kodeka, poziom)
+            poprzednia = self._pomiary.get(klucz)
+            if poprzednia is not None:
+                przepustowosc = (
+                    WAGA_POMIARU * przepustowosc + (1 - WAGA_POMIARU) * poprzednia
+                )
+            self._pomiary[klucz] = przepustowosc
+
+    def pomiary(self) -> dict:
+        """
+        Zwraca kopię pomiarów.
+
+        Returns:
+            Dict[Tuple[str, int], float]: {(kodek, poziom): MB/s}
+        """
+        with self._blokada:
+            return dict(self._pomiary)
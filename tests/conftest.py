@@ -0,0 +1,54 @@
+"""
+Wspólne dane testów: drzewo plików do kompresji i uruchamianie kompresji
+wersją synchroniczną lub asynchroniczną.
+"""
+
+import asyncio
+
+import pytest
+
+from core import KompresorPlikow
+
+# Zawartość plików drzewa (ścieżka względem folderu źródłowego)
+PLIKI = {
+    "a/x.txt": b"linia pliku x\n" * 2000,
+    "b/y.txt": b"inna zawartosc y " * 500,
+    "b/pusty.txt": b"",
+    "dane.bin": bytes(range(256)) * 64,
+}
+
+
+@pytest.fixture
+def pliki() -> dict[str, bytes]:
+    """Zawartość plików folderu źródłowego: {nazwa: dane}."""
+    return dict(PLIKI)
+
+
+@pytest.fixture
+def zrodlo(tmp_path):
+    """Folder z plikami PLIKI; zwraca (folder, lista ścieżek w kolejności)."""
+    folder = tmp_path / "zrodlo"
+    sciezki = []
+    for nazwa, dane in PLIKI.items():
+        sciezka = folder / nazwa
+        sciezka.parent.mkdir(parents=True, exist_ok=True)
+        sciezka.write_bytes(dane)
+        sciezki.append(str(sciezka))
+    return folder, sciezki
+
+
+@pytest.fixture(params=["sync", "async"])
+def kompresuj(request):
+    """
+    Funkcja (kompresor, sciezki) -> (sukces, bledy, komunikaty) - ta sama
+    dla kompresuj_wiele_plikow i kompresuj_wiele_plikow_async.
+    """
+    if request.param == "sync":
+        return KompresorPlikow.kompresuj_wiele_plikow
+
+    def kompresuj_async(kompresor, sciezki_plikow, **opcje):
+        return asyncio.run(
+            kompresor.kompresuj_wiele_plikow_async(sciezki_plikow, **opcje)
+        )
+
+    return kompresuj_async
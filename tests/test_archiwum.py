@@ -0,0 +1,136 @@
+"""
+Wspólne archiwum: woluminy, wznawianie przerwanej kompresji i aktualizacja
+przyrostowa.
+"""
+
+import os
+import threading
+import time
+import zipfile
+
+import pytest
+
+import cli
+from archiwum import czas_z_pola_ntfs
+from core import KompresorPlikow
+
+
+def _wpisy(folder) -> dict[str, bytes]:
+    """Zawartość wszystkich archiwów folderu: {nazwa_wpisu: dane}."""
+    wpisy = {}
+    for nazwa in sorted(os.listdir(folder)):
+        if nazwa.endswith(".zip"):
+            with zipfile.ZipFile(os.path.join(folder, nazwa)) as archiwum:
+                for info in archiwum.infolist():
+                    assert info.filename not in wpisy, "zdublowany wpis"
+                    wpisy[info.filename] = archiwum.read(info)
+    return wpisy
+
+
+def test_wspolne_archiwum(tmp_path, zrodlo, pliki):
+    _, sciezki = zrodlo
+    kompresor = KompresorPlikow(str(tmp_path / "wyniki"), nazwa_archiwum="paczka")
+
+    assert kompresor.kompresuj_wiele_plikow(sciezki)[:2] == (len(pliki), 0)
+    assert _wpisy(tmp_path / "wyniki") == pliki
+
+
+@pytest.mark.parametrize("wolumin_mb", [None, 1])
+def test_wznowienie_zachowuje_nazwy_wpisow(tmp_path, zrodlo, wolumin_mb, pliki):
+    _, sciezki = zrodlo
+    opcje = {
+        "nazwa_archiwum": "paczka",
+        "maks_rozmiar_woluminu_mb": wolumin_mb,
+        "plik_wznowienia": str(tmp_path / "wznowienie.json"),
+    }
+
+    # Przerwanie po pierwszym pliku (a/x.txt) - reszta plików ma wspólny
+    # folder "b", ale nazwy wpisów muszą dalej zaczynać się od "b/"
+    przerwij = threading.Event()
+    kompresor = KompresorPlikow(str(tmp_path / "wyniki"), **opcje)
+    sukces, _, komunikaty = kompresor.kompresuj_wiele_plikow(
+        sciezki[:3], lambda *_: przerwij.set(), przerwij
+    )
+    assert sukces == 1
+    assert komunikaty[-1].startswith("⏹️")
+
+    kompresor = KompresorPlikow(str(tmp_path / "wyniki"), **opcje)
+    assert kompresor.kompresuj_wiele_plikow(sciezki[:3])[:2] == (3, 0)
+
+    assert _wpisy(tmp_path / "wyniki") == {
+        nazwa: pliki[nazwa] for nazwa in ("a/x.txt", "b/y.txt", "b/pusty.txt")
+    }
+    assert not os.path.exists(tmp_path / "wznowienie.json")
+
+
+def test_cli_niedostepny_dziennik_wznowienia(tmp_path, zrodlo, capsys):
+    _, sciezki = zrodlo
+    dziennik = str(tmp_path / "brak" / "folder" / "wznowienie.json")
+
+    kod = cli.main(
+        [*sciezki, "-o", str(tmp_path / "wyniki"), "-a", "paczka"]
+        + ["--wznowienie", dziennik]
+    )
+
+    assert kod == cli.KOD_BLEDNE_ARGUMENTY
+    assert capsys.readouterr().err.startswith("❌")
+
+
+def _przyrostowo(tmp_path, sciezki) -> list[str]:
+    kompresor = KompresorPlikow(
+        str(tmp_path / "wyniki"), nazwa_archiwum="paczka", tryb_przyrostowy=True
+    )
+    kompresor.kompresuj_wiele_plikow(sciezki)
+    return [wynik.decyzja for wynik in kompresor.wyniki_plikow]
+
+
+def test_przyrostowo_kopiuje_niezmienione(tmp_path, zrodlo, pliki):
+    _, sciezki = zrodlo
+
+    assert _przyrostowo(tmp_path, sciezki) == ["kompresja"] * len(sciezki)
+    assert _przyrostowo(tmp_path, sciezki) == ["kopia"] * len(sciezki)
+    assert _wpisy(tmp_path / "wyniki") == pliki
+
+
+def test_wpisy_maja_dokladny_czas_modyfikacji(tmp_path, zrodlo):
+    folder, sciezki = zrodlo
+    _przyrostowo(tmp_path, sciezki)
+
+    with zipfile.ZipFile(tmp_path / "wyniki" / "paczka.zip") as archiwum:
+        for info in archiwum.infolist():
+            mtime_ns = os.stat(folder / info.filename).st_mtime_ns
+            assert czas_z_pola_ntfs(info.extra) == mtime_ns // 100 * 100
+
+
+def test_przyrostowo_wykrywa_zmiane_bez_zmiany_rozmiaru(tmp_path, zrodlo, pliki):
+    # Ten sam rozmiar i czas modyfikacji różny o 1 µs - data DOS (2 s) tego
+    # nie odróżni, pole extra NTFS tak
+    _, sciezki = zrodlo
+    _przyrostowo(tmp_path, sciezki)
+    sciezka = sciezki[0]
+    stat = os.stat(sciezka)
+    nowe_dane = pliki["a/x.txt"].upper()
+    with open(sciezka, "wb") as plik:
+        plik.write(nowe_dane)
+    os.utime(sciezka, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+    assert _przyrostowo(tmp_path, sciezki)[0] == "kompresja"
+    assert _wpisy(tmp_path / "wyniki")["a/x.txt"] == nowe_dane
+
+
+def test_przyrostowo_stary_wpis_bez_pola_czasu(tmp_path, zrodlo, pliki):
+    # Archiwum ze starszej wersji: tylko data DOS, zgodna z plikiem - o zmianie
+    # decyduje suma CRC
+    folder, sciezki = zrodlo
+    os.makedirs(tmp_path / "wyniki")
+    with zipfile.ZipFile(tmp_path / "wyniki" / "paczka.zip", "w") as archiwum:
+        for nazwa, dane in pliki.items():
+            czas = os.stat(folder / nazwa).st_mtime
+            info = zipfile.ZipInfo(nazwa, time.localtime(czas)[:6])
+            archiwum.writestr(info, dane if nazwa != "b/y.txt" else dane.upper())
+
+    decyzje = dict(zip(pliki, _przyrostowo(tmp_path, sciezki), strict=True))
+
+    assert decyzje["b/y.txt"] == "kompresja"
+    assert decyzje["a/x.txt"] == "kopia"
+    assert _wpisy(tmp_path / "wyniki") == pliki
@@ -0,0 +1,103 @@
+"""
+Kompresja do osobnych archiwów - te same testy dla wersji synchronicznej
+i asynchronicznej (fixture kompresuj).
+"""
+
+import asyncio
+import os
+import zipfile
+
+from core import KompresorPlikow
+from wyniki import KOD_BRAK_PLIKU, KOD_KOLIZJA_NAZWY
+
+
+def test_archiwa_zawieraja_pliki(tmp_path, zrodlo, kompresuj, pliki):
+    _, sciezki = zrodlo
+    kompresor = KompresorPlikow(str(tmp_path / "wyniki"))
+
+    sukces, bledy, komunikaty = kompresuj(kompresor, sciezki)
+
+    assert (sukces, bledy) == (len(pliki), 0)
+    assert isinstance(komunikaty, list)
+    assert all(komunikat.startswith("✅") for komunikat in komunikaty)
+    for nazwa, dane in pliki.items():
+        nazwa_pliku = os.path.basename(nazwa)
+        nazwa_zip = os.path.splitext(nazwa_pliku)[0] + ".zip"
+        with zipfile.ZipFile(tmp_path / "wyniki" / nazwa_zip) as archiwum:
+            assert archiwum.read(nazwa_pliku) == dane
+
+
+def test_bledy_walidacji_na_poczatku(tmp_path, zrodlo, kompresuj, pliki):
+    _, sciezki = zrodlo
+    brak = str(tmp_path / "brak.txt")
+    kompresor = KompresorPlikow(str(tmp_path / "wyniki"))
+
+    sukces, bledy, komunikaty = kompresuj(kompresor, [*sciezki, brak])
+
+    assert (sukces, bledy) == (len(pliki), 1)
+    assert komunikaty[0] == f"❌ {brak} - plik nie istnieje"
+    assert kompresor.wyniki_plikow[0].kod_bledu == KOD_BRAK_PLIKU
+
+
+def test_kolizja_nazw_archiwow(tmp_path, kompresuj):
+    # x/log.txt i y/log.txt dają oba log.zip - drugi nie może nadpisać pierwszego
+    sciezki = []
+    for folder in ("x", "y"):
+        (tmp_path / folder).mkdir()
+        sciezka = tmp_path / folder / "log.txt"
+        sciezka.write_text(f"log z {folder}")
+        sciezki.append(str(sciezka))
+    kompresor = KompresorPlikow(str(tmp_path / "wyniki"))
+
+    sukces, bledy, _ = kompresuj(kompresor, sciezki)
+
+    assert (sukces, bledy) == (1, 1)
+    kody = sorted(wynik.kod_bledu for wynik in kompresor.wyniki_plikow)
+    assert kody[-1] == KOD_KOLIZJA_NAZWY
+    with zipfile.ZipFile(tmp_path / "wyniki" / "log.zip") as archiwum:
+        assert archiwum.read("log.txt") == b"log z x"
+
+
+def test_wyniki_sync_i_async_zgodne(tmp_path, zrodlo):
+    _, sciezki = zrodlo
+    sciezki = [*sciezki, str(tmp_path / "brak.txt")]
+    synchroniczny = KompresorPlikow(str(tmp_path / "sync"))
+    asynchroniczny = KompresorPlikow(str(tmp_path / "async"))
+
+    wynik_sync = synchroniczny.kompresuj_wiele_plikow(sciezki)
+    wynik_async = asyncio.run(
+        asynchroniczny.kompresuj_wiele_plikow_async(sciezki, maks_rownoleglych=2)
+    )
+
+    assert wynik_sync == wynik_async
+
+    def wiersze(kompresor):
+        return [
+            (w.sciezka, w.decyzja, w.kodek, w.rozmiar_przed, w.rozmiar_po, w.kod_bledu)
+            for w in kompresor.wyniki_plikow
+        ]
+
+    assert wiersze(synchroniczny) == wiersze(asynchroniczny)
+
+
+def test_postep_konczy_kazdy_plik(tmp_path, zrodlo):
+    # Pusty plik, trafienie w pamięć podręczną i błąd też kończą plik w postępie
+    # (pasek postępu GUI dochodzi do końca)
+    from pamiec_podreczna import PamiecPodreczna
+
+    _, sciezki = zrodlo
+    sciezki = [*sciezki, str(tmp_path / "brak.txt")]
+    for przebieg in range(2):
+        konce = []
+
+        def postep(sciezka, przetworzone, rozmiar, konce=konce):
+            if przetworzone >= rozmiar:
+                konce.append(sciezka)
+
+        kompresor = KompresorPlikow(
+            str(tmp_path / "wyniki"),
+            pamiec_podreczna=PamiecPodreczna(str(tmp_path / "pamiec")),
+        )
+        kompresor.kompresuj_wiele_plikow(sciezki, postep)
+
+        assert sorted(konce) == sorted(sciezki), f"przebieg {przebieg}"
@@ -0,0 +1,97 @@
+"""
+Odtwarzanie danych z archiwów: rozpakowanie, sprawdzanie sum CRC, odczyt
+fragmentów przez indeks bloków i odczyt plików z bloków ciągłych.
+"""
+
+import os
+
+import pytest
+
+from ciagly import CzytnikCiagly
+from core import KompresorPlikow
+from indeks import CzytnikFragmentow
+from rozpakowanie import RozpakowywaczArchiwow
+
+
+def _archiwum(tmp_path, sciezki, **opcje) -> str:
+    kompresor = KompresorPlikow(
+        str(tmp_path / "wyniki"), nazwa_archiwum="paczka", rozmiar_bloku=4096, **opcje
+    )
+    assert kompresor.kompresuj_wiele_plikow(sciezki)[:2] == (len(sciezki), 0)
+    return str(tmp_path / "wyniki" / "paczka.zip")
+
+
+def _pliki_folderu(folder) -> dict[str, bytes]:
+    pliki = {}
+    for katalog, _, nazwy in os.walk(folder):
+        for nazwa in nazwy:
+            sciezka = os.path.join(katalog, nazwa)
+            nazwa_wzgledna = os.path.relpath(sciezka, folder).replace(os.sep, "/")
+            with open(sciezka, "rb") as plik:
+                pliki[nazwa_wzgledna] = plik.read()
+    return pliki
+
+
+@pytest.mark.parametrize(
+    "opcje",
+    [{}, {"dostep_swobodny": True}, {"tryb_ciagly": True}, {"kodek": "auto"}],
+    ids=["deflate", "dostep_swobodny", "ciagly", "auto"],
+)
+@pytest.mark.parametrize("liczba_procesow", [1, 2])
+def test_rozpakowanie_odtwarza_pliki(tmp_path, zrodlo, opcje, liczba_procesow, pliki):
+    _, sciezki = zrodlo
+    archiwum = _archiwum(tmp_path, sciezki, **opcje)
+    rozpakowywacz = RozpakowywaczArchiwow(
+        str(tmp_path / "odtworzone"), liczba_procesow=liczba_procesow
+    )
+
+    assert rozpakowywacz.sprawdz_wiele_archiwow([archiwum])[:2] == (1, 0)
+    assert rozpakowywacz.rozpakuj_wiele_archiwow([archiwum])[:2] == (1, 0)
+    assert _pliki_folderu(tmp_path / "odtworzone") == pliki
+
+
+def test_sprawdzanie_wykrywa_uszkodzenie(tmp_path, zrodlo):
+    _, sciezki = zrodlo
+    archiwum = _archiwum(tmp_path, sciezki[:1], kodek="store")
+    with open(archiwum, "r+b") as plik:
+        dane = plik.read()
+        pozycja = dane.index(b"linia pliku x")
+        plik.seek(pozycja)
+        plik.write(b"LINIA")
+
+    sukces, bledy, komunikaty = RozpakowywaczArchiwow().sprawdz_wiele_archiwow(
+        [archiwum]
+    )
+
+    assert (sukces, bledy) == (0, 1)
+    assert komunikaty[0].startswith("❌")
+
+
+def test_odczyt_fragmentow_z_indeksem(tmp_path, zrodlo, pliki):
+    _, sciezki = zrodlo
+    archiwum = _archiwum(tmp_path, sciezki[:1], dostep_swobodny=True)
+    dane = pliki["a/x.txt"]
+    wiersze = dane.splitlines(keepends=True)
+
+    czytnik = CzytnikFragmentow(archiwum, "x.txt")
+    try:
+        assert czytnik.liczba_wierszy == len(wiersze)
+        assert czytnik.czytaj(10_000, 5000) == dane[10_000:15_000]
+        assert czytnik.czytaj(len(dane) - 7) == dane[-7:]
+        assert czytnik.czytaj_wiersze(1500, 3) == b"".join(wiersze[1500:1503])
+        assert czytnik.czytaj_wiersze(-2) == b"".join(wiersze[-2:])
+    finally:
+        czytnik.zamknij()
+
+
+def test_odczyt_plikow_z_blokow_ciaglych(tmp_path, zrodlo, pliki):
+    _, sciezki = zrodlo
+    archiwum = _archiwum(tmp_path, sciezki, tryb_ciagly=True)
+
+    czytnik = CzytnikCiagly(archiwum)
+
+    assert sorted(czytnik.pliki()) == sorted(pliki)
+    for nazwa, dane in pliki.items():
+        assert nazwa in czytnik
+        assert czytnik.rozmiar(nazwa) == len(dane)
+        assert czytnik.czytaj(nazwa) == dane
@@ -0,0 +1,57 @@
+"""
+Zgodność funkcji pomocniczych z wcześniejszymi wersjami.
+"""
+
+import zipfile
+
+from core import KompresorPlikow
+from dziennik import Dziennik
+from utils import stworz_raport_kompresji, zapisz_log_do_pliku
+
+
+def test_raport_z_wynikow_kompresora(tmp_path, zrodlo):
+    _, sciezki = zrodlo
+    kompresor = KompresorPlikow(str(tmp_path / "wyniki"))
+    kompresor.kompresuj_wiele_plikow(sciezki)
+
+    raport = stworz_raport_kompresji(kompresor.wyniki_plikow)
+
+    assert raport["liczba_plikow"] == len(sciezki)
+    assert raport["rozmiar_przed"] == sum(
+        w.rozmiar_przed for w in kompresor.wyniki_plikow
+    )
+    assert "data" in raport
+
+
+def test_raport_dawna_postac_wywolania(tmp_path, monkeypatch):
+    # Dawna postać: archiwa szukane w bieżącym folderze, pliki_po nieużywane
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.txt").write_bytes(b"a" * 100)
+    (tmp_path / "b.txt").write_bytes(b"b" * 50)
+    with zipfile.ZipFile(tmp_path / "a.zip", "w", zipfile.ZIP_DEFLATED) as archiwum:
+        archiwum.write("a.txt")
+    rozmiar_zip = (tmp_path / "a.zip").stat().st_size
+
+    for pliki_po in ([], ["inne.zip"], ["x", "y", "z"]):
+        raport = stworz_raport_kompresji(["a.txt", "b.txt"], pliki_po)
+
+        assert raport["rozmiar_przed"] == 150
+        assert raport["rozmiar_po"] == rozmiar_zip
+        assert [plik["rozmiar_po"] for plik in raport["pliki"]] == [rozmiar_zip, 0]
+
+
+def test_zapis_logow_w_formacie_tekstowym(tmp_path):
+    dziennik = Dziennik()
+    wpis = dziennik.zapisz("z dziennika")
+    sciezka = tmp_path / "squeezeit.log"
+
+    zapisz_log_do_pliku(str(sciezka), ["napis"])
+    zapisz_log_do_pliku(str(sciezka), dziennik)
+
+    linie = sciezka.read_text(encoding="utf-8").splitlines()
+    assert linie[0].endswith(": napis")
+    assert linie[1] == f"{wpis.czas}: z dziennika"
+
+
+def test_zapis_logow_ignoruje_bledy(tmp_path):
+    zapisz_log_do_pliku(str(tmp_path / "brak" / "squeezeit.log"), ["napis"])
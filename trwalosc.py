@@ -0,0 +1,322 @@
+# === MODUŁ TRWAŁOŚĆ - BEZPIECZNY ZAPIS I WZNAWIANIE ===
+"""
+Moduł zawierający bezpieczny zapis wyników kompresji.
+Odpowiedzialny za:
+- Zapis atomowy - archiwum powstaje pod nazwą tymczasową i dopiero
+  gotowe dostaje docelową nazwę (os.replace)
+- Synchronizację z dyskiem (fsync) paczkami po kilka plików
+- Dziennik punktów kontrolnych - listę ukończonych plików, dzięki której
+  przerwaną kompresję można wznowić
+
+Po awarii procesu pod docelowymi nazwami są tylko kompletne archiwa,
+a dziennik zawiera tylko pliki, których archiwa na pewno są zapisane.
+Ponowne uruchomienie kompresuje więc tylko pliki, które były w toku.
+"""
+
+import contextlib
+import os
+import threading
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from skaner import RekordPliku
+    from wyniki import WynikPliku
+
+# Wersja formatu dziennika punktów kontrolnych
+WERSJA_DZIENNIKA = 1
+
+
+def sciezka_tymczasowa(sciezka_pliku: str) -> str:
+    """
+    Tworzy nazwę pliku tymczasowego obok pliku docelowego.
+
+    Nazwa zawiera numer procesu i wątku, więc równoległe zapisy tego
+    samego celu sobie nie przeszkadzają.
+
+    Args:
+        sciezka_pliku (str): Ścieżka pliku docelowego
+
+    Returns:
+        str: Ścieżka pliku tymczasowego w tym samym folderze
+    """
+    return f"{sciezka_pliku}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+@contextlib.contextmanager
+def zapisz_atomowo(sciezka_pliku: str) -> Iterator[str]:
+    """
+    Zapisuje plik pod nazwą tymczasową i podmienia cel po udanym zapisie.
+
+    Gdy blok with zakończy się wyjątkiem (także przerwaniem), plik
+    tymczasowy jest usuwany, a poprzednia wersja celu zostaje nietknięta.
+
+    Args:
+        sciezka_pliku (str): Ścieżka pliku docelowego
+
+    Yields:
+        str: Ścieżka, pod którą należy zapisać plik
+    """
+    tymczasowa = sciezka_tymczasowa(sciezka_pliku)
+    try:
+        yield tymczasowa
+        os.replace(tymczasowa, sciezka_pliku)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tymczasowa)
+        raise
+
+
+def synchronizuj_plik(sciezka_pliku: str):
+    """
+    Zapisuje na dysk dane pliku z pamięci podręcznej systemu (fsync).
+
+    Args:
+        sciezka_pliku (str): Ścieżka do pliku
+
+    Raises:
+        OSError: Gdy pliku nie da się otworzyć lub zsynchronizować
+    """
+    with open(sciezka_pliku, "rb") as plik:
+        os.fsync(plik.fileno())
+
+
+def synchronizuj_katalog(sciezka_katalogu: str):
+    """
+    Zapisuje na dysk wpisy katalogu - np. nazwę nadaną przez os.replace.
+
+    Nie każdy system pozwala otworzyć katalog (np. Windows) - wtedy
+    funkcja nic nie robi.
+
+    Args:
+        sciezka_katalogu (str): Ścieżka do katalogu
+    """
+    try:
+        deskryptor = os.open(sciezka_katalogu or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        with contextlib.suppress(OSError):
+            os.fsync(deskryptor)
+    finally:
+        os.close(deskryptor)
+
+
+class PunktyKontrolne:
+    """
+    Zatwierdzanie ukończonych plików: fsync paczkami i dziennik wznowienia.
+
+    Ukończony plik najpierw czeka w paczce. Co synchronizuj_co plików
+    archiwa z paczki (i ich katalogi) są synchronizowane z dyskiem, a
+    dopiero potem pliki trafiają do dziennika. Wpis w dzienniku oznacza
+    więc, że archiwum pliku na pewno jest kompletne.
+
+    Archiwum zapisywane przez wiele plików (wspólne archiwum, wolumin) jest
+    zatwierdzane dopiero po zamknięciu - do tego czasu jego pliki czekają
+    (rozpocznij_wynik / zakoncz_wynik).
+
+    Dziennik to plik JSON lines: nagłówek z ustawieniami, potem jeden
+    wiersz na plik. Dziennik z innymi ustawieniami jest pomijany.
+
+    Atrybuty:
+        sciezka_dziennika (str | None): Plik dziennika (None = bez wznawiania)
+        synchronizuj_co (int): Co ile plików wykonywać fsync (0 = nigdy)
+        ukonczone (dict): {sciezka_pliku: wpis} - pliki ukończone we
+            wcześniejszych przebiegach
+        czas_synchronizacji_ns (int): Łączny czas fsync
+    """
+
+    def __init__(
+        self,
+        sciezka_dziennika: str | None,
+        ustawienia: dict,
+        synchronizuj_co: int = 0,
+    ):
+        """
+        Wczytuje dziennik (jeśli istnieje) i otwiera go do dopisywania.
+
+        Args:
+            sciezka_dziennika (str | None): Plik dziennika punktów kontrolnych
+            ustawienia (dict): Ustawienia kompresji zapisywane w nagłówku;
+                dziennik z innymi ustawieniami nie jest wznawiany
+            synchronizuj_co (int): Co ile ukończonych plików synchronizować
+                archiwa i dziennik z dyskiem (0 = bez fsync)
+
+        Raises:
+            OSError: Gdy dziennika nie da się otworzyć
+        """
+        self.sciezka_dziennika = sciezka_dziennika
+        self.synchronizuj_co = max(synchronizuj_co, 0)
+        self.ukonczone = {}
+        self.czas_synchronizacji_ns = 0
+        self._oczekujace = []  # [(wpis, sciezka_wyniku)] gotowe do zatwierdzenia
+        self._otwarte_wyniki = {}  # {sciezka_wyniku: [(wpis, sciezka_wyniku)]}
+        self._plik = None
+
+        if sciezka_dziennika is None:
+            return
+
+        # Import na miejscu - json potrzebny tylko przy wznawianiu
+        import json
+
+        naglowek = {"wersja": WERSJA_DZIENNIKA, "ustawienia": ustawienia}
+        if os.path.exists(sciezka_dziennika):
+            with open(sciezka_dziennika, encoding="utf-8") as plik:
+                wiersze = iter(plik)
+                try:
+                    zgodny = json.loads(next(wiersze, "")) == naglowek
+                except ValueError:
+                    zgodny = False
+                if zgodny:
+                    for wiersz in wiersze:
+                        try:
+                            wpis = json.loads(wiersz)
+                        except ValueError:
+                            continue  # Wiersz urwany przez awarię
+                        self.ukonczone[wpis["plik"]] = wpis
+
+        if self.ukonczone:
+            self._plik = open(sciezka_dziennika, "a", encoding="utf-8")
+        else:
+            self._plik = open(sciezka_dziennika, "w", encoding="utf-8")
+            self._plik.write(json.dumps(naglowek, ensure_ascii=False) + "\n")
+            self._plik.flush()
+
+    def ukonczony(self, sciezka_pliku: str, rekord: "RekordPliku") -> dict | None:
+        """
+        Sprawdza, czy plik ukończono we wcześniejszym przebiegu.
+
+        Plik musi mieć ten sam rozmiar i czas modyfikacji, a jego archiwum
+        musi nadal istnieć.
+
+        Args:
+            sciezka_pliku (str): Ścieżka do pliku
+            rekord (RekordPliku): Bieżący rekord pliku
+
+        Returns:
+            dict | None: Wpis dziennika (plik, rozmiar, mtime_ns, wynik, kodek,
+                rozmiar_po) albo None, gdy plik trzeba skompresować
+        """
+        wpis = self.ukonczone.get(sciezka_pliku)
+        if (
+            wpis is None
+            or wpis["rozmiar"] != rekord.rozmiar
+            or wpis["mtime_ns"] != rekord.mtime_ns
+            or not os.path.exists(wpis["wynik"])
+        ):
+            return None
+        return wpis
+
+    def rozpocznij_wynik(self, sciezka_wyniku: str):
+        """
+        Oznacza archiwum jako zapisywane - jego pliki czekają na zamknięcie.
+
+        Args:
+            sciezka_wyniku (str): Docelowa ścieżka archiwum
+        """
+        self._otwarte_wyniki.setdefault(sciezka_wyniku, [])
+
+    def zakoncz_wynik(self, sciezka_wyniku: str):
+        """
+        Oznacza archiwum jako gotowe i zatwierdza pliki, które na nie czekały.
+
+        Args:
+            sciezka_wyniku (str): Docelowa ścieżka archiwum
+
+        Raises:
+            OSError: Gdy synchronizacja lub zapis dziennika się nie powiodą
+        """
+        self._oczekujace.extend(self._otwarte_wyniki.pop(sciezka_wyniku, ()))
+        self.synchronizuj()
+
+    def dodaj(self, wynik: "WynikPliku", rekord: "RekordPliku", sciezka_wyniku: str):
+        """
+        Dodaje ukończony plik do paczki oczekującej na zatwierdzenie.
+
+        Args:
+            wynik (WynikPliku): Wynik kompresji pliku
+            rekord (RekordPliku): Rekord pliku z chwili kompresji
+            sciezka_wyniku (str): Docelowa ścieżka archiwum z plikiem
+
+        Raises:
+            OSError: Gdy synchronizacja lub zapis dziennika się nie powiodą
+        """
+        wpis = {
+            "plik": wynik.sciezka,
+            "rozmiar": rekord.rozmiar,
+            "mtime_ns": rekord.mtime_ns,
+            "wynik": sciezka_wyniku,
+            "kodek": wynik.kodek,
+            "rozmiar_po": wynik.rozmiar_po,
+        }
+        czekajace = self._otwarte_wyniki.get(sciezka_wyniku)
+        if czekajace is not None:
+            czekajace.append((wpis, sciezka_wyniku))
+            return
+        self._oczekujace.append((wpis, sciezka_wyniku))
+        if len(self._oczekujace) >= self.synchronizuj_co:
+            self.synchronizuj()
+
+    def synchronizuj(self):
+        """
+        Zatwierdza oczekujące pliki, których archiwa są już zamknięte.
+
+        Przy synchronizuj_co > 0 archiwa, ich katalogi i dziennik są
+        najpierw synchronizowane z dyskiem (fsync).
+
+        Raises:
+            OSError: Gdy synchronizacja lub zapis dziennika się nie powiodą
+        """
+        gotowe = self._oczekujace
+        if not gotowe:
+            return
+        self._oczekujace = []
+
+        poczatek = time.perf_counter_ns()
+        if self.synchronizuj_co:
+            # Jedno archiwum (np. wolumin) wystarczy zsynchronizować raz
+            wyniki = dict.fromkeys(sciezka for _, sciezka in gotowe)
+            for sciezka_wyniku in wyniki:
+                synchronizuj_plik(sciezka_wyniku)
+            for katalog in {os.path.dirname(sciezka) for sciezka in wyniki}:
+                synchronizuj_katalog(katalog)
+
+        if self._plik is not None:
+            # Import na miejscu - json potrzebny tylko przy wznawianiu
+            import json
+
+            self._plik.write(
+                "".join(
+                    json.dumps(wpis, ensure_ascii=False) + "\n" for wpis, _ in gotowe
+                )
+            )
+            self._plik.flush()
+            if self.synchronizuj_co:
+                os.fsync(self._plik.fileno())
+        self.czas_synchronizacji_ns += time.perf_counter_ns() - poczatek
+
+    def zamknij(self, usun_dziennik: bool = False):
+        """
+        Zatwierdza zaległe pliki i zamyka dziennik.
+
+        Pliki archiwów, które nie zostały zamknięte, nie są zatwierdzane.
+
+        Args:
+            usun_dziennik (bool): Usuń dziennik (np. gdy wszystkie pliki
+                skompresowano i nie ma czego wznawiać)
+
+        Raises:
+            OSError: Gdy synchronizacja lub zapis dziennika się nie powiodą
+        """
+        try:
+            self.synchronizuj()
+        finally:
+            self._oczekujace.clear()
+            self._otwarte_wyniki.clear()
+            if self._plik is not None:
+                self._plik.close()
+                self._plik = None
+                if usun_dziennik:
+                    with contextlib.suppress(OSError):
+                        os.remove(self.sciezka_dziennika)
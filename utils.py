@@ -10,8 +10,15 @@ Odpowiedzialny za:
 
 import os
 import time
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from skaner import RekordPliku
+
+if TYPE_CHECKING:
+    from dziennik import WpisDziennika
+    from wyniki import WynikiKompresji, WynikPliku
 
 
 def sprawdz_rozszerzenie_pliku(sciezka_pliku: str) -> str:
@@ -51,6 +58,41 @@ def czy_plik_tekstowy(sciezka_pliku: str) -> bool:
     return sprawdz_rozszerzenie_pliku(sciezka_pliku) in rozszerzenia_tekstowe
 
 
+def czy_plik_skompresowany(sciezka_pliku: str) -> bool:
+    """
+    Sprawdza czy plik jest już skompresowany (media, archiwa) na podstawie
+    rozszerzenia - ponowna kompresja takich plików nic nie daje.
+
+    Args:
+        sciezka_pliku (str): Ścieżka do pliku
+
+    Returns:
+        bool: True jeśli plik jest już skompresowany
+    """
+    rozszerzenia_skompresowane = {
+        ".zip",
+        ".gz",
+        ".bz2",
+        ".xz",
+        ".7z",
+        ".rar",
+        ".zst",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".mp3",
+        ".mp4",
+        ".mkv",
+        ".avi",
+        ".docx",
+        ".xlsx",
+        ".pptx",
+    }
+    return sprawdz_rozszerzenie_pliku(sciezka_pliku) in rozszerzenia_skompresowane
+
+
 def pobierz_rozmiar_pliku(sciezka_pliku: str) -> int:
     """
     Pobiera rozmiar pliku w bajtach.
@@ -151,23 +193,28 @@ def sprawdz_uprawnienia_zapisu(folder: str) -> bool:
         return False
 
 
-def pobierz_informacje_o_pliku(sciezka_pliku: str) -> Dict[str, Any]:
+def pobierz_informacje_o_pliku(
+    sciezka_pliku: str, rekord: RekordPliku | None = None
+) -> Dict[str, Any]:
     """
     Pobiera szczegółowe informacje o pliku.
 
     Args:
         sciezka_pliku (str): Ścieżka do pliku
+        rekord (RekordPliku | None): Rekord pliku ze skanera - wtedy plik
+            nie jest ponownie sprawdzany (None = wywołaj stat)
 
     Returns:
         Dict[str, Any]: Słownik z informacjami o pliku
     """
     try:
-        stat = os.stat(sciezka_pliku)
+        if rekord is None:
+            rekord = RekordPliku(sciezka_pliku, os.stat(sciezka_pliku))
         return {
             "nazwa": os.path.basename(sciezka_pliku),
-            "rozmiar": stat.st_size,
-            "data_modyfikacji": datetime.fromtimestamp(stat.st_mtime),
-            "data_utworzenia": datetime.fromtimestamp(stat.st_ctime),
+            "rozmiar": rekord.rozmiar,
+            "data_modyfikacji": datetime.fromtimestamp(rekord.czas_modyfikacji),
+            "data_utworzenia": datetime.fromtimestamp(rekord.czas_utworzenia),
             "rozszerzenie": sprawdz_rozszerzenie_pliku(sciezka_pliku),
             "czy_tekstowy": czy_plik_tekstowy(sciezka_pliku),
             "sciezka": sciezka_pliku,
@@ -199,37 +246,77 @@ def filtruj_pliki_tekstowe(sciezki_plikow: List[str]) -> List[str]:
 
 
 def stworz_raport_kompresji(
-    pliki_przed: List[str], pliki_po: List[str]
+    wyniki: "WynikiKompresji | Iterable[WynikPliku] | list[str]",
+    pliki_po: list[str] | None = None,
 ) -> Dict[str, Any]:
     """
     Tworzy raport z kompresji plików.
 
+    Raport powstaje z wyników kompresji - pliki nie są ponownie
+    sprawdzane na dysku. Wyniki kompresora (kompresor.wyniki_plikow) mają
+    raport zbierany na bieżąco, więc jego utworzenie trwa milisekundy
+    niezależnie od liczby plików.
+
+    Dawna postać wywołania, stworz_raport_kompresji(pliki_przed, pliki_po),
+    nadal działa jak dotąd: rozmiary są wtedy odczytywane z dysku (archiwum
+    pliku szukane jest w bieżącym folderze, pliki_po nie jest używane),
+    a raport ma dodatkowo listę pliki.
+
+    Args:
+        wyniki (WynikiKompresji | Iterable[WynikPliku] | List[str]): Wyniki
+            kompresji, np. kompresor.wyniki_plikow, albo (razem z pliki_po)
+            lista plików przed kompresją
+        pliki_po (List[str] | None): Lista plików po kompresji - jej podanie
+            wybiera dawną postać wywołania; zawartość nie jest używana
+
+    Returns:
+        Dict[str, Any]: Raport kompresji (RaportKompresji.jako_slownik) z
+            dodatkowym kluczem data
+    """
+    if pliki_po is not None:
+        return _stworz_raport_z_dysku(wyniki)
+
+    # Import na miejscu - raport potrzebny tylko tej funkcji
+    from raport import RaportKompresji
+
+    raport = getattr(wyniki, "raport", None)
+    if raport is None:
+        raport = RaportKompresji.z_wynikow(wyniki)
+    return {"data": datetime.now(), **raport.jako_slownik()}
+
+
+def _stworz_raport_z_dysku(pliki_przed: list[str]) -> dict[str, Any]:
+    """
+    Tworzy raport dawnej postaci stworz_raport_kompresji z rozmiarów plików.
+
+    Archiwum pliku ma nazwę ze stworz_nazwe_pliku_wynikowego i jest szukane
+    w bieżącym folderze; brakujące archiwum liczy się jako rozmiar 0.
+
     Args:
         pliki_przed (List[str]): Lista plików przed kompresją
-        pliki_po (List[str]): Lista plików po kompresji
 
     Returns:
-        Dict[str, Any]: Raport kompresji
-    """
-    raport = {
-        "data": datetime.now(),
-        "liczba_plikow": len(pliki_przed),
-        "rozmiar_przed": 0,
-        "rozmiar_po": 0,
-        "oszczednosc_bajty": 0,
-        "oszczednosc_procent": 0,
-        "pliki": [],
-    }
+        Dict[str, Any]: Raport kompresji z listą pliki (nazwa, rozmiar_przed,
+            rozmiar_po, oszczednosc)
+    """
+    # Import na miejscu - wyniki potrzebne tylko dawnej postaci wywołania
+    from wyniki import WynikPliku
 
+    wyniki = []
+    pliki = []
     for plik_przed in pliki_przed:
         plik_po = stworz_nazwe_pliku_wynikowego(plik_przed, "")
         rozmiar_przed = pobierz_rozmiar_pliku(plik_przed)
         rozmiar_po = pobierz_rozmiar_pliku(plik_po) if os.path.exists(plik_po) else 0
-
-        raport["rozmiar_przed"] += rozmiar_przed
-        raport["rozmiar_po"] += rozmiar_po
-
-        raport["pliki"].append(
+        wyniki.append(
+            WynikPliku(
+                plik_przed,
+                "kompresja",
+                rozmiar_przed=rozmiar_przed,
+                rozmiar_po=rozmiar_po,
+            )
+        )
+        pliki.append(
             {
                 "nazwa": os.path.basename(plik_przed),
                 "rozmiar_przed": rozmiar_przed,
@@ -238,27 +325,32 @@ def stworz_raport_kompresji(
             }
         )
 
-    raport["oszczednosc_bajty"] = raport["rozmiar_przed"] - raport["rozmiar_po"]
-    raport["oszczednosc_procent"] = oblicz_oszczednosc(
-        raport["rozmiar_przed"], raport["rozmiar_po"]
-    )
-
+    raport = stworz_raport_kompresji(wyniki)
+    raport["pliki"] = pliki
     return raport
 
 
-def zapisz_log_do_pliku(sciezka_pliku: str, logi: List[str]):
+def zapisz_log_do_pliku(sciezka_pliku: str, logi: "Iterable[WpisDziennika | str]"):
     """
     Zapisuje logi do pliku.
 
+    Każdy log to wiersz "czas: komunikat" - wpisy dziennika zachowują swój
+    czas, zwykłe napisy dostają wspólny czas zapisu. Wszystkie wiersze
+    trafiają do pliku jednym wywołaniem write. Zapis w formacie JSON lines
+    (także w trakcie kompresji) zapewnia dziennik.UjscieDziennika.
+
     Args:
         sciezka_pliku (str): Ścieżka do pliku logów
-        logi (List[str]): Lista logów do zapisania
+        logi (Iterable[WpisDziennika | str]): Wpisy dziennika lub napisy
     """
+    teraz = datetime.now()
+    linie = [
+        f"{teraz}: {log}\n" if isinstance(log, str) else f"{log}\n" for log in logi
+    ]
     try:
         with open(sciezka_pliku, "a", encoding="utf-8") as f:
-            for log in logi:
-                f.write(f"{datetime.now()}: {log}\n")
-    except (OSError, IOError):
+            f.write("".join(linie))
+    except OSError:
         pass  # Ignoruj błędy zapisu logów
 
 
@@ -272,6 +364,34 @@ def pobierz_wersje_aplikacji() -> str:
     return "1.0.0"
 
 
+def pobierz_zuzycie_pamieci() -> int:
+    """
+    Pobiera bieżące zużycie pamięci procesu (RSS).
+
+    Na Linuksie odczytuje bieżące RSS z /proc, na innych systemach
+    uniksowych zwraca szczytowe RSS z modułu resource.
+
+    Returns:
+        int: Zużycie pamięci w bajtach, -1 jeśli błąd
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            strony_rezydentne = int(f.read().split()[1])
+        return strony_rezydentne * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+        import sys
+
+        szczyt = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS podaje bajty, Linux i BSD - kilobajty
+        return szczyt if sys.platform == "darwin" else szczyt * 1024
+    except (ImportError, OSError):
+        return -1
+
+
 def pobierz_informacje_systemowe() -> Dict[str, str]:
     """
     Pobiera podstawowe informacje o systemie.
@@ -0,0 +1,431 @@
+# === MODUŁ WYNIKI - WYNIKI KOMPRESJI PLIKÓW ===
+"""
+Moduł zawierający struktury wyników kompresji.
+Odpowiedzialny za:
+- Wynik jednego pliku (WynikPliku) - zwarty obiekt z __slots__
+- Wyniki całej paczki (WynikiKompresji) - kolumny w tablicach array
+- Komunikaty dla użytkownika tworzone z wyników dopiero przy odczycie
+- Podsumowanie paczki bez tworzenia obiektu dla każdego pliku
+- Raport paczki (RaportKompresji) uzupełniany po każdym pliku
+
+Przy milionie plików lista słowników i lista napisów zajmowały setki
+bajtów na plik. Tutaj każda kolumna to jedna tablica liczb, więc plik
+kosztuje kilkadziesiąt bajtów, a sumy liczone są w kodzie C.
+"""
+
+import math
+import os
+from array import array
+from collections.abc import Iterator, Sequence
+
+# Kody błędów pliku (kolumna kod_bledu)
+KOD_BEZ_BLEDU = 0
+KOD_BRAK_PLIKU = 1  # Plik nie istnieje lub nie jest zwykłym plikiem
+KOD_BRAK_UPRAWNIEN = 2  # Brak prawa odczytu
+KOD_BLAD_KOMPRESJI = 3  # Błąd odczytu, zapisu lub kompresji
+KOD_LIMIT_PAMIECI = 4  # Przekroczono limit_pamieci_mb
+KOD_PRZERWANO = 5  # Kompresję pliku przerwano (np. anulowanie)
+KOD_KOLIZJA_NAZWY = 6  # Archiwum o tej nazwie tworzy już inny plik paczki
+
+# Możliwe decyzje dla pliku - w kolumnie zapisywany jest indeks
+DECYZJE = (
+    "kompresja",
+    "store",
+    "pamiec",
+    "kopia",
+    "pominiety",
+    "blad",
+    "gotowy",
+    "ciagly",
+)
+_INDEKSY_DECYZJI = {decyzja: indeks for indeks, decyzja in enumerate(DECYZJE)}
+
+# Pola dostępne też przez wynik["pole"] (dawniej wyniki były słownikami)
+_POLA_SLOWNIKA = (
+    "sciezka",
+    "decyzja",
+    "kodek",
+    "poziom",
+    "rozmiar_przed",
+    "rozmiar_po",
+    "szacowany_stosunek",
+    "rzeczywisty_stosunek",
+    "czas",
+    "kod_bledu",
+)
+
+# Indeks "opisu spoza tabeli" w kolumnie komunikatów
+_OPIS_RZADKI = 0xFFFF
+
+
+class WynikPliku:
+    """
+    Wynik kompresji jednego pliku.
+
+    Atrybuty:
+        sciezka (str): Ścieżka do pliku źródłowego
+        decyzja (str): "kompresja", "store", "pamiec", "kopia", "pominiety",
+            "blad", "gotowy" (ukończony w przerwanym przebiegu) lub "ciagly"
+            (zapisany w bloku ciągłym)
+        kodek (str): Nazwa użytego kodeka ("" gdy plik nie był kompresowany)
+        poziom (int): Poziom kompresji
+        rozmiar_przed (int): Rozmiar pliku w bajtach
+        rozmiar_po (int): Rozmiar wpisu w archiwum w bajtach
+        szacowany_stosunek (float | None): Wynik sondy kompresowalności
+        czas (float): Czas obsługi pliku w sekundach
+        kod_bledu (int): KOD_BEZ_BLEDU lub jeden z kodów KOD_* błędu
+    """
+
+    __slots__ = (
+        "sciezka",
+        "decyzja",
+        "kodek",
+        "poziom",
+        "rozmiar_przed",
+        "rozmiar_po",
+        "szacowany_stosunek",
+        "czas",
+        "kod_bledu",
+    )
+
+    def __init__(
+        self,
+        sciezka: str,
+        decyzja: str = "blad",
+        kodek: str = "",
+        poziom: int = 0,
+        rozmiar_przed: int = 0,
+        rozmiar_po: int = 0,
+        szacowany_stosunek: float | None = None,
+        czas: float = 0.0,
+        kod_bledu: int = KOD_BEZ_BLEDU,
+    ):
+        self.sciezka = sciezka
+        self.decyzja = decyzja
+        self.kodek = kodek
+        self.poziom = poziom
+        self.rozmiar_przed = rozmiar_przed
+        self.rozmiar_po = rozmiar_po
+        self.szacowany_stosunek = szacowany_stosunek
+        self.czas = czas
+        self.kod_bledu = kod_bledu
+
+    def __repr__(self) -> str:
+        return (
+            f"WynikPliku({self.sciezka!r}, decyzja={self.decyzja!r}, "
+            f"kodek={self.kodek!r}, {self.rozmiar_przed} -> {self.rozmiar_po} B, "
+            f"kod_bledu={self.kod_bledu})"
+        )
+
+    def __getitem__(self, pole: str):
+        # Zgodność ze starszym kodem, który czytał wynik["rozmiar_po"]
+        if pole not in _POLA_SLOWNIKA:
+            raise KeyError(pole)
+        return getattr(self, pole)
+
+    @property
+    def sukces(self) -> bool:
+        """bool: True jeśli plik obsłużono bez błędu."""
+        return self.kod_bledu == KOD_BEZ_BLEDU
+
+    @property
+    def rzeczywisty_stosunek(self) -> float | None:
+        """float | None: Rozmiar po / rozmiar przed (None bez zapisanego wpisu)."""
+        if self.decyzja in ("pominiety", "blad") or not self.rozmiar_przed:
+            return None
+        return self.rozmiar_po / self.rozmiar_przed
+
+    def jako_slownik(self) -> dict:
+        """
+        Zamienia wynik na słownik (np. do zapisu w JSON).
+
+        Returns:
+            dict: Pola wyniku wraz z rzeczywisty_stosunek
+        """
+        return {pole: getattr(self, pole) for pole in _POLA_SLOWNIKA}
+
+
+class WynikiKompresji:
+    """
+    Wyniki kompresji paczki plików, zapisane kolumnami.
+
+    Liczby trafiają do tablic array, ścieżki - do jednej listy (te same
+    obiekty str, które podano do kompresji), a komunikaty nie są
+    przechowywane w całości: zapisujemy tylko ich powtarzalną część
+    (np. "skompresowany pomyślnie") jako indeks w małej tabeli opisów.
+    Pojedyncze wyniki (WynikPliku) powstają dopiero przy odczycie.
+
+    Atrybuty:
+        uwagi (List[str]): Komunikaty dotyczące całej paczki (np. o
+            przerwaniu), podawane po komunikatach plików
+        raport (RaportKompresji): Raport paczki, uzupełniany przy dodaj()
+    """
+
+    def __init__(self):
+        """Inicjalizuje puste wyniki."""
+        self._sciezki: list[str] = []
+        self._rozmiar_przed = array("q")
+        self._rozmiar_po = array("q")
+        self._szacowany = array("d")  # NaN = brak sondy
+        self._czas = array("d")
+        self._poziom = array("b")
+        self._decyzja = array("B")
+        self._kod_bledu = array("B")
+        self._kodek = array("B")  # Indeks w self._kodeki
+        self._opis = array("H")  # Indeks w self._opisy lub _OPIS_RZADKI
+
+        self._kodeki: list[str] = []
+        self._indeksy_kodekow: dict[str, int] = {}
+        self._opisy: list[str] = []
+        self._indeksy_opisow: dict[str, int] = {}
+        # Komunikaty, których nie da się złożyć z tabeli opisów (np. błędy)
+        self._komunikaty_rzadkie: dict[int, str] = {}
+
+        self.uwagi: list[str] = []
+
+        # Import na miejscu - import kompresora nie wczytuje modułu raportu
+        from raport import RaportKompresji
+
+        self.raport = RaportKompresji()
+
+    def __len__(self) -> int:
+        return len(self._sciezki)
+
+    def __getitem__(self, indeks: int) -> WynikPliku:
+        indeks = range(len(self._sciezki))[indeks]  # Indeksy ujemne i IndexError
+        szacowany = self._szacowany[indeks]
+        return WynikPliku(
+            self._sciezki[indeks],
+            DECYZJE[self._decyzja[indeks]],
+            self._kodeki[self._kodek[indeks]],
+            self._poziom[indeks],
+            self._rozmiar_przed[indeks],
+            self._rozmiar_po[indeks],
+            None if math.isnan(szacowany) else szacowany,
+            self._czas[indeks],
+            self._kod_bledu[indeks],
+        )
+
+    def __iter__(self) -> Iterator[WynikPliku]:
+        for indeks in range(len(self._sciezki)):
+            yield self[indeks]
+
+    def dodaj(self, wynik: WynikPliku, komunikat: str = ""):
+        """
+        Dopisuje wynik pliku.
+
+        Args:
+            wynik (WynikPliku): Wynik pliku
+            komunikat (str): Komunikat dla użytkownika (bez ikony); pusty
+                dla błędów walidacji - komunikat powstanie z kodu błędu
+        """
+        indeks = len(self._sciezki)
+        self._sciezki.append(wynik.sciezka)
+        self._rozmiar_przed.append(wynik.rozmiar_przed)
+        self._rozmiar_po.append(wynik.rozmiar_po)
+        szacowany = wynik.szacowany_stosunek
+        self._szacowany.append(math.nan if szacowany is None else szacowany)
+        self._czas.append(wynik.czas)
+        self._poziom.append(wynik.poziom)
+        self._decyzja.append(_INDEKSY_DECYZJI[wynik.decyzja])
+        self._kod_bledu.append(wynik.kod_bledu)
+        self._kodek.append(self._indeks_kodeka(wynik.kodek))
+        self._opis.append(self._indeks_opisu(indeks, wynik.sciezka, komunikat))
+        self.raport.dodaj(wynik)
+
+    def _indeks_kodeka(self, nazwa: str) -> int:
+        """
+        Zwraca indeks kodeka w tabeli kodeków (dopisując nowy kodek).
+
+        Args:
+            nazwa (str): Nazwa kodeka
+
+        Returns:
+            int: Indeks w self._kodeki
+        """
+        indeks = self._indeksy_kodekow.get(nazwa)
+        if indeks is None:
+            indeks = self._indeksy_kodekow[nazwa] = len(self._kodeki)
+            self._kodeki.append(nazwa)
+        return indeks
+
+    def _indeks_opisu(self, indeks: int, sciezka: str, komunikat: str) -> int:
+        """
+        Zapisuje komunikat pliku możliwie oszczędnie.
+
+        Komunikat "Plik nazwa.txt skompresowany pomyślnie" różni się między
+        plikami tylko nazwą, więc zapamiętujemy resztę ("skompresowany
+        pomyślnie") raz, w tabeli opisów. Pozostałe komunikaty (np. treść
+        błędów) trafiają do słownika komunikatów rzadkich.
+
+        Args:
+            indeks (int): Numer wiersza
+            sciezka (str): Ścieżka do pliku
+            komunikat (str): Pełny komunikat
+
+        Returns:
+            int: Indeks opisu lub _OPIS_RZADKI
+        """
+        if not komunikat:
+            return _OPIS_RZADKI  # Komunikat powstanie z kodu błędu
+
+        poczatek = f"Plik {os.path.basename(sciezka)} "
+        if komunikat.startswith(poczatek):
+            opis = komunikat[len(poczatek) :]
+            numer = self._indeksy_opisow.get(opis)
+            if numer is None and len(self._opisy) < _OPIS_RZADKI:
+                numer = self._indeksy_opisow[opis] = len(self._opisy)
+                self._opisy.append(opis)
+            if numer is not None:
+                return numer
+
+        self._komunikaty_rzadkie[indeks] = komunikat
+        return _OPIS_RZADKI
+
+    def komunikat(self, indeks: int) -> str:
+        """
+        Składa komunikat pliku z ikoną (✅, ⏭️ lub ❌).
+
+        Args:
+            indeks (int): Numer wiersza
+
+        Returns:
+            str: Komunikat, np. "✅ Plik a.txt skompresowany pomyślnie"
+        """
+        if self._kod_bledu[indeks] != KOD_BEZ_BLEDU:
+            ikona = "❌"
+        elif DECYZJE[self._decyzja[indeks]] in ("pominiety", "gotowy"):
+            ikona = "⏭️"
+        else:
+            ikona = "✅"
+
+        numer = self._opis[indeks]
+        if numer == _OPIS_RZADKI:
+            tekst = self._komunikaty_rzadkie.get(indeks)
+            if tekst is None and ikona == "❌":
+                tekst = opis_bledu_walidacji(
+                    self._sciezki[indeks], self._kod_bledu[indeks]
+                )
+            elif tekst is None:  # Wiersz dodany bez komunikatu
+                tekst = f"{self._sciezki[indeks]} - {DECYZJE[self._decyzja[indeks]]}"
+            return f"{ikona} {tekst}"
+        nazwa = os.path.basename(self._sciezki[indeks])
+        return f"{ikona} Plik {nazwa} {self._opisy[numer]}"
+
+    def komunikaty(self) -> "WidokKomunikatow":
+        """
+        Zwraca komunikaty plików i uwagi jako sekwencję tylko do odczytu.
+
+        Returns:
+            WidokKomunikatow: Komunikaty tworzone przy odczycie
+        """
+        return WidokKomunikatow(self)
+
+    def liczba_bledow(self) -> int:
+        """
+        Zwraca liczbę plików zakończonych błędem.
+
+        Returns:
+            int: Liczba wierszy z kodem błędu innym niż KOD_BEZ_BLEDU
+        """
+        return len(self._kod_bledu) - self._kod_bledu.count(KOD_BEZ_BLEDU)
+
+    def podsumowanie(self) -> dict:
+        """
+        Podsumowuje paczkę - sumy liczone są wprost na kolumnach.
+
+        Returns:
+            dict: liczba_plikow, liczba_sukcesow, liczba_bledow,
+                rozmiar_przed, rozmiar_po, stosunek, czas, decyzje
+                ({decyzja: liczba}) i bledy ({kod_bledu: liczba})
+        """
+        liczba_bledow = self.liczba_bledow()
+        rozmiar_przed = sum(self._rozmiar_przed)
+        rozmiar_po = sum(self._rozmiar_po)
+        decyzje = {
+            decyzja: self._decyzja.count(indeks)
+            for indeks, decyzja in enumerate(DECYZJE)
+        }
+        bledy = {}
+        if liczba_bledow:
+            for kod in range(KOD_BRAK_PLIKU, KOD_KOLIZJA_NAZWY + 1):
+                if liczba := self._kod_bledu.count(kod):
+                    bledy[kod] = liczba
+
+        return {
+            "liczba_plikow": len(self),
+            "liczba_sukcesow": len(self) - liczba_bledow,
+            "liczba_bledow": liczba_bledow,
+            "rozmiar_przed": rozmiar_przed,
+            "rozmiar_po": rozmiar_po,
+            "stosunek": rozmiar_po / rozmiar_przed if rozmiar_przed else None,
+            "czas": math.fsum(self._czas),
+            "decyzje": {
+                decyzja: liczba for decyzja, liczba in decyzje.items() if liczba
+            },
+            "bledy": bledy,
+        }
+
+
+class WidokKomunikatow(Sequence):
+    """
+    Komunikaty paczki jako sekwencja tylko do odczytu.
+
+    Zachowuje się jak lista napisów (len, indeksy, pętla for, "\\n".join),
+    ale każdy komunikat powstaje dopiero przy odczycie z kolumn wyników.
+    """
+
+    def __init__(self, wyniki: WynikiKompresji):
+        """
+        Tworzy widok komunikatów.
+
+        Args:
+            wyniki (WynikiKompresji): Wyniki paczki
+        """
+        self._wyniki = wyniki
+
+    def __len__(self) -> int:
+        return len(self._wyniki) + len(self._wyniki.uwagi)
+
+    def __getitem__(self, indeks):
+        if isinstance(indeks, slice):
+            return [self[numer] for numer in range(len(self))[indeks]]
+
+        indeks = range(len(self))[indeks]  # Indeksy ujemne i IndexError
+        liczba_plikow = len(self._wyniki)
+        if indeks < liczba_plikow:
+            return self._wyniki.komunikat(indeks)
+        return self._wyniki.uwagi[indeks - liczba_plikow]
+
+    def __eq__(self, inny) -> bool:
+        if isinstance(inny, Sequence) and not isinstance(inny, str):
+            return list(self) == list(inny)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"WidokKomunikatow({len(self)} komunikatów)"
+
+
+def opis_bledu_walidacji(sciezka_pliku: str, kod_bledu: int) -> str:
+    """
+    Tworzy opis pliku odrzuconego przez walidację.
+
+    Args:
+        sciezka_pliku (str): Ścieżka do pliku
+        kod_bledu (int): KOD_BRAK_PLIKU, KOD_BRAK_UPRAWNIEN lub
+            KOD_KOLIZJA_NAZWY
+
+    Returns:
+        str: Opis błędu, np. "dane/a.txt - plik nie istnieje"
+    """
+    if kod_bledu == KOD_BRAK_PLIKU:
+        return f"{sciezka_pliku} - plik nie istnieje"
+    if kod_bledu == KOD_BRAK_UPRAWNIEN:
+        return f"{sciezka_pliku} - brak uprawnień do odczytu"
+    if kod_bledu == KOD_KOLIZJA_NAZWY:
+        nazwa = os.path.splitext(os.path.basename(sciezka_pliku))[0]
+        return (
+            f"{sciezka_pliku} - archiwum {nazwa}.zip tworzy już inny plik "
+            "o tej samej nazwie"
+        )
+    return f"{sciezka_pliku} - błąd (kod {kod_bledu})"